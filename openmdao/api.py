@@ -105,6 +105,7 @@ from openmdao.utils.options_dictionary import OptionsDictionary
 
 # Recorders
 from openmdao.recorders.sqlite_recorder import SqliteRecorder
+from openmdao.recorders.npy_recorder import NpyRecorder
 from openmdao.recorders.case_reader import CaseReader
 
 # Visualizations
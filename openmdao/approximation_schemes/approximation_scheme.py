@@ -1,6 +1,7 @@
 """Base class used to define the interface for derivative approximation schemes."""
 import time
 from collections import defaultdict
+from concurrent.futures.process import BrokenProcessPool
 import numpy as np
 
 from openmdao.core.constants import INT_DTYPE
@@ -24,6 +25,45 @@ else:
         PETSc = None
 
 
+# the approximation scheme and system of a worker process in a local pool
+_pool_worker = None
+
+
+def _init_pool_worker(scheme, system):
+    """
+    Store the forked copies of the approximation scheme and system in a pool worker.
+
+    Parameters
+    ----------
+    scheme : ApproximationScheme
+        The approximation scheme that evaluates the columns.
+    system : System
+        System whose derivatives are being approximated.
+    """
+    global _pool_worker
+    _pool_worker = (scheme, system)
+
+
+def _run_pool_tasks(state, tasks):
+    """
+    Evaluate approximation columns in a pool worker.
+
+    Parameters
+    ----------
+    state : tuple
+        State of the system in the parent process.
+    tasks : list
+        Data needed to evaluate each column.
+
+    Returns
+    -------
+    list of ndarray
+        The result of each column evaluation.
+    """
+    scheme, system = _pool_worker
+    return scheme._run_pool_tasks(system, state, tasks)
+
+
 class ApproximationScheme(object):
     """
     Base class used to define the interface for derivative approximation schemes.
@@ -579,6 +619,129 @@ class ApproximationScheme(object):
                     else:
                         yield jinds, res
 
+    def _pool_column_iter(self, system, pool, approx_groups, colored_approx_groups):
+        """
+        Perform approximations in a pool of worker processes and yield each jac column.
+
+        The workers are forked from this process, so the system doesn't need to be pickled. The
+        starting state of the system is sent with each chunk of columns, so the workers evaluate
+        the columns at the current point.
+
+        Parameters
+        ----------
+        system : Component
+            Component whose partial derivatives are being approximated.
+        pool : ProcessPoolExecutor
+            The pool of worker processes of the component.
+        approx_groups : list of tuples
+            Data for the uncolored approximations.  See _uncolored_column_iter.
+        colored_approx_groups : list of tuples
+            Data for the colored approximations.  See _colored_column_iter.
+
+        Yields
+        ------
+        int
+            column index
+        ndarray
+            solution array corresponding to the jacobian column at the given column index
+        """
+        vec_names = {id(system._inputs): 'input', id(system._outputs): 'output', id(None): None}
+        tasks = []
+        columns = []
+
+        for data, jcols, vec_ind_list, nzrows, _ in colored_approx_groups or ():
+            idx_info = [(vec_names[id(vec)], idxs) for vec, idxs in vec_ind_list]
+            tasks.append((data, idx_info, range(1)))
+            columns.append((jcols, nzrows, self._get_multiplier(data)))
+
+        for _, data, jcol_idxs, vec_ind_list, directional, direction in approx_groups:
+            if direction is not None:
+                app_data = self.apply_directional(data, direction)
+            else:
+                app_data = data
+
+            mult = self._get_multiplier(data)
+            jidx_iter = iter(range(len(jcol_idxs)))
+
+            for vec_ind_info, vecidxs in self._vec_ind_iter(vec_ind_list):
+                if vecidxs is None:
+                    continue  # non-local partial jac column
+
+                idx_info = [(vec_names[id(vec)], idxs) for vec, idxs in vec_ind_info]
+                tasks.append((app_data, idx_info, jcol_idxs))
+
+                jinds = jcol_idxs[next(jidx_iter)]
+                columns.append((jinds[0] if directional else jinds, None, mult))
+
+        if not tasks:
+            return
+
+        # send the starting state once with each chunk of columns
+        state = self._get_pool_state(system)
+        num_chunks = min(system._num_fd_workers, len(tasks))
+        chunk_size = -(-len(tasks) // num_chunks)
+        futures = [pool.submit(_run_pool_tasks, state, tasks[i:i + chunk_size])
+                   for i in range(0, len(tasks), chunk_size)]
+
+        try:
+            scratch = np.empty(len(system._outputs))
+            results = (res for future in futures for res in future.result())
+
+            for (jcols, nzrows, mult), result in zip(columns, results):
+                if mult != 1.0:
+                    result *= mult
+
+                if nzrows is None:
+                    yield jcols, result
+                else:
+                    for i, col in enumerate(jcols):
+                        scratch[:] = 0.0
+                        scratch[nzrows[i]] = result[nzrows[i]]
+                        yield col, scratch
+        except BrokenProcessPool:
+            # a worker died, so fork new ones the next time
+            system._shutdown_fd_pool()
+            raise
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _get_pool_state(self, system):
+        """
+        Return the state of the system needed by pool workers to evaluate columns.
+
+        Parameters
+        ----------
+        system : System
+            System whose derivatives are being approximated.
+
+        Returns
+        -------
+        tuple
+            The state of the system.
+        """
+        raise NotImplementedError("_get_pool_state has not been implemented")
+
+    def _run_pool_tasks(self, system, state, tasks):
+        """
+        Evaluate approximation columns in a pool worker.
+
+        Parameters
+        ----------
+        system : System
+            The worker's copy of the system whose derivatives are being approximated.
+        state : tuple
+            State of the system in the parent process.
+        tasks : list
+            Data needed to evaluate each column.
+
+        Returns
+        -------
+        list of ndarray
+            The result of each column evaluation.
+        """
+        raise NotImplementedError("_run_pool_tasks has not been implemented")
+
     def compute_approximations(self, system, jac):
         """
         Execute the system to compute the approximate sub-Jacobians.
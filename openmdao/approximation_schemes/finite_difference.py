@@ -256,6 +256,91 @@ class FiniteDifference(ApproximationScheme):
         self._starting_resids = None
         self._results_tmp = None
 
+    def _compute_approx_col_iter(self, system, under_cs):
+        """
+        Execute the system to compute the approximate sub-Jacobians.
+
+        If the system is a component with num_fd_workers > 1, the columns are evaluated in its
+        pool of worker processes, if the pool can be forked safely.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        under_cs : bool
+            True if we're currently under complex step at a higher level.
+
+        Yields
+        ------
+        int
+            column index
+        ndarray
+            solution array corresponding to the jacobian column at the given column index
+        """
+        if getattr(system, '_num_fd_workers', 1) > 1 and not under_cs and \
+                not system._discrete_inputs:
+            pool = system._get_fd_pool(self)
+            if pool is not None:
+                approx_groups, colored_approx_groups = self._get_approx_groups(system, under_cs)
+                yield from self._pool_column_iter(system, pool, approx_groups,
+                                                  colored_approx_groups)
+                return
+
+        yield from super()._compute_approx_col_iter(system, under_cs)
+
+    def _get_pool_state(self, system):
+        """
+        Return the state of the system needed by pool workers to evaluate columns.
+
+        Parameters
+        ----------
+        system : System
+            System whose derivatives are being approximated.
+
+        Returns
+        -------
+        tuple
+            The starting inputs, outputs and residuals.
+        """
+        return self._starting_ins, self._starting_outs, self._starting_resids
+
+    def _run_pool_tasks(self, system, state, tasks):
+        """
+        Evaluate finite difference columns in a pool worker.
+
+        Parameters
+        ----------
+        system : System
+            The worker's copy of the system whose derivatives are being approximated.
+        state : tuple
+            The starting inputs, outputs and residuals in the parent process.
+        tasks : list
+            The FD data, the names of the perturbed vectors with their indices and the
+            range of jac columns for each column evaluation.
+
+        Returns
+        -------
+        list of ndarray
+            The result of each column evaluation.
+        """
+        self._starting_ins, self._starting_outs, self._starting_resids = state
+        self._results_tmp = self._starting_resids.copy()
+
+        system._inputs.set_val(self._starting_ins)
+        system._outputs.set_val(self._starting_outs)
+        system._residuals.set_val(self._starting_resids)
+
+        vecs = {'input': system._inputs, 'output': system._outputs, None: None}
+        results_array = self._starting_resids.copy()
+
+        results = []
+        for data, idx_info, idx_range in tasks:
+            idx_info = [(vecs[name], idxs) for name, idxs in idx_info]
+            result = self._run_point(system, idx_info, data, results_array, False, idx_range)
+            results.append(self._transform_result(result).copy())
+
+        return results
+
     def _get_multiplier(self, data):
         """
         Return a multiplier to be applied to the jacobian.
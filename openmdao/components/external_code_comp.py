@@ -2,6 +2,12 @@
 import os
 import sys
 import re
+import json
+import hashlib
+import shutil
+import tempfile
+from contextlib import contextmanager
+from itertools import chain
 
 from shutil import which
 
@@ -10,6 +16,9 @@ from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.core.implicitcomponent import ImplicitComponent
 from openmdao.utils.shell_proc import STDOUT, DEV_NULL, ShellProc  # noqa: F401
 
+# user functions of the external code components that run the external code
+_EXTERNAL_CODE_FUNCS = frozenset(('compute', 'apply_nonlinear', 'solve_nonlinear'))
+
 
 class ExternalCodeDelegate(object):
     """
@@ -24,6 +33,9 @@ class ExternalCodeDelegate(object):
     ----------
     _comp : ExternalCodeComp or ExternalCodeImplicitComp object
         The external code object this delegate is associated with.
+    _startdir : str or None
+        The working directory before switching to a scratch directory, against which a relative
+        cache_dir is resolved.
     """
 
     def __init__(self, comp):
@@ -31,6 +43,7 @@ class ExternalCodeDelegate(object):
         Initialize.
         """
         self._comp = comp
+        self._startdir = None
 
     def declare_options(self):
         """
@@ -46,7 +59,8 @@ class ExternalCodeDelegate(object):
         comp.options.declare('env_vars', {}, desc='Environment variables required by the command.')
         comp.options.declare('poll_delay', 0.0, lower=0.0,
                              desc='Delay between polling for command completion. '
-                                  'A value of zero will use an internally computed default.')
+                                  'A value of zero waits for the command to complete without '
+                                  'polling.')
         comp.options.declare('timeout', 0.0, lower=0.0,
                              desc='Maximum time to wait for command completion. '
                                   'A value of zero implies an infinite wait.')
@@ -62,6 +76,32 @@ class ExternalCodeDelegate(object):
                                   "(AnalysisError).")
         comp.options.declare('allowed_return_codes', [0],
                              desc="List of return codes that are considered successful.")
+        comp.options.declare('run_in_scratch_dir', types=bool, default=False,
+                             desc="If True, each execution runs in a new temporary working "
+                                  "directory that is removed afterwards, so that concurrent "
+                                  "executions, such as finite difference columns evaluated "
+                                  "with num_fd_workers > 1, don't overwrite each other's files. "
+                                  "Any files needed after the execution must be read before "
+                                  "it returns.")
+        comp.options.declare('scratch_dir_files', [],
+                             desc="List of files and directories, relative to the working "
+                                  "directory, that are copied into each scratch directory along "
+                                  "with the external_input_files, such as scripts and static "
+                                  "data used by the command.")
+        comp.options.declare('scratch_root', types=str, default=None, allow_none=True,
+                             desc="Directory in which the scratch directories are created. "
+                                  "If None, the system temporary directory is used.")
+        comp.options.declare('cache_dir', types=str, default=None, allow_none=True,
+                             desc="Directory of an on-disk cache of external code results. "
+                                  "If set, the external_output_files of each successful "
+                                  "execution are stored under a hash of the contents of the "
+                                  "external_input_files and stdin file, the command and the "
+                                  "env_vars, and later executions with the same hash restore "
+                                  "those files instead of running the command. If None, no "
+                                  "results are cached.")
+        comp.options.declare('cache_size', types=int, default=100, lower=1,
+                             desc="Maximum number of results kept in the cache_dir. The least "
+                                  "recently used results are removed first.")
 
     def check_config(self, logger):
         """
@@ -98,6 +138,56 @@ class ExternalCodeDelegate(object):
             logger.warning("The following input files are missing at setup "
                            "time: %s" % missing)
 
+    @contextmanager
+    def user_function_context(self, fname):
+        """
+        Context manager for a user function that may run the external code.
+
+        If the run_in_scratch_dir option is set, the function runs in a new temporary working
+        directory holding copies of the external_input_files and scratch_dir_files.
+
+        Parameters
+        ----------
+        fname : str
+            Name of the user defined function.
+
+        Yields
+        ------
+        None
+        """
+        comp = self._comp
+
+        if fname not in _EXTERNAL_CODE_FUNCS or not comp.options['run_in_scratch_dir']:
+            yield
+            return
+
+        startdir = os.getcwd()
+        scratch_dir = tempfile.mkdtemp(prefix='extcode-', dir=comp.options['scratch_root'])
+
+        try:
+            for path in chain(comp.options['scratch_dir_files'],
+                              comp.options['external_input_files']):
+                # absolute paths are valid from any directory, and missing input files may
+                # be generated by the user function itself.
+                if os.path.isabs(path) or os.path.normpath(path).startswith(os.pardir) or \
+                        not os.path.exists(path):
+                    continue
+
+                dest = os.path.join(scratch_dir, path)
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                if os.path.isdir(path):
+                    shutil.copytree(path, dest, dirs_exist_ok=True)
+                else:
+                    shutil.copy2(path, dest)
+
+            self._startdir = startdir
+            os.chdir(scratch_dir)
+            yield
+        finally:
+            self._startdir = None
+            os.chdir(startdir)
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+
     def _check_for_files(self, files):
         """
         Check that specified files exist.
@@ -147,6 +237,16 @@ class ExternalCodeDelegate(object):
             if missing:
                 raise err_class("The following input files are missing: %s"
                                 % sorted(missing))
+
+            cache_key = None
+            if comp.options['cache_dir'] is not None:
+                cache_key = self._cache_key(command)
+                return_code = self._restore_from_cache(cache_key)
+                if return_code is not None:
+                    comp.cache_hits += 1
+                    return
+                comp.cache_misses += 1
+
             return_code, error_msg = self._execute_local(command)
 
             if return_code is None:
@@ -172,9 +272,141 @@ class ExternalCodeDelegate(object):
                 raise err_class("The following output files are missing: %s"
                                 % sorted(missing))
 
+            if cache_key is not None:
+                self._store_in_cache(cache_key, return_code)
+
         finally:
             comp.return_code = -999999 if return_code is None else return_code
 
+    def _cache_path(self):
+        """
+        Return the absolute path of the result cache directory.
+
+        Returns
+        -------
+        str
+            Path of the cache directory.
+        """
+        cache_dir = os.path.expanduser(self._comp.options['cache_dir'])
+        return os.path.join(self._startdir or os.getcwd(), cache_dir)
+
+    def _cache_key(self, command):
+        """
+        Hash everything that determines the results of an execution of the command.
+
+        Parameters
+        ----------
+        command : list or str
+            The command to be executed.
+
+        Returns
+        -------
+        str
+            Hex digest identifying the execution in the cache.
+        """
+        comp = self._comp
+        key = hashlib.sha256()
+        key.update(repr((command, sorted(comp.options['env_vars'].items()),
+                         comp.options['external_output_files'])).encode())
+
+        files = list(comp.options['external_input_files'])
+        if isinstance(comp.stdin, str) and os.path.isfile(comp.stdin):
+            files.append(comp.stdin)
+
+        for path in files:
+            if os.path.isdir(path):
+                paths = sorted(os.path.join(dirpath, f)
+                               for dirpath, _, fnames in os.walk(path) for f in fnames)
+            else:
+                paths = [path]
+
+            for fpath in paths:
+                key.update(repr(fpath).encode())
+                with open(fpath, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b''):
+                        key.update(chunk)
+
+        return key.hexdigest()
+
+    def _restore_from_cache(self, key):
+        """
+        Restore the output files of a cached execution.
+
+        Parameters
+        ----------
+        key : str
+            Hex digest identifying the execution in the cache.
+
+        Returns
+        -------
+        int or None
+            Return code of the cached execution, or None if it is not in the cache.
+        """
+        entry = os.path.join(self._cache_path(), key)
+
+        try:
+            with open(os.path.join(entry, 'manifest.json'), 'r') as f:
+                manifest = json.load(f)
+
+            for i, path in enumerate(manifest['files']):
+                dirname = os.path.dirname(path)
+                if dirname:
+                    os.makedirs(dirname, exist_ok=True)
+                shutil.copy2(os.path.join(entry, str(i)), path)
+
+            # mark the entry as the most recently used
+            os.utime(entry)
+        except (OSError, ValueError):
+            return None
+
+        return manifest['return_code']
+
+    def _store_in_cache(self, key, return_code):
+        """
+        Store the output files of a successful execution and evict the least recently used ones.
+
+        Parameters
+        ----------
+        key : str
+            Hex digest identifying the execution in the cache.
+        return_code : int
+            Return code of the execution.
+        """
+        files = self._comp.options['external_output_files']
+        cache_dir = self._cache_path()
+        entry = os.path.join(cache_dir, key)
+
+        os.makedirs(cache_dir, exist_ok=True)
+        if os.path.isdir(entry):
+            return
+
+        # The entry is filled in a temporary directory and then renamed, so concurrent
+        # executions never see a partial entry.
+        tmp = tempfile.mkdtemp(prefix='.tmp-', dir=cache_dir)
+        try:
+            for i, path in enumerate(files):
+                shutil.copy2(path, os.path.join(tmp, str(i)))
+            with open(os.path.join(tmp, 'manifest.json'), 'w') as f:
+                json.dump({'return_code': return_code, 'files': list(files)}, f)
+            os.rename(tmp, entry)
+        except OSError:
+            # the outputs can't be copied or another execution stored the same entry first
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+
+        entries = []
+        for e in os.scandir(cache_dir):
+            try:
+                if e.is_dir() and not e.name.startswith('.'):
+                    entries.append((e.stat().st_mtime_ns, e.path))
+            except OSError:
+                pass
+
+        excess = len(entries) - self._comp.options['cache_size']
+        if excess > 0:
+            for _, path in sorted(entries)[:excess]:
+                shutil.rmtree(path, ignore_errors=True)
+
     def _execute_local(self, command):
         """
         Run the command.
@@ -255,6 +487,11 @@ class ExternalCodeComp(ExplicitComponent):
         The delegate object that handles all the running of the external code for this object.
     return_code : int
         Exit status of the child process.
+    cache_hits : int
+        Number of executions whose results were restored from the cache_dir.
+    cache_misses : int
+        Number of executions that ran the command because their results weren't in the
+        cache_dir.
     """
 
     def __init__(self, **kwargs):
@@ -269,6 +506,8 @@ class ExternalCodeComp(ExplicitComponent):
         self.stderr = "external_code_comp_error.out"
 
         self.return_code = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def _declare_options(self):
         """
@@ -292,6 +531,34 @@ class ExternalCodeComp(ExplicitComponent):
         # check for the command
         self._external_code_runner.check_config(logger)
 
+    @contextmanager
+    def _call_user_function(self, fname, protect_inputs=True,
+                            protect_outputs=False, protect_residuals=False):
+        """
+        Context manager that wraps a call to a user defined function.
+
+        Functions that run the external code are run in a scratch directory if requested.
+
+        Parameters
+        ----------
+        fname : str
+            Name of the user defined function.
+        protect_inputs : bool
+            If True, then set the inputs vector to be read only
+        protect_outputs : bool
+            If True, then set the outputs vector to be read only
+        protect_residuals : bool
+            If True, then set the residuals vector to be read only
+
+        Yields
+        ------
+        None
+        """
+        with super()._call_user_function(fname, protect_inputs, protect_outputs,
+                                         protect_residuals):
+            with self._external_code_runner.user_function_context(fname):
+                yield
+
     def compute(self, inputs, outputs):
         """
         Run this component.
@@ -332,6 +599,11 @@ class ExternalCodeImplicitComp(ImplicitComponent):
         The delegate object that handles all the running of the external code for this object.
     return_code : int
         Exit status of the child process.
+    cache_hits : int
+        Number of executions whose results were restored from the cache_dir.
+    cache_misses : int
+        Number of executions that ran the command because their results weren't in the
+        cache_dir.
     """
 
     def __init__(self, **kwargs):
@@ -346,6 +618,8 @@ class ExternalCodeImplicitComp(ImplicitComponent):
         self.stderr = "external_code_comp_error.out"
 
         self.return_code = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def _declare_options(self):
         """
@@ -375,6 +649,34 @@ class ExternalCodeImplicitComp(ImplicitComponent):
         """
         self._external_code_runner.check_config(logger)
 
+    @contextmanager
+    def _call_user_function(self, fname, protect_inputs=True,
+                            protect_outputs=False, protect_residuals=False):
+        """
+        Context manager that wraps a call to a user defined function.
+
+        Functions that run the external code are run in a scratch directory if requested.
+
+        Parameters
+        ----------
+        fname : str
+            Name of the user defined function.
+        protect_inputs : bool
+            If True, then set the inputs vector to be read only
+        protect_outputs : bool
+            If True, then set the outputs vector to be read only
+        protect_residuals : bool
+            If True, then set the residuals vector to be read only
+
+        Yields
+        ------
+        None
+        """
+        with super()._call_user_function(fname, protect_inputs, protect_outputs,
+                                         protect_residuals):
+            with self._external_code_runner.user_function_context(fname):
+                yield
+
     def apply_nonlinear(self, inputs, outputs, residuals):
         """
         Compute residuals given inputs and outputs.
@@ -366,12 +366,13 @@ class InterpND(object):
             result, derivs_x, derivs_val, derivs_grid = table.evaluate_vectorized(xi)
 
         else:
+            # Fixed-dimension tables evaluated at a single point, or custom algorithms that don't
+            # provide a stencil.
             n_nodes, nx = xi.shape
             result = np.empty((n_nodes, ), dtype=xi.dtype)
             derivs_x = np.empty((n_nodes, nx), dtype=xi.dtype)
             derivs_val = None
 
-            # TODO: it might be possible to vectorize over n_nodes.
             for j in range(n_nodes):
                 val, d_x, d_values, d_grid = table.evaluate(xi[j, ...])
                 result[j] = val.item()
@@ -437,6 +438,15 @@ class InterpND(object):
 
                     result[j, :], _, _, _ = table.evaluate_vectorized(xi.reshape((nx, 1)))
 
+        elif table._supports_stencil:
+            # All rows of values are interpolated together as leading dimensions of the table.
+            nx = shape_to_len(xi.shape)
+            table.values = values
+            table._compute_d_dvalues = self._compute_d_dvalues
+            table._compute_d_dx = False
+
+            result, _, derivs_val, _ = table.evaluate_vectorized(xi.reshape((nx, 1)))
+
         else:
             interp = self._interp
             n_nodes, _ = values.shape
@@ -444,7 +454,6 @@ class InterpND(object):
             result = np.empty((n_nodes, nx), dtype=values.dtype)
             derivs_val = None
 
-            # TODO: it might be possible to vectorize over n_nodes.
             for j in range(n_nodes):
 
                 table = interp(self.grid, values[j, :], interp, **self._interp_options)
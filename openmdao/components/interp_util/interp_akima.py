@@ -81,6 +81,34 @@ def dv_abs_smooth_complex(x, x_deriv, delta_x):
     return y, y_deriv
 
 
+def _abs_and_deriv(x, delta_x):
+    """
+    Compute the (optionally smoothed) complex-step absolute value and its derivative.
+
+    Parameters
+    ----------
+    x : ndarray
+        Input array.
+    delta_x : float
+        Half width of the rounded section.
+
+    Returns
+    -------
+    ndarray
+        Absolute value of x.
+    ndarray
+        Derivative of the absolute value with respect to x.
+    """
+    sign = np.where(x.real < 0.0, -1.0, 1.0)
+
+    if delta_x > 0:
+        inner = np.abs(x.real) < delta_x
+        return np.where(inner, x**2 / (2.0 * delta_x) + delta_x / 2.0, sign * x), \
+            np.where(inner, x / delta_x, sign)
+
+    return sign * x, sign
+
+
 class InterpAkima(InterpAlgorithm):
     """
     Interpolate using an Akima polynomial.
@@ -104,6 +132,8 @@ class InterpAkima(InterpAlgorithm):
         super().__init__(grid, values, interp, **kwargs)
         self.k = 4
         self._name = 'akima'
+        self._supports_stencil = True
+        self._poly_order = (3, 1)
 
     def initialize(self):
         """
@@ -730,6 +760,154 @@ class InterpAkima(InterpAlgorithm):
         # Evaluate dependent value and exit
         return a + dx * (b + dx * (c + dx * d)), deriv_dx, deriv_dv, None
 
+    def _get_stencil(self, x):
+        """
+        Return the indices of the table values needed to interpolate each point.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independent to interpolate.
+
+        Returns
+        -------
+        ndarray of shape (n_points, 6)
+            Grid indices needed by each point.
+        tuple of ndarray
+            Matrix that maps the stencil values to the five interval slopes, the extrapolation
+            flag, the inverse width of the interval, and the distance from its reference point.
+        """
+        grid = self.grid
+        ngrid = len(grid)
+        n_points = len(x)
+
+        idx, extrap = self._bracket_vectorized(x)
+        idx = np.minimum(idx, ngrid - 2)
+
+        # Entries that fall off the ends of the table are clipped; their slopes are replaced below.
+        stencil = np.clip(idx[:, np.newaxis] + np.arange(-2, 4), 0, ngrid - 1)
+
+        dgrid = np.diff(grid[stencil], axis=1)
+        dgrid[dgrid == 0.0] = 1.0
+        dgrid = 1.0 / dgrid
+
+        # Slope m_j is the dot product of row j with the stencil values.
+        slopes = np.zeros((n_points, 5, 6))
+        cols = np.arange(5)
+        slopes[:, cols, cols] = -dgrid
+        slopes[:, cols, cols + 1] = dgrid
+
+        slopes[idx < 2, 0] = 0.0
+        slopes[idx < 1, 1] = 0.0
+        slopes[idx >= ngrid - 2, 3] = 0.0
+        slopes[idx >= ngrid - 3, 4] = 0.0
+
+        # Same precedence as the scalar version when the table only has 4 points.
+        mask = idx == 0
+        slopes[mask, 1] = 2.0 * slopes[mask, 2] - slopes[mask, 3]
+        slopes[mask, 0] = 2.0 * slopes[mask, 1] - slopes[mask, 2]
+
+        mask = idx == 1
+        slopes[mask, 0] = 2.0 * slopes[mask, 1] - slopes[mask, 2]
+
+        mask = np.logical_and(idx == ngrid - 3, idx > 1)
+        slopes[mask, 4] = 2.0 * slopes[mask, 3] - slopes[mask, 2]
+
+        mask = idx == ngrid - 2
+        slopes[mask, 3] = 2.0 * slopes[mask, 2] - slopes[mask, 1]
+        slopes[mask, 4] = 2.0 * slopes[mask, 3] - slopes[mask, 2]
+
+        h = dgrid[:, 2]
+        dx = x - grid[np.where(extrap == 1, idx + 1, idx)]
+
+        return stencil, (slopes, extrap, h, dx)
+
+    def _interpolate_stencil(self, x, stencil_data, vals):
+        """
+        Compute the interpolated value over this grid dimension from the gathered values.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independent to interpolate.
+        stencil_data : tuple of ndarray
+            Information computed by `_get_stencil`.
+        vals : ndarray of shape (..., n_points, n_lines, 6)
+            Values at the stencil points, one set per line in the preceding dimensions.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to this independent.
+        ndarray
+            Derivative of interpolated values with respect to the stencil values.
+        """
+        slopes, extrap, h, dx = stencil_data
+        eps = self.options['eps']
+        delta_x = self.options['delta_x']
+
+        extrap = extrap[:, np.newaxis]
+        h = h[:, np.newaxis]
+        dx = dx[:, np.newaxis]
+
+        m1, m2, m3, m4, m5 = np.einsum('...ijk,ilk->l...ij', vals, slopes)
+
+        w2, dw2 = _abs_and_deriv(m4 - m3, delta_x)
+        w31, dw31 = _abs_and_deriv(m2 - m1, delta_x)
+        w32, dw32 = _abs_and_deriv(m5 - m4, delta_x)
+        w4, dw4 = _abs_and_deriv(m3 - m2, delta_x)
+
+        # Special case to avoid divide by zero.
+        den = w2 + w31
+        active = den.real > eps
+        den = np.where(active, den, 1.0)
+        b = np.where(active, (m2 * w2 + m3 * w31) / den, 0.5 * (m2 + m3))
+        db_dm = (np.where(active, -dw31 * (m3 - b) / den, 0.0),
+                 np.where(active, (w2 + dw31 * (m3 - b)) / den, 0.5),
+                 np.where(active, (w31 - dw2 * (m2 - b)) / den, 0.5),
+                 np.where(active, dw2 * (m2 - b) / den, 0.0),
+                 0.0)
+
+        den = w32 + w4
+        active = den.real > eps
+        den = np.where(active, den, 1.0)
+        bp1 = np.where(active, (m3 * w32 + m4 * w4) / den, 0.5 * (m3 + m4))
+        dbp1_dm = (0.0,
+                   np.where(active, -dw4 * (m4 - bp1) / den, 0.0),
+                   np.where(active, (w32 + dw4 * (m4 - bp1)) / den, 0.5),
+                   np.where(active, (w4 - dw32 * (m3 - bp1)) / den, 0.5),
+                   np.where(active, dw32 * (m3 - bp1) / den, 0.0))
+
+        interior = extrap == 0
+        high = extrap == 1
+
+        c = np.where(interior, (3 * m3 - 2 * b - bp1) * h, 0.0)
+        d = np.where(interior, (b + bp1 - 2 * m3) * h * h, 0.0)
+        slope = np.where(high, bp1, b)
+        a = np.where(high, vals[..., 3], vals[..., 2])
+
+        result = a + dx * (slope + dx * (c + dx * d))
+        deriv_dx = slope + dx * (2.0 * c + 3.0 * d * dx)
+
+        # Derivatives of the result with respect to b, bp1 and the direct dependence on m3.
+        dx2 = dx * dx
+        dx3 = dx2 * dx
+        dr_db = np.where(interior, dx - 2.0 * h * dx2 + h * h * dx3, np.where(high, 0.0, dx))
+        dr_dbp1 = np.where(interior, h * h * dx3 - h * dx2, np.where(high, dx, 0.0))
+        dr_dm3 = np.where(interior, 3.0 * h * dx2 - 2.0 * h * h * dx3, 0.0)
+
+        dr_dm = np.stack(np.broadcast_arrays(*[dr_db * db_dm[j] + dr_dbp1 * dbp1_dm[j]
+                                               for j in range(5)]))
+        dr_dm[2] += dr_dm3
+
+        deriv_dv = np.einsum('l...ij,ilk->...ijk', dr_dm, slopes)
+        deriv_dv[..., 2] += np.logical_not(high)
+        deriv_dv[..., 3] += high
+
+        return result, deriv_dx, deriv_dv
+
 
 def abs_smooth_1d(x, x_deriv=None, delta_x=0):
     """
@@ -4,8 +4,13 @@ Base class for interpolation methods.  New methods should inherit from this clas
 import numpy as np
 
 from openmdao.components.interp_util.outofbounds_error import OutOfBoundsError
+from openmdao.utils.array_utils import shape_to_len
 from openmdao.utils.options_dictionary import OptionsDictionary
 
+# Upper limit on the number of gathered table values held in memory at once during a vectorized
+# evaluation. Larger requests are processed in chunks of points.
+_MAX_STENCIL_ENTRIES = 2 ** 21
+
 
 class InterpAlgorithm(object):
     """
@@ -38,14 +43,26 @@ class InterpAlgorithm(object):
         Array containing the table values for all dimensions.
     _compute_d_dvalues : bool
         When set to True, compute gradients with respect to the grid values.
+    _cell_coeffs : tuple or None
+        Cached polynomial coefficients for every cell of the last table dimension, and the left
+        edge and inverse width of each cell. Cleared when the table values are set.
     _compute_d_dx : bool
         When set to True, compute gradients with respect to the interpolated point location.
     _full_slice : tuple of <Slice>
         Used to cache the full slice if training derivatives are computed.
+    _last_intervals : ndarray or None
+        Grid intervals found for each point during the last vectorized evaluation, used to start
+        the search for the current intervals.
     _name : str
         Algorithm name for error messages.
+    _poly_order : tuple(int, int)
+        Order of the polynomial that this method fits within each grid interval, and in the
+        extrapolated regions.
     _supports_d_dvalues : bool
         If True, this algorithm can compute the derivatives with respect to table values.
+    _supports_stencil : bool
+        If True, this algorithm can gather the table values surrounding each point into a
+        stencil, so that it can be evaluated at many points at once.
     _vectorized :bool
         If True, this method is vectorized and can simultaneously solve multiple interpolations.
     """
@@ -74,6 +91,31 @@ class InterpAlgorithm(object):
         self._compute_d_dx = True
         self._full_slice = None
         self._supports_d_dvalues = True
+        self._supports_stencil = False
+        self._last_intervals = None
+        self._cell_coeffs = None
+        self._poly_order = (3, 3)
+
+    @property
+    def values(self):
+        """
+        Get the array containing the table values for all dimensions.
+
+        Values cached from the table, like the cell coefficients of the vectorized evaluation,
+        are cleared when the values are set, so a table edited in place must be set again for
+        the edits to be used.
+
+        Returns
+        -------
+        ndarray
+            The table values.
+        """
+        return self._values
+
+    @values.setter
+    def values(self, values):
+        self._values = values
+        self._cell_coeffs = None
 
     def initialize(self):
         """
@@ -111,7 +153,7 @@ class InterpAlgorithm(object):
         bool
             Returns True if this table can be run vectorized.
         """
-        return self._vectorized
+        return self._vectorized or self._supports_stencil
 
     def bracket(self, x):
         """
@@ -257,6 +299,442 @@ class InterpAlgorithm(object):
         """
         raise NotImplementedError()
 
+    def evaluate_vectorized(self, x):
+        """
+        Interpolate across this and subsequent table dimensions at many points at once.
+
+        The table values surrounding each point are gathered into a stencil, which is reduced one
+        dimension at a time, starting with the last one. The derivatives with respect to the
+        independents of the dimensions already reduced are reduced along with the values.
+
+        When derivatives with respect to the table values are not needed, the last dimension is
+        evaluated from polynomial coefficients that are computed once per cell and reused until
+        the table values change.
+
+        Any leading dimensions of the values beyond those of the grid are interpolated together.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, ndim)
+            The coordinates to sample the gridded data at.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to the independents.
+        ndarray or None
+            Derivative of interpolated values with respect to the table values, when requested.
+        None
+            Derivatives with respect to the grid are not computed.
+        """
+        tables = []
+        table = self
+        while table is not None:
+            tables.append(table)
+            table = table.subtable
+
+        values = self.values
+        if self._compute_d_dvalues or values.ndim > len(tables):
+            return self._evaluate_chunked(tables, values, x)
+
+        coeffs, cells = self._get_cell_coeffs(tables[-1])
+        return self._evaluate_chunked(tables, coeffs, x, cells)
+
+    def _evaluate_chunked(self, tables, values, x, cells=None):
+        """
+        Interpolate at many points, splitting them into chunks to limit the memory used.
+
+        Parameters
+        ----------
+        tables : list of <InterpAlgorithm>
+            This table and all of its subtables.
+        values : ndarray
+            Table values, or the cell coefficients of the last dimension when cells is given.
+        x : ndarray of shape (n_points, ndim)
+            The coordinates to sample the gridded data at.
+        cells : tuple of ndarray or None
+            Left edge and inverse width of each cell of the last dimension, when values holds
+            the cell coefficients.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to the independents.
+        ndarray or None
+            Derivative of interpolated values with respect to the table values, when requested.
+        None
+            Derivatives with respect to the grid are not computed.
+        """
+        ndim = len(tables)
+        n_points = x.shape[0]
+
+        stencils = []
+        stencil_data = []
+        n_stencil = 1
+        for i, table in enumerate(tables):
+            if cells is not None and i == ndim - 1:
+                stencil = table._find_intervals(x[:, i])[:, np.newaxis] + 1
+                data = ()
+            else:
+                stencil, data = table._get_stencil(x[:, i])
+            stencils.append(stencil)
+            stencil_data.append(data)
+            n_stencil *= stencil.shape[1]
+
+        if cells is None:
+            batch_shape = values.shape[:-ndim]
+        else:
+            batch_shape = ()
+            n_stencil *= values.shape[-1]
+
+        chunk = max(_MAX_STENCIL_ENTRIES // (n_stencil * shape_to_len(batch_shape)), 1)
+        if chunk >= n_points:
+            return self._evaluate_stencil(tables, values, x, stencils, stencil_data, cells)
+
+        results = []
+        for start in range(0, n_points, chunk):
+            end = start + chunk
+            results.append(self._evaluate_stencil(tables, values, x[start:end],
+                                                  [stencil[start:end] for stencil in stencils],
+                                                  [tuple(d[start:end] for d in data)
+                                                   for data in stencil_data], cells))
+
+        axis = len(batch_shape)
+        result = np.concatenate([res[0] for res in results], axis=axis)
+        d_dx = np.concatenate([res[1] for res in results], axis=axis)
+        d_values = None
+        if self._compute_d_dvalues:
+            d_values = np.concatenate([res[2] for res in results], axis=axis)
+
+        return result, d_dx, d_values, None
+
+    def _evaluate_stencil(self, tables, values, x, stencils, stencil_data, cells=None):
+        """
+        Interpolate at a set of points given the stencils of all table dimensions.
+
+        Parameters
+        ----------
+        tables : list of <InterpAlgorithm>
+            This table and all of its subtables.
+        values : ndarray
+            Table values, or the cell coefficients of the last dimension when cells is given.
+        x : ndarray of shape (n_points, ndim)
+            The coordinates to sample the gridded data at.
+        stencils : list of ndarray
+            Indices of the table values needed by each point, for each dimension.
+        stencil_data : list of tuple
+            Information needed to interpolate over each stencil, for each dimension.
+        cells : tuple of ndarray or None
+            Left edge and inverse width of each cell of the last dimension, when values holds
+            the cell coefficients.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to the independents.
+        ndarray or None
+            Derivative of interpolated values with respect to the table values, when requested.
+        None
+            Derivatives with respect to the grid are not computed.
+        """
+        ndim = len(tables)
+        n_points = x.shape[0]
+        if cells is None:
+            grid_shape = values.shape[-ndim:]
+            batch_shape = values.shape[:-ndim]
+            n_reduce = ndim
+        else:
+            grid_shape = values.shape[-ndim - 1:-1]
+            batch_shape = ()
+            n_reduce = ndim - 1
+
+        # Flat indices of all combinations of the stencil entries in each dimension.
+        flat_idx = np.zeros((n_points, 1), dtype=int)
+        for i, stencil in enumerate(stencils):
+            flat_idx = flat_idx[:, :, np.newaxis] * grid_shape[i] + stencil[:, np.newaxis, :]
+            flat_idx = flat_idx.reshape((n_points, -1))
+
+        partials = [None] * ndim
+
+        # Derivatives of the values being reduced with respect to the independents of the
+        # dimensions that have already been reduced, stacked along the first axis.
+        d_vals = None
+
+        if cells is None:
+            vals = values.reshape(batch_shape + (-1, ))[..., flat_idx]
+        else:
+            # The last dimension is a polynomial in the normalized position within its cell.
+            coeffs = values.reshape((-1, values.shape[-1]))[flat_idx]
+            left, r_width = cells
+            cell = stencils[-1][:, 0]
+            r_width = r_width[cell][:, np.newaxis]
+            u = (x[:, -1] - left[cell])[:, np.newaxis] * r_width
+
+            vals = coeffs[..., -1]
+            d_vals = np.zeros(vals.shape, dtype=vals.dtype)
+            for j in range(coeffs.shape[-1] - 2, -1, -1):
+                d_vals = d_vals * u + vals
+                vals = vals * u + coeffs[..., j]
+
+            d_vals = (d_vals * r_width)[np.newaxis]
+            partials[-1] = np.ones((n_points, 1, 1))
+
+        # The derivatives with respect to the independents of the subsequent dimensions are
+        # reduced along with the values, in the same way as in the per-point evaluation.
+        for i in range(n_reduce - 1, -1, -1):
+            shape = (n_points, -1, stencils[i].shape[1])
+            vals = vals.reshape(batch_shape + shape)
+            vals, d_dx_i, partials[i] = \
+                tables[i]._interpolate_stencil(x[:, i], stencil_data[i], vals)
+
+            if d_vals is None:
+                d_vals = d_dx_i[np.newaxis]
+            else:
+                d_vals = d_vals.reshape(d_vals.shape[:1] + batch_shape + shape)
+                d_vals = tables[i]._interpolate_stencil_derivs(x[:, i], stencil_data[i],
+                                                               partials[i], d_vals)
+                d_vals = np.concatenate((d_dx_i[np.newaxis], d_vals))
+
+        result = vals.reshape(batch_shape + (n_points, ))
+        d_dx = np.moveaxis(d_vals.reshape((ndim, ) + batch_shape + (n_points, )), 0, -1)
+
+        d_values = None
+        if self._compute_d_dvalues:
+            # Sensitivity of the result to the values interpolated in each dimension.
+            sens = np.ones((n_points, 1))
+            for i in range(ndim):
+                sens = sens[..., np.newaxis] * partials[i]
+                sens = sens.reshape(sens.shape[:-2] + (-1, ))
+
+            n_flat = shape_to_len(grid_shape)
+            n_batch = shape_to_len(batch_shape)
+            sens = np.broadcast_to(sens, batch_shape + flat_idx.shape).reshape((n_batch, -1))
+
+            # Stencil entries can repeat near the table edges, so they must be accumulated.
+            rows = (np.arange(n_points)[:, np.newaxis] * n_flat + flat_idx).ravel()
+            d_values = np.zeros((n_points * n_flat, n_batch), dtype=sens.dtype)
+            np.add.at(d_values, rows, sens.T)
+            d_values = d_values.T.reshape(batch_shape + (n_points, ) + grid_shape)
+
+        return result, d_dx, d_values, None
+
+    def _get_cell_coeffs(self, leaf):
+        """
+        Return the polynomial coefficients of every cell in the last dimension of the table.
+
+        Every method is a polynomial of at most third order within each grid interval and in each
+        extrapolated region, so the coefficients are found by evaluating the method at equally
+        spaced points across each cell. They are computed on the first call and reused until the
+        table values are set.
+
+        Parameters
+        ----------
+        leaf : <InterpAlgorithm>
+            Table for the last dimension.
+
+        Returns
+        -------
+        ndarray
+            Polynomial coefficients in the normalized cell position for each cell, in increasing
+            order.
+        tuple of ndarray
+            Left edge and inverse width of each cell.
+        """
+        if self._cell_coeffs is not None:
+            return self._cell_coeffs
+
+        values = self.values
+
+        # The cells are the region below the table, each grid interval, and the region above. The
+        # extrapolated regions are scaled by the table span to limit growth of the roundoff error.
+        grid = leaf.grid
+        span = grid[-1:] - grid[:1]
+        width = np.concatenate((span, np.diff(grid), span))
+        left = np.concatenate((grid[:1] - span, grid))
+        n_cell = len(left)
+
+        # Evaluating the samples must not disturb the intervals cached for the previous points.
+        last_intervals = leaf._last_intervals
+
+        # Fitting only the order of the method keeps the higher order terms free of roundoff, and
+        # keeps linear interpolation exact.
+        interior, extrap = leaf._poly_order
+        coeffs = np.zeros(values.shape[:-1] + (n_cell, max(interior, extrap) + 1),
+                          dtype=values.dtype)
+        for order, cells in ((interior, np.arange(1, n_cell - 1)), (extrap, [0, n_cell - 1])):
+            u = np.linspace(0.0, 1.0, order + 1)
+            x = (left[cells] + u[:, np.newaxis] * width[cells]).reshape((-1, 1))
+
+            f, _, _, _ = leaf._evaluate_chunked([leaf], values, x)
+            f = f.reshape(f.shape[:-1] + (order + 1, len(cells)))
+
+            fit = np.linalg.inv(np.vander(u, increasing=True))
+            coeffs[..., cells, :order + 1] = np.einsum('ij,...jk->...ki', fit, f)
+
+        leaf._last_intervals = last_intervals
+
+        self._cell_coeffs = (coeffs, (left, 1.0 / width))
+        return self._cell_coeffs
+
+    def _find_intervals(self, x):
+        """
+        Locate the grid interval of each of the new independents.
+
+        The search starts from the intervals found during the previous call, which is fast when
+        the points move little from one evaluation to the next. Points that have moved to
+        another interval fall back to a binary search.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independent to interpolate.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the last grid point that is less than each x, or -1 if there isn't one.
+        """
+        grid = self.grid
+        x = x.real
+        last = self._last_intervals
+
+        if last is None or last.shape != x.shape:
+            idx = np.searchsorted(grid, x, side='left') - 1
+
+        else:
+            padded = np.concatenate(([-np.inf], grid, [np.inf]))
+            idx = last.copy()
+            miss = np.nonzero(~((padded[idx + 1] < x) & (x <= padded[idx + 2])))[0]
+
+            if len(miss) > 0:
+                # Try the neighboring intervals first.
+                ngrid = len(grid)
+                for step in (1, -1):
+                    trial = np.clip(idx[miss] + step, -1, ngrid - 1)
+                    x_miss = x[miss]
+                    found = (padded[trial + 1] < x_miss) & (x_miss <= padded[trial + 2])
+                    idx[miss[found]] = trial[found]
+                    miss = miss[~found]
+
+                idx[miss] = np.searchsorted(grid, x[miss], side='left') - 1
+
+        self._last_intervals = idx
+        return idx
+
+    def _bracket_vectorized(self, x):
+        """
+        Locate the interval of each of the new independents.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independent to interpolate.
+
+        Returns
+        -------
+        ndarray of int
+            Grid interval index that contains each x.
+        ndarray of int
+            Extrapolation flag for each x, -1 if the bracket is below the first table element, 1
+            if the bracket is above the last table element, 0 for normal interpolation.
+        """
+        grid = self.grid
+        x = x.real
+
+        idx = self._find_intervals(x)
+        idx = np.maximum(idx, 0)
+
+        extrap = np.zeros(idx.shape, dtype=int)
+        extrap[x < grid[0]] = -1
+        extrap[x > grid[-1]] = 1
+
+        return idx, extrap
+
+    def _get_stencil(self, x):
+        """
+        Return the indices of the table values needed to interpolate each point on this dimension.
+
+        This method must be defined by child classes that support vectorized evaluation.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independent to interpolate.
+
+        Returns
+        -------
+        ndarray of shape (n_points, n_stencil)
+            Grid indices needed by each point.
+        tuple of ndarray
+            Information needed by `_interpolate_stencil`. Each array must have a leading
+            dimension of n_points.
+        """
+        raise NotImplementedError()
+
+    def _interpolate_stencil(self, x, stencil_data, vals):
+        """
+        Compute the interpolated value over this grid dimension from the gathered values.
+
+        The default implementation applies the interpolation weights (and their derivatives with
+        respect to x) returned by `_get_stencil`, which covers the methods that are linear in the
+        table values.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independent to interpolate.
+        stencil_data : tuple of ndarray
+            Information computed by `_get_stencil`.
+        vals : ndarray of shape (..., n_points, n_lines, n_stencil)
+            Values at the stencil points, one set per line in the preceding dimensions.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to this independent.
+        ndarray
+            Derivative of interpolated values with respect to the stencil values.
+        """
+        weights, d_weights = stencil_data
+
+        return np.einsum('...ijk,ik->...ij', vals, weights), \
+            np.einsum('...ijk,ik->...ij', vals, d_weights), weights[:, np.newaxis, :]
+
+    def _interpolate_stencil_derivs(self, x, stencil_data, partials, d_vals):
+        """
+        Compute the derivatives of the interpolated value with respect to subsequent independents.
+
+        The default implementation applies the derivatives with respect to the stencil values
+        returned by `_interpolate_stencil`.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independent to interpolate.
+        stencil_data : tuple of ndarray
+            Information computed by `_get_stencil`.
+        partials : ndarray
+            Derivative of interpolated values with respect to the stencil values.
+        d_vals : ndarray of shape (n_deriv, ..., n_points, n_lines, n_stencil)
+            Derivatives of the values at the stencil points with respect to the independents of
+            the subsequent dimensions.
+
+        Returns
+        -------
+        ndarray of shape (n_deriv, ..., n_points, n_lines)
+            Derivatives of interpolated values with respect to the independents of the subsequent
+            dimensions.
+        """
+        return np.sum(d_vals * partials, axis=-1)
+
 
 class InterpAlgorithmFixed(object):
     """
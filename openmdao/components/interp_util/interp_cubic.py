@@ -31,6 +31,8 @@ class InterpCubic(InterpAlgorithm):
     ----------
     second_derivs : ndarray
         Cache of all second derivatives for the leaf table only.
+    _sec_deriv_weights : ndarray or None
+        Cache of the matrix that maps the values on this dimension to their second derivatives.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
@@ -39,8 +41,10 @@ class InterpCubic(InterpAlgorithm):
         """
         super().__init__(grid, values, interp)
         self.second_derivs = None
+        self._sec_deriv_weights = None
         self.k = 4
         self._name = 'cubic'
+        self._supports_stencil = True
 
     def compute_coeffs(self, grid, values, x):
         """
@@ -199,3 +203,56 @@ class InterpCubic(InterpAlgorithm):
              (3.0 * a * a - 1) * sec_deriv[..., idx]) * (step * fact)
 
         return val, deriv, None, None
+
+    def _get_stencil(self, x):
+        """
+        Return the indices and weights of the table values needed to interpolate each point.
+
+        The spline depends on every value in this dimension, but it is linear in them, so the
+        weights can be formed from the matrix that maps values to second derivatives.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independent to interpolate.
+
+        Returns
+        -------
+        ndarray of shape (n_points, n_stencil)
+            Grid indices needed by each point.
+        tuple of ndarray
+            Interpolation weights for each stencil point and their derivatives with respect to x.
+        """
+        grid = self.grid
+        ngrid = len(grid)
+        n_points = len(x)
+
+        if self._sec_deriv_weights is None:
+            self._sec_deriv_weights = self.compute_coeffs(grid, np.eye(ngrid), grid).T
+        sec_deriv = self._sec_deriv_weights
+
+        idx, _ = self._bracket_vectorized(x)
+
+        # Extrapolate high
+        idx = np.minimum(idx, ngrid - 2)
+
+        step = grid[idx + 1] - grid[idx]
+        r_step = 1.0 / step
+        a = (grid[idx + 1] - x) * r_step
+        b = (x - grid[idx]) * r_step
+        fact = 1.0 / 6.0
+
+        weights = ((a * a * a - a) * (step * step * fact))[:, np.newaxis] * sec_deriv[idx] + \
+            ((b * b * b - b) * (step * step * fact))[:, np.newaxis] * sec_deriv[idx + 1]
+        d_weights = ((1.0 - 3.0 * a * a) * (step * fact))[:, np.newaxis] * sec_deriv[idx] + \
+            ((3.0 * b * b - 1.0) * (step * fact))[:, np.newaxis] * sec_deriv[idx + 1]
+
+        rows = np.arange(n_points)
+        weights[rows, idx] += a
+        weights[rows, idx + 1] += b
+        d_weights[rows, idx] -= r_step
+        d_weights[rows, idx + 1] += r_step
+
+        stencil = np.broadcast_to(np.arange(ngrid), (n_points, ngrid))
+
+        return stencil, (weights, d_weights)
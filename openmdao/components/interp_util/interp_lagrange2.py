@@ -32,6 +32,8 @@ class InterpLagrange2(InterpAlgorithm):
         super().__init__(grid, values, interp, **kwargs)
         self.k = 3
         self._name = 'lagrange2'
+        self._supports_stencil = True
+        self._poly_order = (2, 2)
 
     def interpolate(self, x, idx, slice_idx):
         """
@@ -126,6 +128,46 @@ class InterpLagrange2(InterpAlgorithm):
 
         return xx3 * (q1 * xx2 - q2 * xx1) + q3 * xx1 * xx2, derivs, None, None
 
+    def _get_stencil(self, x):
+        """
+        Return the indices and weights of the table values needed to interpolate each point.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independent to interpolate.
+
+        Returns
+        -------
+        ndarray of shape (n_points, n_stencil)
+            Grid indices needed by each point.
+        tuple of ndarray
+            Interpolation weights for each stencil point and their derivatives with respect to x.
+        """
+        grid = self.grid
+        idx, _ = self._bracket_vectorized(x)
+
+        # Extrapolate high
+        idx = np.minimum(idx, len(grid) - 3)
+
+        xx1 = x - grid[idx]
+        xx2 = x - grid[idx + 1]
+        xx3 = x - grid[idx + 2]
+
+        c12 = grid[idx] - grid[idx + 1]
+        c13 = grid[idx] - grid[idx + 2]
+        c23 = grid[idx + 1] - grid[idx + 2]
+
+        q1 = 1.0 / (c12 * c13)
+        q2 = 1.0 / (c12 * c23)
+        q3 = 1.0 / (c13 * c23)
+
+        stencil = idx[:, np.newaxis] + np.arange(3)
+        weights = np.column_stack((q1 * xx2 * xx3, -q2 * xx1 * xx3, q3 * xx1 * xx2))
+        d_weights = np.column_stack((q1 * (xx2 + xx3), -q2 * (xx1 + xx3), q3 * (xx1 + xx2)))
+
+        return stencil, (weights, d_weights)
+
 
 class InterpLagrange2Semi(InterpAlgorithmSemi):
     """
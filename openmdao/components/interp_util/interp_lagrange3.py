@@ -32,6 +32,7 @@ class InterpLagrange3(InterpAlgorithm):
         super().__init__(grid, values, interp, **kwargs)
         self.k = 4
         self._name = 'lagrange3'
+        self._supports_stencil = True
 
     def interpolate(self, x, idx, slice_idx):
         """
@@ -147,6 +148,126 @@ class InterpLagrange3(InterpAlgorithm):
         return xx4 * (xx3 * (q1 * xx2 - q2 * xx1) + q3 * xx1 * xx2) - q4 * xx1 * xx2 * xx3, \
             derivs, None, None
 
+    def _get_stencil(self, x):
+        """
+        Return the indices of the table values needed to interpolate each point.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independent to interpolate.
+
+        Returns
+        -------
+        ndarray of shape (n_points, n_stencil)
+            Grid indices needed by each point.
+        tuple of ndarray
+            Lagrange coefficients of each stencil point, distances from x to each stencil point,
+            and the stencil point locations.
+        """
+        grid = self.grid
+        idx, _ = self._bracket_vectorized(x)
+
+        # Shift if we don't have 2 points on each side.
+        idx = np.clip(idx, 1, len(grid) - 3)
+
+        p1 = grid[idx - 1]
+        p2 = grid[idx]
+        p3 = grid[idx + 1]
+        p4 = grid[idx + 2]
+
+        xx1 = x - p1
+        xx2 = x - p2
+        xx3 = x - p3
+        xx4 = x - p4
+
+        c12 = 1.0 / (p1 - p2)
+        c13 = 1.0 / (p1 - p3)
+        c14 = 1.0 / (p1 - p4)
+        c23 = 1.0 / (p2 - p3)
+        c24 = 1.0 / (p2 - p4)
+        c34 = 1.0 / (p3 - p4)
+
+        stencil = idx[:, np.newaxis] + np.arange(-1, 3)
+        coeffs = np.column_stack((c12 * c13 * c14, c12 * c23 * c24, c13 * c23 * c34,
+                                  c14 * c24 * c34))
+
+        return stencil, (coeffs, np.column_stack((xx1, xx2, xx3, xx4)),
+                         np.column_stack((p1, p2, p3, p4)))
+
+    def _interpolate_stencil(self, x, stencil_data, vals):
+        """
+        Compute the interpolated value over this grid dimension from the gathered values.
+
+        The terms are evaluated in the same order as in `interpolate`, so that both give the same
+        result to the last bit.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independent to interpolate.
+        stencil_data : tuple of ndarray
+            Information computed by `_get_stencil`.
+        vals : ndarray of shape (..., n_points, n_lines, n_stencil)
+            Values at the stencil points, one set per line in the preceding dimensions.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to this independent.
+        ndarray
+            Derivative of interpolated values with respect to the stencil values.
+        """
+        coeffs, xx, p = stencil_data
+        x = x[:, np.newaxis]
+        xx1, xx2, xx3, xx4 = [xx[:, i:i + 1] for i in range(4)]
+        p1, p2, p3, p4 = [p[:, i:i + 1] for i in range(4)]
+
+        q1, q2, q3, q4 = [vals[..., i] * coeffs[:, i:i + 1] for i in range(4)]
+
+        result = xx4 * (xx3 * (q1 * xx2 - q2 * xx1) + q3 * xx1 * xx2) - q4 * xx1 * xx2 * xx3
+
+        d_dx = q1 * (x * (3.0 * x - 2.0 * (p4 + p3 + p2)) + p4 * (p2 + p3) + p2 * p3) - \
+            q2 * (x * (3.0 * x - 2.0 * (p4 + p3 + p1)) + p4 * (p1 + p3) + p1 * p3) + \
+            q3 * (x * (3.0 * x - 2.0 * (p4 + p2 + p1)) + p4 * (p2 + p1) + p2 * p1) - \
+            q4 * (x * (3.0 * x - 2.0 * (p3 + p2 + p1)) + p1 * (p2 + p3) + p2 * p3)
+
+        weights = coeffs * np.column_stack((xx2 * xx3 * xx4, -xx1 * xx3 * xx4,
+                                            xx1 * xx2 * xx4, -xx1 * xx2 * xx3))
+
+        return result, d_dx, weights[:, np.newaxis, :]
+
+    def _interpolate_stencil_derivs(self, x, stencil_data, partials, d_vals):
+        """
+        Compute the derivatives of the interpolated value with respect to subsequent independents.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independent to interpolate.
+        stencil_data : tuple of ndarray
+            Information computed by `_get_stencil`.
+        partials : ndarray
+            Derivative of interpolated values with respect to the stencil values.
+        d_vals : ndarray of shape (n_deriv, ..., n_points, n_lines, 4)
+            Derivatives of the values at the stencil points with respect to the independents of
+            the subsequent dimensions.
+
+        Returns
+        -------
+        ndarray of shape (n_deriv, ..., n_points, n_lines)
+            Derivatives of interpolated values with respect to the independents of the subsequent
+            dimensions.
+        """
+        coeffs, xx, _ = stencil_data
+        xx1, xx2, xx3, xx4 = [xx[:, i:i + 1] for i in range(4)]
+
+        dq1, dq2, dq3, dq4 = [d_vals[..., i] * coeffs[:, i:i + 1] for i in range(4)]
+
+        return xx4 * (xx3 * (dq1 * xx2 - dq2 * xx1) + dq3 * xx1 * xx2) - dq4 * xx1 * xx2 * xx3
+
 
 class InterpLagrange3Semi(InterpAlgorithmSemi):
     """
@@ -32,6 +32,8 @@ class InterpLinear(InterpAlgorithm):
         super().__init__(grid, values, interp, **kwargs)
         self.k = 2
         self._name = 'slinear'
+        self._supports_stencil = True
+        self._poly_order = (1, 1)
 
     def interpolate(self, x, idx, slice_idx):
         """
@@ -102,6 +104,37 @@ class InterpLinear(InterpAlgorithm):
             return values[..., idx] + (x - grid[idx]) * slope, slope[..., None], \
                 None, None
 
+    def _get_stencil(self, x):
+        """
+        Return the indices and weights of the table values needed to interpolate each point.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independent to interpolate.
+
+        Returns
+        -------
+        ndarray of shape (n_points, n_stencil)
+            Grid indices needed by each point.
+        tuple of ndarray
+            Interpolation weights for each stencil point and their derivatives with respect to x.
+        """
+        grid = self.grid
+        idx, _ = self._bracket_vectorized(x)
+
+        # Extrapolate high
+        idx = np.minimum(idx, len(grid) - 2)
+
+        h = 1.0 / (grid[idx + 1] - grid[idx])
+        t = (x - grid[idx]) * h
+
+        stencil = np.column_stack((idx, idx + 1))
+        weights = np.column_stack((1.0 - t, t))
+        d_weights = np.column_stack((-h, h))
+
+        return stencil, (weights, d_weights)
+
 
 class InterpLinearSemi(InterpAlgorithmSemi):
     """
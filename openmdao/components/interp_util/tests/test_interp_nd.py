@@ -929,6 +929,91 @@ class TestInterpNDPython(unittest.TestCase):
             derivs = force_check_partials(prob, method='fd', out_stream=None)
             assert_check_partials(derivs, atol=1e-3, rtol=1e-4)
 
+    def test_vectorized_matches_scalar(self):
+        # The stencil evaluation over all points must match the per-point evaluation.
+        rng = np.random.default_rng(11)
+        grid = (np.sort(rng.uniform(0, 10, 5)), np.sort(rng.uniform(-1, 1, 7)),
+                np.sort(rng.uniform(2, 3, 4)))
+        values = rng.normal(size=(5, 7, 4))
+
+        lower = np.array([g[0] for g in grid]) - 0.5
+        upper = np.array([g[-1] for g in grid]) + 0.5
+        x = rng.uniform(lower, upper, size=(40, 3))
+
+        for method in ['slinear', 'lagrange2', 'lagrange3', 'cubic', 'akima']:
+            with self.subTest(method=method):
+                interp = InterpND(method=method, points=grid, values=values, extrapolate=True)
+                self.assertTrue(interp.table.vectorized(x))
+                f, df_dx = interp.interpolate(x, compute_derivative=True)
+
+                interp = InterpND(method=method, points=grid, values=values, extrapolate=True)
+                interp.table._supports_stencil = False
+                f_pt, df_dx_pt = interp.interpolate(x, compute_derivative=True)
+
+                assert_near_equal(f, f_pt, 1e-12)
+                assert_near_equal(df_dx, df_dx_pt, 1e-12)
+
+                # Training data gradients
+                interp = InterpND(method=method, points=grid, values=values, extrapolate=True)
+                interp._compute_d_dvalues = True
+                interp._interpolate(x)
+                d_dvalues = interp._d_dvalues.reshape((40, -1))
+
+                delta = 1e-6
+                fd = np.empty(d_dvalues.shape)
+                for j in range(values.size):
+                    dvals = np.zeros(values.size)
+                    dvals[j] = delta
+                    dvals = dvals.reshape(values.shape)
+                    interp = InterpND(method=method, points=grid, values=values + dvals,
+                                      extrapolate=True)
+                    f_plus = interp.interpolate(x)
+                    interp = InterpND(method=method, points=grid, values=values - dvals,
+                                      extrapolate=True)
+                    fd[:, j] = (f_plus - interp.interpolate(x)) / (2.0 * delta)
+
+                assert_near_equal(d_dvalues, fd, 1e-6)
+
+    def test_vectorized_reuse(self):
+        # Cell coefficients and grid intervals cached from earlier calls must give the same
+        # results as a fresh evaluation when the points move.
+        rng = np.random.default_rng(12)
+        grid = (np.sort(rng.uniform(0, 10, 6)), np.sort(rng.uniform(-1, 1, 8)))
+        values = rng.normal(size=(6, 8))
+
+        lower = np.array([g[0] for g in grid]) - 0.5
+        upper = np.array([g[-1] for g in grid]) + 0.5
+        x = rng.uniform(lower, upper, size=(50, 2))
+        steps = [np.zeros((50, 2)), np.full((50, 2), 1e-3), np.full((50, 2), 0.3),
+                 rng.uniform(-2.0, 2.0, size=(50, 2))]
+
+        for method in ['slinear', 'lagrange2', 'lagrange3', 'cubic', 'akima']:
+            with self.subTest(method=method):
+                interp = InterpND(method=method, points=grid, values=values, extrapolate=True)
+                ref = InterpND(method=method, points=grid, values=values, extrapolate=True)
+                ref.table._supports_stencil = False
+
+                coeffs = None
+                for step in steps:
+                    x += step
+                    f, df_dx = interp.interpolate(x, compute_derivative=True)
+                    f_ref, df_dx_ref = ref.interpolate(x, compute_derivative=True)
+
+                    assert_near_equal(f, f_ref, 1e-12)
+                    assert_near_equal(df_dx, df_dx_ref, 1e-12)
+
+                    if coeffs is None:
+                        coeffs = interp.table._cell_coeffs[0]
+                    self.assertIs(interp.table._cell_coeffs[0], coeffs)
+
+                # setting the table again after editing it in place gives new coefficients
+                interp.values[...] *= 2.0
+                interp.table.values = interp.values
+                f, df_dx = interp.interpolate(x, compute_derivative=True)
+                assert_near_equal(f, 2.0 * f_ref, 1e-12)
+                assert_near_equal(df_dx, 2.0 * df_dx_ref, 1e-12)
+                self.assertIsNot(interp.table._cell_coeffs[0], coeffs)
+
 
 class TestInterpNDFixedPython(unittest.TestCase):
     """Tests for efficient fixed-grid interpolation."""
@@ -1299,6 +1384,12 @@ class TestInterpNDFixedPython(unittest.TestCase):
         assert_near_equal(f, f_base, 1e-11)
         assert_near_equal(df_dx, df_dx_base, 3e-11)
 
+        # The single points are compared with the per-point general evaluation. The vectorized
+        # one evaluates the last dimension from cell polynomials, which round differently.
+        interp_base = InterpND(points=(p1, p2, p3), values=f_p, method='lagrange3', extrapolate=True)
+        interp_base.table._supports_stencil = False
+        f_base, df_dx_base = interp_base.interpolate(x, compute_derivative=True)
+
         # Test non-vectorized.
         for j, x_i in enumerate(x):
             interp = InterpND(points=(p1, p2, p3), values=f_p, method='3D-lagrange3', extrapolate=True)
@@ -107,6 +107,13 @@ class MetaModelUnStructuredComp(ExplicitComponent):
         self.options.declare('vec_size', types=int, default=1, lower=1,
                              desc='Number of points that will be simultaneously predicted by '
                                   'the surrogate.')
+        self.options.declare('incremental_training', types=bool, default=False,
+                             desc='If True, when the training data only appends points to the '
+                                  'data a surrogate was last trained on, call the surrogate\'s '
+                                  'update method with the new points instead of training it '
+                                  'again. Updated surrogates may differ from retrained ones; '
+                                  'KrigingSurrogate, for example, keeps its hyperparameters and '
+                                  'data normalization from the last full training.')
 
     def add_input(self, name, val=1.0, training_data=None, **kwargs):
         """
@@ -358,6 +365,11 @@ class MetaModelUnStructuredComp(ExplicitComponent):
         for name, shape in self._surrogate_output_names:
             surrogate = self._metadata(name).get('surrogate')
 
+            if isinstance(shape, tuple):
+                output_shape = (vec_size, ) + shape
+            else:
+                output_shape = (vec_size, )
+
             if vec_size == 1:
                 # Non vectorized.
                 predicted = surrogate.predict(flat_inputs)
@@ -368,19 +380,14 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
             elif overrides_method('vectorized_predict', surrogate, SurrogateModel):
                 # Vectorized; surrogate provides vectorized computation.
-                # TODO: This code is untested because no surrogates provide this option.
-                predicted = surrogate.vectorized_predict(flat_inputs.flat)
+                predicted = surrogate.vectorized_predict(flat_inputs)
                 if isinstance(predicted, tuple):  # rmse option
                     self._metadata(name)['rmse'] = predicted[1]
                     predicted = predicted[0]
-                outputs[name] = np.reshape(predicted, shape)
+                outputs[name] = np.reshape(predicted, output_shape)
 
             else:
                 # Vectorized; must call surrogate multiple times.
-                if isinstance(shape, tuple):
-                    output_shape = (vec_size, ) + shape
-                else:
-                    output_shape = (vec_size, )
                 predicted = np.zeros(output_shape, dtype=flat_inputs.dtype)
                 rmse = self._metadata(name)['rmse'] = []
                 for i in range(vec_size):
@@ -433,12 +440,10 @@ class MetaModelUnStructuredComp(ExplicitComponent):
         vec_size = self.options['vec_size']
         arr = np.zeros((vec_size, self._input_size), dtype=vec.asarray().dtype)
 
-        vecvals = [(vec[n], sz) for n, sz in self._surrogate_input_names]
-        for row in range(vec_size):
-            idx = 0
-            for val, sz in vecvals:
-                arr[row][idx:idx + sz] = val[row].flat
-                idx += sz
+        idx = 0
+        for name, sz in self._surrogate_input_names:
+            arr[:, idx:idx + sz] = vec[name].reshape((vec_size, sz))
+            idx += sz
 
         return arr
 
@@ -515,7 +520,15 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
         for out_name, out_shape in self._surrogate_output_names:
             surrogate = self._metadata(out_name).get('surrogate')
-            if vec_size > 1:
+            if vec_size > 1 and overrides_method('vectorized_linearize', surrogate,
+                                                 SurrogateModel):
+                derivs = surrogate.vectorized_linearize(flat_inputs)
+                idx = 0
+                for in_name, sz in self._surrogate_input_names:
+                    partials[out_name, in_name] = derivs[:, :, idx:idx + sz].ravel()
+                    idx += sz
+
+            elif vec_size > 1:
                 out_size = shape_to_len(out_shape)
                 for j in range(vec_size):
                     flat_input = flat_inputs[j]
@@ -560,6 +573,7 @@ class MetaModelUnStructuredComp(ExplicitComponent):
             raise RuntimeError(f"{self.msginfo}: The following training data sets must be "
                                f"provided as options: {missing_training_data}")
 
+        prev_inputs = self._training_input
         inputs = np.zeros((num_sample, self._input_size))
         self._training_input = inputs
 
@@ -576,10 +590,17 @@ class MetaModelUnStructuredComp(ExplicitComponent):
                     inputs[row_idx, idx:idx + sz] = v.flat
                 idx += sz
 
+        # If requested, surrogates that support incremental training only get the points that
+        # were appended since they were last trained.
+        num_prev = len(prev_inputs) if isinstance(prev_inputs, np.ndarray) else 0
+        appended = (self.options['incremental_training'] and 0 < num_prev < num_sample and
+                    np.array_equal(inputs[:num_prev], prev_inputs))
+
         # Assemble output data and train each output.
         for name, shape in self._surrogate_output_names:
             output_size = shape_to_len(shape)
 
+            prev_outputs = self._training_output.get(name)
             outputs = np.zeros((num_sample, output_size))
             self._training_output[name] = outputs
 
@@ -595,6 +616,10 @@ class MetaModelUnStructuredComp(ExplicitComponent):
             surrogate = self._metadata(name).get('surrogate')
             if surrogate is None:
                 raise RuntimeError(f"{self.msginfo}: No surrogate specified for output '{name}'")
+            elif (appended and surrogate.trained and prev_outputs is not None
+                  and np.array_equal(outputs[:num_prev], prev_outputs)
+                  and overrides_method('update', surrogate, SurrogateModel)):
+                surrogate.update(inputs[num_prev:], outputs[num_prev:])
             else:
                 surrogate.train(self._training_input,
                                 self._training_output[name])
@@ -1,7 +1,10 @@
 """Define the SubmodelComp class for evaluating OpenMDAO systems within components."""
 
+from collections import deque
 from itertools import chain
 
+import numpy as np
+
 from openmdao.core.constants import _SetupStatus
 from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.core.total_jac import _TotalJacInfo
@@ -97,6 +100,18 @@ class SubmodelComp(ExplicitComponent):
         Object that computes the total jacobian for the submodel.
     _do_opt : bool
         True if the submodel has an optimizer.
+    _warm_starts : deque
+        Inputs and submodel outputs of recent runs of the submodel, used to warm start new runs.
+    _last_inputs : ndarray or None
+        Inputs of the last run of the submodel.
+    _last_outputs : ndarray or None
+        Outputs of this component from the last run of the submodel.
+    _run_count : int
+        Number of runs of the submodel.
+    _totals : dict or None
+        Total derivatives of the submodel computed by the last call to compute_partials.
+    _totals_run_count : int or None
+        Value of _run_count when _totals were computed.
     """
 
     def __init__(self, problem, inputs=None, outputs=None, reports=False, **kwargs):
@@ -116,6 +131,7 @@ class SubmodelComp(ExplicitComponent):
         self._ins2sub_outs_idxs = None
         self._sub_outs_idxs = None
         self._zero_partials = set()
+        self._reset_run_cache()
 
         self._static_submodel_inputs = {
             name: (outer_name, {}) for name, outer_name in _io_namecheck_iter(inputs, 'input')
@@ -131,6 +147,26 @@ class SubmodelComp(ExplicitComponent):
         super()._declare_options()
         self.options.declare('do_coloring', types=bool, default=False,
                              desc='If True, attempt to compute a total coloring for the submodel.')
+        self.options.declare('skip_tol', types=float, default=None, allow_none=True, lower=0.,
+                             desc='If not None, the submodel is not rerun when no input has '
+                                  'changed by more than skip_tol * max(1, |input|) since its last '
+                                  'run, and the outputs and partials of that run are reused.')
+        self.options.declare('warm_start_cache_size', types=int, default=0, lower=0,
+                             desc='Number of recent submodel solutions that are kept to warm start '
+                                  'its solvers or driver. If greater than zero, each run starts '
+                                  'from the kept solution whose inputs are nearest to the new '
+                                  'inputs instead of from the solution of the last run.')
+
+    def _reset_run_cache(self):
+        """
+        Forget the results of previous runs of the submodel.
+        """
+        self._warm_starts = deque()
+        self._last_inputs = None
+        self._last_outputs = None
+        self._run_count = 0
+        self._totals = None
+        self._totals_run_count = None
 
     def _add_static_input(self, inner_prom_name_or_pattern, outer_name=None, **kwargs):
         self._static_submodel_inputs[inner_prom_name_or_pattern] = (outer_name, kwargs)
@@ -254,6 +290,7 @@ class SubmodelComp(ExplicitComponent):
         Perform some final setup and checks.
         """
         self._totjacinfo = None
+        self._reset_run_cache()
         p = self._subprob
 
         # make sure comm is correct or at least reasonable.  In cases
@@ -515,26 +552,80 @@ class SubmodelComp(ExplicitComponent):
             Unscaled, dimensional output variables read via outputs[key].
         """
         p = self._subprob
+        sub_outputs = p.model._outputs
+        ins = inputs.asarray()[self._ins_idxs()]
+
+        # results of complex step runs aren't kept
+        cache = not self.under_complex_step
+
+        if cache and self._is_unchanged(ins):
+            self._outputs.set_val(self._last_outputs)
+            return
+
+        if cache and self._warm_starts:
+            # start from the kept solution nearest to the new inputs
+            dist = np.array([np.sum((ins - old_ins) ** 2) for old_ins, _ in self._warm_starts])
+            if self.comm.size > 1:
+                dist = self.comm.allreduce(dist, op=MPI.SUM)
+            sub_outputs.set_val(self._warm_starts[np.argmin(dist)][1])
 
         # set our inputs into the submodel outputs. We don't set into the submodel inputs
         # because they are all connected to outputs which would overwrite our values when the
         # submodel runs. So the only inputs we allow from outside are those that are connected to
         # indep vars, which are outputs in the submodel that are not dependent on anything else.
-        p.model._outputs.set_val(inputs.asarray()[self._ins_idxs()], idxs=self._ins2sub_outs_idxs())
+        sub_outputs.set_val(ins, idxs=self._ins2sub_outs_idxs())
 
         if self._do_opt:
             p.run_driver()
         else:
             p.run_model()
 
+        self._run_count += 1
+
         # collect outputs from the submodel
         self._outputs.set_val(0.0)
-        self._outputs.set_val(p.model._outputs.asarray()[self._sub_outs_idxs()],
+        self._outputs.set_val(sub_outputs.asarray()[self._sub_outs_idxs()],
                               idxs=self._outs_idxs())
 
         if self.comm.size > 1:
             self._outputs.set_val(self.comm.allreduce(self._outputs.asarray(), op=MPI.SUM))
 
+        if cache:
+            self._last_inputs = ins.copy()
+            self._last_outputs = self._outputs.asarray().copy()
+
+            size = self.options['warm_start_cache_size']
+            if size > 0:
+                self._warm_starts.append((self._last_inputs, sub_outputs.asarray().copy()))
+                if len(self._warm_starts) > size:
+                    self._warm_starts.popleft()
+
+    def _is_unchanged(self, ins):
+        """
+        Return True if the inputs are within skip_tol of the inputs of the last run.
+
+        Parameters
+        ----------
+        ins : ndarray
+            Values of the inputs of this component.
+
+        Returns
+        -------
+        bool
+            True if the submodel doesn't need to be rerun.
+        """
+        tol = self.options['skip_tol']
+        if tol is None or self._last_inputs is None:
+            return False
+
+        last = self._last_inputs
+        unchanged = bool(np.all(np.abs(ins - last) <= tol * np.maximum(1., np.abs(last))))
+
+        if self.comm.size > 1:
+            unchanged = self.comm.allreduce(unchanged, op=MPI.LAND)
+
+        return unchanged
+
     def compute_partials(self, inputs, partials):
         """
         Update the partials object with updated partial derivatives.
@@ -551,9 +642,13 @@ class SubmodelComp(ExplicitComponent):
                                "an internal optimizer.")
 
         # we don't need to set our inputs into the submodel here because we've already done it
-        # in compute.
+        # in compute. If the submodel hasn't been rerun since the last call, its derivatives
+        # haven't changed either.
+        if self._totals_run_count != self._run_count or self._totals is None:
+            self._totals = self._totjacinfo.compute_totals()
+            self._totals_run_count = self._run_count
 
-        tots = self._totjacinfo.compute_totals()
+        tots = self._totals
         coloring = self._sub_coloring_info.coloring
 
         if coloring is None:
@@ -474,6 +474,70 @@ class TestExternalCodeCompFeature(unittest.TestCase):
         assert_near_equal(prob.get_val('p.x'), 6.66666667, 1e-6)
         assert_near_equal(prob.get_val('p.y'), -7.3333333, 1e-6)
 
+    def test_scratch_dir_fd_workers(self):
+        scratch_root = os.path.join(self.tempdir, 'scratch')
+        os.mkdir(scratch_root)
+
+        prob = om.Problem()
+        model = prob.model
+
+        # each FD column runs the external code concurrently in its own directory
+        model.add_subsystem('p', ParaboloidExternalCodeCompFD(
+            num_fd_workers=2, run_in_scratch_dir=True, scratch_root=scratch_root,
+            scratch_dir_files=['extcode_paraboloid.py']))
+
+        model.add_design_var('p.x')
+        model.add_design_var('p.y')
+        model.add_objective('p.f_xy')
+
+        prob.setup()
+
+        prob.set_val('p.x', 3.0)
+        prob.set_val('p.y', -4.0)
+
+        prob.run_model()
+        totals = prob.compute_totals()
+
+        assert_near_equal(prob.get_val('p.f_xy'), -15.0)
+        assert_near_equal(totals['p.f_xy', 'p.x'], [[-4.0]], 1e-5)
+        assert_near_equal(totals['p.f_xy', 'p.y'], [[3.0]], 1e-5)
+
+        # the files were only written in the scratch directories, which are removed
+        self.assertFalse(os.path.exists('paraboloid_input.dat'))
+        self.assertEqual(os.listdir(scratch_root), [])
+
+    def test_result_cache(self):
+        cache_dir = os.path.join(self.tempdir, 'cache')
+
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('p', ParaboloidExternalCodeComp(cache_dir=cache_dir,
+                                                                        cache_size=2))
+        prob.setup()
+
+        for x, expected in [(3.0, -15.0), (5.0, -19.0), (3.0, -15.0), (1.0, -3.0),
+                            (3.0, -15.0), (5.0, -19.0)]:
+            prob.set_val('p.x', x)
+            prob.set_val('p.y', -4.0)
+
+            # a cached result must come from the cache, not from a stale output file
+            if os.path.exists('paraboloid_output.dat'):
+                os.remove('paraboloid_output.dat')
+
+            prob.run_model()
+            assert_near_equal(prob.get_val('p.f_xy'), [expected], 1e-10)
+
+        # x=3 is restored from the cache twice, while the least recently used x=5 was
+        # evicted to make room for x=1 and had to be run again
+        self.assertEqual(comp.cache_hits, 2)
+        self.assertEqual(comp.cache_misses, 4)
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+        # a different command is a different result
+        comp.options['command'] += ' '
+        prob.run_model()
+        self.assertEqual(comp.cache_hits, 2)
+        self.assertEqual(comp.cache_misses, 5)
+
     def test_optimize_derivs(self):
 
         prob = om.Problem()
@@ -599,6 +599,105 @@ class MetaModelTestCase(unittest.TestCase):
                          1e-4)
         self.assertEqual(len(prob.model.trig._metadata('y')['rmse']), 3)
 
+    def test_vectorized_surrogates(self):
+        # Surrogates that predict and linearize all points at once.
+        size = 20
+        surrogates = {
+            'kriging': om.KrigingSurrogate(eval_rmse=True),
+            'response_surface': om.ResponseSurface(),
+            'nearest_neighbor': om.NearestNeighbor(interpolant_type='linear'),
+            'cokriging': om.MultiFiCoKrigingSurrogate(theta=np.array([2., 2.])),
+        }
+
+        mm = om.MetaModelUnStructuredComp(vec_size=size)
+        mm.add_input('x', np.zeros((size, 2)))
+        for name, surrogate in surrogates.items():
+            mm.add_output(name, np.zeros(size), surrogate=surrogate)
+
+        prob = om.Problem()
+        prob.model.add_subsystem('mm', mm)
+        prob.setup()
+
+        train_x = np.array([[a, b] for a in np.linspace(0, 2, 6) for b in np.linspace(-1, 1, 6)])
+        mm.options['train_x'] = train_x
+        for name in surrogates:
+            mm.options[f'train_{name}'] = np.sin(train_x[:, 0]) * train_x[:, 1] + train_x[:, 0]
+
+        x = np.column_stack((np.linspace(0.1, 1.9, size), np.linspace(-0.9, 0.9, size)))
+        prob.set_val('mm.x', x)
+        prob.run_model()
+
+        for name, surrogate in surrogates.items():
+            expected = [surrogate.predict(point) for point in x]
+            if name in ('kriging', 'cokriging'):
+                expected = [val[0] for val in expected]
+            assert_near_equal(prob.get_val(f'mm.{name}'), np.ravel(expected), 1e-10)
+
+        self.assertEqual(mm._metadata('kriging')['rmse'].shape, (size, 1))
+
+        data = force_check_partials(prob, method='fd', out_stream=None)
+        assert_check_partials(data, atol=1e-4, rtol=1e-4)
+
+    def test_incremental_training(self):
+        # Appending training points updates the surrogates instead of training them again, if
+        # incremental training is enabled.
+        calls = []
+
+        class CountingSurrogate(om.ResponseSurface):
+            def train(self, x, y):
+                calls.append(('train', len(x)))
+                super().train(x, y)
+
+            def update(self, x_new, y_new):
+                calls.append(('update', len(x_new)))
+                super().update(x_new, y_new)
+
+        mm = om.MetaModelUnStructuredComp(incremental_training=True)
+        mm.add_input('x', np.zeros(2))
+        mm.add_output('y', 0., surrogate=CountingSurrogate())
+
+        prob = om.Problem()
+        prob.model.add_subsystem('mm', mm)
+        prob.setup()
+
+        train_x = np.array([[a, b] for a in np.linspace(0, 2, 6) for b in np.linspace(-1, 1, 6)])
+        train_y = np.sin(train_x[:, 0]) * train_x[:, 1] + train_x[:, 0]
+
+        mm.options['train_x'] = train_x[:20]
+        mm.options['train_y'] = train_y[:20]
+        prob.set_val('mm.x', [0.5, 0.5])
+        prob.run_model()
+
+        mm.options['train_x'] = train_x
+        mm.options['train_y'] = train_y
+        mm.train = True
+        prob.run_model()
+
+        # changed points are trained from scratch
+        mm.options['train_y'] = 2. * train_y
+        mm.train = True
+        prob.run_model()
+
+        self.assertEqual(calls, [('train', 20), ('update', 16), ('train', 36)])
+
+        expected = om.ResponseSurface()
+        expected.train(train_x, 2. * train_y[:, np.newaxis])
+        assert_near_equal(prob.get_val('mm.y'), expected.predict(np.array([0.5, 0.5])), 1e-10)
+
+        # by default, appended points train the surrogate again
+        calls.clear()
+        mm.options['incremental_training'] = False
+        mm.options['train_x'] = train_x[:20]
+        mm.options['train_y'] = train_y[:20]
+        mm.train = True
+        prob.run_model()
+        mm.options['train_x'] = train_x
+        mm.options['train_y'] = train_y
+        mm.train = True
+        prob.run_model()
+
+        self.assertEqual(calls, [('train', 20), ('train', 36)])
+
     def test_derivatives_vectorized_multiD(self):
         vec_size = 5
 
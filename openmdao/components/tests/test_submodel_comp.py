@@ -696,6 +696,93 @@ class TestSubmodelOpt(unittest.TestCase):
                          "derivatives of a SubmodelComp with an internal optimizer.")
 
 
+class CountingComp(om.ExplicitComponent):
+    def setup(self):
+        self.add_input('a', 1.0)
+        self.add_output('b', 1.0)
+        self.declare_partials('b', 'a')
+        self.ncompute = self.npartials = 0
+
+    def compute(self, inputs, outputs):
+        self.ncompute += 1
+        outputs['b'] = inputs['a'] ** 2
+
+    def compute_partials(self, inputs, partials):
+        self.npartials += 1
+        partials['b', 'a'] = 2 * inputs['a']
+
+
+class TestSubmodelRunCache(unittest.TestCase):
+
+    def test_skip_unchanged(self):
+        subprob = om.Problem()
+        comp = subprob.model.add_subsystem('comp', CountingComp(), promotes=['*'])
+
+        p = om.Problem()
+        p.model.add_subsystem('sub', om.SubmodelComp(problem=subprob, inputs=['a'],
+                                                     outputs=['b'], skip_tol=1e-10))
+        p.setup()
+
+        p.set_val('sub.a', 3.0)
+        p.run_model()
+        p.run_model()
+        self.assertEqual(comp.ncompute, 1)
+        assert_near_equal(p.get_val('sub.b'), 9.0)
+
+        # repeated derivatives at the same point are only computed once
+        for _ in range(2):
+            totals = p.compute_totals('sub.b', 'sub.a')
+            assert_near_equal(totals['sub.b', 'sub.a'], [[6.0]])
+        self.assertEqual(comp.npartials, 1)
+
+        # a change within the tolerance is skipped, but not a larger one
+        p.set_val('sub.a', 3.0 + 1e-12)
+        p.run_model()
+        self.assertEqual(comp.ncompute, 1)
+
+        p.set_val('sub.a', 4.0)
+        p.run_model()
+        totals = p.compute_totals('sub.b', 'sub.a')
+        self.assertEqual(comp.ncompute, 2)
+        self.assertEqual(comp.npartials, 2)
+        assert_near_equal(p.get_val('sub.b'), 16.0)
+        assert_near_equal(totals['sub.b', 'sub.a'], [[8.0]])
+
+    def test_warm_start(self):
+
+        def run_cases(cache_size):
+            subprob = om.Problem()
+            model = subprob.model
+            model.add_subsystem('cube', om.ExecComp('y = x**3'), promotes=['*'])
+            bal = model.add_subsystem('balance', om.BalanceComp(), promotes=['*'])
+            bal.add_balance('x', val=1.0, lhs_name='y', rhs_name='a')
+            model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=100,
+                                                     atol=1e-12, rtol=1e-12, iprint=-1)
+            model.linear_solver = om.DirectSolver()
+
+            p = om.Problem()
+            p.model.add_subsystem('sub', om.SubmodelComp(problem=subprob, inputs=['a'],
+                                                         outputs=['x'],
+                                                         warm_start_cache_size=cache_size))
+            p.setup()
+
+            iters = []
+            for a in (2.0, 1000.0, 2.01):
+                p.set_val('sub.a', a)
+                p.run_model()
+                assert_near_equal(p.get_val('sub.x'), a ** (1. / 3.), 1e-10)
+                iters.append(model.nonlinear_solver._iter_count)
+
+            return iters
+
+        cold = run_cases(0)
+        warm = run_cases(2)
+
+        # the last case starts from the nearby first solution rather than the last one
+        self.assertEqual(warm[:2], cold[:2])
+        self.assertLess(warm[2], cold[2])
+
+
 def build_submodel(subsystem_name):
     p = om.Problem()
     supmodel = om.Group()
@@ -1,7 +1,10 @@
 """Define the Component class."""
 
+import os
 import sys
 import inspect
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from collections import defaultdict
 from collections.abc import Iterable
 from itertools import product, chain
@@ -12,6 +15,7 @@ import numpy as np
 from numpy import ndarray, isscalar, ndim, atleast_1d
 from scipy.sparse import issparse, coo_matrix, csr_matrix
 
+from openmdao.approximation_schemes.approximation_scheme import _init_pool_worker
 from openmdao.core.system import System, _supported_methods, _DEFAULT_COLORING_META, \
     global_meta_names, collect_errors, _iter_derivs
 from openmdao.core.constants import INT_DTYPE, _DEFAULT_OUT_STREAM, _SetupStatus
@@ -25,6 +29,7 @@ from openmdao.utils.deriv_display import _deriv_display, _deriv_display_compact
 from openmdao.utils.general_utils import format_as_float_or_array, ensure_compatible, \
     find_matches, make_set, inconsistent_across_procs, LocalRangeIterable
 from openmdao.utils.indexer import Indexer, indexer
+from openmdao.utils.concurrent_utils import _other_threads_alive
 import openmdao.utils.coloring as coloring_mod
 from openmdao.utils.om_warnings import issue_warning, MPIWarning, DistributedComponentWarning, \
     DerivativesWarning, warn_deprecation, OMInvalidCheckDerivativesOptionsWarning
@@ -71,11 +76,24 @@ class Component(System):
 
     Parameters
     ----------
+    num_fd_workers : int
+        If FD is active and the value is > 1, the number of local worker processes used to
+        evaluate finite difference columns concurrently. The workers are forked the first time
+        the partials are approximated and reused until the component is set up again or
+        cleaned up.
     **kwargs : dict of keyword arguments
         Available here and in all descendants of this system.
 
     Attributes
     ----------
+    _num_fd_workers : int
+        Number of local worker processes used to evaluate finite difference columns.
+    _fd_pool : tuple or None
+        The process id that forked the pool of finite difference workers, and the pool. The
+        workers are kept until the component is set up again or cleaned up.
+    _fd_pool_warned : bool
+        True if a warning has been issued that the finite difference workers could not be
+        forked.
     _var_rel2meta : dict
         Dictionary mapping relative names to metadata.
         This is only needed while adding inputs and outputs. During setup, these are used to
@@ -106,12 +124,15 @@ class Component(System):
         The original compute_primal method.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, num_fd_workers=1, **kwargs):
         """
         Initialize all attributes.
         """
         super().__init__(**kwargs)
 
+        self._num_fd_workers = num_fd_workers
+        self._fd_pool = None
+        self._fd_pool_warned = False
         self._var_rel_names = {'input': [], 'output': []}
         self._var_rel2meta = {}
 
@@ -202,6 +223,10 @@ class Component(System):
         """
         super()._setup_procs(pathname, comm, prob_meta)
 
+        # workers forked before this setup hold a stale copy of the component
+        self._shutdown_fd_pool()
+        self._fd_pool_warned = False
+
         if self._num_par_fd > 1:
             if comm.size > 1:
                 comm = self._setup_par_fd_procs(comm)
@@ -211,6 +236,19 @@ class Component(System):
                               prefix=self.msginfo, category=MPIWarning)
                 self._num_par_fd = 1
 
+        if self._num_fd_workers > 1:
+            if comm.size > 1:
+                issue_warning(f"num_fd_workers = {self._num_fd_workers} is not supported under "
+                              "MPI. Finite difference columns will be evaluated serially.",
+                              prefix=self.msginfo, category=DerivativesWarning)
+                self._num_fd_workers = 1
+            elif 'fork' not in multiprocessing.get_all_start_methods():
+                issue_warning(f"num_fd_workers = {self._num_fd_workers} requires the 'fork' "
+                              "process start method, which is not available on this platform. "
+                              "Finite difference columns will be evaluated serially.",
+                              prefix=self.msginfo, category=DerivativesWarning)
+                self._num_fd_workers = 1
+
         self.comm = comm
 
         # Clear out old variable information so that we can call setup on the component.
@@ -240,6 +278,67 @@ class Component(System):
 
         self._set_vector_class()
 
+    def _get_fd_pool(self, scheme):
+        """
+        Return the pool of worker processes used to evaluate finite difference columns.
+
+        The workers are forked the first time the pool is needed, so this component doesn't need
+        to be picklable, and are reused until the component is set up again or cleaned up.
+        Forking a process that has other live threads, like the writer thread of a SqliteRecorder
+        with async_write, can deadlock the workers, so no pool is forked while other threads are
+        running.
+
+        Parameters
+        ----------
+        scheme : FiniteDifference
+            The approximation scheme that evaluates the columns in the workers.
+
+        Returns
+        -------
+        ProcessPoolExecutor or None
+            The pool, or None if the columns must be evaluated serially.
+        """
+        if self._fd_pool is not None:
+            pid, pool = self._fd_pool
+            if pid == os.getpid():
+                return pool
+
+            # this process was forked from the one that owns the pool
+            self._fd_pool = None
+
+        if _other_threads_alive():
+            if not self._fd_pool_warned:
+                self._fd_pool_warned = True
+                issue_warning(f"num_fd_workers = {self._num_fd_workers} but other threads are "
+                              "running in this process, so no worker processes can be forked "
+                              "safely. Finite difference columns will be evaluated serially.",
+                              prefix=self.msginfo, category=DerivativesWarning)
+            return None
+
+        pool = ProcessPoolExecutor(max_workers=self._num_fd_workers,
+                                   mp_context=multiprocessing.get_context('fork'),
+                                   initializer=_init_pool_worker, initargs=(scheme, self))
+        self._fd_pool = (os.getpid(), pool)
+
+        return pool
+
+    def _shutdown_fd_pool(self):
+        """
+        Stop the worker processes used to evaluate finite difference columns, if any.
+        """
+        if self._fd_pool is not None:
+            pid, pool = self._fd_pool
+            self._fd_pool = None
+            if pid == os.getpid():
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    def cleanup(self):
+        """
+        Clean up resources prior to exit.
+        """
+        super().cleanup()
+        self._shutdown_fd_pool()
+
     def _set_vector_class(self):
         if self._has_distrib_vars:
             dist_vec_class = self._problem_meta['distributed_vector_class']
@@ -1,4 +1,6 @@
 """Define a base class for all Drivers in OpenMDAO."""
+from collections import OrderedDict
+from copy import deepcopy
 from fnmatch import fnmatchcase
 import functools
 from itertools import chain
@@ -191,6 +193,158 @@ class DriverResult():
         return _track_time
 
 
+class _EvalCache(object):
+    """
+    A bounded least-recently-used cache of results keyed on the exact design vector.
+
+    Drivers use it to avoid running the model, or computing total derivatives, again when the
+    optimizer returns to a design point it has already visited.
+
+    Parameters
+    ----------
+    size : int
+        Maximum number of design points to keep.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups that found a stored result.
+    _current : bytes or None
+        Key of the design point that the model was last run at.
+    _entries : OrderedDict
+        Stored results for each design point, ordered from least to most recently used.
+    _size : int
+        Maximum number of design points to keep.
+    """
+
+    def __init__(self, size):
+        """
+        Initialize the cache.
+        """
+        self.hits = 0
+        self._current = None
+        self._entries = OrderedDict()
+        self._size = size
+
+    def __len__(self):
+        """
+        Return the number of design points in the cache.
+
+        Returns
+        -------
+        int
+            Number of design points in the cache.
+        """
+        return len(self._entries)
+
+    @staticmethod
+    def _key(x):
+        """
+        Return the cache key for the given design point.
+
+        Parameters
+        ----------
+        x : ndarray or dict
+            Design vector, or dict of design variable values.
+
+        Returns
+        -------
+        bytes
+            Cache key.
+        """
+        if isinstance(x, dict):
+            x = [np.ravel(val) for val in x.values()]
+            x = np.concatenate(x) if x else np.zeros(0)
+        return np.ascontiguousarray(x, dtype=float).tobytes()
+
+    def get(self, x, kind):
+        """
+        Return a copy of the stored result of the given kind at a design point.
+
+        Parameters
+        ----------
+        x : ndarray or dict
+            Design vector, or dict of design variable values.
+        kind : str
+            Kind of result, e.g. 'values' or 'jac'.
+
+        Returns
+        -------
+        object or None
+            The stored result, or None if there isn't one.
+        """
+        key = self._key(x)
+        entry = self._entries.get(key)
+        if entry is None or kind not in entry:
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return deepcopy(entry[kind])
+
+    def store(self, x, kind, result):
+        """
+        Store a copy of a result of the given kind at a design point.
+
+        Parameters
+        ----------
+        x : ndarray or dict
+            Design vector, or dict of design variable values.
+        kind : str
+            Kind of result, e.g. 'values' or 'jac'.
+        result : object
+            The result to store.
+        """
+        key = self._key(x)
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        else:
+            entries[key] = {}
+            while len(entries) > self._size:
+                entries.popitem(last=False)
+
+        entries[key][kind] = deepcopy(result)
+
+    def discard(self, x):
+        """
+        Remove all results at a design point.
+
+        Parameters
+        ----------
+        x : ndarray or dict
+            Design vector, or dict of design variable values.
+        """
+        self._entries.pop(self._key(x), None)
+
+    def set_current(self, x):
+        """
+        Note that the model has just been run at a design point.
+
+        Parameters
+        ----------
+        x : ndarray or dict
+            Design vector, or dict of design variable values.
+        """
+        self._current = self._key(x)
+
+    def is_current(self, x):
+        """
+        Return True if the model was last run at the given design point.
+
+        Parameters
+        ----------
+        x : ndarray or dict
+            Design vector, or dict of design variable values.
+
+        Returns
+        -------
+        bool
+            True if the model was last run at the given design point.
+        """
+        return self._current == self._key(x)
+
+
 class Driver(object, metaclass=DriverMetaclass):
     """
     Top-level container for the systems and drivers.
@@ -265,6 +419,9 @@ class Driver(object, metaclass=DriverMetaclass):
         Variables to record based on recording options.
     _in_find_feasible : bool
         True if the driver is currently executing find_feasible.
+    _eval_cache : _EvalCache or None
+        Cache of results at design points that have already been evaluated, or None if the
+        driver doesn't cache them.
     """
 
     def __init__(self, **kwargs):
@@ -283,6 +440,7 @@ class Driver(object, metaclass=DriverMetaclass):
         self._lin_dvs = None
         self._nl_dvs = None
         self._in_find_feasible = False
+        self._eval_cache = None
 
         # Driver options
         self.options = OptionsDictionary(parent_name=type(self).__name__)
@@ -409,6 +567,47 @@ class Driver(object, metaclass=DriverMetaclass):
         """
         pass
 
+    def _setup_eval_cache(self):
+        """
+        Create an empty cache of evaluated design points if the 'eval_cache_size' option is set.
+
+        This is called at the start of a run by drivers that declare the option.
+        """
+        size = self.options['eval_cache_size']
+        self._eval_cache = _EvalCache(size) if size > 0 else None
+
+    def _get_recorded_iterations(self, filenames):
+        """
+        Return the iteration numbers of the cases recorded by this driver in case recorder files.
+
+        Parameters
+        ----------
+        filenames : str or PathLike or list
+            The case recorder file or files, e.g. one for each rank of a parallel run.
+
+        Returns
+        -------
+        set of int
+            Iteration numbers of the driver cases recorded under the current name of this driver.
+        """
+        from openmdao.recorders.case_reader import CaseReader
+
+        if isinstance(filenames, (str, os.PathLike)):
+            filenames = [filenames]
+
+        name = self._get_name()
+        iterations = set()
+
+        for filename in filenames:
+            cr = CaseReader(filename)
+            for case_name in cr.list_cases('driver', recurse=False, out_stream=None):
+                # case names look like 'rank0:DOEDriver_Uniform|3'
+                case_driver, _, iteration = case_name.split(':', 1)[-1].rpartition('|')
+                if case_driver == name:
+                    iterations.add(int(iteration))
+
+        return iterations
+
     def _setup_comm(self, comm):
         """
         Perform any driver-specific setup of communicators for the model.
@@ -1,6 +1,6 @@
 """Define the Group class."""
 import sys
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, OrderedDict
 from collections.abc import Iterable
 
 from itertools import product, chain
@@ -51,6 +51,9 @@ from openmdao.jacobians.jacobian import GroupJacobianUpdateContext
 import re
 namecheck_rgx = re.compile('[a-zA-Z][_a-zA-Z0-9]*')
 
+# maximum number of seed sets whose filtered linear transfers are cached in each group
+_RELEVANT_TRANSFER_CACHE_SIZE = 8
+
 
 # use a class with slots instead of a namedtuple so that we can
 # change index after creation if needed.
@@ -190,6 +193,10 @@ class Group(System):
         or subname can be None for the full, simultaneous transfer.
     _discrete_transfers : dict of discrete transfer metadata
         Key is system pathname or None for the full, simultaneous transfer.
+    _relevant_transfers : OrderedDict
+        LRU cache that maps the active (fwd, rev) seeds to their variable relevance array, the
+        mask of relevant entries in the input vector, and the linear transfers filtered by that
+        mask.
     _setup_procs_finished : bool
         Flag to check if setup_procs is complete
     _contains_parallel_group : bool
@@ -250,6 +257,7 @@ class Group(System):
         self._conn_discrete_in2out = {}
         self._transfers = {}
         self._discrete_transfers = {}
+        self._relevant_transfers = OrderedDict()
         self._setup_procs_finished = False
         self._contains_parallel_group = False
         self._order_set = False
@@ -3278,6 +3286,9 @@ class Group(System):
 
         vec_inputs = self._vectors['input'][vec_name]
 
+        if vec_name == 'linear' and xfer is not None:
+            xfer = self._get_relevant_transfer(xfer, mode, sub)
+
         if mode == 'fwd':
             if xfer is not None:
                 if xfer._has_input_scaling:
@@ -3300,12 +3311,66 @@ class Group(System):
                 if self._problem_meta['parallel_deriv_color'] is None:
                     key = (sub, '@nocolor')
                     if key in self._transfers['rev']:
-                        xfer = self._transfers['rev'][key]
+                        xfer = self._get_relevant_transfer(self._transfers['rev'][key], mode, key)
                         xfer._transfer(vec_inputs, self._vectors['output'][vec_name], mode)
 
                 if xfer._has_input_scaling:
                     vec_inputs.scale_to_phys(mode='rev')
 
+    def _get_relevant_transfer(self, xfer, mode, sub):
+        """
+        Return the part of a linear transfer that is relevant to the active seeds.
+
+        Parameters
+        ----------
+        xfer : <Transfer>
+            The full transfer.
+        mode : str
+            Either 'fwd' or 'rev'
+        sub : None or str or tuple
+            The key of the transfer in the transfers for the given mode.
+
+        Returns
+        -------
+        <Transfer>
+            The filtered transfer, or the full transfer if relevance isn't active.
+        """
+        relevance = self._relevance
+        rel_array = relevance._current_rel_varray
+        if not relevance._active or rel_array is None:
+            return xfer
+
+        cache = self._relevant_transfers
+        key = (relevance._seed_vars['fwd'], relevance._seed_vars['rev'])
+        entry = cache.get(key)
+
+        if entry is not None and entry[0] is rel_array:
+            cache.move_to_end(key)
+            _, in_mask, xfers = entry
+        else:
+            in_vec = self._vectors['input']['linear']
+            var2idx = relevance._var2idx
+            in_mask = np.ones(len(in_vec), dtype=bool)
+            for name, vinfo in in_vec._views.items():
+                if name in var2idx and not rel_array[var2idx[name]]:
+                    start, end = vinfo.range
+                    in_mask[start:end] = False
+
+            xfers = {}
+            cache[key] = (rel_array, in_mask, xfers)
+            cache.move_to_end(key)
+            if len(cache) > _RELEVANT_TRANSFER_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        try:
+            return xfers[mode, sub]
+        except KeyError:
+            pass
+
+        xfers[mode, sub] = rel_xfer = xfer._relevant_subset(in_mask)
+
+        return rel_xfer
+
     def _discrete_transfer(self, sub):
         """
         Transfer discrete variables between components.  This only occurs in fwd mode.
@@ -3372,6 +3437,7 @@ class Group(System):
         for subsys in self._subgroups_myproc:
             subsys._setup_transfers()
 
+        self._relevant_transfers = OrderedDict()
         self._vector_class.TRANSFER._setup_transfers(self)
         if self._conn_discrete_in2out:
             self._vector_class.TRANSFER._setup_discrete_transfers(self)
@@ -1,4 +1,5 @@
 """ Testing for group finite differencing."""
+import threading
 import time
 import unittest
 from io import StringIO
@@ -19,7 +20,7 @@ from openmdao.test_suite.components.unit_conv import SrcComp, TgtCompC, TgtCompF
 from openmdao.test_suite.groups.parallel_groups import FanInSubbedIDVC
 from openmdao.test_suite.parametric_suite import parametric_suite
 from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials, \
-    assert_check_totals, assert_warnings
+    assert_check_totals, assert_warnings, assert_warning
 from openmdao.utils.general_utils import set_pyoptsparse_opt
 from openmdao.utils.mpi import MPI
 from openmdao.utils.rich_utils import strip_formatting
@@ -2095,6 +2096,123 @@ class TestComponentRelevance(unittest.TestCase):
         self.assertEqual(comp.n_execs - count, 0)
 
 
+class PoolFDComp(om.ExplicitComponent):
+    def initialize(self):
+        self.options.declare('n', types=int, default=6)
+        self.options.declare('coloring', types=bool, default=False)
+
+    def setup(self):
+        n = self.options['n']
+        self.add_input('x', np.arange(n, dtype=float) + 1.)
+        self.add_input('y', 2.0)
+        self.add_output('f', np.zeros(n))
+        self.add_output('g', 0.0)
+
+        self.ncompute = 0
+
+        if self.options['coloring']:
+            self.declare_partials('*', '*', method='fd')
+            self.declare_coloring(wrt='*', method='fd')
+        else:
+            self.declare_partials('*', '*', method='fd', form='central')
+
+    def compute(self, inputs, outputs):
+        self.ncompute += 1
+        outputs['f'] = inputs['x'] ** 2 * inputs['y']
+        outputs['g'] = np.sin(inputs['x'][0]) + inputs['y'] ** 3
+
+
+class TestComponentFDPool(unittest.TestCase):
+
+    def run_partials(self, num_fd_workers, coloring=False):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', PoolFDComp(coloring=coloring,
+                                                           num_fd_workers=num_fd_workers))
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+
+        # the first linearization computes the coloring, if any
+        prob.model.run_linearize()
+        ncompute = comp.ncompute
+        prob.model.run_linearize()
+        subjacs = {key: np.array(comp._jacobian[key]) for key in
+                   [('comp.f', 'comp.x'), ('comp.f', 'comp.y'), ('comp.g', 'comp.x'),
+                    ('comp.g', 'comp.y')]}
+
+        return prob, comp, subjacs, comp.ncompute - ncompute
+
+    def test_matches_serial(self):
+        for coloring in (False, True):
+            with self.subTest(coloring=coloring):
+                _, _, expected, nserial = self.run_partials(1, coloring)
+                prob, comp, subjacs, npool = self.run_partials(3, coloring)
+
+                # the columns were evaluated by the workers
+                self.assertTrue(nserial > 0)
+                self.assertEqual(npool, 0)
+                if coloring:
+                    self.assertTrue(comp._approx_schemes['fd']._colored_approx_groups)
+
+                for key, subjac in expected.items():
+                    assert_near_equal(subjacs[key], subjac, 1e-12)
+
+                # the workers see the new evaluation point
+                x = np.linspace(-1., 1., 6)
+                prob.set_val('comp.x', x)
+                prob.run_model()
+                prob.model.run_linearize()
+                assert_near_equal(np.diag(comp._jacobian['comp.f', 'comp.x']), 4. * x, 1e-5)
+
+                data = prob.check_partials(method='cs', out_stream=None)
+                assert_check_partials(data, atol=1e-5, rtol=1e-5)
+
+    def test_pool_reused(self):
+        prob, comp, _, _ = self.run_partials(3)
+
+        _, pool = comp._fd_pool
+        pids = set(pool._processes)
+        self.assertEqual(len(pids), 3)
+
+        # the same workers evaluate the columns at the next point
+        prob.set_val('comp.y', 3.0)
+        prob.run_model()
+        prob.model.run_linearize()
+        self.assertIs(comp._fd_pool[1], pool)
+        self.assertEqual(set(pool._processes), pids)
+        assert_near_equal(np.diag(comp._jacobian['comp.f', 'comp.x']),
+                          6. * (np.arange(6) + 1.), 1e-5)
+
+        # setting up again forks new workers
+        prob.setup()
+        self.assertIsNone(comp._fd_pool)
+        prob.run_model()
+        prob.model.run_linearize()
+        self.assertIsNot(comp._fd_pool[1], pool)
+
+        prob.cleanup()
+        self.assertIsNone(comp._fd_pool)
+
+    def test_serial_with_live_thread(self):
+        # workers are not forked while another thread, like an async recorder writer, is alive
+        stop = threading.Event()
+        thread = threading.Thread(target=stop.wait)
+        thread.start()
+        try:
+            with assert_warning(om.DerivativesWarning,
+                                "'comp' <class PoolFDComp>: num_fd_workers = 3 but other threads "
+                                "are running in this process, so no worker processes can be "
+                                "forked safely. Finite difference columns will be evaluated "
+                                "serially."):
+                _, comp, subjacs, nserial = self.run_partials(3)
+        finally:
+            stop.set()
+            thread.join()
+
+        self.assertIsNone(comp._fd_pool)
+        self.assertTrue(nserial > 0)
+        assert_near_equal(np.diag(subjacs['comp.f', 'comp.x']), 4. * (np.arange(6) + 1.), 1e-5)
+
+
 class ApproxTotalsFeature(unittest.TestCase):
 
     def test_basic(self):
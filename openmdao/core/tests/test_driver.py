@@ -9,7 +9,7 @@ import unittest
 import numpy as np
 
 import openmdao.api as om
-from openmdao.core.driver import Driver
+from openmdao.core.driver import Driver, _EvalCache
 from openmdao.utils.units import convert_units
 from openmdao.utils.assert_utils import assert_near_equal, assert_warnings, assert_check_totals, assert_no_warning
 from openmdao.utils.general_utils import printoptions, set_pyoptsparse_opt
@@ -893,6 +893,41 @@ class TestDriver(unittest.TestCase):
 
         self.assertEqual(str(cm.exception), 'Problem has no design variables.')
 
+    def test_eval_cache(self):
+        cache = _EvalCache(2)
+
+        x1 = np.array([1., 2.])
+        x2 = np.array([3., 4.])
+        x3 = np.array([5., 6.])
+
+        cache.store(x1, 'values', {'f': np.array([1.])})
+        cache.store(x2, 'values', {'f': np.array([2.])})
+        cache.store(x2, 'jac', np.ones((1, 2)))
+
+        # results are copies, keyed on the exact design vector
+        val = cache.get(x1.copy(), 'values')
+        assert_near_equal(val['f'], 1.)
+        val['f'][:] = 0.
+        assert_near_equal(cache.get(x1, 'values')['f'], 1.)
+        self.assertIsNone(cache.get(x1, 'jac'))
+        self.assertIsNone(cache.get(x1 + 1e-15, 'values'))
+        self.assertEqual(cache.hits, 2)
+
+        # x2 is now the least recently used point, so it is dropped
+        cache.store(x3, 'values', {'f': np.array([3.])})
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(x2, 'jac'))
+        assert_near_equal(cache.get(x1, 'values')['f'], 1.)
+        assert_near_equal(cache.get(x3, 'values')['f'], 3.)
+
+        cache.discard(x3)
+        self.assertIsNone(cache.get(x3, 'values'))
+
+        # dicts of design variable values can be used as keys too
+        cache.set_current({'a': x1, 'b': 3.})
+        self.assertTrue(cache.is_current({'a': np.array([1., 2.]), 'b': np.array([3.])}))
+        self.assertFalse(cache.is_current(x1))
+
 
 @use_tempdirs
 class TestCheckRelevance(unittest.TestCase):
@@ -90,6 +90,8 @@ class _TotalJacInfo(object):
         Dict of relevance dictionaries for each var of interest.
     add_coloring_noise : bool
         If True, add noise to the seed during coloring (sparsity) generation.
+    _batch_plans : dict
+        Cache of index arrays, keyed by mode, used when solving for multiple seeds at once.
     """
 
     def __init__(self, problem, of, wrt, return_format, approx=False,
@@ -148,6 +150,7 @@ class _TotalJacInfo(object):
         self.directional = directional
         self.initialize = True
         self.approx = approx
+        self._batch_plans = {}
         self.coloring_info = coloring_info
         self.nsolves = 0
         self.add_coloring_noise = problem._metadata['randomize_seeds']
@@ -1420,6 +1423,11 @@ class _TotalJacInfo(object):
 
                 # Main loop over columns (fwd) or rows (rev) of the jacobian
                 for mode in self.modes:
+                    batch_size = self._get_rhs_batch_size(mode)
+                    if batch_size != 1:
+                        self._compute_totals_batched(mode, batch_size)
+                        continue
+
                     fwd = mode == 'fwd'
                     for key, idx_info in self.idx_iter_dict[mode].items():
                         imeta, idx_iter = idx_info
@@ -1502,6 +1510,186 @@ class _TotalJacInfo(object):
 
         return self.J_final
 
+    def _get_rhs_batch_size(self, mode):
+        """
+        Return the number of seeds to solve for in each call to the model linear solver.
+
+        Parameters
+        ----------
+        mode : str
+            Direction of derivative solution.
+
+        Returns
+        -------
+        int
+            Max number of seeds per linear solve. 1 means no batching, and 0 means that all seeds
+            are solved for in a single call.
+        """
+        model = self.model
+        batch_size = model._linear_solver._rhs_batch_size()
+
+        if batch_size == 1:
+            return 1
+
+        # batching is only supported for a serial solve with the top level linear solver
+        if (self.comm.size > 1 or self.directional or self.debug_print or
+                model._owns_approx_jac or model.under_complex_step):
+            return 1
+
+        # linear solution caching requires a solve for each seed
+        if not self.has_lin_cons and self.mode == mode:
+            if any(tup[0] for tup in self.in_idx_map[mode]):
+                return 1
+
+        for _, idx_iter in self.idx_iter_dict[mode].values():
+            if idx_iter != self.single_index_iter and idx_iter != self.simul_coloring_iter:
+                return 1
+
+        return batch_size
+
+    def _get_batch_plan(self, mode):
+        """
+        Return the index arrays needed to solve for all seeds of the given mode in batches.
+
+        Each seed (single index or color) corresponds to a single right-hand side.
+
+        Parameters
+        ----------
+        mode : str
+            Direction of derivative solution.
+
+        Returns
+        -------
+        dict
+            Dict containing the number of right-hand sides along with arrays that map seed
+            values into the right-hand sides and solutions into the total jacobian.  All
+            arrays are sorted by right-hand side index.
+        """
+        if mode in self._batch_plans:
+            return self._batch_plans[mode]
+
+        loc_idxs = self.in_loc_idxs[mode]
+        seeds = self.seeds[mode]
+
+        seed_rhs = []
+        seed_locs = []
+        seed_vals = []
+        single_rhs = []
+        single_jac = []
+        color_rhs = []
+        color_sol = []
+        color_jac = []
+        nrhs = 0
+
+        for imeta, idx_iter in self.idx_iter_dict[mode].values():
+            if idx_iter == self.single_index_iter:
+                idxs = np.asarray(imeta['idx_list'], dtype=INT_DTYPE)
+                rhs = np.arange(nrhs, nrhs + idxs.size, dtype=INT_DTYPE)
+                seed_rhs.append(rhs)
+                seed_locs.append(loc_idxs[idxs])
+                seed_vals.append(seeds[idxs])
+                single_rhs.append(rhs)
+                single_jac.append(idxs)
+                nrhs += idxs.size
+            else:  # simul coloring
+                row_col_map = imeta['coloring'].get_row_col_map(mode)
+                for ilist in imeta['coloring'].color_iter(mode):
+                    ilist = np.asarray(ilist, dtype=INT_DTYPE)
+                    seed_rhs.append(np.full(ilist.size, nrhs, dtype=INT_DTYPE))
+                    seed_locs.append(loc_idxs[ilist])
+                    seed_vals.append(seeds[ilist])
+                    for i in ilist:
+                        nzs = row_col_map[i]
+                        if nzs is not None and len(nzs) > 0:
+                            color_rhs.append(np.full(len(nzs), nrhs, dtype=INT_DTYPE))
+                            color_sol.append(np.asarray(nzs, dtype=INT_DTYPE))
+                            color_jac.append(np.full(len(nzs), i, dtype=INT_DTYPE))
+                    nrhs += 1
+
+        def _cat(arrs, dtype=INT_DTYPE):
+            return np.concatenate(arrs) if arrs else np.zeros(0, dtype=dtype)
+
+        self._batch_plans[mode] = plan = {
+            'nrhs': nrhs,
+            'seed_rhs': _cat(seed_rhs),
+            'seed_locs': _cat(seed_locs),
+            'seed_vals': _cat(seed_vals, float),
+            'single_rhs': _cat(single_rhs),
+            'single_jac': _cat(single_jac),
+            'color_rhs': _cat(color_rhs),
+            'color_sol': _cat(color_sol),
+            'color_jac': _cat(color_jac),
+        }
+
+        return plan
+
+    def _compute_totals_batched(self, mode, batch_size):
+        """
+        Compute the part of the total jacobian for the given mode using multi-RHS linear solves.
+
+        Parameters
+        ----------
+        mode : str
+            Direction of derivative solution.
+        batch_size : int
+            Max number of right-hand sides per linear solve, or 0 for no limit.
+        """
+        model = self.model
+        ln_solver = model._linear_solver
+        plan = self._get_batch_plan(mode)
+        nrhs = plan['nrhs']
+        if batch_size < 1:
+            batch_size = nrhs
+
+        seed_rhs = plan['seed_rhs']
+        single_rhs = plan['single_rhs']
+        color_rhs = plan['color_rhs']
+
+        # in rev mode, rows of the jacobian correspond to right-hand sides
+        J = self.J if mode == 'fwd' else self.J.T
+        deriv_idxs, jac_idxs, _ = self.sol2jac_map[mode]
+
+        in_vec = self.input_vec[mode]
+        out_vec = self.output_vec[mode]
+        if mode == 'fwd':
+            in_scaled = model._has_resid_scaling
+            out_scaled = model._has_output_scaling
+        else:
+            in_scaled = model._has_output_scaling
+            out_scaled = model._has_resid_scaling
+
+        size = in_vec.asarray().size
+
+        for start in range(0, nrhs, batch_size):
+            end = min(start + batch_size, nrhs)
+
+            rhs = np.zeros((size, end - start))
+            s0, s1 = np.searchsorted(seed_rhs, (start, end))
+            rhs[plan['seed_locs'][s0:s1], seed_rhs[s0:s1] - start] = plan['seed_vals'][s0:s1]
+
+            # put the right-hand sides into the same scaled state that model._solve_linear uses
+            if in_scaled:
+                rhs /= in_vec._scaling[0][:, np.newaxis]
+
+            sol = ln_solver._solve_multi(mode, rhs)
+
+            if out_scaled:
+                sol *= out_vec._scaling[0][:, np.newaxis]
+
+            reduced = np.zeros((J.shape[0], end - start))
+            reduced[jac_idxs] = sol[deriv_idxs]
+
+            s0, s1 = np.searchsorted(single_rhs, (start, end))
+            if s1 > s0:
+                J[:, plan['single_jac'][s0:s1]] = reduced[:, single_rhs[s0:s1] - start]
+
+            s0, s1 = np.searchsorted(color_rhs, (start, end))
+            if s1 > s0:
+                rows = plan['color_sol'][s0:s1]
+                J[rows, plan['color_jac'][s0:s1]] = reduced[rows, color_rhs[s0:s1] - start]
+
+            self.nsolves += end - start
+
     def _compute_totals_approx(self, progress_out_stream=None):
         """
         Compute derivatives of desired quantities with respect to desired inputs.
@@ -4,6 +4,7 @@ AnalysisDriver definition.
 from collections import deque
 from collections.abc import Iterable
 import itertools
+import os
 import traceback
 
 from openmdao.core.driver import Driver, RecordingDebugging
@@ -11,6 +12,8 @@ from openmdao.core.analysis_error import AnalysisError
 
 from openmdao.drivers.analysis_generator import AnalysisGenerator, SequenceGenerator
 from openmdao.utils.mpi import MPI
+from openmdao.utils.concurrent_utils import LocalPool, check_num_workers, \
+    can_fork_workers
 from openmdao.utils.om_warnings import issue_warning, DriverWarning
 
 
@@ -51,6 +54,10 @@ class AnalysisDriver(Driver):
         The set of variables seen in the previous iteration of the driver on this rank.
     _generator : AnalysisGenerator
         The internal AnalysisGenerator providing samples.
+    _num_workers : int
+        Number of local worker processes used to run the samples.
+    _skip_samples : set of int
+        Numbers of the samples recorded by an earlier run, which are not run again.
     """
 
     def __init__(self, samples=None, **kwargs):
@@ -81,6 +88,8 @@ class AnalysisDriver(Driver):
         self._num_colors = 1
         self._prev_sample_vars = set()
         self._total_jac_format = 'dict'
+        self._num_workers = 1
+        self._skip_samples = set()
 
     def _declare_options(self):
         """
@@ -95,6 +104,18 @@ class AnalysisDriver(Driver):
                              'large.')
         self.options.declare('procs_per_model', types=int, default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('num_workers', types=int, default=1, lower=1,
+                             desc='Number of worker processes, forked from this one, used to '
+                             'run samples in parallel when not running under MPI. Samples are '
+                             'recorded in this process, but the model in this process is '
+                             'not run.')
+        self.options.declare('restart_from', types=(str, os.PathLike, list), default=None,
+                             allow_none=True,
+                             desc='Case recorder file, or list of files, written by an earlier '
+                             'run of this driver. Samples recorded there are not run again, and '
+                             'the other samples keep their sample numbers, so an interrupted run '
+                             'can be completed. The samples must be given in the same order, and '
+                             'new samples should be recorded to a different file.')
 
     def add_response(self, name, indices=None, units=None,
                      linear=False, parallel_deriv_color=None,
@@ -165,6 +186,29 @@ class AnalysisDriver(Driver):
                 if isinstance(res, str):
                     self.add_response(res)
 
+    def _setup_driver(self, problem):
+        """
+        Prepare the driver for execution.
+
+        This is the final thing to run during setup.
+
+        Parameters
+        ----------
+        problem : <Problem>
+            Pointer to the containing problem.
+        """
+        super()._setup_driver(problem)
+
+        self._num_workers = check_num_workers(self.options['num_workers'], problem.comm,
+                                              self.msginfo)
+
+        # read the recorded samples now, before the recorders are started
+        restart_from = self.options['restart_from']
+        if restart_from is None:
+            self._skip_samples = set()
+        else:
+            self._skip_samples = self._get_recorded_iterations(restart_from)
+
     def _setup_comm(self, comm):
         """
         Perform any driver-specific setup of communicators for the model.
@@ -243,11 +287,19 @@ class AnalysisDriver(Driver):
         self._allowable_vars = model_inputs | model_implicit_outputs
         n_procs = 1 if comm is None else comm.size
 
+        # Samples are taken from the generator as they are needed and numbered, so that they keep
+        # their numbers when recorded samples are skipped.
+        samples = enumerate(self._generator)
+
+        skip = self._skip_samples
+        if skip:
+            samples = ((sample_num, sample) for sample_num, sample in samples
+                       if sample_num not in skip)
+
         if self.options['run_parallel'] and MPI and n_procs > 1:
             batch_size = self.options['batch_size']
             color_cycler = itertools.cycle(range(self._num_colors))
             samples_complete = False
-            sample_num = 0
             job_queues = None
             colors = comm.gather(self._color, root=0)
 
@@ -260,20 +312,13 @@ class AnalysisDriver(Driver):
                     job_queues = [deque() for _ in range(n_procs)]
                     # Rank 0 pushes batch_size jobs to the ranks in job_queues
                     batch_i = 0
-                    while True:
-                        try:
-                            sample = next(self._generator)
-                        except StopIteration:
-                            samples_complete = True
-                            break
-
+                    for sample_num, sample in itertools.islice(samples, batch_size):
                         color_idx = next(color_cycler)
                         for rank_idx in color_to_rank_map[color_idx]:
                             job_queues[rank_idx].appendleft((sample_num, sample))
-                        if batch_i >= batch_size:
-                            break
                         batch_i += 1
-                        sample_num += 1
+
+                    samples_complete = batch_i < batch_size
 
                 # Broadcast the samples_complete signal from root to all ranks
                 samples_complete = comm.bcast(samples_complete, root=0)
@@ -290,9 +335,19 @@ class AnalysisDriver(Driver):
                 # Then repeat until samples are exhausted.
                 comm.barrier()
 
+        elif self._num_workers > 1 and can_fork_workers(self._num_workers, self.msginfo):
+            def check_sample(retval, err):
+                if err is not None:
+                    raise RuntimeError(f"{self.msginfo}: A sample failed in a worker "
+                                       f"process:\n{err}")
+
+            with LocalPool(self._run_sample, self, self._num_workers) as pool:
+                pool.evaluate((((sample, sample_num), None) for sample_num, sample in samples),
+                              callback=check_sample)
+
         else:
             # Not under MPI
-            for sample_num, sample in enumerate(self._generator):
+            for sample_num, sample in samples:
                 self._run_sample(sample, sample_num)
 
         return False
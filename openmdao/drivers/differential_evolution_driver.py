@@ -25,7 +25,8 @@ except ModuleNotFoundError:
 
 from openmdao.core.constants import INF_BOUND
 from openmdao.core.driver import Driver, RecordingDebugging
-from openmdao.utils.concurrent_utils import concurrent_eval
+from openmdao.utils.concurrent_utils import concurrent_eval, concurrent_eval_lb, LocalPool, \
+    check_num_workers, can_fork_workers
 from openmdao.utils.mpi import MPI
 from openmdao.core.analysis_error import AnalysisError
 
@@ -56,6 +57,8 @@ class DifferentialEvolutionDriver(Driver):
         Main genetic algorithm lies here.
     _nfit : int
          Number of successful function evaluations.
+    _num_workers : int
+        Number of local worker processes used to evaluate points.
     _randomstate : int
         Seed-number which controls the random draws.
     """
@@ -90,6 +93,7 @@ class DifferentialEvolutionDriver(Driver):
         self._desvar_idx = {}
         self._ga = None
         self._nfit = 0
+        self._num_workers = 1
 
         # random state can be set for predictability during testing
         if 'DifferentialEvolutionDriver_seed' in os.environ:
@@ -114,6 +118,23 @@ class DifferentialEvolutionDriver(Driver):
                              desc='Set to True to execute the points in a generation in parallel.')
         self.options.declare('procs_per_model', default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('steady_state', types=bool, default=False,
+                             desc='If True, evolve the population one point at a time instead of '
+                             'a generation at a time. Each new trial point replaces its target '
+                             'in the current population as soon as it is evaluated, if it is '
+                             'better. When run in parallel, rank 0 sends a new point to each rank '
+                             'as soon as it finishes its last one, so ranks never wait for a '
+                             'whole generation. The number of evaluations is the same as for '
+                             'max_gen generations. Requires procs_per_model=1.')
+        self.options.declare('num_workers', types=int, default=1, lower=1,
+                             desc='Number of worker processes, forked from this one, used to '
+                             'evaluate points in parallel when not running under MPI.')
+        self.options.declare('eval_cache_size', types=int, default=0, lower=0,
+                             desc='Maximum number of design points whose fitness values are kept, '
+                             'so that the model is not run again when a point is revisited. The '
+                             'least recently used point is dropped first. Set to 0 to turn the '
+                             'cache off. Points are looked up before they are sent to worker '
+                             'processes or ranks.')
         self.options.declare('penalty_parameter', default=10., lower=0.,
                              desc='Penalty function parameter.')
         self.options.declare('penalty_exponent', default=1.,
@@ -166,6 +187,13 @@ class DifferentialEvolutionDriver(Driver):
                        f"equals={equals}, lower={lower}, upper={upper}.")
                 raise ValueError(msg)
 
+        if self.options['steady_state'] and self.options['procs_per_model'] > 1:
+            raise RuntimeError(f"{self.msginfo}: The 'steady_state' option requires "
+                               "'procs_per_model' to be 1.")
+
+        self._num_workers = check_num_workers(self.options['num_workers'], problem.comm,
+                                              self.msginfo)
+
         model_mpi = None
         comm = problem.comm
         if self._concurrent_pop_size > 0:
@@ -263,7 +291,10 @@ class DifferentialEvolutionDriver(Driver):
             Failure flag; True if failed to converge, False is successful.
         """
         self.result.reset()
+        self._setup_eval_cache()
         ga = self._ga
+        ga.steady_state = self.options['steady_state']
+        ga.eval_cache = self._eval_cache
 
         pop_size = self.options['pop_size']
         max_gen = self.options['max_gen']
@@ -298,9 +329,17 @@ class DifferentialEvolutionDriver(Driver):
         if pop_size == 0:
             pop_size = 20 * count
 
-        desvar_new, obj, self._nfit = ga.execute_ga(x0, lower_bound, upper_bound,
-                                                    pop_size, max_gen,
-                                                    self._randomstate, F, Pc)
+        if self._num_workers > 1 and can_fork_workers(self._num_workers, self.msginfo):
+            ga.pool = LocalPool(self.objective_callback, self, self._num_workers)
+
+        try:
+            desvar_new, obj, self._nfit = ga.execute_ga(x0, lower_bound, upper_bound,
+                                                        pop_size, max_gen,
+                                                        self._randomstate, F, Pc)
+        finally:
+            if ga.pool is not None:
+                ga.pool.shutdown()
+                ga.pool = None
 
         # Pull optimal parameters back into framework and re-run, so that
         # framework is left in the right final state
@@ -497,6 +536,8 @@ class DifferentialEvolution(object):
     ----------
     comm : MPI communicator or None
         The MPI communicator that will be used objective evaluation for each generation.
+    eval_cache : _EvalCache or None
+        Cache of the fitness values of points that have already been evaluated.
     lchrom : int
         Chromosome length.
     model_mpi : None or tuple
@@ -507,6 +548,11 @@ class DifferentialEvolution(object):
         Population size.
     objfun : function
         Objective function callback.
+    pool : LocalPool or None
+        Pool of local worker processes used to evaluate points when not running under MPI.
+    steady_state : bool
+        If True, evolve the population one point at a time, evaluating points asynchronously
+        when run in parallel.
     """
 
     def __init__(self, objfun, comm=None, model_mpi=None):
@@ -524,7 +570,10 @@ class DifferentialEvolution(object):
 
         self.lchrom = 0
         self.npop = 0
+        self.steady_state = False
+        self.eval_cache = None
         self.model_mpi = model_mpi
+        self.pool = None
 
     def execute_ga(self, x0, vlb, vub, pop_size, max_gen, random_state, F=0.5, Pc=0.5):
         """
@@ -592,28 +641,49 @@ class DifferentialEvolution(object):
         population = np.vstack((population, x0))
         fitness = np.ones(self.npop) * np.inf  # initialize fitness to infinitely bad
 
+        if self.steady_state:
+            return self._execute_steady_state(population, vlb, vub, (max_gen + 1) * self.npop,
+                                              rng, F, Pc)
+
         # Main Loop
         nfit = 0
+        cache = self.eval_cache
         for generation in range(max_gen + 1):
-            # Evaluate fitness of points in this generation
-            if comm is not None:  # Parallel
-                # Since GA is random, ranks generate different new populations, so just take one
-                # and use it on all.
+            if comm is not None:
+                # Since GA is random, ranks generate different new populations, so just take
+                # one and use it on all.
                 population = comm.bcast(population, root=0)
 
-                cases = [((item, ii), None) for ii, item in enumerate(population)]
+            # Points that have already been evaluated are taken from the cache.
+            run = list(range(self.npop))
+            fitness[:] = np.inf
+            if cache is not None:
+                run = []
+                for ii in range(self.npop):
+                    cached = cache.get(population[ii], 'values')
+                    if cached is None:
+                        run.append(ii)
+                    elif cached[1]:
+                        fitness[ii] = cached[0]
+                        nfit += 1
+
+            # Evaluate fitness of points in this generation
+            if comm is not None or self.pool is not None:  # Parallel
+                cases = [((population[ii], ii), None) for ii in run]
 
-                # Pad the cases with some dummy cases to make the cases divisible amongst the procs.
-                # TODO: Add a load balancing option to this driver.
-                extra = len(cases) % comm.size
-                if extra > 0:
-                    for j in range(comm.size - extra):
-                        cases.append(cases[-1])
+                if self.pool is not None:
+                    results = self.pool.evaluate(cases)
+                else:
+                    # Pad the cases with some dummy cases to make the cases divisible amongst the
+                    # procs. The 'steady_state' option evaluates the cases with load balancing.
+                    extra = len(cases) % comm.size
+                    if extra > 0:
+                        for j in range(comm.size - extra):
+                            cases.append(cases[-1])
 
-                results = concurrent_eval(self.objfun, cases, comm,
-                                          allgather=True, model_mpi=self.model_mpi)
+                    results = concurrent_eval(self.objfun, cases, comm,
+                                              allgather=True, model_mpi=self.model_mpi)
 
-                fitness[:] = np.inf
                 for result in results:
                     returns, traceback = result
 
@@ -622,14 +692,18 @@ class DifferentialEvolution(object):
                         if success:
                             fitness[ii] = val
                             nfit += 1
+                        if cache is not None:
+                            cache.store(population[ii], 'values', (val, success))
                     else:
                         # Print the traceback if it fails
                         print('A case failed:')
                         print(traceback)
             else:  # Serial
-                for ii in range(self.npop):
+                for ii in run:
                     fitness[ii], success, _ = self.objfun(population[ii], 0)
                     nfit += 1
+                    if cache is not None:
+                        cache.store(population[ii], 'values', (fitness[ii], success))
 
             # Find best performing point in this generation.
             min_fit = np.min(fitness)
@@ -682,3 +756,118 @@ class DifferentialEvolution(object):
                 population[ii][r] = mutant[r]  # always replace at least one with mutant's
 
         return xopt, fopt, nfit
+
+    def _execute_steady_state(self, population, vlb, vub, ncases, rng, F, Pc):
+        """
+        Perform the steady-state differential evolution.
+
+        After the initial population, a trial point is generated for each population member in
+        turn from the current population, and replaces that member as soon as it is evaluated,
+        if it is better. Under MPI, trial points are generated in rank 0 and sent to the first
+        free rank. In a local pool, they are sent to the first free worker process.
+
+        Parameters
+        ----------
+        population : ndarray
+            Initial population.
+        vlb : ndarray
+            Lower bounds array.
+        vub : ndarray
+            Upper bounds array.
+        ncases : int
+            Total number of points to generate, including the initial population.
+        rng : np.random.Generator
+            Generator for the random draws.
+        F : float
+            Differential rate.
+        Pc : float
+            Crossover rate.
+
+        Returns
+        -------
+        ndarray
+            Best design point.
+        float
+            Objective value at best design point.
+        int
+            Number of successful function evaluations.
+        """
+        comm = self.comm
+        if comm is not None and comm.size == 1:
+            comm = None
+
+        npop = self.npop
+        fitness = np.full(npop, np.inf)
+        pending = {}
+        cache = self.eval_cache
+        best = {'x': vlb.copy(), 'f': np.inf, 'nfit': 0}
+
+        def cases():
+            for icase in range(ncases):
+                target = icase % npop
+
+                if icase < npop:
+                    trial = population[target].copy()
+                else:
+                    # randomly select 3 different population members other than the target
+                    others = np.delete(np.arange(npop), target)
+                    a, b, c = rng.choice(others, 3, replace=False)
+
+                    # clip mutant so that it cannot be outside the bounds
+                    mutant = np.clip(population[a] + F * (population[b] - population[c]),
+                                     vlb, vub)
+
+                    # sometimes replace target's feature with mutant's, and always at least one
+                    trial = population[target].copy()
+                    idx = rng.random(self.lchrom) < Pc
+                    idx[rng.integers(0, self.lchrom)] = True
+                    trial[idx] = mutant[idx]
+
+                pending[icase] = (target, trial)
+
+                if cache is not None:
+                    # a point that has already been evaluated is taken from the cache
+                    cached = cache.get(trial, 'values')
+                    if cached is not None:
+                        receive((cached[0], cached[1], icase), None)
+                        continue
+
+                yield (trial, icase), None
+
+        def receive(returns, traceback):
+            if not returns:
+                # Print the traceback if it fails
+                print('A case failed:')
+                print(traceback)
+                return
+
+            val, success, icase = returns
+            target, trial = pending.pop(icase)
+
+            if cache is not None:
+                cache.store(trial, 'values', (val, success))
+
+            if not success:
+                return
+
+            best['nfit'] += 1
+            f = np.asarray(val).item()
+
+            # the trial replaces its target if it is better (implied elitism)
+            if f < fitness[target]:
+                population[target] = trial
+                fitness[target] = f
+
+            if f < best['f']:
+                best['x'] = trial
+                best['f'] = f
+
+        if self.pool is not None:
+            self.pool.evaluate(cases(), callback=receive)
+        else:
+            concurrent_eval_lb(self.objfun, cases(), comm, callback=receive)
+
+        if comm is not None:
+            best = comm.bcast(best, root=0)
+
+        return best['x'], best['f'], best['nfit']
@@ -2,6 +2,7 @@
 Design-of-Experiments Driver.
 """
 
+import os
 import traceback
 import inspect
 
@@ -12,6 +13,8 @@ from openmdao.core.analysis_error import AnalysisError
 from openmdao.drivers.doe_generators import DOEGenerator, ListGenerator
 
 from openmdao.utils.mpi import MPI
+from openmdao.utils.concurrent_utils import LocalPool, check_num_workers, \
+    can_fork_workers
 
 
 class DOEDriver(Driver):
@@ -37,6 +40,10 @@ class DOEDriver(Driver):
         List of design variables, used to compute derivatives.
     _quantities : list
         Contains the objectives plus nonlinear constraints, used to compute derivatives.
+    _num_workers : int
+        Number of local worker processes used to run the cases.
+    _skip_cases : set of int
+        Numbers of the cases recorded by an earlier run, which are not run again.
     """
 
     def __init__(self, generator=None, **kwargs):
@@ -77,6 +84,8 @@ class DOEDriver(Driver):
         self._indep_list = []
         self._quantities = []
         self._total_jac_format = 'dict'
+        self._num_workers = 1
+        self._skip_cases = set()
 
     def _declare_options(self):
         """
@@ -88,6 +97,42 @@ class DOEDriver(Driver):
                              desc='Set to True to execute cases in parallel.')
         self.options.declare('procs_per_model', types=int, default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('num_workers', types=int, default=1, lower=1,
+                             desc='Number of worker processes, forked from this one, used to '
+                             'run cases in parallel when not running under MPI. Cases are '
+                             'recorded in this process, but the model in this process is '
+                             'not run.')
+        self.options.declare('restart_from', types=(str, os.PathLike, list), default=None,
+                             allow_none=True,
+                             desc='Case recorder file, or list of files, written by an earlier '
+                             'run of this DOE. Cases recorded there are not run again, and the '
+                             'other cases keep their case numbers, so an interrupted run can be '
+                             'completed. The generator must produce the same cases in the same '
+                             'order, and new cases should be recorded to a different file.')
+
+    def _setup_driver(self, problem):
+        """
+        Prepare the driver for execution.
+
+        This is the final thing to run during setup.
+
+        Parameters
+        ----------
+        problem : <Problem>
+            Pointer to the containing problem.
+        """
+        super()._setup_driver(problem)
+
+        self._num_workers = check_num_workers(self.options['num_workers'], problem.comm,
+                                              self.msginfo)
+
+        # read the recorded cases now, before the recorders are started
+        restart_from = self.options['restart_from']
+        if restart_from is None:
+            self._skip_cases = set()
+        else:
+            self._set_name()
+            self._skip_cases = self._get_recorded_iterations(restart_from)
 
     def _setup_comm(self, comm):
         """
@@ -182,18 +227,34 @@ class DOEDriver(Driver):
         for name, _ in self._cons.items():
             self._quantities.append(name)
 
+        # Cases are generated as they are needed and numbered, so that they keep their numbers
+        # when recorded cases are skipped.
+        cases = enumerate(self.options['generator'](self._designvars, self._problem().model))
+
+        skip = self._skip_cases
+        if skip:
+            cases = ((case_num, case) for case_num, case in cases if case_num not in skip)
+
         if MPI and self.options['run_parallel']:
-            case_gen = self._parallel_generator
-        else:
-            case_gen = self.options['generator']
+            cases = self._parallel_generator(cases)
 
-        for case in case_gen(self._designvars, self._problem().model):
-            self._run_case(case)
-            self.iter_count += 1
+        if self._num_workers > 1 and can_fork_workers(self._num_workers, self.msginfo):
+            def check_case(retval, err):
+                if err is not None:
+                    raise RuntimeError(f"{self.msginfo}: A case failed in a worker "
+                                       f"process:\n{err}")
+
+            with LocalPool(self._run_case, self, self._num_workers) as pool:
+                pool.evaluate((((case, case_num), None) for case_num, case in cases),
+                              callback=check_case)
+        else:
+            for case_num, case in cases:
+                self._run_case(case, case_num)
+                self.iter_count += 1
 
         return False
 
-    def _run_case(self, case):
+    def _run_case(self, case, case_num):
         """
         Run case, save exception info and mark the metadata if the case fails.
 
@@ -201,7 +262,10 @@ class DOEDriver(Driver):
         ----------
         case : list
             list of name, value tuples for the design variables.
+        case_num : int
+            The number of the case, used as the iteration number when it is recorded.
         """
+        self.iter_count = case_num
         metadata = {}
 
         for dv_name, dv_val in case:
@@ -239,29 +303,28 @@ class DOEDriver(Driver):
                                  return_format=self._total_jac_format,
                                  driver_scaling=False)
 
-    def _parallel_generator(self, design_vars, model=None):
+    def _parallel_generator(self, cases):
         """
-        Generate case for this processor when running under MPI.
+        Select the cases for this processor when running under MPI.
 
         Parameters
         ----------
-        design_vars : dict
-            Dictionary of design variables for which to generate values.
-
-        model : Group
-            The model containing the design variables (used by some generators).
+        cases : iterator
+            Iterator over the case numbers and cases for all processors.
 
         Yields
         ------
+        int
+            The number of the case.
         list
             list of name, value tuples for the design variables.
         """
         ncolors = self._problem_comm.size // self.options['procs_per_model']
         color = self._color
 
-        for i, case in enumerate(self.options['generator'](design_vars, model)):
+        for i, (case_num, case) in enumerate(cases):
             if i % ncolors == color:
-                yield case
+                yield case_num, case
 
     def _setup_recording(self):
         """
@@ -15,6 +15,7 @@ except ImportError:
 
 
 _LEVELS = 2  # default number of levels for pyDOE generators
+_CHUNK_SIZE = 1000  # number of design rows generated at a time by streaming generators
 
 
 class DOEGenerator(object):
@@ -360,7 +361,7 @@ class _pyDOE_Generator(DOEGenerator):
         self._sizes = OrderedDict([(name, _get_size(meta))
                                    for name, meta in design_vars.items()])
         size = sum(self._sizes.values())
-        doe = self._generate_design(size).astype('int')
+        rows = np.arange(size)
 
         # Maximum number of levels, or the default if the maximum is smaller than the default.
         # This is to ensure that the array will be big enough even if some keys are missing
@@ -393,19 +394,33 @@ class _pyDOE_Generator(DOEGenerator):
 
                 row += 1
 
-        # yield values for doe generated indices
-        for idxs in doe:
-            retval = []
-            row = 0
-            for name, meta in design_vars.items():
-                size_i = _get_size(meta)
-                val = np.empty(size_i)
-                for k in range(size_i):
-                    idx = idxs[row + k]
-                    val[k] = values[row + k][idx]
-                retval.append((name, val))
-                row += size_i
-            yield retval
+        # yield values for doe generated indices, one chunk of the design at a time
+        for doe in self._iter_design(rows.size):
+            for vals in values[rows, doe.astype(int)]:
+                retval = []
+                row = 0
+                for name, size_i in self._sizes.items():
+                    retval.append((name, vals[row:row + size_i]))
+                    row += size_i
+                yield retval
+
+    def _iter_design(self, size):
+        """
+        Generate the DOE design in chunks of rows.
+
+        By default, the whole design is generated at once and yielded as a single chunk.
+
+        Parameters
+        ----------
+        size : int
+            The total size (sum of sizes) of all factors for the design.
+
+        Yields
+        ------
+        ndarray
+            Rows of the design matrix as an array of level indices.
+        """
+        yield self._generate_design(size)
 
     def _generate_design(self, size):
         """
@@ -453,6 +468,31 @@ class FullFactorialGenerator(_pyDOE_Generator):
         """
         return pyDOE3.fullfact(self._get_all_levels())
 
+    def _iter_design(self, size):
+        """
+        Generate the full factorial design in chunks of rows, without storing the whole design.
+
+        Parameters
+        ----------
+        size : int
+            The number of factors for the design.
+
+        Yields
+        ------
+        ndarray
+            Rows of the design matrix as an array of level indices.
+        """
+        levels = self._get_all_levels()
+        if size == 0:
+            yield self._generate_design(size)
+            return
+
+        # The first factor varies fastest, as in pyDOE3.fullfact.
+        ncases = int(np.prod(levels))
+        for start in range(0, ncases, _CHUNK_SIZE):
+            idx = np.arange(start, min(start + _CHUNK_SIZE, ncases))
+            yield np.stack(np.unravel_index(idx, levels, order='F'), axis=-1)
+
 
 class GeneralizedSubsetGenerator(_pyDOE_Generator):
     """
@@ -21,7 +21,6 @@ Multidisciplinary Design Optimization Supported by Knowledge Based Engineering.
 John Wiley & Sons, Ltd.
 """
 import os
-import copy
 
 import numpy as np
 
@@ -32,10 +31,16 @@ except ModuleNotFoundError:
 
 from openmdao.core.constants import INF_BOUND
 from openmdao.core.driver import Driver, RecordingDebugging
-from openmdao.utils.concurrent_utils import concurrent_eval
+from openmdao.utils.concurrent_utils import concurrent_eval, concurrent_eval_lb, LocalPool, \
+    check_num_workers, can_fork_workers
 from openmdao.utils.mpi import MPI
 from openmdao.core.analysis_error import AnalysisError
 
+# Number of points compared at a time when finding the non-dominated points, and the maximum
+# number of elements in the comparison arrays.
+_PARETO_BLOCK_SIZE = 64
+_PARETO_MAX_ELEMENTS = 2 ** 22
+
 
 class SimpleGADriver(Driver):
     """
@@ -63,6 +68,8 @@ class SimpleGADriver(Driver):
          Random state (or seed-number) which controls the seed and random draws.
     _nfit : int
          Number of successful function evaluations.
+    _num_workers : int
+        Number of local worker processes used to evaluate points.
     """
 
     def __init__(self, **kwargs):
@@ -94,6 +101,7 @@ class SimpleGADriver(Driver):
 
         self._desvar_idx = {}
         self._ga = None
+        self._num_workers = 1
 
         # random state can be set for predictability during testing
         if 'SimpleGADriver_seed' in os.environ:
@@ -134,6 +142,25 @@ class SimpleGADriver(Driver):
                              desc='Set to True to execute the points in a generation in parallel.')
         self.options.declare('procs_per_model', default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('steady_state', types=bool, default=False,
+                             desc='If True, evolve the population one point at a time instead of '
+                             'a generation at a time. Each new point is bred from the current '
+                             'population and replaces its worst point if it is better. When run in '
+                             'parallel, rank 0 sends a new point to each rank as soon as it '
+                             'finishes its last one, so ranks never wait for a whole generation. '
+                             'The number of evaluations is the same as for max_gen generations. '
+                             'Requires procs_per_model=1 and is not available with '
+                             'compute_pareto.')
+        self.options.declare('num_workers', types=int, default=1, lower=1,
+                             desc='Number of worker processes, forked from this one, used to '
+                             'evaluate points in parallel when not running under MPI.')
+        self.options.declare('eval_cache_size', types=int, default=0, lower=0,
+                             desc='Maximum number of design points whose fitness values are kept, '
+                             'so that the model is not run again when a point is revisited. The '
+                             'least recently used point is dropped first. Set to 0 to turn the '
+                             'cache off. Points are looked up before they are sent to worker '
+                             'processes or ranks, and a point that appears more than once in a '
+                             'generation is only run once.')
         self.options.declare('penalty_parameter', default=10., lower=0.,
                              desc='Penalty function parameter.')
         self.options.declare('penalty_exponent', default=1.,
@@ -191,6 +218,17 @@ class SimpleGADriver(Driver):
                        f"equals={equals}, lower={lower}, upper={upper}.")
                 raise ValueError(msg)
 
+        if self.options['steady_state']:
+            if self.options['procs_per_model'] > 1:
+                raise RuntimeError(f"{self.msginfo}: The 'steady_state' option requires "
+                                   "'procs_per_model' to be 1.")
+            if self.options['compute_pareto']:
+                raise RuntimeError(f"{self.msginfo}: The 'steady_state' option is not available "
+                                   "with 'compute_pareto'.")
+
+        self._num_workers = check_num_workers(self.options['num_workers'], problem.comm,
+                                              self.msginfo)
+
         model_mpi = None
         comm = problem.comm
         if self._concurrent_pop_size > 0:
@@ -288,12 +326,15 @@ class SimpleGADriver(Driver):
             Failure flag; True if failed to converge, False is successful.
         """
         self.result.reset()
+        self._setup_eval_cache()
         model = self._problem().model
         ga = self._ga
 
         ga.elite = self.options['elitism']
         ga.gray_code = self.options['gray']
         ga.cross_bits = self.options['cross_bits']
+        ga.steady_state = self.options['steady_state']
+        ga.eval_cache = self._eval_cache
         pop_size = self.options['pop_size']
         max_gen = self.options['max_gen']
         user_bits = self.options['bits']
@@ -373,9 +414,17 @@ class SimpleGADriver(Driver):
         if pop_size == 0:
             pop_size = 4 * np.sum(bits)
 
-        desvar_new, obj, self._nfit = ga.execute_ga(x0, lower_bound, upper_bound, outer_bound,
-                                                    bits, pop_size, max_gen,
-                                                    self._randomstate, Pm, Pc)
+        if self._num_workers > 1 and can_fork_workers(self._num_workers, self.msginfo):
+            ga.pool = LocalPool(self.objective_callback, self, self._num_workers)
+
+        try:
+            desvar_new, obj, self._nfit = ga.execute_ga(x0, lower_bound, upper_bound,
+                                                        outer_bound, bits, pop_size, max_gen,
+                                                        self._randomstate, Pm, Pc)
+        finally:
+            if ga.pool is not None:
+                ga.pool.shutdown()
+                ga.pool = None
 
         if compute_pareto:
             # Just save the non-dominated points.
@@ -588,6 +637,8 @@ class GeneticAlgorithm(object):
         The MPI communicator that will be used objective evaluation for each generation.
     elite : bool
         Elitism flag.
+    eval_cache : _EvalCache or None
+        Cache of the fitness values of points that have already been evaluated.
     gray_code : bool
         Gray code binary representation flag.
     cross_bits : bool
@@ -605,6 +656,11 @@ class GeneticAlgorithm(object):
         Population size.
     objfun : function
         Objective function callback.
+    pool : LocalPool or None
+        Pool of local worker processes used to evaluate points when not running under MPI.
+    steady_state : bool
+        If True, evolve the population one point at a time, evaluating points asynchronously
+        when run in parallel.
     """
 
     def __init__(self, objfun, comm=None, model_mpi=None):
@@ -626,7 +682,10 @@ class GeneticAlgorithm(object):
         self.elite = True
         self.gray_code = False
         self.cross_bits = False
+        self.steady_state = False
+        self.eval_cache = None
         self.model_mpi = model_mpi
+        self.pool = None
 
     def execute_ga(self, x0, vlb, vub, vob, bits, pop_size, max_gen, random_state, Pm=None, Pc=0.5):
         """
@@ -678,7 +737,7 @@ class GeneticAlgorithm(object):
             if np.mod(pop_size, nobj) > 0:
                 pop_size += nobj - np.mod(pop_size, nobj)
         else:
-            xopt = copy.deepcopy(vlb)
+            xopt = vlb.copy()
             fopt = np.inf
 
             # Needs to be divisible by two because tournament selection pits one half of the
@@ -698,34 +757,67 @@ class GeneticAlgorithm(object):
                                random_state=random_state))
         new_gen[0] = self.encode(x0, vlb, vub, bits)
 
+        if self.steady_state:
+            return self._execute_steady_state(new_gen, vlb, vub, vob, bits,
+                                              (max_gen + 1) * self.npop, Pm, Pc)
+
         # Main Loop
         nfit = 0
+        cache = self.eval_cache
         for generation in range(max_gen + 1):
-            old_gen = copy.deepcopy(new_gen)
+            old_gen = new_gen
             x_pop = self.decode(old_gen, vlb, vub, bits)
 
-            # Evaluate fitness of points in this generation.
             if comm is not None:
-                # Parallel
-
-                # Since GA is random, ranks generate different new populations, so just take one
-                # and use it on all.
+                # Since GA is random, ranks generate different new populations, so just take
+                # one and use it on all.
                 x_pop = comm.bcast(x_pop, root=0)
 
-                cases = [((item, ii), None) for ii, item in enumerate(x_pop)
-                         if np.all(item - vob <= 0)]
+            # Skip points that exceed the bounds for integer variables that are over-allocated.
+            run = np.all(x_pop - vob <= 0, axis=1)
+            fitness[:] = np.inf
+
+            if cache is not None:
+                # Points that have already been evaluated are taken from the cache, and a point
+                # that appears more than once in this generation is only evaluated once.
+                first = {}
+                repeats = []
+                for ii in np.flatnonzero(run):
+                    key = x_pop[ii].tobytes()
+                    if key in first:
+                        repeats.append((ii, first[key]))
+                        run[ii] = False
+                        continue
+                    first[key] = ii
+
+                    cached = cache.get(x_pop[ii], 'values')
+                    if cached is not None:
+                        val, success = cached
+                        if success:
+                            fitness[ii, :] = val
+                            nfit += 1
+                        run[ii] = False
 
-                # Pad the cases with some dummy cases to make the cases divisible amongst the procs.
-                # TODO: Add a load balancing option to this driver.
-                extra = len(cases) % comm.size
-                if extra > 0:
-                    for j in range(comm.size - extra):
-                        cases.append(cases[-1])
+            run = np.flatnonzero(run).tolist()
 
-                results = concurrent_eval(self.objfun, cases, comm, allgather=True,
-                                          model_mpi=self.model_mpi)
+            # Evaluate fitness of points in this generation.
+            if comm is not None or self.pool is not None:
+                # Parallel
+                cases = [((x_pop[ii], ii), None) for ii in run]
+
+                if self.pool is not None:
+                    results = self.pool.evaluate(cases)
+                else:
+                    # Pad the cases with some dummy cases to make the cases divisible amongst the
+                    # procs. The 'steady_state' option evaluates the cases with load balancing.
+                    extra = len(cases) % comm.size
+                    if extra > 0:
+                        for j in range(comm.size - extra):
+                            cases.append(cases[-1])
+
+                    results = concurrent_eval(self.objfun, cases, comm, allgather=True,
+                                              model_mpi=self.model_mpi)
 
-                fitness[:] = np.inf
                 for result in results:
                     returns, traceback = result
 
@@ -734,6 +826,8 @@ class GeneticAlgorithm(object):
                         if success:
                             fitness[ii, :] = val
                             nfit += 1
+                        if cache is not None:
+                            cache.store(x_pop[ii], 'values', (val, success))
 
                     else:
                         # Print the traceback if it fails
@@ -742,19 +836,20 @@ class GeneticAlgorithm(object):
 
             else:
                 # Serial
-                for ii in range(self.npop):
-                    x = x_pop[ii]
-
-                    if np.any(x - vob > 0):
-                        # Exceeded bounds for integer variables that are over-allocated.
-                        success = False
-                    else:
-                        fitness[ii, :], success, _ = self.objfun(x, 0)
+                for ii in run:
+                    val, success, _ = self.objfun(x_pop[ii], 0)
 
                     if success:
+                        fitness[ii, :] = val
+                        nfit += 1
+                    if cache is not None:
+                        cache.store(x_pop[ii], 'values', (val, success))
+
+            if cache is not None:
+                for ii, jj in repeats:
+                    fitness[ii] = fitness[jj]
+                    if np.isfinite(fitness[jj, 0]):
                         nfit += 1
-                    else:
-                        fitness[ii, :] = np.inf
 
             # Find Pareto front.
             if nobj > 1:
@@ -773,8 +868,8 @@ class GeneticAlgorithm(object):
                 # Find best performing point in this generation.
                 min_fit = np.min(fitness)
                 min_index = np.argmin(fitness)
-                min_gen = old_gen[min_index]  # noqa: F841, used above
-                min_x = x_pop[min_index]
+                min_gen = old_gen[min_index].copy()  # noqa: F841, used above
+                min_x = x_pop[min_index].copy()
 
                 if min_fit < fopt:
                     fopt = min_fit
@@ -792,6 +887,141 @@ class GeneticAlgorithm(object):
 
         return xopt, fopt, nfit
 
+    def _execute_steady_state(self, pop, vlb, vub, vob, bits, ncases, Pm, Pc):
+        """
+        Perform the steady-state genetic algorithm.
+
+        After the initial population, each new point is bred from the current population by
+        tournament selection, crossover and mutation, and replaces the worst point if it is
+        better. Under MPI, new points are generated in rank 0 and sent to the first free rank.
+        In a local pool, they are sent to the first free worker process.
+
+        Parameters
+        ----------
+        pop : ndarray
+            Initial population, encoded.
+        vlb : ndarray
+            Lower bounds array.
+        vub : ndarray
+            Upper bounds array.
+        vob : ndarray
+            Outer bounds array. This is purely for bounds check.
+        bits : ndarray
+            Number of bits to encode the design space for each element of the design vector.
+        ncases : int
+            Total number of points to generate, including the initial population.
+        Pm : float
+            Mutation rate.
+        Pc : float
+            Crossover rate.
+
+        Returns
+        -------
+        ndarray
+            Best design point.
+        float
+            Objective value at best design point.
+        int
+            Number of successful function evaluations.
+        """
+        comm = self.comm
+        if comm is not None and comm.size == 1:
+            comm = None
+
+        npop = self.npop
+        fitness = np.full(npop, np.inf)
+        evaluated = np.zeros(npop, dtype=bool)
+        pending = {}
+        cache = self.eval_cache
+        best = {'x': vlb.copy(), 'f': np.inf, 'nfit': 0}
+
+        def select():
+            # binary tournament between two evaluated points
+            idx = np.flatnonzero(evaluated) if np.any(evaluated) else np.arange(npop)
+            i, j = np.random.choice(idx, 2)
+            return pop[i] if fitness[i] <= fitness[j] else pop[j]
+
+        def cases():
+            x_init = self.decode(pop, vlb, vub, bits)
+
+            for icase in range(ncases):
+                if icase < npop:
+                    genome = pop[icase]
+                    x = x_init[icase]
+                else:
+                    genome = select().copy()
+                    mate = select()
+
+                    sites = np.flatnonzero(np.random.rand(self.lchrom) < Pc)
+                    if self.cross_bits:
+                        genome[sites] = mate[sites]
+                    elif sites.size > 0:
+                        genome[sites[0]:] = mate[sites[0]:]
+
+                    flip = np.random.rand(self.lchrom) < Pm
+                    genome[flip] = 1 - genome[flip]
+
+                    x = self.decode(genome[np.newaxis, :], vlb, vub, bits)[0]
+
+                if np.any(x - vob > 0):
+                    # Exceeded bounds for integer variables that are over-allocated.
+                    if icase < npop:
+                        evaluated[icase] = True
+                    continue
+
+                pending[icase] = (genome, x)
+
+                if cache is not None:
+                    # a point that has already been evaluated is taken from the cache
+                    cached = cache.get(x, 'values')
+                    if cached is not None:
+                        receive((cached[0], cached[1], icase), None)
+                        continue
+
+                yield (x, icase), None
+
+        def receive(returns, traceback):
+            if not returns:
+                # Print the traceback if it fails
+                print('A case failed:')
+                print(traceback)
+                return
+
+            val, success, icase = returns
+            genome, x = pending.pop(icase)
+
+            if cache is not None:
+                cache.store(x, 'values', (val, success))
+
+            f = np.asarray(val).item() if success else np.inf
+            if success:
+                best['nfit'] += 1
+
+            if icase < npop:
+                fitness[icase] = f
+                evaluated[icase] = True
+            else:
+                idx = np.flatnonzero(evaluated) if np.any(evaluated) else np.arange(npop)
+                worst = idx[np.argmax(fitness[idx])]
+                # don't let copies of one genome take over the population
+                if f < fitness[worst] and not np.any(np.all(pop[idx] == genome, axis=1)):
+                    pop[worst] = genome
+                    fitness[worst] = f
+
+            if f < best['f']:
+                best['x'] = x
+                best['f'] = f
+
+        if self.pool is not None:
+            self.pool.evaluate(cases(), callback=receive)
+        else:
+            concurrent_eval_lb(self.objfun, cases(), comm, callback=receive)
+
+        if comm is not None:
+            best = comm.bcast(best, root=0)
+
+        return best['x'], best['f'], best['nfit']
+
     def eval_pareto(self, x, obj, x_nd, obj_nd):
         """
         Produce a set of non dominated designs.
@@ -821,19 +1051,31 @@ class GeneticAlgorithm(object):
             ypop = obj
             xpop = x
 
-        n_pts = ypop.shape[0]
-        i = 0
-        pot_idx = np.arange(n_pts)
-        while i < len(ypop):
-            nd_point_mask = np.any(ypop < ypop[i, :], axis=1)
-            nd_point_mask[i] = True
+        n_pts, nobj = ypop.shape
+        keep = np.zeros(n_pts, dtype=bool)
+
+        # A point can only be dominated by a point that comes before it when they are sorted by
+        # their objectives, and an identical point is dropped if it comes after the first one.
+        # So each block of sorted points is compared with the front found so far and with the
+        # earlier points in the block.
+        order = np.lexsort(ypop.T[::-1])
+        front = ypop[:0]
+        block = max(1, min(_PARETO_BLOCK_SIZE, _PARETO_MAX_ELEMENTS // (n_pts * nobj)))
+        earlier = np.tri(block, k=-1, dtype=bool)
+
+        for i in range(0, n_pts, block):
+            iblock = order[i:i + block]
+            y = ypop[iblock]
+            nblock = len(iblock)
 
-            # Remove dominated points
-            pot_idx = pot_idx[nd_point_mask]
-            ypop = ypop[nd_point_mask]
-            i = np.sum(nd_point_mask[:i]) + 1
+            dominated = np.any(np.all(front <= y[:, np.newaxis], axis=2), axis=1)
+            dominated |= np.any(np.all(y <= y[:, np.newaxis], axis=2) &
+                                earlier[:nblock, :nblock], axis=1)
 
-        return xpop[pot_idx, :], ypop
+            keep[iblock[~dominated]] = True
+            front = np.concatenate((front, y[~dominated]))
+
+        return xpop[keep, :], ypop[keep]
 
     def tournament(self, old_gen, fitness):
         """
@@ -852,17 +1094,16 @@ class GeneticAlgorithm(object):
             New generation with best points.
         """
         new_gen = []
-        idx = np.array(range(0, self.npop - 1, 2))
+        idx = np.arange(0, self.npop - 1, 2)
         for j in range(2):
             old_gen, i_shuffled = self.shuffle(old_gen)
             fitness = fitness[i_shuffled]
 
             # Each point competes with its neighbor; save the best.
-            i_min = np.argmin(np.array([[fitness[idx]], [fitness[idx + 1]]]), axis=0)
-            selected = i_min + idx
-            new_gen.append(old_gen[selected])
+            i_min = np.argmin(np.stack((fitness[idx], fitness[idx + 1])), axis=0)
+            new_gen.append(old_gen[idx + i_min])
 
-        return np.concatenate(np.array(new_gen), axis=1).reshape(old_gen.shape)
+        return np.concatenate(new_gen)
 
     def tournament_multi_obj(self, old_gen, obj_val):
         """
@@ -891,8 +1132,8 @@ class GeneticAlgorithm(object):
         new_gen = []
         new_obj = []
 
-        idx = np.array(range(0, npop - 1, nobj))
-        for j in np.arange(nobj):
+        idx = np.arange(0, npop - 1, nobj)
+        for j in range(nobj):
             old_gen, i_shuffled = self.shuffle(old_gen)
             obj_val = obj_val[i_shuffled]
 
@@ -902,8 +1143,9 @@ class GeneticAlgorithm(object):
             new_gen.append(old_gen[selected])
             new_obj.append(obj_val[selected])
 
-        return np.concatenate(np.array(new_gen), axis=1).reshape(old_gen.shape), \
-            np.concatenate(np.array(new_obj), axis=1).reshape(obj_val.shape)
+        # winners of the different objectives alternate in the new generation
+        return np.stack(new_gen, axis=1).reshape(old_gen.shape), \
+            np.stack(new_obj, axis=1).reshape(obj_val.shape)
 
     def crossover(self, old_gen, Pc):
         """
@@ -923,19 +1165,18 @@ class GeneticAlgorithm(object):
         ndarray
             Current generation with crossovers applied.
         """
-        new_gen = copy.deepcopy(old_gen)
         num_sites = self.npop // 2
-        sites = np.random.rand(num_sites, self.lchrom)
-        idx, idy = np.where(sites < Pc)
-        for ii, jj in zip(idx, idy):
-            i = 2 * ii
-            j = i + 1
-            if self.cross_bits:  # swap single bit
-                new_gen[i][jj] = old_gen[j][jj]
-                new_gen[j][jj] = old_gen[i][jj]
-            else:               # swap remainder
-                new_gen[i][jj:] = old_gen[j][jj:]
-                new_gen[j][jj:] = old_gen[i][jj:]
+        sites = np.random.rand(num_sites, self.lchrom) < Pc
+
+        if not self.cross_bits:
+            # Swapping the tail at the first site also swaps it at all later sites.
+            first = np.argmax(sites, axis=1)[:, np.newaxis]
+            sites = (np.arange(self.lchrom) >= first) & np.any(sites, axis=1)[:, np.newaxis]
+
+        i = np.arange(0, 2 * num_sites, 2)
+        new_gen = old_gen.copy()
+        new_gen[i] = np.where(sites, old_gen[i + 1], old_gen[i])
+        new_gen[i + 1] = np.where(sites, old_gen[i], old_gen[i + 1])
         return new_gen
 
     def mutate(self, current_gen, Pm):
@@ -957,9 +1198,8 @@ class GeneticAlgorithm(object):
         ndarray
             Current generation with mutations applied.
         """
-        temp = np.random.rand(self.npop, self.lchrom)
-        idx, idy = np.where(temp < Pm)
-        current_gen[idx, idy] = 1 - current_gen[idx, idy]
+        flip = np.random.rand(self.npop, self.lchrom) < Pm
+        current_gen[flip] = 1 - current_gen[flip]
         return current_gen
 
     def shuffle(self, old_gen):
@@ -1004,22 +1244,17 @@ class GeneticAlgorithm(object):
         ndarray
             Decoded design variable values.
         """
-        pts = gen.copy()
-        if self.gray_code:
-            for i in range(np.shape(gen)[0]):
-                pts[i] = self.from_gray(gen[i])
+        pts = self.from_gray(gen) if self.gray_code else gen
         num_desvar = len(bits)
         interval = (vub - vlb) / (2**bits - 1)
-        x = np.empty((self.npop, num_desvar))
-        sbit = 0
-        ebit = 0
-        for jj in range(num_desvar):
-            exponents = 2**np.array(range(bits[jj] - 1, -1, -1))
-            ebit += bits[jj]
-            fact = exponents * (pts[:, sbit:ebit])
-            x[:, jj] = np.einsum('ij->i', fact) * interval[jj] + vlb[jj]
-            sbit = ebit
-        return x
+
+        # Each bit adds its place value to the integer of its design variable.
+        ivar = np.repeat(np.arange(num_desvar), bits)
+        ibit = np.arange(ivar.size)
+        place = np.zeros((ivar.size, num_desvar))
+        place[ibit, ivar] = 2.0 ** (np.cumsum(bits)[ivar] - 1 - ibit)
+
+        return (pts @ place) * interval + vlb
 
     def encode(self, x, vlb, vub, bits):
         """
@@ -1047,8 +1282,11 @@ class GeneticAlgorithm(object):
         x = np.maximum(x, vlb)
         x = np.minimum(x, vub)
         x = np.round((x - vlb) / interval).astype(np.int_)
-        byte_str = [("0" * b + bin(i)[2:])[-b:] for i, b in zip(x, bits)]
-        result = np.array([int(c) for s in byte_str for c in s])
+
+        ivar = np.repeat(np.arange(len(bits)), bits)
+        shift = np.cumsum(bits)[ivar] - 1 - np.arange(ivar.size)
+        result = (x[..., ivar] >> shift) & 1
+
         if self.gray_code:
             result = self.to_gray(result)
         return result
@@ -1068,11 +1306,10 @@ class GeneticAlgorithm(object):
         ndarray
             Binary array using Gray code, e.g. np.array([0, 0, 1, 1]).
         """
-        s = ''.join([str(x) for x in g])                     # convert to binary string: '0010'
-        i = int(s, 2)                                        # convert to Integer: 2
-        gi = i ^ (i >> 1)                                    # compute gray code Integer: 3
-        gs = np.binary_repr(gi, len(g))                      # convert to binary string: '0011'
-        return np.array([0 if q == '0' else 1 for q in gs])  # convert to np.array: [0, 0, 1, 1]
+        b = np.asarray(g, dtype=np.int_)
+        gray = b.copy()
+        gray[..., 1:] ^= b[..., :-1]  # each bit is xor'ed with the bit before it
+        return gray
 
     @staticmethod
     def from_gray(g):
@@ -1091,8 +1328,5 @@ class GeneticAlgorithm(object):
         ndarray
             Binary array using normal coding, e.g. np.array([0, 0, 1, 0]).
         """
-        b = g.copy()
-        for i in range(1, len(g)):
-            prev = 1 if b[i - 1] == 0 else 0
-            b[i] = b[i - 1] if g[i] == 0 else prev
-        return b
+        # each bit is the xor of all of the gray coded bits up to it
+        return np.cumsum(g, axis=-1) % 2
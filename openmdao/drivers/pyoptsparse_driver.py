@@ -272,6 +272,12 @@ class pyOptSparseDriver(Driver):
                              allow_none=True,
                              desc='Directory location of pyopt_sparse output files.'
                              'Default is {prob_name}_out/reports.')
+        self.options.declare('eval_cache_size', types=int, default=0, lower=0,
+                             desc='Maximum number of design points whose objective, constraint '
+                                  'and total derivative values are kept, so that the model is not '
+                                  'run again when the optimizer returns to one of them. The least '
+                                  'recently used point is dropped first. Set to 0 to turn the '
+                                  'cache off.')
 
     @property
     def hist_file(self):
@@ -356,6 +362,7 @@ class pyOptSparseDriver(Driver):
         self._total_jac_linear = None
         self.iter_count = 0
         self._nl_responses = []
+        self._setup_eval_cache()
 
         optimizer = self.options['optimizer']
 
@@ -690,6 +697,7 @@ class pyOptSparseDriver(Driver):
             1 for unsuccessful function evaluation
         """
         model = self._problem().model
+        cache = self._eval_cache
         fail = 0
 
         # Note: we place our handler as late as possible so that codes that run in the
@@ -699,6 +707,11 @@ class pyOptSparseDriver(Driver):
             self._signal_cache = signal.getsignal(sigusr)
             signal.signal(sigusr, self._signal_handler)
 
+        if cache is not None:
+            func_dict = cache.get(dv_dict, 'values')
+            if func_dict is not None:
+                return func_dict, 0
+
         try:
             for name in self._designvars:
                 self.set_design_var(name, dv_dict[name])
@@ -750,6 +763,11 @@ class pyOptSparseDriver(Driver):
             for name in func_dict:
                 func_dict[name].fill(np.nan)
 
+        if cache is not None:
+            cache.set_current(dv_dict)
+            if fail == 0:
+                cache.store(dv_dict, 'values', func_dict)
+
         # print("Functions calculated")
         # print(dv_dict)
         # print(func_dict, flush=True)
@@ -783,6 +801,7 @@ class pyOptSparseDriver(Driver):
         """
         prob = self._problem()
         model = prob.model
+        cache = self._eval_cache
         fail = 0
         sens_dict = {}
         nl_dvs = self._get_nl_dvs()
@@ -793,10 +812,25 @@ class pyOptSparseDriver(Driver):
             if self._user_termination_flag:
                 return {}, 2
 
+            totals = None if cache is None else cache.get(dv_dict, 'jac')
+
             try:
+                if totals is None and cache is not None and not cache.is_current(dv_dict):
+                    # The model was last run at another point, so it has to be run here first.
+                    cache.discard(dv_dict)
+                    _, fail = self._objfunc(dv_dict)
+                    if fail == 1:
+                        raise AnalysisError('Model evaluation failed.')
+                    elif fail == 2:
+                        raise UserRequestedException('User requested termination.')
+
                 self._in_user_function = True
-                sens_dict = self._compute_totals(of=self._nl_responses, wrt=nl_dvs,
-                                                 return_format=self._total_jac_format)
+                if totals is None:
+                    totals = self._compute_totals(of=self._nl_responses, wrt=nl_dvs,
+                                                  return_format=self._total_jac_format)
+                    if cache is not None:
+                        cache.store(dv_dict, 'jac', totals)
+                sens_dict = totals
 
                 # First time through, check for zero row/col.
                 if self._check_jac and self._total_jac is not None:
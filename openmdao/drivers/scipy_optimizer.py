@@ -195,6 +195,11 @@ class ScipyOptimizeDriver(Driver):
                              "ignore - don't perform check.")
         self.options.declare('singular_jac_tol', default=1e-16,
                              desc='Tolerance for zero row/column check.')
+        self.options.declare('eval_cache_size', types=int, default=0, lower=0,
+                             desc='Maximum number of design points whose objective, constraint '
+                             'and total derivative values are kept, so that the model is not run '
+                             'again when the optimizer returns to one of them. The least recently '
+                             'used point is dropped first. Set to 0 to turn the cache off.')
 
     def _get_name(self):
         """
@@ -264,6 +269,7 @@ class ScipyOptimizeDriver(Driver):
         self._total_jac = None
         self._total_jac_linear = None
         self._desvar_array_cache = None
+        self._setup_eval_cache()
 
         self._check_for_missing_objective()
         self._check_for_invalid_desvar_values()
@@ -346,6 +352,13 @@ class ScipyOptimizeDriver(Driver):
             keep_feasible = self.opt_settings.get('keep_feasible_bounds', True)
             bounds = Bounds(lb=lower, ub=upper, keep_feasible=keep_feasible)
 
+        # The optimizer usually starts by evaluating the initial point, which was just run.
+        cache = self._eval_cache
+        if cache is not None:
+            f_init = next(iter(self.get_objective_values().values()))
+            cache.store(x_init, 'values', (f_init, self._con_cache))
+            cache.set_current(x_init)
+
         # Constraints
         constraints = []
         nl_i = 1  # start at 1 since row 0 is the objective.  Constraints start at row 1.
@@ -574,6 +587,15 @@ class ScipyOptimizeDriver(Driver):
 
         self._scipy_optimize_result = result
 
+        # Results taken from the cache don't run the model, so make sure that it is left at the
+        # final point.
+        x_final = getattr(result, 'x', None)
+        if cache is not None and x_final is not None and not cache.is_current(x_final):
+            cache.discard(x_final)
+            self._objfunc(x_final)
+            if self._exc_info is not None:
+                self._reraise()
+
         if hasattr(result, 'success'):
             self.fail = not result.success
             if self.fail:
@@ -612,6 +634,7 @@ class ScipyOptimizeDriver(Driver):
             Value of the objective function evaluated at the new design point.
         """
         model = self._problem().model
+        cache = self._eval_cache
 
         try:
 
@@ -619,6 +642,12 @@ class ScipyOptimizeDriver(Driver):
             if MPI:
                 model.comm.Bcast(x_new, root=0)
 
+            if cache is not None:
+                values = cache.get(x_new, 'values')
+                if values is not None:
+                    f_new, self._con_cache = values
+                    return f_new
+
             if self._desvar_array_cache is None:
                 self._desvar_array_cache = np.empty(x_new.shape, dtype=x_new.dtype)
 
@@ -638,6 +667,10 @@ class ScipyOptimizeDriver(Driver):
 
             self._con_cache = self.get_constraint_values()
 
+            if cache is not None:
+                cache.store(x_new, 'values', (f_new, self._con_cache))
+                cache.set_current(x_new)
+
         except Exception:
             if self._exc_info is None:  # only record the first one
                 self._exc_info = sys.exc_info()
@@ -748,10 +781,22 @@ class ScipyOptimizeDriver(Driver):
         """
         prob = self._problem()
         model = prob.model
+        cache = self._eval_cache
 
         try:
-            grad = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
-                                        return_format=self._total_jac_format)
+            grad = None if cache is None else cache.get(x_new, 'jac')
+
+            if grad is None:
+                if cache is not None and not cache.is_current(x_new):
+                    # The model was last run at another point, so it has to be run here first.
+                    cache.discard(x_new)
+                    self._objfunc(x_new)
+
+                grad = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
+                                            return_format=self._total_jac_format)
+                if cache is not None:
+                    cache.store(x_new, 'jac', grad)
+
             self._grad_cache = grad
 
             # First time through, check for zero row/col.
@@ -422,6 +422,73 @@ class TestAnalysisDriver(unittest.TestCase):
                 num_recorded_cases += len(cr.list_cases(out_stream=None))
             self.assertEqual(num_recorded_cases, 4)
 
+    def test_num_workers(self):
+        """
+        Test AnalysisDriver running samples in local worker processes.
+        """
+        prob = om.Problem()
+
+        prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+
+        prob.driver = om.AnalysisDriver(samples=fullfact3, num_workers=2)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+        prob.driver.recording_options.set(record_derivatives=True)
+
+        prob.driver.add_response('f_xy', units=None, indices=[0])
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual(prob.driver.result.model_evals, 9)
+
+        cr = om.CaseReader(prob.get_outputs_dir() / "cases.sql")
+        case_numbers = set()
+        for case in cr.get_cases(source='driver'):
+            case_number = int(case.name.split('|')[-1])
+            case_numbers.add(case_number)
+            assert_near_equal(case.get_val('f_xy'), expected_fullfact3[case_number]['f_xy'])
+            for wrt in ['x', 'y']:
+                expected_deriv = expected_fullfact3_derivs[case_number]['f_xy', wrt]
+                assert_near_equal(case.derivatives['f_xy', wrt], np.atleast_2d(expected_deriv))
+
+        self.assertSetEqual(case_numbers, set(range(9)))
+
+    def test_restart(self):
+        """
+        Test AnalysisDriver skipping the samples recorded by an earlier run.
+        """
+        first = om.Problem(name='first')
+        first.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        first.driver = om.AnalysisDriver(samples=fullfact3[:4])
+        first.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+        first.driver.add_response('f_xy', units=None, indices=[0])
+        first.setup()
+        first.run_driver()
+        first.cleanup()
+
+        prob = om.Problem(name='restart')
+        prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        prob.driver = om.AnalysisDriver(samples=fullfact3,
+                                        restart_from=first.get_outputs_dir() / "cases.sql")
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+        prob.driver.add_response('f_xy', units=None, indices=[0])
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        # only the remaining samples are run, and they keep their sample numbers
+        self.assertEqual(prob.driver.result.model_evals, 5)
+
+        cr = om.CaseReader(prob.get_outputs_dir() / "cases.sql")
+        case_numbers = []
+        for case in cr.get_cases(source='driver'):
+            case_number = int(case.name.split('|')[-1])
+            case_numbers.append(case_number)
+            assert_near_equal(case.get_val('f_xy'), expected_fullfact3[case_number]['f_xy'])
+
+        self.assertEqual(case_numbers, list(range(4, 9)))
+
     def test_output_in_sample(self):
         """
         Test AnalysisDriver when the variables changed in the samples are changing.
@@ -101,6 +101,74 @@ class TestDifferentialEvolution(unittest.TestCase):
         # Optimal solution (actual optimum, not the optimal with integer inputs as found by SimpleGA)
         assert_near_equal(prob['comp.f'], 0.397887, 1e-4)
 
+    def test_steady_state(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.DifferentialEvolutionDriver(steady_state=True)
+
+        prob.setup()
+        prob.run_driver()
+
+        assert_near_equal(prob['comp.f'], 0.397887, 1e-4)
+
+        # same evaluation budget as the generational algorithm
+        self.assertEqual(prob.driver.iter_count,
+                         (prob.driver.options['max_gen'] + 1) * prob.driver._ga.npop + 1)
+
+    def test_num_workers(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.DifferentialEvolutionDriver(num_workers=2)
+        prob.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        assert_near_equal(prob['comp.f'], 0.397887, 1e-4)
+
+        # every evaluation in the workers, plus the final one, is recorded in this process
+        cr = om.CaseReader(prob.get_outputs_dir() / 'cases.sql')
+        cases = cr.list_cases('driver', out_stream=None)
+        self.assertEqual(len(cases), prob.driver.iter_count)
+        self.assertEqual(len(set(cases)), prob.driver.iter_count)
+        self.assertEqual(prob.driver.result.model_evals, prob.driver.iter_count)
+
+    def test_steady_state_errors(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.DifferentialEvolutionDriver(steady_state=True, procs_per_model=2)
+
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as err:
+            prob.final_setup()
+
+        self.assertEqual(str(err.exception),
+                         "DifferentialEvolutionDriver: The 'steady_state' option requires "
+                         "'procs_per_model' to be 1.")
+
     def test_rastrigin(self):
 
         ORDER = 6  # dimension of problem
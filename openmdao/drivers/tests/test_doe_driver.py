@@ -19,11 +19,12 @@ from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.test_suite.components.paraboloid_distributed import DistParab
 from openmdao.test_suite.groups.parallel_groups import FanInGrouped
 
-from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.assert_utils import assert_near_equal, assert_warning
 from openmdao.utils.general_utils import run_driver
 from openmdao.utils.testing_utils import use_tempdirs
 
 from openmdao.utils.mpi import MPI
+from openmdao.utils.om_warnings import DriverWarning
 
 try:
     from openmdao.vectors.petsc_vector import PETScVector
@@ -1589,6 +1590,141 @@ class TestDOEDriver(unittest.TestCase):
             derivs = cr.get_case(case).derivatives
             self.assertIsNone(derivs)
 
+    def test_num_workers(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        model.set_input_defaults('x', 0.0)
+        model.set_input_defaults('y', 0.0)
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(self.fullfact3, num_workers=2)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+        prob.driver.recording_options['record_derivatives'] = True
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual(prob.driver.iter_count, 9)
+        self.assertEqual(prob.driver.result.model_evals, 9)
+
+        cr = om.CaseReader(prob.get_outputs_dir() / "cases.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+
+        self.assertEqual(len(cases), 9)
+
+        # cases are recorded in the order they finish, but keep their iteration coordinate
+        cases = sorted(cases, key=lambda case: int(case.split('|')[-1]))
+        self.assertEqual(cases, [f'rank0:DOEDriver_List|{i}' for i in range(9)])
+
+        for case, expected_val, expected_deriv in zip(cases, self.expected_fullfact3,
+                                                      self.expected_fullfact3_derivs):
+            outputs = cr.get_case(case).outputs
+            for name in ('x', 'y', 'f_xy'):
+                self.assertEqual(outputs[name], expected_val[name])
+
+            derivs = cr.get_case(case).derivatives
+            for dv in ('x', 'y'):
+                self.assertEqual(derivs['f_xy', dv], expected_deriv['f_xy', dv])
+
+    def test_num_workers_other_threads(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        model.set_input_defaults('x', 0.0)
+        model.set_input_defaults('y', 0.0)
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        # the writer thread of the recorder is running, so no workers are forked
+        prob.driver = om.DOEDriver(self.fullfact3, num_workers=2)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql", async_write=True))
+
+        prob.setup()
+
+        msg = ("DOEDriver: num_workers = 2 but other threads are running in this process, so "
+               "no worker processes can be forked safely. Cases will be evaluated serially.")
+        with assert_warning(DriverWarning, msg):
+            prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual(prob.driver.iter_count, 9)
+
+        cr = om.CaseReader(prob.get_outputs_dir() / "cases.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+        self.assertEqual(cases, [f'rank0:DOEDriver_List|{i}' for i in range(9)])
+
+        for case, expected_val in zip(cases, self.expected_fullfact3):
+            outputs = cr.get_case(case).outputs
+            for name in ('x', 'y', 'f_xy'):
+                self.assertEqual(outputs[name], expected_val[name])
+
+    @unittest.skipUnless(pyDOE3, "requires 'pyDOE3', pip install openmdao[doe]")
+    def test_full_factorial_chunks(self):
+        # more cases than are generated at a time
+        design_vars = {'x': {'size': 2, 'global_size': 2, 'distributed': False,
+                             'lower': 0., 'upper': 1.},
+                       'y': {'size': 1, 'global_size': 1, 'distributed': False,
+                             'lower': np.array([-1.]), 'upper': np.array([1.])}}
+
+        cases = list(om.FullFactorialGenerator(levels=11)(design_vars))
+        self.assertEqual(len(cases), 11**3)
+
+        levels = np.linspace(0., 1., 11), np.linspace(0., 1., 11), np.linspace(-1., 1., 11)
+        for case, idx in zip(cases, pyDOE3.fullfact([11, 11, 11]).astype(int)):
+            self.assertEqual([name for name, _ in case], ['x', 'y'])
+            assert_near_equal(case[0][1], [levels[0][idx[0]], levels[1][idx[1]]], 1e-15)
+            assert_near_equal(case[1][1], [levels[2][idx[2]]], 1e-15)
+
+    def _run_uniform_doe(self, name, num_samples, **options):
+        prob = om.Problem(name=name)
+        model = prob.model
+
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        model.add_design_var('x', lower=-10.0, upper=10.0)
+        model.add_design_var('y', lower=-10.0, upper=10.0)
+        model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(om.UniformGenerator(num_samples=num_samples, seed=0),
+                                   **options)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / "cases.sql")
+        cases = {case.name: case for case in cr.get_cases('driver')}
+        return prob, cases
+
+    def test_restart(self):
+        _, expected = self._run_uniform_doe('full', 10)
+
+        first, cases = self._run_uniform_doe('first', 5)
+        self.assertEqual(sorted(cases), [f'rank0:DOEDriver_Uniform|{i}' for i in range(5)])
+
+        for num_workers in (1, 2):
+            with self.subTest(num_workers=num_workers):
+                prob, cases = self._run_uniform_doe(f'restart{num_workers}', 10,
+                                                    num_workers=num_workers,
+                                                    restart_from=first.get_outputs_dir() /
+                                                    'cases.sql')
+
+                # only the remaining cases are run, and they keep their case numbers
+                self.assertEqual(prob.driver.result.model_evals, 5)
+                self.assertEqual(sorted(cases, key=lambda case: int(case.split('|')[-1])),
+                                 [f'rank0:DOEDriver_Uniform|{i}' for i in range(5, 10)])
+
+                for name, case in cases.items():
+                    for var in ('x', 'y', 'f_xy'):
+                        self.assertEqual(case.outputs[var], expected[name].outputs[var])
+
 
 @use_tempdirs
 class TestDOEDriverListVars(unittest.TestCase):
@@ -166,6 +166,165 @@ class TestSimpleGA(unittest.TestCase):
         assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
         self.assertTrue(int(prob['xI'].item()) in [3, -3])
 
+    def test_mixed_integer_branin_steady_state(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.set_input_defaults('xC', 7.5)
+        model.set_input_defaults('xI', 0.0)
+
+        model.add_subsystem('comp', Branin(),
+                            promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(max_gen=75, pop_size=25, steady_state=True)
+        prob.driver.options['bits'] = {'xC': 8}
+
+        prob.driver._randomstate = 1
+
+        prob.setup()
+        prob.run_driver()
+
+        if extra_prints:
+            print('comp.f', prob['comp.f'])
+
+        # Optimal solution
+        assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+        self.assertTrue(int(prob['xI'].item()) in [3, -3])
+
+    def test_mixed_integer_branin_num_workers(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.set_input_defaults('xC', 7.5)
+        model.set_input_defaults('xI', 0.0)
+
+        model.add_subsystem('comp', Branin(),
+                            promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(max_gen=75, pop_size=25, num_workers=2)
+        prob.driver.options['bits'] = {'xC': 8}
+        prob.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+
+        prob.driver._randomstate = 1
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        # same points and optimum as the serial run
+        assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+        self.assertTrue(int(prob['xI'].item()) in [3, -3])
+
+        # every evaluation in the workers, plus the final one, is recorded in this process
+        cr = om.CaseReader(prob.get_outputs_dir() / 'cases.sql')
+        cases = cr.list_cases('driver', out_stream=None)
+        self.assertEqual(len(cases), prob.driver.iter_count)
+        self.assertEqual(len(set(cases)), prob.driver.iter_count)
+        self.assertEqual(prob.driver.result.model_evals, prob.driver.iter_count)
+
+    def test_mixed_integer_branin_eval_cache_iters(self):
+        iter_count = {}
+        for size, num_workers in ((0, 1), (1000, 1), (1000, 2)):
+            prob = om.Problem()
+            model = prob.model
+
+            model.set_input_defaults('xC', 7.5)
+            model.set_input_defaults('xI', 0.0)
+
+            model.add_subsystem('comp', Branin(),
+                                promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+            model.add_design_var('xI', lower=-5.0, upper=10.0)
+            model.add_design_var('xC', lower=0.0, upper=15.0)
+            model.add_objective('comp.f')
+
+            prob.driver = om.SimpleGADriver(max_gen=75, pop_size=25, eval_cache_size=size,
+                                            num_workers=num_workers)
+            prob.driver.options['bits'] = {'xC': 8}
+
+            prob.driver._randomstate = 1
+
+            prob.setup()
+            prob.run_driver()
+
+            # the search itself is unchanged
+            assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+            self.assertTrue(int(prob['xI'].item()) in [3, -3])
+
+            iter_count[size, num_workers] = prob.driver.iter_count
+
+            if size > 0:
+                # the cache is kept in this process, so points are looked up before they are
+                # sent to the workers
+                self.assertGreater(prob.driver._eval_cache.hits, 0)
+
+        self.assertLess(iter_count[1000, 1], iter_count[0, 1] / 2)
+        self.assertLess(iter_count[1000, 2], iter_count[0, 1] / 2)
+
+    def test_mixed_integer_branin_eval_cache(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.set_input_defaults('xC', 7.5)
+        model.set_input_defaults('xI', 0.0)
+
+        model.add_subsystem('comp', Branin(),
+                            promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(max_gen=75, pop_size=25, eval_cache_size=100)
+        prob.driver.options['bits'] = {'xC': 8}
+
+        prob.driver._randomstate = 1
+
+        prob.setup()
+        prob.run_driver()
+
+        # same optimum as without the cache
+        assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+        self.assertTrue(int(prob['xI'].item()) in [3, -3])
+
+        # revisited points are taken from the cache, so the model runs less often
+        cache = prob.driver._eval_cache
+        self.assertGreater(cache.hits, 0)
+        self.assertEqual(len(cache), 100)
+        self.assertLess(prob.driver.result.model_evals + cache.hits, prob.driver._nfit + 1)
+        self.assertEqual(prob.driver.result.model_evals, prob.driver.iter_count)
+
+    def test_steady_state_errors(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(),
+                            promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(steady_state=True, compute_pareto=True)
+        prob.driver.options['bits'] = {'xC': 8}
+
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as err:
+            prob.final_setup()
+
+        self.assertEqual(str(err.exception),
+                         "SimpleGADriver: The 'steady_state' option is not available "
+                         "with 'compute_pareto'.")
+
     def test_mixed_integer_branin_discrete(self):
         prob = om.Problem(reports=('optimizer',))
         model = prob.model
@@ -322,6 +322,46 @@ class TestPyoptSparse(unittest.TestCase):
         assert_near_equal(prob['x'], 7.16667, 1e-6)
         assert_near_equal(prob['y'], -7.833334, 1e-6)
 
+    def test_eval_cache(self):
+        results = {}
+        for size in (0, 20):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('p1', om.IndepVarComp('x', 50.0), promotes=['*'])
+            model.add_subsystem('p2', om.IndepVarComp('y', 50.0), promotes=['*'])
+            model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+            model.add_subsystem('con', om.ExecComp('c = - x + y'), promotes=['*'])
+
+            prob.set_solver_print(level=0)
+
+            prob.driver = pyOptSparseDriver(optimizer=OPTIMIZER, print_results=False,
+                                            eval_cache_size=size)
+            if OPTIMIZER == 'SLSQP':
+                prob.driver.opt_settings['ACC'] = 1e-9
+
+            model.add_design_var('x', lower=-50.0, upper=50.0)
+            model.add_design_var('y', lower=-50.0, upper=50.0)
+            model.add_objective('f_xy')
+            model.add_constraint('c', upper=-15.0)
+
+            prob.setup()
+
+            result = prob.run_driver()
+
+            self.assertTrue(result.success, "Optimization failed, info = " +
+                            str(prob.driver.pyopt_solution.optInform))
+
+            # Minimum should be at (7.166667, -7.833334)
+            assert_near_equal(prob['x'], 7.16667, 1e-6)
+            assert_near_equal(prob['y'], -7.833334, 1e-6)
+
+            results[size] = (result.model_evals, result.deriv_evals)
+
+        # points that were already visited are not run again
+        self.assertLessEqual(results[20][0], results[0][0])
+        self.assertLessEqual(results[20][1], results[0][1])
+
     def test_simple_paraboloid_upper_indices(self):
 
         prob = om.Problem()
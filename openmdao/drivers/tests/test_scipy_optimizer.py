@@ -473,6 +473,43 @@ class TestScipyOptimizeDriver(unittest.TestCase):
         assert_near_equal(prob['x'], 7.16667, 1e-6)
         assert_near_equal(prob['y'], -7.833334, 1e-6)
 
+    def test_eval_cache(self):
+        results = {}
+        for size in (0, 20):
+            prob = om.Problem()
+            model = prob.model
+
+            model.set_input_defaults('x', val=50.)
+            model.set_input_defaults('y', val=50.)
+
+            model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+            model.add_subsystem('con', om.ExecComp('c = - x + y'), promotes=['*'])
+
+            prob.set_solver_print(level=0)
+
+            prob.driver = om.ScipyOptimizeDriver(optimizer='L-BFGS-B', tol=1e-9, disp=False,
+                                                 eval_cache_size=size)
+
+            model.add_design_var('x', lower=-50.0, upper=50.0)
+            model.add_design_var('y', lower=-50.0, upper=50.0)
+            model.add_objective('f_xy')
+
+            prob.setup()
+            prob.run_driver()
+
+            results[size] = (prob.get_val('x'), prob.get_val('y'), prob.get_val('f_xy'),
+                             prob.driver.result.model_evals, prob.driver.result.deriv_evals)
+
+        # points already visited are not run again, but the optimization is unchanged
+        x, y, f, model_evals, deriv_evals = results[20]
+        assert_near_equal(x, results[0][0], 1e-12)
+        assert_near_equal(y, results[0][1], 1e-12)
+        assert_near_equal(f, results[0][2], 1e-12)
+        self.assertLess(model_evals, results[0][3])
+        self.assertLessEqual(deriv_evals, results[0][4])
+        assert_near_equal(x, 6.66666667, 1e-6)
+        assert_near_equal(y, -7.33333333, 1e-6)
+
     def test_simple_paraboloid_lower(self):
 
         prob = om.Problem()
@@ -2,6 +2,7 @@
 CaseReader factory function.
 """
 from openmdao.recorders.sqlite_reader import SqliteCaseReader
+from openmdao.recorders.npy_reader import NpyCaseReader, is_npy_recording
 
 
 def CaseReader(filename, pre_load=True, metadata_filename=None):
@@ -12,7 +13,8 @@ def CaseReader(filename, pre_load=True, metadata_filename=None):
     ----------
     filename : str or Path
         A path to the recorded file.
-        Currently only sqlite database files recorded via SqliteRecorder are supported.
+        Sqlite database files recorded via SqliteRecorder and directories recorded via
+        NpyRecorder are supported.
     pre_load : bool
         If True, load all the data into memory during initialization.
     metadata_filename : str
@@ -23,4 +25,7 @@ def CaseReader(filename, pre_load=True, metadata_filename=None):
     BaseCaseReader
         An instance of a CaseReader.
     """
+    if is_npy_recording(filename):
+        return NpyCaseReader(filename, pre_load)
+
     return SqliteCaseReader(filename, pre_load, metadata_filename)
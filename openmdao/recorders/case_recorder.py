@@ -8,12 +8,139 @@ from openmdao.core.problem import Problem
 from openmdao.utils.mpi import MPI
 from openmdao.utils.options_dictionary import OptionsDictionary
 from openmdao.utils.record_util import check_path
+from openmdao.utils.general_utils import make_serializable
 
 
 # default pickle protocol version for serialization
 PICKLE_VER = 4
 
 
+def _get_requester_system(recording_requester):
+    """
+    Get the System and Driver associated with a recording requester.
+
+    Parameters
+    ----------
+    recording_requester : object
+        Object to which a recorder is attached.
+
+    Returns
+    -------
+    System
+        The system whose variables are recorded.
+    Driver or None
+        The driver associated with the requester, if any.
+    """
+    if isinstance(recording_requester, Driver):
+        return recording_requester._problem().model, recording_requester
+    elif isinstance(recording_requester, System):
+        return recording_requester, None
+    elif isinstance(recording_requester, Problem):
+        return recording_requester.model, recording_requester.driver
+    elif isinstance(recording_requester, Solver):
+        return recording_requester._system(), None
+
+    raise ValueError('Driver encountered a recording_requester it cannot handle'
+                     ': {0}'.format(recording_requester))
+
+
+def _update_var_metadata(system, desvars, responses, objectives, constraints, states, var_order,
+                         abs2prom, prom2abs, abs2meta):
+    """
+    Merge the variable names and metadata of the given system into a recorder's maps.
+
+    Parameters
+    ----------
+    system : System
+        The system whose variables are recorded.
+    desvars : dict
+        Design variable metadata.
+    responses : dict
+        Response metadata.
+    objectives : dict
+        Objective metadata.
+    constraints : dict
+        Constraint metadata.
+    states : list
+        Absolute names of all state variables.
+    var_order : list
+        Variable names in execution order.
+    abs2prom : {'input': dict, 'output': dict}
+        Dictionary mapping absolute names to promoted names, updated in place.
+    prom2abs : {'input': dict, 'output': dict}
+        Dictionary mapping promoted names to absolute names, updated in place.
+    abs2meta : dict
+        Dictionary mapping absolute variable names to their metadata, updated in place.
+
+    Returns
+    -------
+    dict
+        Settings of the design variables, objectives and constraints in a form that can be
+        dumped as JSON, plus the variable execution order.
+    """
+    # merge current abs2prom and prom2abs with this system's version
+    abs2prom['input'].update(system._resolver.abs2prom_iter('input'))
+    abs2prom['output'].update(system._resolver.abs2prom_iter('output'))
+    for v, abs_names in system._resolver.prom2abs_iter('input'):
+        if v not in prom2abs['input']:
+            prom2abs['input'][v] = abs_names.copy()
+        else:
+            lst = prom2abs['input'][v]
+            old = set(lst)
+            for name in abs_names:
+                if name not in old:
+                    lst.append(name)
+
+    # for outputs, there can be only one abs name per promoted name
+    for v, abs_names in system._resolver.prom2abs_iter('output'):
+        prom2abs['output'][v] = abs_names
+
+    for name, meta in system.abs_meta_iter('output', local=False, discrete=True):
+        if name not in abs2meta:
+            meta = meta.copy()
+            abs2meta[name] = meta
+            meta['type'] = ['output']
+            meta['explicit'] = name not in states
+
+    for name, meta in system.abs_meta_iter('input', local=False, discrete=True):
+        if name not in abs2meta:
+            meta = meta.copy()
+            abs2meta[name] = meta
+            meta['type'] = ['input']
+            meta['explicit'] = True
+
+    for varinfo, var_type in [(desvars, 'desvar'), (responses, 'response'),
+                              (objectives, 'objective'), (constraints, 'constraint')]:
+        for name, vmeta in varinfo.items():
+            srcname = vmeta['source']
+            abs2meta[srcname]['type'].append(var_type)
+            abs2meta[srcname]['explicit'] = srcname not in states
+
+    # convert all abs2meta variable properties to a form that can be dumped as JSON
+    for meta in abs2meta.values():
+        for prop, val in meta.items():
+            meta[prop] = make_serializable(val)
+
+    # TODO: seems like we could clobber the var_settings for a desvar in cases where a
+    # desvar is also a constraint... Make a test case and fix if needed.
+    var_settings = {}
+    var_settings.update(desvars)
+    var_settings.update(objectives)
+    var_settings.update(constraints)
+
+    # copy the inner dicts to prevent modifying the original designvars, objectives,
+    # and constraints.
+    for name, meta in var_settings.items():
+        meta = meta.copy()
+        for prop, val in meta.items():
+            meta[prop] = make_serializable(val)
+        var_settings[name] = meta
+
+    var_settings['execution_order'] = var_order
+
+    return var_settings
+
+
 class CaseRecorder(object):
     """
     Base class for all case recorders and is not a functioning case recorder on its own.
@@ -0,0 +1,560 @@
+"""
+Definition of the NpyCaseReader.
+"""
+import os
+import sys
+import json
+import pathlib
+import struct
+from io import TextIOBase
+
+import numpy as np
+
+from openmdao.recorders.base_case_reader import BaseCaseReader
+from openmdao.recorders.case import Case
+from openmdao.recorders.npy_recorder import format_version, INDEX_FILENAME, CASES_FILENAME, \
+    OBJECTS_FILENAME, DERIVS_TABLE
+from openmdao.recorders.sqlite_reader import _safer_unpickle
+from openmdao.core.constants import _DEFAULT_OUT_STREAM
+from openmdao.utils.variable_table import write_source_table
+from openmdao.utils.record_util import dict_to_structured_array, get_recorded_name
+from openmdao.utils.notebook_utils import notebook, display, HTML
+from openmdao.visualization.tables.table_builder import generate_table
+
+
+def is_npy_recording(filename):
+    """
+    Return True if the given path is a directory written by NpyRecorder.
+
+    Parameters
+    ----------
+    filename : str or Path
+        The path to check.
+
+    Returns
+    -------
+    bool
+        True if the path is a directory containing a case index.
+    """
+    return os.path.isfile(os.path.join(filename, INDEX_FILENAME))
+
+
+class NpyCaseReader(BaseCaseReader):
+    """
+    A CaseReader specific to directories written by NpyRecorder.
+
+    The history of a single variable can be retrieved with get_val_history, which returns
+    a memory mapped view of the recorded values without reading any other data.
+
+    Parameters
+    ----------
+    filename : str or Path
+        The path to the recording directory.
+    pre_load : bool
+        If True, load all the column data into memory during initialization.
+
+    Attributes
+    ----------
+    _filename : Path
+        The path to the recording directory.
+    _abs2prom : {'input': dict, 'output': dict}
+        Dictionary mapping absolute names to promoted names.
+    _prom2abs : {'input': dict, 'output': dict}
+        Dictionary mapping promoted names to absolute names.
+    _abs2meta : dict
+        Dictionary mapping absolute variable names to variable metadata.
+    _conns : dict
+        Dictionary of all model connections.
+    _sources : dict
+        Index entry of each recorded source, keyed by source name, with the names of its cases
+        under 'names'.
+    _cases : list
+        Global execution order of the recorded cases, as (source, row, counter, timestamp,
+        success, msg, abs_err, rel_err) entries.
+    _case_index : dict
+        Mapping of case name to its position in _cases.
+    _arrays : dict
+        Loaded column arrays, keyed by (source, kind, name).
+    _rows : dict
+        Row of the case that recorded each value, for columns that were not recorded for
+        every case of their source.
+    _row_maps : dict
+        Mapping of source row to position in the column array, for columns that were not
+        recorded for every case of their source.
+    _objects : dict or None
+        Values that could not be stored in a numeric column, keyed by (source, row, kind),
+        loaded on first use.
+    _deriv_rows : dict or None
+        Mapping of driver case name to the row of its recorded derivatives.
+    _pre_load : bool
+        If True, column arrays are read into memory rather than memory mapped.
+    """
+
+    def __init__(self, filename, pre_load=False):
+        """
+        Initialize.
+        """
+        super().__init__(filename, pre_load)
+
+        self._filename = pathlib.Path(filename)
+
+        with open(self._filename / INDEX_FILENAME, 'r') as f:
+            index = json.load(f)
+
+        self._format_version = index['format_version']
+        if self._format_version not in range(1, format_version + 1):
+            raise ValueError('NpyCaseReader encountered an unhandled '
+                             'format version: {0}'.format(self._format_version))
+
+        self._openmdao_version = index['openmdao_version']
+        self._abs2prom = index['abs2prom']
+        self._prom2abs = index['prom2abs']
+        self._abs2meta = index['abs2meta']
+        self._conns = index['conns']
+
+        # need to convert bounds to numpy arrays
+        for meta in self._abs2meta.values():
+            if 'lower' in meta and meta['lower'] is not None:
+                meta['lower'] = np.resize(np.array(meta['lower']), meta['shape'])
+            if 'upper' in meta and meta['upper'] is not None:
+                meta['upper'] = np.resize(np.array(meta['upper']), meta['shape'])
+
+        self.problem_metadata['variables'] = index['var_settings']
+        self.problem_metadata['abs2prom'] = self._abs2prom
+
+        self._sources = index['sources']
+        for info in self._sources.values():
+            info['names'] = []
+
+        # the rows of each source are listed in order
+        self._cases = []
+        with open(self._filename / CASES_FILENAME, 'r') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    # the recorder was interrupted while writing this line
+                    break
+                source, row, name, *meta = json.loads(line)
+                self._sources[source]['names'].append(name)
+                if meta:
+                    self._cases.append([source, row] + meta)
+
+        self._case_index = {}
+        for i, (source, row, *_) in enumerate(self._cases):
+            self._case_index[self._sources[source]['names'][row]] = i
+
+        self._arrays = {}
+        self._rows = {}
+        self._row_maps = {}
+        self._objects = None
+        self._deriv_rows = None
+        self._pre_load = pre_load
+
+        if pre_load:
+            for source, info in self._sources.items():
+                for kind, columns in info['columns'].items():
+                    for name in columns:
+                        self._get_array(source, kind, name)
+
+    def _get_array(self, source, kind, name):
+        """
+        Return the recorded values of a variable, stacked along the first axis.
+
+        Parameters
+        ----------
+        source : str
+            Name of the recording source.
+        kind : str
+            'inputs', 'outputs', 'residuals' or 'derivatives'.
+        name : str
+            Name of the variable as recorded.
+
+        Returns
+        -------
+        ndarray
+            The recorded values.
+        """
+        key = (source, kind, name)
+        try:
+            return self._arrays[key]
+        except KeyError:
+            info = self._sources[source]
+            col = info['columns'][kind][name]
+            arr = np.load(self._filename / info['dir'] / col['file'],
+                          mmap_mode=None if self._pre_load else 'r')
+            self._arrays[key] = arr
+            if col['rows'] is not None:
+                rows = np.load(self._filename / info['dir'] / col['rows'])
+                self._rows[key] = rows
+                self._row_maps[key] = {row: i for i, row in enumerate(rows.tolist())}
+            return arr
+
+    def _get_objects(self):
+        """
+        Return the values that could not be stored in a numeric column.
+
+        Returns
+        -------
+        dict
+            Mapping of (source, row, kind) to a dict of values keyed by variable name.
+        """
+        if self._objects is None:
+            with open(self._filename / OBJECTS_FILENAME, 'rb') as f:
+                data = f.read()
+
+            # one pickle, preceded by its length, was appended by each flush of the recorder
+            self._objects = {}
+            start = 0
+            while start + 8 <= len(data):
+                size, = struct.unpack_from('<Q', data, start)
+                end = start + 8 + size
+                if end > len(data):
+                    # the recorder was interrupted while writing this pickle
+                    break
+                self._objects.update(_safer_unpickle(data[start + 8:end], 'recorded values'))
+                start = end
+
+        return self._objects
+
+    def _get_row_values(self, source, kind, row):
+        """
+        Return the values of all variables of the given kind recorded in one case.
+
+        Parameters
+        ----------
+        source : str
+            Name of the recording source.
+        kind : str
+            'inputs', 'outputs', 'residuals' or 'derivatives'.
+        row : int
+            Index of the case among the cases of the source.
+
+        Returns
+        -------
+        ndarray or dict or None
+            The recorded values as a structured array, or as a dict keyed by variable name if
+            some values are not arrays. None if nothing was recorded.
+        """
+        values = {}
+
+        for name, col in self._sources[source]['columns'].get(kind, {}).items():
+            arr = self._get_array(source, kind, name)
+            if col['rows'] is None:
+                if row < arr.shape[0]:
+                    values[name] = np.array(arr[row])
+            else:
+                idx = self._row_maps[source, kind, name].get(row)
+                if idx is not None:
+                    values[name] = np.array(arr[idx])
+
+        objects = self._get_objects().get((source, row, kind))
+        if objects:
+            values.update(objects)
+            return values
+
+        # same representation as the values read from a SqliteRecorder database
+        return dict_to_structured_array(values)
+
+    def get_val_history(self, names, source='driver', slice=None):
+        """
+        Return the recorded values of one or more variables across all cases of a source.
+
+        Values are read from memory mapped column files, so only the requested variables
+        are loaded from disk.
+
+        Parameters
+        ----------
+        names : str or list of str
+            Promoted or absolute names of the variables. Outputs are searched first, then
+            inputs.
+        source : str
+            The recording source, e.g. 'driver', 'problem', a system or a solver pathname.
+        slice : slice or array of int or None
+            If given, selects a subset of the cases of the source.
+
+        Returns
+        -------
+        ndarray or dict
+            The values of the variable stacked along the first axis, or a dict of such arrays
+            keyed by name if names is a list.
+        """
+        if source not in self._sources:
+            raise RuntimeError('Source not found: %s' % source)
+
+        ncases = len(self._sources[source]['names'])
+        columns = self._sources[source]['columns']
+
+        vals = {}
+        for name in [names] if isinstance(names, str) else names:
+            for kind in ('outputs', 'inputs'):
+                objects = set()
+                for (src, _, knd), objs in self._get_objects().items():
+                    if src == source and knd == kind:
+                        objects.update(objs)
+
+                recname = get_recorded_name(name, objects.union(columns.get(kind, ())),
+                                            kind[:-1], self._prom2abs, self._abs2prom,
+                                            self._conns)
+                if recname is not None:
+                    break
+            else:
+                raise KeyError(f"Variable '{name}' was not recorded by '{source}'.")
+
+            if recname in objects:
+                raise RuntimeError(f"Variable '{name}' has recorded values that are not "
+                                   "numeric arrays of a fixed shape.")
+
+            col = columns[kind][recname]
+            arr = self._get_array(source, kind, recname)
+            if arr.shape[0] != ncases:
+                raise RuntimeError(f"Variable '{name}' was not recorded in every case of "
+                                   f"'{source}'.")
+
+            if col['rows'] is not None:
+                arr = arr[np.argsort(self._rows[source, kind, recname])]
+            vals[name] = arr if slice is None else arr[slice]
+
+        return vals[names] if isinstance(names, str) else vals
+
+    def _make_case(self, idx):
+        """
+        Create the Case at the given position in the global case order.
+
+        Parameters
+        ----------
+        idx : int
+            Position of the case in the global case order.
+
+        Returns
+        -------
+        Case
+            The case.
+        """
+        source, row, counter, timestamp, success, msg, abs_err, rel_err = self._cases[idx]
+        info = self._sources[source]
+        name = info['names'][row]
+
+        data = {
+            'counter': counter,
+            'timestamp': timestamp,
+            'success': success,
+            'msg': msg,
+            'inputs': self._get_row_values(source, 'inputs', row),
+            'outputs': self._get_row_values(source, 'outputs', row),
+            'residuals': self._get_row_values(source, 'residuals', row),
+        }
+
+        if info['type'] == 'problem':
+            data['case_name'] = name
+            data['jacobian'] = self._get_row_values(source, 'derivatives', row)
+        else:
+            data['iteration_coordinate'] = name
+
+        if info['type'] in ('problem', 'solver'):
+            data['abs_err'] = abs_err
+            data['rel_err'] = rel_err
+
+        if info['type'] == 'driver' and DERIVS_TABLE in self._sources:
+            if self._deriv_rows is None:
+                self._deriv_rows = {}
+                for i, deriv_name in enumerate(self._sources[DERIVS_TABLE]['names']):
+                    self._deriv_rows.setdefault(deriv_name, i)
+            if name in self._deriv_rows:
+                data['jacobian'] = self._get_row_values(DERIVS_TABLE, 'derivatives',
+                                                        self._deriv_rows[name])
+
+        return Case(source, data, self._prom2abs, self._abs2prom, self._abs2meta,
+                    self._conns, self.problem_metadata['variables'], 0)
+
+    def _case_indices(self, source=None, recurse=True):
+        """
+        Return the positions, in global case order, of the cases identified by source.
+
+        Parameters
+        ----------
+        source : str or None
+            'problem', 'driver', system or solver pathname, or case name. If None, all cases.
+        recurse : bool
+            If True, include the cases recorded while executing the identified cases.
+
+        Returns
+        -------
+        list of int
+            Positions of the cases in the global case order.
+        """
+        if source is None:
+            return list(range(len(self._cases)))
+
+        if not isinstance(source, str):
+            raise TypeError("Source parameter must be a string, %s is type %s." %
+                            (source, type(source).__name__))
+
+        if source in self._sources and source != DERIVS_TABLE:
+            names = self._sources[source]['names']
+            indices = [i for i, case in enumerate(self._cases) if case[0] == source]
+        elif source in self._case_index:
+            names = [source]
+            indices = [self._case_index[source]]
+        else:
+            raise RuntimeError('Source not found: %s' % source)
+
+        if not recurse:
+            return indices
+
+        # a case is a descendant if one of its parent iteration coordinates is in names
+        names = set(names)
+        for i, (src, row, *_) in enumerate(self._cases):
+            if src != source:
+                parts = self._sources[src]['names'][row].split('|')
+                for n in range(len(parts) - 2, 0, -2):
+                    if '|'.join(parts[:n]) in names:
+                        indices.append(i)
+                        break
+
+        return sorted(indices)
+
+    def list_sources(self, out_stream=_DEFAULT_OUT_STREAM):
+        """
+        List of all the different recording sources for which there is recorded data.
+
+        Parameters
+        ----------
+        out_stream : file-like object
+            Where to send human readable output. Default is sys.stdout.
+            Set to None to suppress.
+
+        Returns
+        -------
+        list
+            One or more of: `problem`, `driver`, `<system hierarchy location>`,
+                            `<solver hierarchy location>`
+        """
+        # same ordering as SqliteCaseReader
+        order = ('driver', 'solver', 'system', 'problem')
+        sources = sorted((source for source, info in self._sources.items()
+                          if info['type'] in order),
+                         key=lambda source: order.index(self._sources[source]['type']))
+
+        if out_stream:
+            if notebook and out_stream is _DEFAULT_OUT_STREAM:
+                display(HTML(str(generate_table([[s] for s in sources], headers=['Sources'],
+                                                tablefmt='html'))))
+            else:
+                if out_stream is _DEFAULT_OUT_STREAM:
+                    out_stream = sys.stdout
+                elif not isinstance(out_stream, TextIOBase):
+                    raise TypeError("Invalid output stream specified for 'out_stream'.")
+                for source in sources:
+                    out_stream.write('{}\n'.format(source))
+
+        return sources
+
+    def list_source_vars(self, source, out_stream=_DEFAULT_OUT_STREAM):
+        """
+        List of all inputs and outputs recorded by the specified source.
+
+        Parameters
+        ----------
+        source : {'problem', 'driver', <system hierarchy location>, <solver hierarchy location>}
+            Identifies the source for which to return information.
+        out_stream : file-like object
+            Where to send human readable output. Default is sys.stdout.
+            Set to None to suppress.
+
+        Returns
+        -------
+        dict
+            {'inputs':[key list], 'outputs':[key list], 'residuals':[key list]}. No recurse.
+        """
+        if source not in self._sources or source == DERIVS_TABLE:
+            raise RuntimeError('Source not found: %s' % source)
+
+        case = self._make_case(self._case_indices(source, recurse=False)[0])
+
+        dct = {
+            'inputs': list(case.inputs) if case.inputs else [],
+            'outputs': list(case.outputs) if case.outputs else [],
+            'residuals': list(case.residuals) if case.residuals else [],
+        }
+
+        if out_stream:
+            write_source_table(dct, out_stream)
+
+        return dct
+
+    def list_cases(self, source=None, recurse=True, out_stream=_DEFAULT_OUT_STREAM):
+        """
+        Iterate over Driver, Solver and System cases in order.
+
+        Parameters
+        ----------
+        source : 'problem', 'driver', component pathname, solver pathname, case_name
+            If not None, only cases originating from the specified source or case are returned.
+        recurse : bool, optional
+            If True, will also return the cases recorded while executing the identified cases.
+        out_stream : file-like object
+            Where to send human readable output. Default is sys.stdout.
+            Set to None to suppress.
+
+        Returns
+        -------
+        list
+            The names of the identified cases.
+        """
+        cases = []
+        for i in self._case_indices(source, recurse):
+            src, row, *_ = self._cases[i]
+            cases.append(self._sources[src]['names'][row])
+
+        if out_stream:
+            write_source_table({'all' if source is None else source: cases}, out_stream)
+
+        return cases
+
+    def get_cases(self, source=None, recurse=True):
+        """
+        Get list of case objects for the cases identified by source.
+
+        Parameters
+        ----------
+        source : 'problem', 'driver', component pathname, solver pathname, case_name
+            If not None, only cases originating from the specified source or case are returned.
+        recurse : bool, optional
+            If True, will also return the cases recorded while executing the identified cases.
+
+        Returns
+        -------
+        list
+            The cases identified by source.
+        """
+        return [self._make_case(i) for i in self._case_indices(source, recurse)]
+
+    def get_case(self, case_id, recurse=False):
+        """
+        Get case identified by case_id.
+
+        Parameters
+        ----------
+        case_id : str or int
+            The unique identifier of the case to return or an index into all cases.
+        recurse : bool, optional
+            If True, will return all successors to the case as well.
+
+        Returns
+        -------
+        Case or list
+            The case identified by case_id, or a list of cases if recurse is True.
+        """
+        if isinstance(case_id, int):
+            if case_id > len(self._cases) - 1:
+                raise IndexError("Invalid index into available cases:", case_id)
+            idx = case_id
+        elif case_id in self._case_index:
+            idx = self._case_index[case_id]
+        else:
+            raise RuntimeError('Case not found:', case_id)
+
+        if recurse:
+            src, row, *_ = self._cases[idx]
+            return self.get_cases(self._sources[src]['names'][row], recurse=True)
+
+        return self._make_case(idx)
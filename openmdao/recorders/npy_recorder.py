@@ -0,0 +1,884 @@
+"""
+Class definition for NpyRecorder, which stores the history of each variable as a numpy array.
+"""
+
+import os
+import shutil
+import json
+import pickle
+import struct
+import weakref
+
+import numpy as np
+
+from openmdao import __version__ as openmdao_version
+from openmdao.recorders.case_recorder import CaseRecorder, PICKLE_VER, \
+    _get_requester_system, _update_var_metadata
+from openmdao.utils.mpi import MPI
+from openmdao.utils.general_utils import default_noraise
+
+
+"""
+Columnar case format version history.
+-------------------------------------
+1 -- Original implementation.
+"""
+format_version = 1
+
+# name of the file, inside the recording directory, that describes the recorded variables and
+# the files holding them
+INDEX_FILENAME = 'cases.json'
+
+# name of the file listing the recorded cases in execution order, one JSON entry per line
+CASES_FILENAME = 'cases.jsonl'
+
+# name of the file holding values that cannot be stored in a numeric column
+OBJECTS_FILENAME = 'objects.pkl'
+
+# name of the table holding the derivatives recorded by the driver
+DERIVS_TABLE = 'driver_derivatives'
+
+# size in bytes of the header written at the start of every column file. It is fixed so that
+# the header can be rewritten in place with the final number of cases.
+_NPY_HEADER_SIZE = 256
+
+
+def _npy_header(dtype, shape):
+    """
+    Return a fixed size .npy file header for an array of the given dtype and shape.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        Data type of the array.
+    shape : tuple
+        Shape of the array.
+
+    Returns
+    -------
+    bytes
+        The header.
+    """
+    header = "{'descr': %r, 'fortran_order': False, 'shape': %r, }" % \
+        (np.lib.format.dtype_to_descr(dtype), tuple(shape))
+
+    magic = np.lib.format.magic(1, 0)
+    size = _NPY_HEADER_SIZE - len(magic) - 2  # 2 bytes for the header length
+    if len(header) >= size:
+        raise ValueError(f"Shape {shape} is too large to be recorded in a column.")
+
+    return magic + struct.pack('<H', size) + (header.ljust(size - 1) + '\n').encode('latin1')
+
+
+def _column_value(value):
+    """
+    Return the given value as a numeric array, or None if it can't be stored in a column.
+
+    Parameters
+    ----------
+    value : object
+        A recorded value.
+
+    Returns
+    -------
+    ndarray or None
+        The value as an array.
+    """
+    if isinstance(value, (np.ndarray, np.number, np.bool_, bool, int, float, complex)):
+        value = np.asarray(value)
+        if value.dtype.kind in 'biufc':
+            return value
+    return None
+
+
+class _Column(object):
+    """
+    Append-only storage for the history of one variable recorded by one source.
+
+    Values are buffered in memory and appended to a .npy file in chunks. The header of the
+    file is rewritten with the current number of values when the column is finalized. If the
+    variable is not recorded in every case of the source, the rows of the cases that recorded
+    it are appended to a second .npy file in the same way.
+
+    Parameters
+    ----------
+    path : str
+        Path of the .npy file.
+    value : ndarray
+        The first value recorded in this column.
+    row : int
+        Index, among the cases of the source, of the case that recorded the first value.
+
+    Attributes
+    ----------
+    path : str
+        Path of the .npy file.
+    rows_path : str or None
+        Path of the .npy file holding the rows of the cases that recorded each value. None if
+        a value was recorded for every case.
+    dtype : numpy.dtype
+        Data type of the values.
+    shape : tuple
+        Shape of a single value.
+    count : int
+        Number of values recorded.
+    _buffer : list
+        Values that have not been written to the file yet.
+    _row_buffer : list
+        Rows that have not been written to the rows file yet.
+    _header_count : int
+        Number of values given in the file headers.
+    """
+
+    def __init__(self, path, value, row):
+        """
+        Create the column file.
+        """
+        self.path = path
+        self.rows_path = None
+        self.dtype = value.dtype
+        self.shape = value.shape
+        self.count = 1
+        self._buffer = [value.copy()]
+        self._row_buffer = []
+        self._header_count = 0
+
+        with open(path, 'wb') as f:
+            f.write(_npy_header(self.dtype, (0,) + self.shape))
+
+        if row != 0:
+            self._start_rows([row])
+
+    def _start_rows(self, rows):
+        """
+        Create the rows file, once a value has been missed for a case of the source.
+
+        Parameters
+        ----------
+        rows : list of int
+            Rows of the cases that recorded each value so far.
+        """
+        self.rows_path = self.path[:-len('.npy')] + '_rows.npy'
+        self._row_buffer = rows
+
+        with open(self.rows_path, 'wb') as f:
+            f.write(_npy_header(np.dtype(np.int64), (0,)))
+
+    def accepts(self, value):
+        """
+        Return True if the given value can be stored in this column.
+
+        Parameters
+        ----------
+        value : ndarray
+            The value.
+
+        Returns
+        -------
+        bool
+            True if the value has the same shape as the column and a compatible type.
+        """
+        return value.shape == self.shape and np.can_cast(value.dtype, self.dtype, 'same_kind')
+
+    def append(self, value, row):
+        """
+        Add a value to the column.
+
+        Parameters
+        ----------
+        value : ndarray
+            The value.
+        row : int
+            Index, among the cases of the source, of the case that recorded the value.
+        """
+        if self.rows_path is not None:
+            self._row_buffer.append(row)
+        elif row != self.count:
+            self._start_rows(list(range(self.count)) + [row])
+
+        self._buffer.append(np.array(value, dtype=self.dtype))
+        self.count += 1
+
+    def flush(self):
+        """
+        Append the buffered values, and rows, to the files.
+        """
+        if self._buffer:
+            with open(self.path, 'ab') as f:
+                f.write(np.ascontiguousarray(self._buffer, dtype=self.dtype).tobytes())
+            self._buffer = []
+
+        if self._row_buffer:
+            with open(self.rows_path, 'ab') as f:
+                f.write(np.asarray(self._row_buffer, dtype=np.int64).tobytes())
+            self._row_buffer = []
+
+    def finalize(self):
+        """
+        Write all buffered values and update the file headers with the current shape.
+        """
+        self.flush()
+
+        if self._header_count != self.count:
+            with open(self.path, 'r+b') as f:
+                f.write(_npy_header(self.dtype, (self.count,) + self.shape))
+            if self.rows_path is not None:
+                with open(self.rows_path, 'r+b') as f:
+                    f.write(_npy_header(np.dtype(np.int64), (self.count,)))
+            self._header_count = self.count
+
+    def get_index(self):
+        """
+        Return the index entry describing this column.
+
+        Returns
+        -------
+        dict
+            The index entry.
+        """
+        return {
+            'file': os.path.basename(self.path),
+            'rows': None if self.rows_path is None else os.path.basename(self.rows_path),
+        }
+
+
+class _SourceTable(object):
+    """
+    The columns of all variables recorded by a single source.
+
+    Parameters
+    ----------
+    dirname : str
+        Directory holding the column files of this source.
+    source_type : str
+        Type of the source: 'driver', 'system', 'solver' or 'problem'.
+
+    Attributes
+    ----------
+    dirname : str
+        Directory holding the column files of this source.
+    source_type : str
+        Type of the source.
+    num_rows : int
+        Number of cases recorded by this source.
+    columns : dict
+        Mapping of kind ('inputs', 'outputs', 'residuals', 'derivatives') to a dict mapping
+        variable names to _Column.
+    objects : dict
+        Mapping of (row, kind) to a dict of the values of that case that can't be stored in
+        a column, keyed by variable name, for the cases recorded since the last flush.
+    changed : bool
+        True if a column was added, or started keeping its rows, since the last flush.
+    _num_columns : int
+        Number of columns created so far, used to name the column files.
+    """
+
+    def __init__(self, dirname, source_type):
+        """
+        Initialize.
+        """
+        self.dirname = dirname
+        self.source_type = source_type
+        self.num_rows = 0
+        self.columns = {}
+        self.objects = {}
+        self.changed = True
+        self._num_columns = 0
+
+        os.makedirs(dirname, exist_ok=True)
+
+    def add_case(self, values):
+        """
+        Add the values of one case to the columns.
+
+        Parameters
+        ----------
+        values : dict
+            Mapping of kind to a dict of variable values, or None.
+
+        Returns
+        -------
+        int
+            Index of the case among the cases of this source.
+        """
+        row = self.num_rows
+        self.num_rows += 1
+
+        for kind, vals in values.items():
+            if not vals:
+                continue
+
+            columns = self.columns.get(kind)
+            if columns is None:
+                columns = self.columns[kind] = {}
+
+            for var, val in vals.items():
+                var = str(var)
+                arr = _column_value(val)
+                col = columns.get(var)
+
+                if arr is None or (col is not None and not col.accepts(arr)):
+                    self.objects.setdefault((row, kind), {})[var] = val
+                elif col is None:
+                    fname = os.path.join(self.dirname, f'c{self._num_columns}.npy')
+                    self._num_columns += 1
+                    columns[var] = _Column(fname, arr, row)
+                    self.changed = True
+                else:
+                    has_rows = col.rows_path is not None
+                    col.append(arr, row)
+                    if col.rows_path is not None and not has_rows:
+                        self.changed = True
+
+        return row
+
+    def finalize(self):
+        """
+        Write all buffered values to disk.
+        """
+        for columns in self.columns.values():
+            for col in columns.values():
+                col.finalize()
+
+    def get_index(self):
+        """
+        Return the index entry describing this source.
+
+        Returns
+        -------
+        dict
+            The index entry.
+        """
+        return {
+            'type': self.source_type,
+            'dir': os.path.basename(self.dirname),
+            'columns': {kind: {var: col.get_index() for var, col in columns.items()}
+                        for kind, columns in self.columns.items()},
+        }
+
+
+class _NpyWriter(object):
+    """
+    The recorded data of one recording directory that has not been written to disk yet.
+
+    This is kept separate from the recorder so that it can be flushed by a finalizer, which
+    must not hold a reference to the recorder.
+
+    Parameters
+    ----------
+    dirname : str
+        The recording directory.
+    chunk_size : int
+        Number of cases buffered in memory before they are written to disk.
+    pickle_version : int
+        The pickle protocol version to use when pickling values.
+
+    Attributes
+    ----------
+    dirname : str
+        The recording directory.
+    meta : dict
+        The variable metadata written to the index.
+    tables : dict
+        Mapping of source name to _SourceTable.
+    cases : list
+        Cases recorded since the last flush, in execution order, as (source, row, name,
+        counter, timestamp, success, msg, abs_err, rel_err) entries. Derivatives recorded by
+        the driver only have the first three.
+    index_changed : bool
+        True if the variable metadata has been updated since the index was last written.
+    _chunk_size : int
+        Number of cases buffered in memory before they are written to disk.
+    _pickle_version : int
+        The pickle protocol version to use when pickling values.
+    """
+
+    def __init__(self, dirname, chunk_size, pickle_version):
+        """
+        Create the files holding the case list and the values that aren't stored in columns.
+        """
+        self.dirname = dirname
+        self.meta = {}
+        self.tables = {}
+        self.cases = []
+        self.index_changed = True
+        self._chunk_size = chunk_size
+        self._pickle_version = pickle_version
+
+        for fname in (CASES_FILENAME, OBJECTS_FILENAME):
+            open(os.path.join(dirname, fname), 'wb').close()
+
+    def add_case(self, source, source_type, values, entry):
+        """
+        Add a case, and write the buffered cases to disk once there are chunk_size of them.
+
+        Parameters
+        ----------
+        source : str
+            Name of the recording source.
+        source_type : str
+            Type of the source: 'driver', 'system', 'solver', 'problem' or DERIVS_TABLE.
+        values : dict
+            Mapping of kind to a dict of variable values, or None.
+        entry : tuple
+            The name of the case followed by its execution metadata.
+        """
+        try:
+            table = self.tables[source]
+        except KeyError:
+            dirname = os.path.join(self.dirname, f's{len(self.tables)}')
+            table = self.tables[source] = _SourceTable(dirname, source_type)
+
+        row = table.add_case(values)
+        self.cases.append((source, row) + entry)
+
+        if len(self.cases) >= self._chunk_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the cases recorded since the last flush to disk.
+
+        Column values and the values that can't be stored in a column are appended to their
+        files, and the new cases are appended to the case list. The index is only rewritten
+        when a variable or source was added or the variable metadata changed.
+        """
+        objects = {}
+        changed = self.index_changed
+        for source, table in self.tables.items():
+            table.finalize()
+            for (row, kind), vals in table.objects.items():
+                objects[source, row, kind] = vals
+            table.objects = {}
+            changed |= table.changed
+            table.changed = False
+
+        if objects:
+            # each flush appends one pickle, preceded by its length
+            data = pickle.dumps(objects, self._pickle_version)
+            with open(os.path.join(self.dirname, OBJECTS_FILENAME), 'ab') as f:
+                f.write(struct.pack('<Q', len(data)) + data)
+
+        if changed:
+            index = {
+                'format_version': format_version,
+                'openmdao_version': openmdao_version,
+                **self.meta,
+                'sources': {source: table.get_index()
+                            for source, table in self.tables.items()},
+            }
+
+            # replace the index in one step, so an interrupted write leaves the previous one
+            fname = os.path.join(self.dirname, INDEX_FILENAME)
+            with open(fname + '.tmp', 'w') as f:
+                json.dump(index, f, default=default_noraise)
+            os.replace(fname + '.tmp', fname)
+
+            self.index_changed = False
+
+        # the cases are written last, so that everything they refer to is already on disk
+        if self.cases:
+            lines = [json.dumps(case, default=default_noraise) + '\n' for case in self.cases]
+            with open(os.path.join(self.dirname, CASES_FILENAME), 'a') as f:
+                f.write(''.join(lines))
+            self.cases = []
+
+
+class NpyRecorder(CaseRecorder):
+    """
+    Recorder that saves the history of each variable as a separate numpy array.
+
+    Cases are stored in a directory, with one .npy file per variable per recording source.
+    Each file holds the values of the variable for all cases of that source stacked along
+    the first axis, so the history of a variable can be memory mapped and sliced without
+    reading any other recorded data. Use NpyCaseReader to read the recorded cases.
+
+    Recorded cases are buffered in memory and appended to the files every chunk_size cases,
+    when the recorder is flushed or shut down, and when the recorder is garbage collected or
+    the interpreter exits, so a run that is interrupted leaves a readable recording of the
+    cases written so far. The cost of a flush depends only on the cases recorded since the
+    previous one.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the recording directory.
+    chunk_size : int, optional
+        Number of cases that are buffered in memory before being appended to disk.
+    pickle_version : int, optional
+        The pickle protocol version to use when pickling values that can't be stored in a
+        numeric array.
+    record_viewer_data : bool, optional
+        If True, record data needed for visualization.
+
+    Attributes
+    ----------
+    _filepath : str or Path
+        Path to the recording directory.
+    _use_outputs_dir : bool
+        Flag indicating if the recording is being saved in the problem outputs dir.
+    _chunk_size : int
+        Number of cases buffered in memory before being appended to disk.
+    _pickle_version : int
+        The pickle protocol version to use when pickling values.
+    _dirname : str or None
+        Directory being written on this process, None if not recording on this process.
+    _writer : _NpyWriter or None
+        The recorded data not yet written to the directory, None if not recording on this
+        process.
+    _initialized : bool
+        Flag indicating whether or not the recording directory has been initialized.
+    _started : set
+        Set of recording requesters for which this recorder has been started.
+    _abs2prom : {'input': dict, 'output': dict}
+        Dictionary mapping absolute names to promoted names.
+    _prom2abs : {'input': dict, 'output': dict}
+        Dictionary mapping promoted names to absolute names.
+    _abs2meta : {'name': {}}
+        Dictionary mapping absolute variable names to their metadata.
+    _conns : dict
+        Dictionary of all model connections.
+    _var_settings : dict
+        Settings of the design variables, objectives and constraints.
+    """
+
+    def __init__(self, filepath, chunk_size=1000, pickle_version=PICKLE_VER,
+                 record_viewer_data=False):
+        """
+        Initialize the NpyRecorder.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}.")
+
+        self._filepath = str(filepath)
+        self._use_outputs_dir = not (os.path.sep in self._filepath or '/' in self._filepath)
+        self._chunk_size = chunk_size
+        self._pickle_version = pickle_version
+        self._dirname = None
+        self._writer = None
+        self._initialized = False
+        self._started = set()
+
+        self._abs2prom = {'input': {}, 'output': {}}
+        self._prom2abs = {'input': {}, 'output': {}}
+        self._abs2meta = {}
+        self._conns = {}
+        self._var_settings = {}
+
+        super().__init__(record_viewer_data)
+
+    def _initialize_directory(self, comm):
+        """
+        Create the recording directory.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm> or None
+            The communicator for the recorder (should be the comm for the Problem).
+        """
+        self._dirname = None
+
+        if MPI and comm and comm.size > 1:
+            if self._record_on_proc:
+                if self._parallel:
+                    # recording on multiple procs, so a separate directory for each proc
+                    self._dirname = f"{self._filepath}_{comm.rank}"
+                    print("Note: NpyRecorder is running on multiple processors. Cases from "
+                          f"rank {comm.rank} are being written to {self._dirname}.")
+                else:
+                    self._dirname = str(self._filepath)
+        else:
+            self._dirname = str(self._filepath)
+
+        if self._dirname:
+            # remove a previous recording, but nothing else that might be in the directory
+            if os.path.isfile(os.path.join(self._dirname, INDEX_FILENAME)):
+                shutil.rmtree(self._dirname)
+            os.makedirs(self._dirname, exist_ok=True)
+
+            self._writer = _NpyWriter(self._dirname, self._chunk_size, self._pickle_version)
+            # make sure recorded cases are written even if shutdown is never called
+            weakref.finalize(self, self._writer.flush)
+
+        self._initialized = True
+
+    def startup(self, recording_requester, comm=None):
+        """
+        Prepare for a new run and update the variable name maps and metadata.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Object to which this recorder is attached.
+        comm : MPI.Comm or <FakeComm> or None
+            The MPI communicator for the recorder (should be the comm for the Problem).
+        """
+        # we only want to set up recording once for each recording_requester
+        if recording_requester in self._started:
+            return
+
+        super().startup(recording_requester, comm)
+
+        system, driver = _get_requester_system(recording_requester)
+
+        if self._use_outputs_dir:
+            self._filepath = system.get_outputs_dir(mkdir=True) / self._filepath
+
+        if not self._initialized:
+            self._initialize_directory(comm)
+
+        states = system._list_states_allprocs()
+
+        if driver is None:
+            desvars = system.get_design_vars(True, get_sizes=False, use_prom_ivc=False)
+            responses = system.get_responses(True, get_sizes=False, use_prom_ivc=False)
+            constraints = {}
+            objectives = {}
+            for name, data in responses.items():
+                if data['type'] == 'con':
+                    constraints[name] = data
+                else:
+                    objectives[name] = data
+        else:
+            desvars = driver._designvars
+            responses = driver._responses
+            constraints = driver._cons
+            objectives = driver._objs
+
+        # _get_vars_exec_order makes a collective MPI call so need to call in all procs
+        var_order = system._get_vars_exec_order(inputs=True, outputs=True, local=False)
+
+        if self._dirname:
+            self._var_settings = _update_var_metadata(system, desvars, responses, objectives,
+                                                      constraints, states, var_order,
+                                                      self._abs2prom, self._prom2abs,
+                                                      self._abs2meta)
+            self._conns = system._problem_meta['model_ref']()._conn_global_abs_in2out
+            self._writer.meta = {
+                'abs2prom': self._abs2prom,
+                'prom2abs': self._prom2abs,
+                'abs2meta': self._abs2meta,
+                'conns': self._conns,
+                'var_settings': self._var_settings,
+            }
+            self._writer.index_changed = True
+
+        self._started.add(recording_requester)
+
+    def _check_initialized(self, requester):
+        """
+        Raise an error if recording was requested before the recorder was started.
+
+        Parameters
+        ----------
+        requester : object
+            The object requesting the recording.
+        """
+        if not self._initialized:
+            raise RuntimeError(f"{requester.msginfo} attempted to record iteration to "
+                               f"'{self._filepath}', but database is not initialized;"
+                               " `run_model()`, `run_driver()`, or `final_setup()` "
+                               "must be called after adding a recorder.")
+
+    def _add_case(self, source, source_type, name, data, metadata, abs_err=None, rel_err=None,
+                  derivatives=None):
+        """
+        Add a case to the table of the given source.
+
+        Parameters
+        ----------
+        source : str
+            Name of the recording source.
+        source_type : str
+            Type of the source: 'driver', 'system', 'solver' or 'problem'.
+        name : str
+            Name of the case.
+        data : dict
+            Dictionary containing the recorded inputs, outputs and residuals.
+        metadata : dict
+            Dictionary containing execution metadata.
+        abs_err : float or None
+            Absolute error, for solver and problem cases.
+        rel_err : float or None
+            Relative error, for solver and problem cases.
+        derivatives : dict or None
+            Recorded derivatives, for problem cases.
+        """
+        self._writer.add_case(source, source_type, {
+            'inputs': data['input'],
+            'outputs': data['output'],
+            'residuals': data['residual'],
+            'derivatives': derivatives,
+        }, (name, self._counter, metadata['timestamp'], metadata['success'], metadata['msg'],
+            abs_err, rel_err))
+
+    def record_iteration_driver(self, driver, data, metadata):
+        """
+        Record data and metadata from a Driver.
+
+        Parameters
+        ----------
+        driver : Driver
+            Driver in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and System vars.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._check_initialized(driver)
+
+        if self._dirname:
+            self._add_case('driver', 'driver', self._iteration_coordinate, data, metadata)
+
+    def record_iteration_problem(self, problem, data, metadata):
+        """
+        Record data and metadata from a Problem.
+
+        Parameters
+        ----------
+        problem : Problem
+            Problem in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, and constraints.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._check_initialized(problem)
+
+        if self._dirname:
+            driver = problem.driver
+            if problem.recording_options['record_derivatives'] and \
+               driver._designvars and driver._responses:
+                totals = data['totals']
+            else:
+                totals = None
+
+            self._add_case('problem', 'problem', metadata['name'], data, metadata,
+                           data.get('abs'), data.get('rel'), totals)
+
+    def record_iteration_system(self, system, data, metadata):
+        """
+        Record data and metadata from a System.
+
+        Parameters
+        ----------
+        system : System
+            System in need of recording.
+        data : dict
+            Dictionary containing inputs, outputs, and residuals.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._check_initialized(system)
+
+        if self._dirname:
+            source = system.pathname if system.pathname else 'root'
+            self._add_case(source, 'system', self._iteration_coordinate, data, metadata)
+
+    def record_iteration_solver(self, solver, data, metadata):
+        """
+        Record data and metadata from a Solver.
+
+        Parameters
+        ----------
+        solver : Solver
+            Solver in need of recording.
+        data : dict
+            Dictionary containing outputs, residuals, and errors.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._check_initialized(solver)
+
+        if self._dirname:
+            source_system = solver._system().pathname
+            if source_system == '':
+                source_system = 'root'
+
+            # get solver type from SOLVER class attribute to determine the solver pathname
+            solver_type = solver.SOLVER[0:2]
+            if solver_type == 'NL':
+                source = source_system + '.nonlinear_solver'
+            elif solver_type == 'LS':
+                source = source_system + '.nonlinear_solver.linesearch'
+            else:
+                raise RuntimeError("Solver type '%s' not recognized during recording. "
+                                   "Expecting NL or LS" % solver.SOLVER)
+
+            self._add_case(source, 'solver', self._iteration_coordinate, data, metadata,
+                           data['abs'], data['rel'])
+
+    def record_derivatives_driver(self, recording_requester, data, metadata):
+        """
+        Record derivatives data from a Driver.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Driver in need of recording.
+        data : dict
+            Dictionary containing derivatives keyed by 'of,wrt' to be recorded.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if self._dirname:
+            self._writer.add_case(DERIVS_TABLE, DERIVS_TABLE, {'derivatives': data},
+                                  (self._iteration_coordinate,))
+
+    def record_viewer_data(self, model_viewer_data):
+        """
+        Record model viewer data.
+
+        Viewer data is not stored by this recorder.
+
+        Parameters
+        ----------
+        model_viewer_data : dict
+            Data required to visualize the model.
+        """
+        pass
+
+    def record_metadata_system(self, system, run_number=None):
+        """
+        Record system metadata.
+
+        System metadata is not stored by this recorder.
+
+        Parameters
+        ----------
+        system : System
+            The System for which to record metadata.
+        run_number : int or None
+            Number indicating which run the metadata is associated with.
+        """
+        pass
+
+    def record_metadata_solver(self, solver, run_number=None):
+        """
+        Record solver metadata.
+
+        Solver metadata is not stored by this recorder.
+
+        Parameters
+        ----------
+        solver : Solver
+            The Solver for which to record metadata.
+        run_number : int or None
+            Number indicating which run the metadata is associated with.
+        """
+        pass
+
+    def flush(self):
+        """
+        Write the cases recorded since the last flush to disk.
+
+        After a flush, the recording directory can be read with NpyCaseReader.
+        """
+        if self._writer is not None:
+            self._writer.flush()
+
+    def shutdown(self):
+        """
+        Shut down the recorder.
+        """
+        self.flush()
@@ -1,9 +1,11 @@
 """
 Definition of the SqliteCaseReader.
 """
+import copy
 import pathlib
 import sqlite3
 from collections import OrderedDict
+from contextlib import closing
 
 import sys
 import numpy as np
@@ -13,7 +15,8 @@ from openmdao.recorders.base_case_reader import BaseCaseReader
 from openmdao.recorders.case import Case
 from openmdao.core.constants import _DEFAULT_OUT_STREAM
 from openmdao.utils.variable_table import write_source_table
-from openmdao.utils.record_util import check_valid_sqlite3_db, get_source_system
+from openmdao.utils.record_util import check_valid_sqlite3_db, get_source_system, \
+    get_recorded_name
 from openmdao.utils.om_warnings import issue_warning, CaseRecorderWarning
 
 from openmdao.recorders.sqlite_recorder import format_version, META_KEY_SEP
@@ -123,6 +126,43 @@ def _safer_unpickle(s, desc, compressed=False):
     return data
 
 
+# maximum number of row ids in a single query
+_MAX_QUERY_IDS = 500
+
+
+def _stack_history(name, source, vals):
+    """
+    Stack the recorded values of a variable into a single array.
+
+    Parameters
+    ----------
+    name : str
+        Name of the variable.
+    source : str
+        The source of the cases.
+    vals : list
+        Values of the variable in each case, None where it was not recorded.
+
+    Returns
+    -------
+    ndarray
+        The values stacked along the first axis.
+    """
+    if any(val is None for val in vals):
+        raise RuntimeError(f"Variable '{name}' was not recorded in every case of '{source}'.")
+
+    try:
+        arr = np.array(vals)
+    except ValueError:
+        arr = None
+
+    if arr is None or arr.dtype.kind not in 'biufc':
+        raise RuntimeError(f"Variable '{name}' has recorded values that are not "
+                           "numeric arrays of a fixed shape.")
+
+    return arr
+
+
 class SqliteCaseReader(BaseCaseReader):
     """
     A CaseReader specific to files created with SqliteRecorder.
@@ -135,6 +175,10 @@ class SqliteCaseReader(BaseCaseReader):
         If True, load all the data into memory during initialization.
     metadata_filename : str
         The path to the filename containing the recorded metadata, if separate.
+    cache_size : int
+        Number of most recently accessed cases of each table that are kept in memory, so they
+        can be returned again without reading the file. Each access returns a shallow copy of
+        the kept case, whose variable values are shared with it and with the other copies.
 
     Attributes
     ----------
@@ -168,7 +212,7 @@ class SqliteCaseReader(BaseCaseReader):
         List of iteration cases and the table and row in which they are found.
     """
 
-    def __init__(self, filename, pre_load=False, metadata_filename=None):
+    def __init__(self, filename, pre_load=False, metadata_filename=None, cache_size=128):
         """Initialize."""
         super().__init__(filename, pre_load)
 
@@ -241,19 +285,19 @@ class SqliteCaseReader(BaseCaseReader):
         var_info = self.problem_metadata['variables']
         self._driver_cases = DriverCases(filename, self._format_version, self._global_iterations,
                                          self._prom2abs, self._abs2prom, self._abs2meta,
-                                         self._conns, var_info)
+                                         self._conns, var_info, cache_size)
         self._system_cases = SystemCases(filename, self._format_version, self._global_iterations,
                                          self._prom2abs, self._abs2prom, self._abs2meta,
-                                         self._conns, var_info)
+                                         self._conns, var_info, cache_size)
         self._solver_cases = SolverCases(filename, self._format_version, self._global_iterations,
                                          self._prom2abs, self._abs2prom, self._abs2meta,
-                                         self._conns, var_info)
+                                         self._conns, var_info, cache_size)
         if self._format_version >= 2:
             self._problem_cases = ProblemCases(filename,
                                                self._format_version,
                                                self._global_iterations,
                                                self._prom2abs, self._abs2prom, self._abs2meta,
-                                               self._conns, var_info)
+                                               self._conns, var_info, cache_size)
 
         # if requested, load all the iteration data into memory
         if pre_load:
@@ -1013,6 +1057,45 @@ class SqliteCaseReader(BaseCaseReader):
 
         raise RuntimeError('Case not found:', case_id)
 
+    def get_val_history(self, names, source='driver', slice=None):
+        """
+        Return the recorded values of one or more variables across all cases of a source.
+
+        Rows are streamed from the database and only the requested variables are decoded,
+        so no Case objects are created.
+
+        Parameters
+        ----------
+        names : str or list of str
+            Promoted or absolute names of the variables. Outputs are searched first, then
+            inputs.
+        source : str
+            The recording source, e.g. 'driver', 'problem', a system or a solver pathname.
+        slice : slice or array of int or None
+            If given, selects a subset of the cases of the source.
+
+        Returns
+        -------
+        ndarray or dict
+            The values of the variable stacked along the first axis, or a dict of such arrays
+            keyed by name if names is a list.
+        """
+        if source == 'driver':
+            table = self._driver_cases
+        elif source == 'problem' and self._format_version >= 2:
+            table = self._problem_cases
+        elif source in self._system_cases.list_sources():
+            table = self._system_cases
+        elif source in self._solver_cases.list_sources():
+            table = self._solver_cases
+        else:
+            raise RuntimeError('Source not found: %s' % source)
+
+        vals = table.get_val_history([names] if isinstance(names, str) else names, source,
+                                     slice)
+
+        return vals[names] if isinstance(names, str) else vals
+
 
 class CaseTable(object):
     """
@@ -1040,6 +1123,8 @@ class CaseTable(object):
         Dictionary of all model connections.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    cache_size : int
+        Number of most recently accessed cases that are kept in memory.
 
     Attributes
     ----------
@@ -1071,10 +1156,17 @@ class CaseTable(object):
         Dictionary mapping keys to cases that have already been loaded.
     _global_iterations : list
         List of iteration cases and the table and row in which they are found.
+    _cache_size : int
+        Number of most recently accessed cases that are kept in memory.
+    _recent_cases : OrderedDict
+        The most recently accessed cases that were not explicitly cached, in access order.
     """
 
+    # names of the table columns holding the recorded inputs and outputs
+    _columns = {'inputs': 'inputs', 'outputs': 'outputs'}
+
     def __init__(self, fname, ver, table, index, giter, prom2abs, abs2prom, abs2meta, conns,
-                 var_info):
+                 var_info, cache_size=0):
         """
         Initialize.
         """
@@ -1093,6 +1185,8 @@ class CaseTable(object):
         self._sources = None
         self._keys = None
         self._cases = {}
+        self._cache_size = cache_size
+        self._recent_cases = OrderedDict()
 
     def count(self):
         """
@@ -1224,8 +1318,9 @@ class CaseTable(object):
             case_id = self._get_iteration_coordinate(case_id)
 
         # if we've already cached this case, return the cached instance
-        if case_id in self._cases:
-            return self._cases[case_id]
+        case = self._get_cached_case(case_id, cache)
+        if case is not None:
+            return case
 
         # we don't have it, so fetch it
         with sqlite3.connect(self._filename) as con:
@@ -1251,16 +1346,199 @@ class CaseTable(object):
             else:
                 source = self._get_source(row[self._index_name])
 
-            case = Case(source, row, self._prom2abs, self._abs2prom, self._abs2meta,
-                        self._conns, self._var_info, self._format_version)
+            return self._load_case(case_id, source, row, cache)
+        else:
+            return None
+
+    def _get_cached_case(self, case_id, cache):
+        """
+        Return the case with the given id if it is in memory.
+
+        A case that was recently used but not explicitly cached is returned as a shallow copy, so
+        replacing its attributes doesn't change the cached case. Its variable values are shared
+        with the cached case and must be copied before being modified in place.
+
+        Parameters
+        ----------
+        case_id : str
+            The string-identifier of the case.
+        cache : bool
+            If True, a recently used case is kept until the reader is deleted.
+
+        Returns
+        -------
+        Case or None
+            The case, or None if it has not been cached.
+        """
+        if case_id in self._cases:
+            return self._cases[case_id]
 
-            # cache it if requested
-            if cache:
-                self._cases[case_id] = case
+        if case_id not in self._recent_cases:
+            return None
 
+        if cache:
+            case = self._cases[case_id] = self._recent_cases.pop(case_id)
             return case
+
+        self._recent_cases.move_to_end(case_id)
+        return copy.copy(self._recent_cases[case_id])
+
+    def _load_case(self, case_id, source, row, cache):
+        """
+        Create a case from a row of the table and keep it in memory.
+
+        Parameters
+        ----------
+        case_id : str
+            The string-identifier of the case.
+        source : str
+            The source of the case.
+        row : sqlite3.Row or dict
+            The row of the table holding the case.
+        cache : bool
+            If True, the case is kept until the reader is deleted. Otherwise it is kept until
+            it is one of the least recently used cases.
+
+        Returns
+        -------
+        Case
+            The case.
+        """
+        case = Case(source, row, self._prom2abs, self._abs2prom, self._abs2meta,
+                    self._conns, self._var_info, self._format_version)
+
+        if cache:
+            self._cases[case_id] = case
+        elif self._cache_size > 0 and case_id not in self._recent_cases:
+            self._recent_cases[case_id] = case
+            if len(self._recent_cases) > self._cache_size:
+                self._recent_cases.popitem(last=False)
+            return copy.copy(case)
+
+        return case
+
+    def get_val_history(self, names, source, slice=None):
+        """
+        Return the recorded values of variables across the cases of a source in this table.
+
+        The rows of the table are streamed with a cursor, and only the requested variables
+        are decoded.
+
+        Parameters
+        ----------
+        names : list of str
+            Promoted or absolute names of the variables. Outputs are searched first, then
+            inputs.
+        source : str
+            The source of the cases.
+        slice : slice or array of int or None
+            If given, selects a subset of the cases of the source.
+
+        Returns
+        -------
+        dict
+            The values of each variable, stacked along the first axis, keyed by name.
+        """
+        if self._keys is None:
+            self.list_cases()
+
+        with closing(sqlite3.connect(self._filename)) as con:
+            cur = con.cursor()
+
+            # ids of the rows recorded by the source, in execution order
+            cur.execute(f"SELECT id, {self._index_name} FROM {self._table_name}"
+                        " ORDER BY id ASC")  # nosec: trusted input
+            keys = {row_id: key for row_id, key in cur if self._get_source(key) == source}
+            ids = list(keys)
+            if not ids:
+                raise RuntimeError('No cases recorded for %s' % source)
+
+            if slice is not None:
+                ids = np.asarray(ids)[slice].tolist()
+                if not ids:
+                    return {name: np.zeros(0) for name in names}
+
+            if self._format_version < 3:
+                # values aren't stored as JSON, so get them from the cases
+                return {name: _stack_history(name, source,
+                                             [self.get_case(keys[row_id])[name]
+                                              for row_id in ids])
+                        for name in names}
+
+            # resolve the names against the variables recorded in the first selected case
+            columns = (self._columns['outputs'], self._columns['inputs'])
+            cur.execute(f"SELECT {', '.join(columns)} FROM {self._table_name} "
+                        "WHERE id=?", (ids[0],))  # nosec: trusted input
+            recorded = [json_loads(text) if text else {} for text in cur.fetchone()]
+
+            var_keys = []
+            for name in names:
+                for io, column, rec in zip(('output', 'input'), columns, recorded):
+                    key = get_recorded_name(name, rec, io, self._prom2abs, self._abs2prom,
+                                            self._conns)
+                    if key is not None:
+                        var_keys.append((column, key))
+                        break
+                else:
+                    raise KeyError(f"Variable '{name}' was not recorded by '{source}'.")
+
+            try:
+                vals = self._select_json_values(cur, ids, var_keys)
+            except sqlite3.OperationalError:
+                # sqlite can't parse values such as NaN, so decode the full JSON text
+                vals = self._select_json_values(cur, ids, var_keys, use_json1=False)
+
+        return {name: _stack_history(name, source, [vals[row_id][i] for row_id in ids])
+                for i, name in enumerate(names)}
+
+    def _select_json_values(self, cur, ids, var_keys, use_json1=True):
+        """
+        Read the values of the given variables from the JSON columns of the given rows.
+
+        Parameters
+        ----------
+        cur : sqlite3.Cursor
+            Database cursor to use for reading the data.
+        ids : list of int
+            The ids of the rows to read.
+        var_keys : list of (str, str)
+            Table column and recorded name of each variable.
+        use_json1 : bool
+            If True, extract the values with the sqlite JSON functions rather than decoding
+            the full JSON text of each column.
+
+        Returns
+        -------
+        dict
+            Mapping of row id to the list of values of the variables.
+        """
+        if use_json1:
+            select = ', '.join('json_quote(json_extract(%s, ?))' % column
+                               for column, _ in var_keys)
+            params = ['$."%s"' % key for _, key in var_keys]
         else:
-            return None
+            columns = list(dict.fromkeys(column for column, _ in var_keys))
+            select = ', '.join(columns)
+            params = []
+
+        vals = {}
+        unique_ids = list(dict.fromkeys(ids))
+
+        # the number of parameters in a single query is limited, so read the rows in chunks
+        for i in range(0, len(unique_ids), _MAX_QUERY_IDS):
+            chunk = unique_ids[i:i + _MAX_QUERY_IDS]
+            cur.execute(f"SELECT id, {select} FROM {self._table_name} "  # nosec: trusted input
+                        f"WHERE id IN ({', '.join('?' * len(chunk))})", params + chunk)
+
+            for row_id, *texts in cur:
+                if use_json1:
+                    vals[row_id] = [json_loads(text) for text in texts]
+                else:
+                    data = {column: json_loads(text) if text else {}
+                            for column, text in zip(columns, texts)}
+                    vals[row_id] = [data[column].get(key) for column, key in var_keys]
+
+        return vals
 
     def _get_iteration_coordinate(self, case_idx):
         """
@@ -1426,16 +1704,18 @@ class DriverCases(CaseTable):
         Dictionary of all model connections.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    cache_size : int
+        Number of most recently accessed cases that are kept in memory.
     """
 
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
-                 var_info):
+                 var_info, cache_size=0):
         """
         Initialize.
         """
         super().__init__(filename, format_version,
                          'driver_iterations', 'iteration_coordinate', giter,
-                         prom2abs, abs2prom, abs2meta, conns, var_info)
+                         prom2abs, abs2prom, abs2meta, conns, var_info, cache_size)
 
     def cases(self, cache=False):
         """
@@ -1501,8 +1781,9 @@ class DriverCases(CaseTable):
             case_id = self._get_iteration_coordinate(case_id)
 
         # return cached case if present, else fetch it
-        if case_id in self._cases:
-            return self._cases[case_id]
+        case = self._get_cached_case(case_id, cache)
+        if case is not None:
+            return case
 
         # Get an unscaled case if does not already exist in _cases
         with sqlite3.connect(self._filename) as con:
@@ -1530,11 +1811,7 @@ class DriverCases(CaseTable):
 
         # if found, create Case object (and cache it if requested) else return None
         if row:
-            case = Case('driver', row, self._prom2abs, self._abs2prom, self._abs2meta,
-                        self._conns, self._var_info, self._format_version)
-            if cache:
-                self._cases[case_id] = case
-            return case
+            return self._load_case(case_id, 'driver', row, cache)
         else:
             return None
 
@@ -1604,16 +1881,18 @@ class SystemCases(CaseTable):
         Dictionary of all model connections.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    cache_size : int
+        Number of most recently accessed cases that are kept in memory.
     """
 
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
-                 var_info):
+                 var_info, cache_size=0):
         """
         Initialize.
         """
         super().__init__(filename, format_version,
                          'system_iterations', 'iteration_coordinate', giter,
-                         prom2abs, abs2prom, abs2meta, conns, var_info)
+                         prom2abs, abs2prom, abs2meta, conns, var_info, cache_size)
 
 
 class SolverCases(CaseTable):
@@ -1638,16 +1917,20 @@ class SolverCases(CaseTable):
         Dictionary of all model connections.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    cache_size : int
+        Number of most recently accessed cases that are kept in memory.
     """
 
+    _columns = {'inputs': 'solver_inputs', 'outputs': 'solver_output'}
+
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
-                 var_info):
+                 var_info, cache_size=0):
         """
         Initialize.
         """
         super().__init__(filename, format_version,
                          'solver_iterations', 'iteration_coordinate', giter,
-                         prom2abs, abs2prom, abs2meta, conns, var_info)
+                         prom2abs, abs2prom, abs2meta, conns, var_info, cache_size)
 
     def _get_source(self, iteration_coordinate):
         """
@@ -1700,16 +1983,18 @@ class ProblemCases(CaseTable):
         Dictionary of all model connections.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    cache_size : int
+        Number of most recently accessed cases that are kept in memory.
     """
 
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
-                 var_info):
+                 var_info, cache_size=0):
         """
         Initialize.
         """
         super().__init__(filename, format_version,
                          'problem_cases', 'case_name', giter,
-                         prom2abs, abs2prom, abs2meta, conns, var_info)
+                         prom2abs, abs2prom, abs2meta, conns, var_info, cache_size)
 
     def list_sources(self):
         """
@@ -7,6 +7,10 @@ from io import BytesIO
 import os.path
 import gc
 import sqlite3
+import queue
+import threading
+import time
+import weakref
 
 import json
 import numpy as np
@@ -15,15 +19,12 @@ import pickle
 import zlib
 
 from openmdao import __version__ as openmdao_version
-from openmdao.recorders.case_recorder import CaseRecorder, PICKLE_VER
+from openmdao.recorders.case_recorder import CaseRecorder, PICKLE_VER, \
+    _get_requester_system, _update_var_metadata
 from openmdao.utils.mpi import MPI
 from openmdao.utils.record_util import dict_to_structured_array
 from openmdao.utils.options_dictionary import OptionsDictionary
 from openmdao.utils.general_utils import make_serializable, default_noraise
-from openmdao.core.driver import Driver
-from openmdao.core.system import System
-from openmdao.core.problem import Problem
-from openmdao.solvers.solver import Solver
 from openmdao.utils.om_warnings import issue_warning, CaseRecorderWarning
 
 
@@ -114,6 +115,187 @@ def blob_to_array(blob):
     return np.load(out, allow_pickle=True)
 
 
+_INSERT_GLOBAL = "INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)"
+
+
+def _insert_case(cursor, sql, values, record_type, source):
+    """
+    Insert a single case record and, if requested, its global_iterations entry.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        Cursor used to execute the inserts.
+    sql : str
+        The INSERT statement for the case table.
+    values : tuple
+        Values for the case table INSERT statement.
+    record_type : str or None
+        Type of the record in the global_iterations table. If None, no entry is added.
+    source : str or None
+        Source of the record in the global_iterations table.
+    """
+    cursor.execute(sql, values)
+    if record_type is not None:
+        cursor.execute(_INSERT_GLOBAL, (record_type, cursor.lastrowid, source))
+
+
+class _AsyncCaseWriter(object):
+    """
+    Background thread that writes case records to a sqlite database in batches.
+
+    Records are taken from a bounded queue and committed in a single transaction once
+    batch_size records have accumulated or flush_interval seconds have passed since the
+    first record of the batch was queued.
+
+    Parameters
+    ----------
+    connection : sqlite3.Connection
+        Connection to the database. Must have been created with check_same_thread=False.
+    lock : threading.Lock
+        Lock guarding all use of the connection.
+    batch_size : int
+        Maximum number of records committed in a single transaction.
+    flush_interval : float
+        Maximum time in seconds that a queued record waits before being committed.
+    max_queue_size : int
+        Maximum number of pending records. When the queue is full, recording blocks until
+        the writer has caught up.
+
+    Attributes
+    ----------
+    _connection : sqlite3.Connection
+        Connection to the database.
+    _lock : threading.Lock
+        Lock guarding all use of the connection.
+    _batch_size : int
+        Maximum number of records committed in a single transaction.
+    _flush_interval : float
+        Maximum time in seconds that a queued record waits before being committed.
+    _queue : queue.Queue
+        Queue of pending records and control messages.
+    _error : Exception or None
+        Exception raised in the writer thread, re-raised in the recording thread.
+    _thread : threading.Thread
+        The writer thread.
+    """
+
+    _STOP = object()
+
+    def __init__(self, connection, lock, batch_size, flush_interval, max_queue_size):
+        """
+        Start the writer thread.
+        """
+        self._connection = connection
+        self._lock = lock
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name='SqliteRecorderWriter',
+                                        daemon=True)
+        self._thread.start()
+
+    def put(self, sql, values, record_type, source):
+        """
+        Queue a case record for writing.
+
+        Parameters
+        ----------
+        sql : str
+            The INSERT statement for the case table.
+        values : tuple
+            Values for the case table INSERT statement.
+        record_type : str or None
+            Type of the record in the global_iterations table.
+        source : str or None
+            Source of the record in the global_iterations table.
+        """
+        self._check_error()
+        self._queue.put((sql, values, record_type, source))
+
+    def flush(self):
+        """
+        Block until all records queued so far have been committed.
+        """
+        if self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put(done)
+            while not done.wait(0.1):
+                if not self._thread.is_alive():
+                    break
+        self._check_error()
+
+    def close(self):
+        """
+        Commit all pending records and stop the writer thread.
+        """
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        self._check_error()
+
+    def _check_error(self):
+        """
+        Re-raise any exception that occurred in the writer thread.
+        """
+        if self._error is not None:
+            err, self._error = self._error, None
+            raise err
+
+    def _write(self, batch):
+        """
+        Commit the given records in a single transaction.
+
+        Parameters
+        ----------
+        batch : list
+            List of (sql, values, record_type, source) tuples.
+        """
+        if batch and self._error is None:
+            try:
+                with self._lock, self._connection as c:
+                    c = c.cursor()  # need a real cursor for lastrowid
+                    for rec in batch:
+                        _insert_case(c, *rec)
+            except Exception as err:
+                self._error = err
+        batch.clear()
+
+    def _run(self):
+        """
+        Take records from the queue and write them until told to stop.
+        """
+        batch = []
+        deadline = None
+        get = self._queue.get
+
+        while True:
+            try:
+                if batch:
+                    item = get(timeout=max(deadline - time.perf_counter(), 0.))
+                else:
+                    item = get()
+            except queue.Empty:
+                self._write(batch)
+                continue
+
+            if item is self._STOP:
+                self._write(batch)
+                return
+            elif isinstance(item, threading.Event):
+                self._write(batch)
+                item.set()
+                continue
+
+            if not batch:
+                deadline = time.perf_counter() + self._flush_interval
+            batch.append(item)
+
+            if len(batch) >= self._batch_size or time.perf_counter() >= deadline:
+                self._write(batch)
+
+
 class SqliteRecorder(CaseRecorder):
     """
     Recorder that saves cases in a sqlite db.
@@ -128,6 +310,18 @@ class SqliteRecorder(CaseRecorder):
         The pickle protocol version to use when pickling metadata.
     record_viewer_data : bool, optional
         If True, record data needed for visualization.
+    async_write : bool, optional
+        If True, case records are written to the database by a background thread, which
+        commits them in batches rather than one transaction per record. Pending records are
+        always written when the recorder is shut down.
+    batch_size : int, optional
+        When async_write is True, the maximum number of records committed in one transaction.
+    flush_interval : float, optional
+        When async_write is True, the maximum time in seconds that a record waits before
+        being committed.
+    max_queue_size : int, optional
+        When async_write is True, the maximum number of records waiting to be written.
+        Recording blocks while the queue is full.
 
     Attributes
     ----------
@@ -156,15 +350,31 @@ class SqliteRecorder(CaseRecorder):
         set of recording requesters for which this recorder has been started.
     _use_outputs_dir : bool
         Flag indicating if the database is being saved in the problem outputs dir.
+    _async_write : bool
+        If True, case records are written by a background thread.
+    _async_options : tuple
+        The batch_size, flush_interval and max_queue_size used by the background writer.
+    _writer : _AsyncCaseWriter or None
+        The background writer, if async_write is True and the database is open.
+    _lock : threading.Lock
+        Lock guarding use of the connection when records are written by a background thread.
     """
 
-    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True):
+    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True,
+                 async_write=False, batch_size=100, flush_interval=0.5, max_queue_size=1000):
         """
         Initialize the SqliteRecorder.
         """
         if append:
             raise NotImplementedError("Append feature not implemented for SqliteRecorder")
 
+        if async_write:
+            if batch_size < 1:
+                raise ValueError(f"batch_size must be a positive integer, got {batch_size}.")
+            if flush_interval < 0:
+                raise ValueError("flush_interval must be non-negative, "
+                                 f"got {flush_interval}.")
+
         self.connection = None
         self.metadata_connection = None
         self._record_metadata = True
@@ -181,6 +391,11 @@ class SqliteRecorder(CaseRecorder):
         self._database_initialized = False
         self._started = set()
 
+        self._async_write = async_write
+        self._async_options = (batch_size, flush_interval, max_queue_size)
+        self._writer = None
+        self._lock = threading.Lock()
+
         super().__init__(record_viewer_data)
 
     def _initialize_database(self, comm):
@@ -228,7 +443,8 @@ class SqliteRecorder(CaseRecorder):
             except OSError:
                 pass
 
-            self.connection = sqlite3.connect(filepath)
+            # the background writer uses the connection from its own thread
+            self.connection = sqlite3.connect(filepath, check_same_thread=not self._async_write)
             if self._record_metadata and self.metadata_connection is None:
                 self.metadata_connection = self.connection
 
@@ -277,41 +493,16 @@ class SqliteRecorder(CaseRecorder):
                         m.execute("CREATE TABLE solver_metadata(id TEXT PRIMARY KEY, "
                                   "solver_options BLOB, solver_class TEXT)")
 
+            if self._async_write:
+                self._writer = _AsyncCaseWriter(self.connection, self._lock,
+                                                *self._async_options)
+                # make sure pending records are written even if shutdown is never called
+                weakref.finalize(self, self._writer.close)
+
         self._database_initialized = True
         if MPI and comm and comm.size > 1:
             comm.barrier()
 
-    def _make_abs2meta_serializable(self):
-        """
-        Convert all abs2meta variable properties to a form that can be dumped as JSON.
-        """
-        for meta in self._abs2meta.values():
-            for prop, val in meta.items():
-                meta[prop] = make_serializable(val)
-
-    def _make_var_setting_serializable(self, var_settings):
-        """
-        Convert all var_settings variable properties to a form that can be dumped as JSON.
-
-        Parameters
-        ----------
-        var_settings : dict
-            Dictionary mapping absolute variable names to variable settings.
-
-        Returns
-        -------
-        var_settings : dict
-            Dictionary mapping absolute variable names to var settings that are JSON compatible.
-        """
-        # var_settings is already a copy at the outer level, so we just have to copy the
-        # inner dicts to prevent modifying the original designvars, objectives, and constraints.
-        for name, meta in var_settings.items():
-            meta = meta.copy()
-            for prop, val in meta.items():
-                meta[prop] = make_serializable(val)
-            var_settings[name] = meta
-        return var_settings
-
     def startup(self, recording_requester, comm=None):
         """
         Prepare for a new run and create/update the abs2prom and prom2abs variables.
@@ -329,22 +520,7 @@ class SqliteRecorder(CaseRecorder):
 
         super().startup(recording_requester, comm)
 
-        # grab the system and driver
-        if isinstance(recording_requester, Driver):
-            system = recording_requester._problem().model
-            driver = recording_requester
-        elif isinstance(recording_requester, System):
-            system = recording_requester
-            driver = None
-        elif isinstance(recording_requester, Problem):
-            system = recording_requester.model
-            driver = recording_requester.driver
-        elif isinstance(recording_requester, Solver):
-            system = recording_requester._system()
-            driver = None
-        else:
-            raise ValueError('Driver encountered a recording_requester it cannot handle'
-                             ': {0}'.format(recording_requester))
+        system, driver = _get_requester_system(recording_requester)
 
         if self._use_outputs_dir:
             self._filepath = system.get_outputs_dir(mkdir=True) / self._filepath
@@ -376,45 +552,9 @@ class SqliteRecorder(CaseRecorder):
                 constraints = driver._cons
                 objectives = driver._objs
 
-            # merge current abs2prom and prom2abs with this system's version
-            self._abs2prom['input'].update(system._resolver.abs2prom_iter('input'))
-            self._abs2prom['output'].update(system._resolver.abs2prom_iter('output'))
-            for v, abs_names in system._resolver.prom2abs_iter('input'):
-                if v not in self._prom2abs['input']:
-                    self._prom2abs['input'][v] = abs_names.copy()
-                else:
-                    lst = self._prom2abs['input'][v]
-                    old = set(lst)
-                    for name in abs_names:
-                        if name not in old:
-                            lst.append(name)
-
-            # for outputs, there can be only one abs name per promoted name
-            for v, abs_names in system._resolver.prom2abs_iter('output'):
-                self._prom2abs['output'][v] = abs_names
-
-            for name, meta in system.abs_meta_iter('output', local=False, discrete=True):
-                if name not in self._abs2meta:
-                    meta = meta.copy()
-                    self._abs2meta[name] = meta
-                    meta['type'] = ['output']
-                    meta['explicit'] = name not in states
-
-            for name, meta in system.abs_meta_iter('input', local=False, discrete=True):
-                if name not in self._abs2meta:
-                    meta = meta.copy()
-                    self._abs2meta[name] = meta
-                    meta['type'] = ['input']
-                    meta['explicit'] = True
-
-            for varinfo, var_type in [(desvars, 'desvar'), (responses, 'response'),
-                                      (objectives, 'objective'), (constraints, 'constraint')]:
-                for name, vmeta in varinfo.items():
-                    srcname = vmeta['source']
-                    self._abs2meta[srcname]['type'].append(var_type)
-                    self._abs2meta[srcname]['explicit'] = srcname not in states
-
-            self._make_abs2meta_serializable()
+            var_settings = _update_var_metadata(system, desvars, responses, objectives,
+                                                constraints, states, var_order,
+                                                self._abs2prom, self._prom2abs, self._abs2meta)
 
             # store the updated abs2prom and prom2abs
             abs2prom = zlib.compress(json.dumps(self._abs2prom).encode('ascii'))
@@ -422,20 +562,11 @@ class SqliteRecorder(CaseRecorder):
             abs2meta = zlib.compress(json.dumps(self._abs2meta).encode('ascii'))
             conns = zlib.compress(json.dumps(
                 system._problem_meta['model_ref']()._conn_global_abs_in2out).encode('ascii'))
-
-            # TODO: seems like we could clobber the var_settings for a desvar in cases where a
-            # desvar is also a constraint... Make a test case and fix if needed.
-            var_settings = {}
-            var_settings.update(desvars)
-            var_settings.update(objectives)
-            var_settings.update(constraints)
-            var_settings = self._make_var_setting_serializable(var_settings)
-            var_settings['execution_order'] = var_order
             var_settings_json = zlib.compress(
                 json.dumps(var_settings, default=default_noraise).encode('ascii'))
 
             if self._record_metadata:
-                with self.metadata_connection as m:
+                with self._lock, self.metadata_connection as m:
                     m.execute("UPDATE metadata SET " +   # nosec: trusted input
                               "abs2prom=?, prom2abs=?, abs2meta=?, var_settings=?, conns=?",
                               (abs2prom, prom2abs, abs2meta, var_settings_json, conns))
@@ -477,18 +608,13 @@ class SqliteRecorder(CaseRecorder):
             inputs_text = json.dumps(inputs)
             residuals_text = json.dumps(residuals)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO driver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs, outputs, residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('driver', c.lastrowid, driver._get_name()))
+            self._insert("INSERT INTO driver_iterations(counter, iteration_coordinate, "
+                         "timestamp, success, msg, inputs, outputs, residuals) "
+                         "VALUES(?,?,?,?,?,?,?,?)",
+                         (self._counter, self._iteration_coordinate,
+                          metadata['timestamp'], metadata['success'], metadata['msg'],
+                          inputs_text, outputs_text, residuals_text),
+                         'driver', driver._get_name())
 
     def record_iteration_problem(self, problem, data, metadata):
         """
@@ -537,20 +663,15 @@ class SqliteRecorder(CaseRecorder):
             abs_err = data['abs'] if 'abs' in data else None
             rel_err = data['rel'] if 'rel' in data else None
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO problem_cases(counter, case_name, "
-                          "timestamp, success, msg, inputs, outputs, residuals, jacobian, "
-                          "abs_err, rel_err ) "
-                          "VALUES(?,?,?,?,?,?,?,?,?,?,?)",
-                          (self._counter, metadata['name'],
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text, totals_blob,
-                           abs_err, rel_err))
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('problem', c.lastrowid, metadata['name']))
+            self._insert("INSERT INTO problem_cases(counter, case_name, "
+                         "timestamp, success, msg, inputs, outputs, residuals, jacobian, "
+                         "abs_err, rel_err ) "
+                         "VALUES(?,?,?,?,?,?,?,?,?,?,?)",
+                         (self._counter, metadata['name'],
+                          metadata['timestamp'], metadata['success'], metadata['msg'],
+                          inputs_text, outputs_text, residuals_text, totals_blob,
+                          abs_err, rel_err),
+                         'problem', metadata['name'])
 
     def record_iteration_system(self, system, data, metadata):
         """
@@ -585,23 +706,18 @@ class SqliteRecorder(CaseRecorder):
             inputs_text = json.dumps(inputs)
             residuals_text = json.dumps(residuals)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO system_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs , outputs , residuals ) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
+            # get the pathname of the source system
+            source_system = system.pathname
+            if source_system == '':
+                source_system = 'root'
 
-                # get the pathname of the source system
-                source_system = system.pathname
-                if source_system == '':
-                    source_system = 'root'
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('system', c.lastrowid, source_system))
+            self._insert("INSERT INTO system_iterations(counter, iteration_coordinate, "
+                         "timestamp, success, msg, inputs , outputs , residuals ) "
+                         "VALUES(?,?,?,?,?,?,?,?)",
+                         (self._counter, self._iteration_coordinate,
+                          metadata['timestamp'], metadata['success'], metadata['msg'],
+                          inputs_text, outputs_text, residuals_text),
+                         'system', source_system)
 
     def record_iteration_solver(self, solver, data, metadata):
         """
@@ -640,34 +756,29 @@ class SqliteRecorder(CaseRecorder):
             inputs_text = json.dumps(inputs)
             residuals_text = json.dumps(residuals)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO solver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, abs_err, rel_err, "
-                          "solver_inputs, solver_output, solver_residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           abs, rel, inputs_text, outputs_text, residuals_text))
-
-                # get the pathname of the source system
-                source_system = solver._system().pathname
-                if source_system == '':
-                    source_system = 'root'
-
-                # get solver type from SOLVER class attribute to determine the solver pathname
-                solver_type = solver.SOLVER[0:2]
-                if solver_type == 'NL':
-                    source_solver = source_system + '.nonlinear_solver'
-                elif solver_type == 'LS':
-                    source_solver = source_system + '.nonlinear_solver.linesearch'
-                else:
-                    raise RuntimeError("Solver type '%s' not recognized during recording. "
-                                       "Expecting NL or LS" % solver.SOLVER)
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('solver', c.lastrowid, source_solver))
+            # get the pathname of the source system
+            source_system = solver._system().pathname
+            if source_system == '':
+                source_system = 'root'
+
+            # get solver type from SOLVER class attribute to determine the solver pathname
+            solver_type = solver.SOLVER[0:2]
+            if solver_type == 'NL':
+                source_solver = source_system + '.nonlinear_solver'
+            elif solver_type == 'LS':
+                source_solver = source_system + '.nonlinear_solver.linesearch'
+            else:
+                raise RuntimeError("Solver type '%s' not recognized during recording. "
+                                   "Expecting NL or LS" % solver.SOLVER)
+
+            self._insert("INSERT INTO solver_iterations(counter, iteration_coordinate, "
+                         "timestamp, success, msg, abs_err, rel_err, "
+                         "solver_inputs, solver_output, solver_residuals) "
+                         "VALUES(?,?,?,?,?,?,?,?,?,?)",
+                         (self._counter, self._iteration_coordinate,
+                          metadata['timestamp'], metadata['success'], metadata['msg'],
+                          abs, rel, inputs_text, outputs_text, residuals_text),
+                         'solver', source_solver)
 
     def record_viewer_data(self, model_viewer_data, key='Driver'):
         """
@@ -685,7 +796,7 @@ class SqliteRecorder(CaseRecorder):
 
             # Note: recorded to 'driver_metadata' table for legacy/compatibility reasons.
             try:
-                with self.metadata_connection as m:
+                with self._lock, self.metadata_connection as m:
                     m.execute("INSERT INTO driver_metadata(id, model_viewer_data) VALUES(?,?)",
                               (key, json_data))
             except sqlite3.IntegrityError:
@@ -739,7 +850,7 @@ class SqliteRecorder(CaseRecorder):
             else:
                 name = META_KEY_SEP.join([path, str(run_number)])
 
-            with self.metadata_connection as m:
+            with self._lock, self.metadata_connection as m:
                 m.execute("INSERT INTO system_metadata"
                           "(id, scaling_factors, component_metadata) "
                           "VALUES(?,?,?)", (name, scaling_factors,
@@ -771,7 +882,7 @@ class SqliteRecorder(CaseRecorder):
 
             solver_options = zlib.compress(pickle.dumps(solver.options, self._pickle_version))
 
-            with self.metadata_connection as m:
+            with self._lock, self.metadata_connection as m:
                 m.execute("INSERT INTO solver_metadata(id, solver_options, solver_class)"
                           " VALUES(?,?,?)", (id, sqlite3.Binary(solver_options), solver_class))
 
@@ -793,19 +904,53 @@ class SqliteRecorder(CaseRecorder):
             data_array = dict_to_structured_array(data)
             data_blob = array_to_blob(data_array)
 
+            self._insert("INSERT INTO driver_derivatives(counter, iteration_coordinate, "
+                         "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?)",
+                         (self._counter, self._iteration_coordinate,
+                          metadata['timestamp'], metadata['success'], metadata['msg'],
+                          data_blob),
+                         None, None)
+
+    def _insert(self, sql, values, record_type, source):
+        """
+        Write a case record, either directly or through the background writer.
+
+        Parameters
+        ----------
+        sql : str
+            The INSERT statement for the case table.
+        values : tuple
+            Values for the case table INSERT statement.
+        record_type : str or None
+            Type of the record in the global_iterations table. If None, no entry is added.
+        source : str or None
+            Source of the record in the global_iterations table.
+        """
+        if self._writer is None:
             with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
+                _insert_case(c.cursor(), sql, values, record_type, source)
+        else:
+            self._writer.put(sql, values, record_type, source)
 
-                c.execute("INSERT INTO driver_derivatives(counter, iteration_coordinate, "
-                          "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           data_blob))
+    def flush(self):
+        """
+        Block until all case records have been written to the database.
+
+        This only has an effect when the recorder was created with async_write=True.
+        """
+        if self._writer is not None:
+            self._writer.flush()
 
     def shutdown(self):
         """
         Shut down the recorder.
         """
+        # write any pending records before closing the connection
+        if self._writer is not None:
+            writer = self._writer
+            self._writer = None
+            writer.close()
+
         # close database connection
         if self._record_metadata and self.metadata_connection and \
                 self.metadata_connection != self.connection:
@@ -824,6 +969,7 @@ class SqliteRecorder(CaseRecorder):
         """
         Delete all the recordings.
         """
+        self.flush()
         if self.connection:
             self.connection.execute("DELETE FROM global_iterations")
             self.connection.execute("DELETE FROM driver_iterations")
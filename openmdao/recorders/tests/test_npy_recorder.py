@@ -0,0 +1,316 @@
+import gc
+import os
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.recorders.npy_reader import NpyCaseReader
+from openmdao.test_suite.components.paraboloid import Paraboloid
+from openmdao.test_suite.components.sellar import SellarProblem
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+class LabelComp(om.ExplicitComponent):
+
+    def setup(self):
+        self.add_input('f_xy', val=0.)
+        self.add_discrete_output('label', val='low')
+
+    def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
+        discrete_outputs['label'] = 'high' if inputs['f_xy'] > 100. else 'low'
+
+
+def _run_sellar(recorder, filename):
+    prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS, linear_solver=om.ScipyKrylov)
+    prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+
+    prob.driver.add_recorder(recorder)
+    prob.driver.recording_options['record_derivatives'] = True
+    prob.driver.recording_options['includes'] = ['*']
+    prob.model.add_recorder(recorder)
+    prob.add_recorder(recorder)
+    prob.recording_options['record_derivatives'] = True
+
+    prob.setup()
+    prob.run_driver()
+    prob.record('final')
+    prob.cleanup()
+
+    return om.CaseReader(prob.get_outputs_dir() / filename)
+
+
+@use_tempdirs
+class TestNpyRecorder(unittest.TestCase):
+
+    def test_matches_sqlite(self):
+        cr_sql = _run_sellar(om.SqliteRecorder('cases.sql'), 'cases.sql')
+        cr_npy = _run_sellar(om.NpyRecorder('cases', chunk_size=3), 'cases')
+
+        self.assertIsInstance(cr_npy, NpyCaseReader)
+
+        sources = cr_sql.list_sources(out_stream=None)
+        self.assertEqual(cr_npy.list_sources(out_stream=None), sources)
+        self.assertEqual(cr_npy.list_cases(out_stream=None), cr_sql.list_cases(out_stream=None))
+
+        for source in sources:
+            for recurse in (True, False):
+                self.assertEqual(cr_npy.list_cases(source, recurse=recurse, out_stream=None),
+                                 cr_sql.list_cases(source, recurse=recurse, out_stream=None))
+            self.assertEqual(cr_npy.list_source_vars(source, out_stream=None),
+                             cr_sql.list_source_vars(source, out_stream=None))
+
+        nderivs = 0
+        for name in cr_sql.list_cases(out_stream=None):
+            c_sql = cr_sql.get_case(name)
+            c_npy = cr_npy.get_case(name)
+
+            self.assertEqual(c_npy.source, c_sql.source)
+            self.assertEqual(c_npy.counter, c_sql.counter)
+            self.assertEqual(c_npy.parent, c_sql.parent)
+
+            for var in ('x', 'z', 'y1', 'obj', 'con1', 'con2'):
+                assert_near_equal(c_npy.get_val(var), c_sql.get_val(var), 1e-15)
+
+            if c_sql.inputs is not None:
+                assert_near_equal(c_npy.inputs['d1.x'], c_sql.inputs['d1.x'], 1e-15)
+            if c_sql.residuals is not None:
+                assert_near_equal(c_npy.residuals['y1'], c_sql.residuals['y1'], 1e-15)
+
+            if c_sql.derivatives is None:
+                self.assertIsNone(c_npy.derivatives)
+            else:
+                nderivs += 1
+                self.assertEqual(set(c_npy.derivatives), set(c_sql.derivatives))
+                for key in c_sql.derivatives:
+                    assert_near_equal(c_npy.derivatives[key], c_sql.derivatives[key], 1e-15)
+
+        self.assertTrue(nderivs > 1)
+
+        # the history of each variable is available as a single array
+        hist = cr_npy.get_val_history(['x', 'z', 'obj'])
+        driver_cases = cr_npy.get_cases('driver', recurse=False)
+        self.assertEqual(hist['z'].shape, (len(driver_cases), 2))
+        for i, case in enumerate(driver_cases):
+            assert_near_equal(hist['x'][i], case.get_val('x'), 1e-15)
+            assert_near_equal(hist['z'][i], case.get_val('z'), 1e-15)
+            assert_near_equal(hist['obj'][i], case.get_val('obj'), 1e-15)
+
+        assert_near_equal(cr_npy.get_val_history('obj', slice=slice(-2, None)),
+                          hist['obj'][-2:], 1e-15)
+        assert_near_equal(cr_npy.get_val_history('d1.x', source='root'),
+                          [case.inputs['d1.x'] for case in cr_npy.get_cases('root')], 1e-15)
+
+    def test_doe_history(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        model.add_subsystem('label', LabelComp(), promotes=['*'])
+        model.add_design_var('x', lower=-10, upper=10)
+        model.add_design_var('y', lower=-10, upper=10)
+        model.add_objective('f_xy')
+
+        levels = np.linspace(-10, 10, 11)
+        samples = [[('x', x), ('y', y)] for x in levels for y in levels]
+        prob.driver = om.DOEDriver(om.ListGenerator(samples))
+        prob.driver.add_recorder(om.NpyRecorder('doe', chunk_size=16))
+        prob.driver.recording_options['includes'] = ['*']
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        dirname = prob.get_outputs_dir() / 'doe'
+        cr = NpyCaseReader(dirname)
+
+        x = cr.get_val_history('x')
+        y = cr.get_val_history('y')
+        f_xy = cr.get_val_history('f_xy')
+
+        self.assertIsInstance(f_xy, np.memmap)
+        self.assertEqual(f_xy.shape, (121, 1))
+        assert_near_equal(np.asarray(f_xy),
+                          np.asarray((x - 3.0)**2 + x * y + (y + 4.0)**2 - 3.0), 1e-12)
+
+        assert_near_equal(np.asarray(cr.get_val_history('f_xy', slice=[0, 120])),
+                          np.asarray(f_xy[[0, 120]]), 1e-15)
+
+        # each column is a standalone .npy file
+        source_dir = dirname / 's0'
+        sizes = sorted(np.load(source_dir / fname).shape for fname in os.listdir(source_dir))
+        self.assertEqual(sizes, [(121, 1)] * len(sizes))
+
+        # values that are not numeric arrays are still available from the cases
+        cases = cr.get_cases('driver')
+        self.assertEqual(len(cases), 121)
+        for case in cases:
+            self.assertEqual(case.get_val('label'),
+                             'high' if case.get_val('f_xy') > 100. else 'low')
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.get_val_history('label')
+        self.assertEqual(str(cm.exception), "Variable 'label' has recorded values that are not "
+                         "numeric arrays of a fixed shape.")
+
+        with self.assertRaises(KeyError) as cm:
+            cr.get_val_history('foo')
+        self.assertEqual(cm.exception.args[0], "Variable 'foo' was not recorded by 'driver'.")
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.get_val_history('x', source='root')
+        self.assertEqual(str(cm.exception), "Source not found: root")
+
+    def test_incremental_flush(self):
+        recorder = om.NpyRecorder('doe')
+        flushes = []
+
+        class FlushComp(om.ExplicitComponent):
+
+            def setup(self):
+                self.add_input('f_xy', val=0.)
+                self.add_output('g', val=0.)
+
+            def compute(self, inputs, outputs):
+                outputs['g'] = 2. * inputs['f_xy']
+
+                # flush the cases recorded so far every 10 evaluations, and read them back
+                ncases = len(recorder._writer.cases)
+                if ncases == 10:
+                    recorder.flush()
+                    dirname = recorder._filepath
+                    with open(dirname / 'cases.json', 'rb') as f:
+                        index = f.read()
+                    cases = NpyCaseReader(dirname).list_cases('driver', out_stream=None)
+                    flushes.append((index, os.path.getsize(dirname / 'objects.pkl'),
+                                    os.path.getsize(dirname / 'cases.jsonl'), len(cases)))
+
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        model.add_subsystem('label', LabelComp(), promotes=['*'])
+        model.add_subsystem('flush', FlushComp(), promotes=['*'])
+        model.add_design_var('x', lower=-10, upper=10)
+        model.add_design_var('y', lower=-10, upper=10)
+        model.add_objective('f_xy')
+
+        levels = np.linspace(-10, 10, 7)
+        samples = [[('x', x), ('y', y)] for x in levels for y in levels]
+        prob.driver = om.DOEDriver(om.ListGenerator(samples))
+        prob.driver.add_recorder(recorder)
+        prob.driver.recording_options['includes'] = ['*']
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual([flush[3] for flush in flushes], [10, 20, 30, 40])
+
+        # the index is only written when variables are added, and the other files grow by the
+        # same amount for each flush
+        self.assertTrue(all(flush[0] == flushes[0][0] for flush in flushes))
+        for i in (1, 2):
+            sizes = np.diff([0] + [flush[i] for flush in flushes])
+            self.assertLess(max(sizes) - min(sizes), 0.1 * min(sizes))
+
+        cr = NpyCaseReader(prob.get_outputs_dir() / 'doe')
+        cases = cr.get_cases('driver')
+        self.assertEqual(len(cases), 49)
+        for case in cases:
+            self.assertEqual(case.get_val('label'),
+                             'high' if case.get_val('f_xy') > 100. else 'low')
+        assert_near_equal(np.asarray(cr.get_val_history('g')),
+                          2. * np.asarray(cr.get_val_history('f_xy')), 1e-15)
+
+    def test_no_cleanup(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        model.add_subsystem('label', LabelComp(), promotes=['*'])
+        model.add_design_var('x', lower=-10, upper=10)
+        model.add_design_var('y', lower=-10, upper=10)
+        model.add_objective('f_xy')
+
+        levels = np.linspace(-10, 10, 7)
+        samples = [[('x', x), ('y', y)] for x in levels for y in levels]
+        prob.driver = om.DOEDriver(om.ListGenerator(samples))
+        prob.driver.add_recorder(om.NpyRecorder('doe', chunk_size=10))
+        prob.driver.recording_options['includes'] = ['*']
+
+        prob.setup()
+        prob.run_driver()
+
+        # without a cleanup, the cases are written every chunk_size cases
+        dirname = prob.get_outputs_dir() / 'doe'
+        cases = NpyCaseReader(dirname).get_cases('driver')
+        self.assertEqual(len(cases), 40)
+        for case in cases:
+            self.assertEqual(case.get_val('label'),
+                             'high' if case.get_val('f_xy') > 100. else 'low')
+
+        # and the rest when the recorder is garbage collected
+        del prob
+        gc.collect()
+
+        cr = NpyCaseReader(dirname)
+        self.assertEqual(len(cr.get_cases('driver')), 49)
+        assert_near_equal(np.asarray(cr.get_val_history('x')[:40]),
+                          np.asarray([case.get_val('x') for case in cases]), 1e-15)
+
+    def test_partial_column(self):
+        class LevelComp(om.ExplicitComponent):
+
+            def setup(self):
+                self.add_input('f_xy', val=0.)
+                self.add_discrete_output('level', val=0)
+
+            def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
+                f_xy = inputs['f_xy'].item()
+                discrete_outputs['level'] = int(f_xy) if f_xy > 100. else 'low'
+
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        model.add_subsystem('level', LevelComp(), promotes=['*'])
+        model.add_design_var('x', lower=-10, upper=10)
+        model.add_design_var('y', lower=-10, upper=10)
+        model.add_objective('f_xy')
+
+        levels = np.linspace(-10, 10, 7)
+        samples = [[('x', x), ('y', y)] for x in levels for y in levels]
+        prob.driver = om.DOEDriver(om.ListGenerator(samples))
+        prob.driver.add_recorder(om.NpyRecorder('doe', chunk_size=4))
+        prob.driver.recording_options['includes'] = ['*']
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        # the rows of the cases that recorded a numeric level are kept in a second file
+        dirname = prob.get_outputs_dir() / 'doe'
+        cr = NpyCaseReader(dirname)
+        rows = cr._sources['driver']['columns']['outputs']['level.level']['rows']
+        self.assertIsNotNone(rows)
+
+        cases = cr.get_cases('driver')
+        high = [i for i, case in enumerate(cases) if case.get_val('f_xy') > 100.]
+        self.assertEqual(np.load(dirname / 's0' / rows).tolist(), high)
+        self.assertTrue(0 < len(high) < len(cases))
+
+        for case in cases:
+            f_xy = case.get_val('f_xy').item()
+            self.assertEqual(case.get_val('level'), int(f_xy) if f_xy > 100. else 'low')
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.get_val_history('level')
+        self.assertEqual(str(cm.exception), "Variable 'level' has recorded values that are not "
+                         "numeric arrays of a fixed shape.")
+
+    def test_bad_chunk_size(self):
+        with self.assertRaises(ValueError) as cm:
+            om.NpyRecorder('cases', chunk_size=0)
+        self.assertEqual(str(cm.exception), "chunk_size must be a positive integer, got 0.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 import sys
 import os
 import unittest
+from unittest import mock
 import platform
 
 from io import StringIO
@@ -2014,6 +2015,105 @@ class TestSqliteCaseReader(unittest.TestCase):
                 self.assertTrue(key in case_type._cases)
                 self.assertEqual(key, case_type._cases[key].name)
 
+    def test_recent_cases_cache(self):
+        prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS,
+                             linear_solver=om.ScipyKrylov)
+        prob.setup()
+
+        prob.model.nonlinear_solver.add_recorder(self.recorder)
+
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = SqliteCaseReader(prob.get_outputs_dir() / self.filename, cache_size=3)
+
+        keys = cr.list_cases('root.nonlinear_solver', out_stream=None)
+        self.assertEqual(len(keys), 7)
+
+        # repeated access doesn't read the file again, decode the case again, or cache the case
+        # permanently
+        case = cr.get_case(keys[0])
+        y1 = case.outputs['y1'].copy()
+        with mock.patch('sqlite3.connect') as connect, \
+             mock.patch('openmdao.recorders.sqlite_reader.Case') as case_class:
+            again = cr._solver_cases.get_case(keys[0])
+        connect.assert_not_called()
+        case_class.assert_not_called()
+        self.assertEqual(len(cr._solver_cases._cases), 0)
+        assert_near_equal(again.outputs['y1'], y1)
+
+        # each call returns a shallow copy, so replacing an attribute of one doesn't change the
+        # others
+        self.assertIsNot(again, case)
+        case.outputs = None
+        assert_near_equal(cr.get_case(keys[0]).outputs['y1'], y1)
+        assert_near_equal(again.outputs['y1'], y1)
+
+        # only the most recently used cases are kept
+        for key in keys:
+            cr.get_case(key)
+        self.assertEqual(list(cr._solver_cases._recent_cases), keys[-3:])
+
+        # explicitly cached cases are kept and returned as before
+        cached = cr._solver_cases.get_case(keys[-1], cache=True)
+        self.assertIs(cr._solver_cases.get_case(keys[-1]), cached)
+        self.assertNotIn(keys[-1], cr._solver_cases._recent_cases)
+
+        cr = SqliteCaseReader(prob.get_outputs_dir() / self.filename, cache_size=0)
+        cr.get_case(keys[0])
+        self.assertEqual(len(cr._solver_cases._recent_cases), 0)
+
+    def test_get_val_history(self):
+        prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS,
+                             linear_solver=om.ScipyKrylov)
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        prob.setup()
+
+        prob.driver.add_recorder(self.recorder)
+        prob.driver.recording_options['includes'] = ['*']
+        prob.model.add_recorder(self.recorder)
+        prob.model.nonlinear_solver.add_recorder(self.recorder)
+        prob.add_recorder(self.recorder)
+
+        prob.run_driver()
+        prob.record('final')
+        prob.cleanup()
+
+        cr = SqliteCaseReader(prob.get_outputs_dir() / self.filename)
+
+        for source in cr.list_sources(out_stream=None):
+            cases = cr.get_cases(source, recurse=False)
+            has_inputs = cases[0].inputs is not None
+            hist = cr.get_val_history(['y1', 'z', 'd1.x'] if has_inputs else ['y1', 'z'],
+                                      source=source)
+
+            self.assertEqual(hist['z'].shape, (len(cases), 2))
+            for i, case in enumerate(cases):
+                assert_near_equal(hist['y1'][i], case['y1'], 1e-15)
+                assert_near_equal(hist['z'][i], case['z'], 1e-15)
+                if has_inputs:
+                    assert_near_equal(hist['d1.x'][i], case.inputs['d1.x'], 1e-15)
+
+        # select a subset of the cases
+        obj = cr.get_val_history('obj')
+        ncases = len(cr.list_cases('driver', recurse=False, out_stream=None))
+        self.assertEqual(obj.shape, (ncases, 1))
+        assert_near_equal(cr.get_val_history('obj', slice=slice(-2, None)), obj[-2:], 1e-15)
+        assert_near_equal(cr.get_val_history('obj', slice=[0, 2]), obj[[0, 2]], 1e-15)
+
+        # no cases are created
+        cr = SqliteCaseReader(prob.get_outputs_dir() / self.filename)
+        assert_near_equal(cr.get_val_history('obj'), obj, 1e-15)
+        self.assertEqual(len(cr._driver_cases._recent_cases), 0)
+
+        with self.assertRaises(KeyError) as cm:
+            cr.get_val_history('foo')
+        self.assertEqual(cm.exception.args[0], "Variable 'foo' was not recorded by 'driver'.")
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.get_val_history('x', source='foo')
+        self.assertEqual(str(cm.exception), "Source not found: foo")
+
     def test_caching_cases(self):
         prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS,
                              linear_solver=om.ScipyKrylov)
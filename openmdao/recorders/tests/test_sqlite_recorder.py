@@ -2906,6 +2906,90 @@ class TestSqliteRecorder(unittest.TestCase):
         self.assertTrue(all([case.startswith('foo_') for case in driver_cases]),
                         msg='One or more cases do not start with the expected prefix.')
 
+
+@use_tempdirs
+class TestSqliteRecorderAsync(unittest.TestCase):
+
+    def _run(self, filename, **kwargs):
+        prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS,
+                             linear_solver=om.ScipyKrylov)
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+
+        recorder = om.SqliteRecorder(filename, record_viewer_data=False, **kwargs)
+        prob.driver.add_recorder(recorder)
+        prob.driver.recording_options['record_derivatives'] = True
+        prob.model.add_recorder(recorder)
+        prob.model.nonlinear_solver.add_recorder(recorder)
+        prob.add_recorder(recorder)
+
+        prob.setup()
+        prob.run_driver()
+        prob.record('final')
+        prob.cleanup()
+
+        return om.CaseReader(prob.get_outputs_dir() / filename)
+
+    def test_async_matches_sync(self):
+        cr_sync = self._run('sync.sql')
+        cr_async = self._run('async.sql', async_write=True, batch_size=7, flush_interval=0.01,
+                             max_queue_size=3)
+
+        sync_cases = cr_sync.list_cases(out_stream=None)
+        async_cases = cr_async.list_cases(out_stream=None)
+        self.assertTrue(len(sync_cases) > 10)
+        self.assertEqual(sync_cases, async_cases)
+
+        for name in sync_cases:
+            c1 = cr_sync.get_case(name)
+            c2 = cr_async.get_case(name)
+            for var in ('x', 'z', 'obj'):
+                assert_near_equal(c2.get_val(var), c1.get_val(var), 1e-12)
+
+        for source in cr_sync.list_sources(out_stream=None):
+            self.assertEqual(cr_sync.list_cases(source, recurse=False, out_stream=None),
+                             cr_async.list_cases(source, recurse=False, out_stream=None))
+
+        nderivs = 0
+        for name in cr_sync.list_cases('driver', recurse=False, out_stream=None):
+            derivs = cr_sync.get_case(name).derivatives
+            async_derivs = cr_async.get_case(name).derivatives
+            if derivs is None:
+                self.assertIsNone(async_derivs)
+            else:
+                nderivs += 1
+                assert_near_equal(async_derivs['obj', 'z'], derivs['obj', 'z'], 1e-12)
+        self.assertTrue(nderivs > 0)
+
+    def test_async_flush(self):
+        prob = SellarProblem()
+        recorder = om.SqliteRecorder('flush.sql', record_viewer_data=False, async_write=True,
+                                     batch_size=1000, flush_interval=1000.)
+        prob.model.add_recorder(recorder)
+
+        prob.setup()
+        prob.run_model()
+
+        # nothing is committed until the batch fills or the recorder is flushed
+        filename = prob.get_outputs_dir() / 'flush.sql'
+        self.assertEqual(len(om.CaseReader(filename).list_cases(out_stream=None)), 0)
+
+        recorder.flush()
+        self.assertEqual(len(om.CaseReader(filename).list_cases(out_stream=None)), 1)
+
+        prob.run_model()
+        prob.cleanup()
+        self.assertEqual(len(om.CaseReader(filename).list_cases(out_stream=None)), 2)
+
+    def test_bad_async_args(self):
+        with self.assertRaises(ValueError) as cm:
+            om.SqliteRecorder('bad.sql', async_write=True, batch_size=0)
+        self.assertEqual(str(cm.exception), "batch_size must be a positive integer, got 0.")
+
+        with self.assertRaises(ValueError) as cm:
+            om.SqliteRecorder('bad.sql', async_write=True, flush_interval=-1.)
+        self.assertEqual(str(cm.exception), "flush_interval must be non-negative, got -1.0.")
+
+
 @use_tempdirs
 class TestFeatureSqliteRecorder(unittest.TestCase):
 
@@ -3014,7 +3098,8 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['type'], 'doe')
         self.assertEqual(metadata['options'], {'debug_print': [], 'generator': 'UniformGenerator',
                                                'invalid_desvar_behavior': 'warn',
-                                               'run_parallel': False, 'procs_per_model': 1})
+                                               'run_parallel': False, 'procs_per_model': 1,
+                                               'num_workers': 1, 'restart_from': None})
 
         # Optimization
         driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-3)
@@ -3034,7 +3119,8 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['options'], {"debug_print": [], "optimizer": "SLSQP",
                                                "tol": 1e-03, "maxiter": 200, "disp": True,
                                                "invalid_desvar_behavior": "warn",
-                                                'singular_jac_behavior': 'warn', 'singular_jac_tol': 1e-16})
+                                                'singular_jac_behavior': 'warn', 'singular_jac_tol': 1e-16,
+                                                'eval_cache_size': 0})
         self.assertEqual(metadata['opt_settings'], {"maxiter": 1000})
 
     def test_feature_solver_options(self):
@@ -6,10 +6,12 @@ import numpy as np
 import scipy.linalg
 import scipy.sparse.linalg
 from scipy.sparse import csc_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
 
 from openmdao.solvers.solver import LinearSolver
 from openmdao.matrices.dense_matrix import DenseMatrix
 from openmdao.utils.array_utils import identity_column_iter
+from openmdao.utils.coloring import _compute_coloring, _DEF_COMP_SPARSITY_ARGS
 from openmdao.solvers.linear.linear_rhs_checker import LinearRHSChecker
 
 
@@ -136,6 +138,179 @@ def format_singular_error(system, matrix):
     return loc_to_error_msg(system, loc_txt, loc)
 
 
+_SUPERLU_ORDERINGS = {
+    'colamd': 'COLAMD',
+    'mmd_at_plus_a': 'MMD_AT_PLUS_A',
+}
+
+
+def compute_sparse_ordering(matrix, ordering):
+    """
+    Compute row and column permutations of a CSC matrix for a fill-reducing ordering.
+
+    scipy doesn't expose the SuperLU column orderings on their own, so for 'colamd' and
+    'mmd_at_plus_a' this performs a full numeric factorization with that ordering, which is
+    returned along with its column permutation so it isn't wasted. 'rcm' only uses the
+    sparsity pattern.
+
+    Parameters
+    ----------
+    matrix : csc_matrix
+        Square matrix to be factored.
+    ordering : str
+        One of 'colamd', 'mmd_at_plus_a' or 'rcm'.
+
+    Returns
+    -------
+    ndarray
+        Row permutation.
+    ndarray
+        Column permutation.
+    SuperLU or None
+        LU factorization of the matrix computed along with the ordering, or None if the
+        ordering didn't require one.
+    """
+    if ordering == 'rcm':
+        perm = reverse_cuthill_mckee(matrix, symmetric_mode=False)
+        return perm, perm, None
+
+    # SuperLU factors Pr @ A @ Pc, so the columns of A @ Pc are A[:, argsort(perm_c)].
+    lu = scipy.sparse.linalg.splu(matrix, permc_spec=_SUPERLU_ORDERINGS[ordering])
+    return np.arange(matrix.shape[0]), np.argsort(lu.perm_c), lu
+
+
+class _SparseOrdering(object):
+    """
+    Cached fill-reducing ordering of a CSC matrix with a fixed sparsity pattern.
+
+    Parameters
+    ----------
+    matrix : csc_matrix
+        Matrix whose sparsity pattern is used to compute the ordering.
+    ordering : str
+        One of 'colamd', 'mmd_at_plus_a' or 'rcm'.
+
+    Attributes
+    ----------
+    rperm : ndarray
+        Row permutation.
+    cperm : ndarray
+        Column permutation.
+    _data_idx : ndarray
+        Index into the data array of the original matrix for each entry of the permuted one.
+    _indices : ndarray
+        Row indices of the permuted matrix.
+    _indptr : ndarray
+        Column pointers of the permuted matrix.
+    _orig_indices : ndarray
+        Row indices of the original matrix.
+    _orig_indptr : ndarray
+        Column pointers of the original matrix.
+    _new_lu : SuperLU or None
+        Factorization of the original matrix computed along with the ordering, until it is
+        returned by the first call to factor.
+    _lu : SuperLU or None
+        Factorization returned by the first call to factor, while it is the latest one. It
+        factors the original matrix rather than the permuted one.
+    """
+
+    def __init__(self, matrix, ordering):
+        """
+        Compute the ordering and the mapping from the original to the permuted matrix.
+        """
+        self.rperm, self.cperm, self._new_lu = compute_sparse_ordering(matrix, ordering)
+        self._lu = None
+
+        # permute a matrix containing the (1 based) position of each nonzero so we know where
+        # each entry of the permuted matrix comes from.
+        marker = csc_matrix((np.arange(1, matrix.nnz + 1, dtype=float), matrix.indices,
+                             matrix.indptr), shape=matrix.shape)
+        marker = marker[self.rperm][:, self.cperm].tocsc()
+        marker.sort_indices()
+
+        self._data_idx = marker.data.astype(int) - 1
+        self._indices = marker.indices
+        self._indptr = marker.indptr
+        self._orig_indices = matrix.indices.copy()
+        self._orig_indptr = matrix.indptr.copy()
+
+    def matches(self, matrix):
+        """
+        Return True if the given matrix has the sparsity pattern used to compute this ordering.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            Matrix to check.
+
+        Returns
+        -------
+        bool
+            True if the sparsity pattern is unchanged.
+        """
+        return (matrix.nnz == self._orig_indices.size and
+                np.array_equal(matrix.indptr, self._orig_indptr) and
+                np.array_equal(matrix.indices, self._orig_indices))
+
+    def factor(self, matrix):
+        """
+        Perform an LU factorization of the permuted matrix using the cached ordering.
+
+        The first call returns the factorization computed along with the ordering, if any, so
+        it must be given the matrix the ordering was computed from.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            Matrix to be factored.
+
+        Returns
+        -------
+        SuperLU
+            LU factorization of the permuted matrix.
+        """
+        self._lu, self._new_lu = self._new_lu, None
+        if self._lu is not None:
+            return self._lu
+
+        pmat = csc_matrix((matrix.data[self._data_idx], self._indices, self._indptr),
+                          shape=matrix.shape)
+        return scipy.sparse.linalg.splu(pmat, permc_spec='NATURAL')
+
+    def solve(self, lu, b, trans='N'):
+        """
+        Solve the original (unpermuted) system using the factorization of the permuted one.
+
+        Parameters
+        ----------
+        lu : SuperLU
+            LU factorization returned by the factor method.
+        b : ndarray
+            Right-hand side, either 1D or 2D with one right-hand side per column.
+        trans : str
+            'N' to solve A x = b or 'T' to solve A^T x = b.
+
+        Returns
+        -------
+        ndarray
+            Solution array.
+        """
+        if lu is self._lu:
+            # computed along with the ordering, so it factors the original matrix
+            return lu.solve(b, trans)
+
+        if trans == 'N':
+            sol = lu.solve(b[self.rperm], 'N')
+            perm = self.cperm
+        else:
+            sol = lu.solve(b[self.cperm], 'T')
+            perm = self.rperm
+
+        x = np.empty_like(sol)
+        x[perm] = sol
+        return x
+
+
 def format_nan_error(system, matrix):
     """
     Format a coherent error message when the matrix contains NaN.
@@ -184,6 +359,14 @@ class DirectSolver(LinearSolver):
     ----------
     _lin_rhs_checker : LinearRHSChecker or None
         Object for checking the right-hand side of the linear solve.
+    _mtx_coloring : Coloring or None
+        Coloring used to assemble the matrix with matrix-vector products when 'matvec_coloring'
+        is active.
+    _sparse_ordering : _SparseOrdering or None
+        Cached fill-reducing ordering for the sparse matrix when 'sparse_ordering' is not
+        'default'.
+    _lu_ordering : _SparseOrdering or None
+        Ordering that applies to the current sparse factorization, if any.
     """
 
     SOLVER = 'LN: Direct'
@@ -194,6 +377,9 @@ class DirectSolver(LinearSolver):
         """
         super().__init__(**kwargs)
         self._lin_rhs_checker = None
+        self._mtx_coloring = None
+        self._sparse_ordering = None
+        self._lu_ordering = None
 
     def _declare_options(self):
         """
@@ -211,6 +397,43 @@ class DirectSolver(LinearSolver):
                              "allow finer control over it. Allowed options are: "
                              f"{LinearRHSChecker.options}")
 
+        self.options.declare('rhs_batch_size', types=int, default=1, lower=0,
+                             desc="Maximum number of right-hand sides to solve with a single call "
+                             "to the factorization when computing total derivatives. A value of "
+                             "0 solves all right-hand sides for a given mode in a single call.")
+
+        self.options.declare('matvec_coloring', types=bool, default=False,
+                             desc="If True and no assembled jacobian is used, compute a coloring "
+                             "from the sparsity of the matrix assembled with matrix-vector "
+                             "products, then assemble it on later linearizations using one "
+                             "matrix-vector product per color into a sparse matrix that is "
+                             "factored with splu. This assumes the sparsity pattern does not "
+                             "change after the coloring is computed.")
+        self.options.declare('matvec_coloring_num_full_jacs', types=int,
+                             default=_DEF_COMP_SPARSITY_ARGS['num_full_jacs'], lower=1,
+                             desc="Number of full matrices whose combined sparsity is used to "
+                             "compute the 'matvec_coloring' coloring. The first is assembled at "
+                             "the current point and the others after randomly perturbing the "
+                             "inputs and outputs of the system, so entries that happen to be "
+                             "zero at the current point are kept.")
+        self.options.declare('matvec_coloring_tol', types=float,
+                             default=_DEF_COMP_SPARSITY_ARGS['tol'], lower=0.0,
+                             desc="Entries of the combined full matrices whose absolute value "
+                             "is not larger than this are treated as zero when computing the "
+                             "'matvec_coloring' coloring.")
+        self.options.declare('sparse_ordering', default='default',
+                             values=('default', 'colamd', 'mmd_at_plus_a', 'rcm'),
+                             desc="Fill-reducing ordering used for sparse LU factorization. "
+                             "'default' lets SuperLU compute a COLAMD ordering at every "
+                             "factorization. Other values compute the ordering once for the "
+                             "fixed sparsity pattern and reuse it, so later factorizations only "
+                             "do the numeric work. 'colamd' and 'mmd_at_plus_a' use the SuperLU "
+                             "COLAMD and multiple minimum degree on A^T + A (MMD_AT_PLUS_A) "
+                             "orderings. Computing either one costs a full factorization with "
+                             "that ordering whenever the sparsity pattern changes. 'rcm' uses the "
+                             "reverse Cuthill-McKee ordering from scipy.sparse.csgraph, which is "
+                             "computed from the sparsity pattern alone.")
+
         # this solver does not iterate
         self.options.undeclare("maxiter")
         self.options.undeclare("err_on_non_converge")
@@ -257,6 +480,9 @@ class DirectSolver(LinearSolver):
         super()._setup_solvers(system, depth)
         self._disallow_distrib_solve()
         self._lin_rhs_checker = LinearRHSChecker.create(system, self.options['rhs_checking'])
+        self._mtx_coloring = None
+        self._sparse_ordering = None
+        self._lu_ordering = None
 
     def _linearize_children(self):
         """
@@ -291,13 +517,22 @@ class DirectSolver(LinearSolver):
         """
         return False
 
-    def _build_mtx(self):
+    def _build_mtx(self, update_coloring=True):
         """
         Assemble a Jacobian matrix by matrix-vector-product with columns of identity.
 
+        If 'matvec_coloring' is active and a coloring has been computed, columns that share a
+        color are seeded together and the result is a sparse matrix.
+
+        Parameters
+        ----------
+        update_coloring : bool
+            If True, 'matvec_coloring' is active and no coloring has been computed yet, compute
+            the coloring after assembling the full matrix.
+
         Returns
         -------
-        ndarray
+        ndarray or csc_matrix
             Jacobian matrix.
         """
         system = self._system()
@@ -310,28 +545,122 @@ class DirectSolver(LinearSolver):
 
         nmtx = x_data.size
         seed = np.zeros(x_data.size)
-        mtx = np.empty((nmtx, nmtx), dtype=b_data.dtype)
         scope_out, scope_in = system._get_matvec_scope()
+        coloring = self._mtx_coloring
 
         # temporarily disable relevance to avoid creating a singular matrix
         with system._relevance.active(False):
-            # Assemble the Jacobian by running the identity matrix through apply_linear
-            for i, seed in enumerate(identity_column_iter(seed)):
-                # set value of x vector to provided value
-                xvec.set_val(seed)
+            if coloring is None:
+                mtx = np.empty((nmtx, nmtx), dtype=b_data.dtype)
 
-                # apply linear
-                system._apply_linear('fwd', scope_out, scope_in)
+                # Assemble the Jacobian by running the identity matrix through apply_linear
+                for i, seed in enumerate(identity_column_iter(seed)):
+                    # set value of x vector to provided value
+                    xvec.set_val(seed)
 
-                # put new value in out_vec
-                mtx[:, i] = bvec.asarray()
+                    # apply linear
+                    system._apply_linear('fwd', scope_out, scope_in)
+
+                    # put new value in out_vec
+                    mtx[:, i] = bvec.asarray()
+            else:
+                compressed = np.empty((nmtx, coloring.total_solves()), dtype=b_data.dtype)
+
+                # Each seed contains all columns of the identity matrix that share a color.
+                for i, (seed, _, _) in enumerate(coloring.tangent_iter('fwd', arr=seed)):
+                    xvec.set_val(seed)
+                    system._apply_linear('fwd', scope_out, scope_in)
+                    compressed[:, i] = bvec.asarray()
+
+                mtx = coloring._expand_jac(compressed, 'fwd')
 
         # Restore the backed-up vectors
         bvec.set_val(b_data)
         xvec.set_val(x_data)
 
+        if update_coloring and coloring is None and self.options['matvec_coloring']:
+            self._compute_mtx_coloring(mtx)
+
         return mtx
 
+    def _compute_mtx_coloring(self, mtx):
+        """
+        Compute the coloring used to assemble the matrix with matrix-vector products.
+
+        As for dynamic partial coloring, the sparsity is taken from the sum of the absolute values
+        of several full matrices. The given one was assembled at the current point. The others
+        are assembled after linearizing the subsystems at random perturbations of the inputs and
+        outputs, which are then restored and linearized again.
+
+        Parameters
+        ----------
+        mtx : ndarray
+            Full matrix assembled by matrix-vector products at the current point.
+        """
+        system = self._system()
+        sum_mtx = np.abs(mtx)
+        num_full_jacs = self.options['matvec_coloring_num_full_jacs']
+
+        if num_full_jacs > 1:
+            with system._relevance.active(False):
+                for _ in system._perturbation_iter(num_full_jacs - 1,
+                                                   _DEF_COMP_SPARSITY_ARGS['perturb_size'],
+                                                   (system._inputs, system._outputs),
+                                                   (system._residuals,)):
+                    system._linearize(sub_do_ln=False)
+                    sum_mtx += np.abs(self._build_mtx(update_coloring=False))
+
+                system._linearize(sub_do_ln=False)
+
+        self._mtx_coloring = _compute_coloring(sum_mtx > self.options['matvec_coloring_tol'],
+                                               'fwd')
+
+    def _sparse_factor(self, matrix):
+        """
+        Perform a sparse LU factorization, reusing a cached ordering if requested.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            Matrix to be factored.
+
+        Returns
+        -------
+        SuperLU
+            The LU factorization.
+        """
+        ordering = self.options['sparse_ordering']
+        if ordering == 'default':
+            self._lu_ordering = None
+            return scipy.sparse.linalg.splu(matrix)
+
+        if self._sparse_ordering is None or not self._sparse_ordering.matches(matrix):
+            self._sparse_ordering = _SparseOrdering(matrix, ordering)
+
+        self._lu_ordering = self._sparse_ordering
+        return self._sparse_ordering.factor(matrix)
+
+    def _sparse_solve(self, b, trans):
+        """
+        Solve using the current sparse LU factorization.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right-hand side, either 1D or 2D with one right-hand side per column.
+        trans : str
+            'N' or 'T'.
+
+        Returns
+        -------
+        ndarray
+            Solution array.
+        """
+        if self._lu_ordering is None:
+            return self._lu.solve(b, trans)
+
+        return self._lu_ordering.solve(self._lu, b, trans)
+
     def _linearize(self):
         """
         Perform factorization.
@@ -349,7 +678,7 @@ class DirectSolver(LinearSolver):
             # Perform dense or sparse lu factorization.
             elif isinstance(matrix, csc_matrix):
                 try:
-                    self._lu = scipy.sparse.linalg.splu(matrix)
+                    self._lu = self._sparse_factor(matrix)
                 except RuntimeError:
                     raise RuntimeError(format_singular_error(system, matrix))
 
@@ -379,21 +708,30 @@ class DirectSolver(LinearSolver):
 
             mtx = self._build_mtx()
 
-            # During LU decomposition, detect singularities and warn user.
-            with warnings.catch_warnings():
+            if isinstance(mtx, csc_matrix):
+                self._lup = None
+                try:
+                    self._lu = self._sparse_factor(mtx)
+                except RuntimeError:
+                    raise RuntimeError(format_singular_error(system, mtx))
+            else:
+                self._lu = None
 
-                if self.options['err_on_singular']:
-                    warnings.simplefilter('error', RuntimeWarning)
+                # During LU decomposition, detect singularities and warn user.
+                with warnings.catch_warnings():
 
-                try:
-                    self._lup = scipy.linalg.lu_factor(mtx)
+                    if self.options['err_on_singular']:
+                        warnings.simplefilter('error', RuntimeWarning)
 
-                except RuntimeWarning:
-                    raise RuntimeError(format_singular_error(system, mtx))
+                    try:
+                        self._lup = scipy.linalg.lu_factor(mtx)
 
-                # NaN in matrix.
-                except ValueError:
-                    raise RuntimeError(format_nan_error(system, mtx))
+                    except RuntimeWarning:
+                        raise RuntimeError(format_singular_error(system, mtx))
+
+                    # NaN in matrix.
+                    except ValueError:
+                        raise RuntimeError(format_nan_error(system, mtx))
 
         if self._lin_rhs_checker is not None:
             self._lin_rhs_checker.clear()
@@ -455,6 +793,8 @@ class DirectSolver(LinearSolver):
                 raise RuntimeError("BroydenSolvers without an assembled jacobian are not supported "
                                    "when running under MPI if comm.size > 1.")
             mtx = self._build_mtx()
+            if isinstance(mtx, csc_matrix):
+                mtx = mtx.toarray()
 
             # During inversion detect singularities and warn user.
             with warnings.catch_warnings():
@@ -519,17 +859,86 @@ class DirectSolver(LinearSolver):
                 if isinstance(system._assembled_jac._dr_do_mtx, DenseMatrix):
                     sol_array = scipy.linalg.lu_solve(self._lup, full_b, trans=trans_lu)
                 else:
-                    sol_array = self._lu.solve(full_b, trans_splu)
+                    sol_array = self._sparse_solve(full_b, trans_splu)
 
                 x_vec[:] = sol_array
 
         # matrix-vector-product generated jacobians are scaled.
+        elif self._lup is None:
+            x_vec[:] = sol_array = self._sparse_solve(b_vec, trans_splu)
         else:
             x_vec[:] = sol_array = scipy.linalg.lu_solve(self._lup, b_vec, trans=trans_lu)
 
         if not system.under_complex_step and self._lin_rhs_checker is not None and mode == 'rev':
             self._lin_rhs_checker.add_solution(b_vec, sol_array, copy=True)
 
+    def _rhs_batch_size(self):
+        """
+        Return the maximum number of right-hand sides to pass to a single call of _solve_multi.
+
+        Returns
+        -------
+        int
+            A value of 1 means that this solver only solves one right-hand side at a time and
+            a value of 0 means that there is no limit on the number of right-hand sides.
+        """
+        return self.options['rhs_batch_size']
+
+    def _solve_multi(self, mode, rhs):
+        """
+        Solve the linear system for multiple right-hand sides using the current factorization.
+
+        Parameters
+        ----------
+        mode : str
+            'fwd' or 'rev'.
+        rhs : ndarray
+            Array of shape (n, nrhs) containing one right-hand side per column, scaled in
+            the same way as the linear vectors are during a call to solve.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (n, nrhs) containing one solution per column.
+        """
+        system = self._system()
+
+        if mode == 'fwd':
+            b_vec = system._dresiduals
+            x_vec = system._doutputs
+            b_scaled = system._has_resid_scaling
+            x_scaled = system._has_output_scaling
+            trans_lu = 0
+            trans_splu = 'N'
+        else:  # rev
+            b_vec = system._doutputs
+            x_vec = system._dresiduals
+            b_scaled = system._has_output_scaling
+            x_scaled = system._has_resid_scaling
+            trans_lu = 1
+            trans_splu = 'T'
+
+        # AssembledJacobians are unscaled.
+        if system._get_assembled_jac() is not None:
+            if b_scaled:
+                rhs = rhs * b_vec._scaling[0][:, np.newaxis]
+
+            if isinstance(system._assembled_jac._dr_do_mtx, DenseMatrix):
+                sol_array = scipy.linalg.lu_solve(self._lup, rhs, trans=trans_lu)
+            else:
+                sol_array = self._sparse_solve(rhs, trans_splu)
+
+            if x_scaled:
+                sol_array /= x_vec._scaling[0][:, np.newaxis]
+
+        # matrix-vector-product generated jacobians are scaled.
+        elif self._lup is None:
+            sol_array = self._sparse_solve(rhs, trans_splu)
+        else:
+            sol_array = scipy.linalg.lu_solve(self._lup, rhs, trans=trans_lu)
+
+        return sol_array
+
     def preferred_sparse_format(self):
         """
         Return the preferred sparse format for the dr/do matrix of a split jacobian.
@@ -272,6 +272,10 @@ class PETScDirectSolver(DirectSolver):
                  "be automatically used."
         )
 
+        # PETSc does its own ordering and only solves a single right-hand side at a time.
+        self.options.undeclare("sparse_ordering")
+        self.options.undeclare("rhs_batch_size")
+
         # Undeclare and redeclare the "err_on_singular" option so that it's
         # still compatible with shared parent methods. Must always be True
         # because during factorization solvers will always error with a singular.
@@ -322,6 +326,18 @@ class PETScDirectSolver(DirectSolver):
             self._disallow_distrib_solve()
         self._lin_rhs_checker = LinearRHSChecker.create(self._system(),
                                                         self.options['rhs_checking'])
+        self._mtx_coloring = None
+
+    def _rhs_batch_size(self):
+        """
+        Return the maximum number of right-hand sides to pass to a single call of _solve_multi.
+
+        Returns
+        -------
+        int
+            Always 1 because PETScLU solves one right-hand side at a time.
+        """
+        return 1
 
     def raise_petsc_error(self, e, system, matrix):
         """
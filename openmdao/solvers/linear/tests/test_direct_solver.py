@@ -1,8 +1,11 @@
 """Test the DirectSolver linear solver class."""
 
 import unittest
+from unittest import mock
 
 import numpy as np
+import scipy.sparse.linalg
+from scipy.sparse import csc_matrix
 
 import openmdao.api as om
 
@@ -933,6 +936,228 @@ class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
             prob.model.run_linearize()
         self.assertEqual(ctx.exception.args[0], '<model> <class Group>: AssembledJacobian not supported for matrix-free subcomponent.')
 
+
+class TestDirectSolverBatchedTotals(unittest.TestCase):
+
+    def _build(self, mode, rhs_batch_size, assemble_jac=True, jac_type='csc', scaled=False,
+               coloring=False):
+        n = 7
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('px', om.IndepVarComp('x', np.linspace(1.0, 2.0, n)))
+
+        ref = 3.0 if scaled else 1.0
+        res_ref = 0.2 if scaled else 1.0
+        model.add_subsystem('c1', om.ExecComp('y = 2.0 * x ** 2 + 0.1 * z',
+                                              y={'shape': n, 'ref': ref, 'res_ref': res_ref},
+                                              x={'shape': n}, z={'shape': n},
+                                              has_diag_partials=True))
+        model.add_subsystem('c2', om.ExecComp('z = 3.0 * y - x', z={'shape': n, 'ref': 1.0 / ref},
+                                              x={'shape': n}, y={'shape': n},
+                                              has_diag_partials=True))
+        model.add_subsystem('obj', om.ExecComp('f = sum(y ** 2)', y={'shape': n}))
+
+        model.connect('px.x', ['c1.x', 'c2.x'])
+        model.connect('c1.y', ['c2.y', 'obj.y'])
+        model.connect('c2.z', 'c1.z')
+
+        model.add_design_var('px.x')
+        model.add_constraint('c1.y', lower=0.0)
+        model.add_constraint('c2.z', upper=10.0)
+        model.add_objective('obj.f')
+
+        if coloring:
+            prob.driver = om.ScipyOptimizeDriver()
+            prob.driver.declare_coloring()
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+        model.linear_solver = om.DirectSolver(assemble_jac=assemble_jac,
+                                              rhs_batch_size=rhs_batch_size)
+        model.options['assembled_jac_type'] = jac_type
+
+        prob.setup(mode=mode)
+        prob.run_model()
+
+        return prob
+
+    def test_batched_matches_serial(self):
+        for mode in ('fwd', 'rev'):
+            for assemble_jac, jac_type in ((True, 'csc'), (True, 'dense'), (False, 'csc')):
+                for scaled in (False, True):
+                    for coloring in (False, True):
+                        with self.subTest(mode=mode, assemble_jac=assemble_jac,
+                                          jac_type=jac_type, scaled=scaled, coloring=coloring):
+                            expected = self._build(mode, 1, assemble_jac, jac_type, scaled,
+                                                   coloring).compute_totals(return_format='array')
+
+                            for batch_size in (0, 3):
+                                prob = self._build(mode, batch_size, assemble_jac, jac_type,
+                                                   scaled, coloring)
+                                J = prob.compute_totals(return_format='array')
+                                assert_near_equal(J, expected, 1e-12)
+
+    def test_batched_nsolves(self):
+        prob = self._build('fwd', 0)
+        prob.model.linear_solver._solve_multi_calls = 0
+
+        orig = prob.model.linear_solver._solve_multi
+
+        def _counting_solve_multi(mode, rhs):
+            prob.model.linear_solver._solve_multi_calls += 1
+            return orig(mode, rhs)
+
+        prob.model.linear_solver._solve_multi = _counting_solve_multi
+        prob.compute_totals()
+        self.assertEqual(prob.model.linear_solver._solve_multi_calls, 1)
+
+
+class TestDirectSolverMatvecColoring(unittest.TestCase):
+
+    def _build(self, matvec_coloring, num_full_jacs=3, x0=np.linspace(1.0, 2.0, 10)):
+        n = 10
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('px', om.IndepVarComp('x', x0))
+        model.add_subsystem('c1', om.ExecComp('y = 2.0 * x ** 2 + 0.1 * z', shape=n,
+                                              has_diag_partials=True))
+        model.add_subsystem('c2', om.ExecComp('z = 3.0 * y - x + 0.01 * y ** 2', shape=n,
+                                              has_diag_partials=True))
+        model.add_subsystem('obj', om.ExecComp('f = sum(y ** 2)', y={'shape': n}))
+
+        model.connect('px.x', ['c1.x', 'c2.x'])
+        model.connect('c1.y', ['c2.y', 'obj.y'])
+        model.connect('c2.z', 'c1.z')
+
+        model.add_design_var('px.x')
+        model.add_objective('obj.f')
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+        model.linear_solver = om.DirectSolver(assemble_jac=False, matvec_coloring=matvec_coloring,
+                                              matvec_coloring_num_full_jacs=num_full_jacs)
+
+        prob.setup(mode='rev')
+        prob.run_model()
+
+        return prob
+
+    def test_matvec_coloring(self):
+        expected_prob = self._build(False)
+        expected = expected_prob.compute_totals(return_format='array')
+
+        for num_full_jacs in (1, 3):
+            with self.subTest(num_full_jacs=num_full_jacs):
+                prob = self._build(True, num_full_jacs)
+                assert_near_equal(prob.get_val('c1.y'), expected_prob.get_val('c1.y'), 1e-10)
+
+                J = prob.compute_totals(return_format='array')
+                assert_near_equal(J, expected, 1e-10)
+
+                coloring = prob.model.linear_solver._mtx_coloring
+                self.assertIsNotNone(coloring)
+
+                # outputs of the diagonal components only couple with each other, so the full
+                # matrix needs far fewer matrix-vector products than columns.
+                nmtx = prob.model._doutputs.asarray().size
+                self.assertLess(coloring.total_solves(), nmtx // 2)
+
+                self.assertIsInstance(prob.model.linear_solver._build_mtx(), csc_matrix)
+
+    def test_matvec_coloring_zero_at_start(self):
+        # dy/dx is 0 where x is 0 when the coloring is computed, but not at later points.
+        x0 = np.linspace(-1.0, 1.0, 10)
+        x0[4] = 0.0
+        x1 = np.linspace(1.0, 2.0, 10)
+
+        expected_prob = self._build(False, x0=x0)
+        expected_prob.set_val('px.x', x1)
+        expected_prob.run_model()
+        expected = expected_prob.compute_totals(return_format='array')
+
+        prob = self._build(True, x0=x0)
+        outputs = prob.model._outputs.asarray(copy=True)
+        prob.compute_totals()
+        self.assertIsNotNone(prob.model.linear_solver._mtx_coloring)
+
+        # the perturbed points were only used for the sparsity
+        assert_near_equal(prob.model._outputs.asarray(), outputs, 0.0)
+
+        prob.set_val('px.x', x1)
+        prob.run_model()
+        assert_near_equal(prob.get_val('c1.y'), expected_prob.get_val('c1.y'), 1e-10)
+        J = prob.compute_totals(return_format='array')
+        assert_near_equal(J, expected, 1e-10)
+
+
+class TestDirectSolverSparseOrdering(unittest.TestCase):
+
+    def _build(self, sparse_ordering, mode='fwd', assemble_jac=True):
+        prob = om.Problem(model=DoubleSellar())
+        model = prob.model
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+        model.linear_solver = om.DirectSolver(assemble_jac=assemble_jac,
+                                              sparse_ordering=sparse_ordering,
+                                              matvec_coloring=not assemble_jac)
+        model.options['assembled_jac_type'] = 'csc'
+
+        model.add_design_var('g1.z')
+        model.add_design_var('g2.z')
+        model.add_objective('g1.y1')
+        model.add_constraint('g2.y2', upper=1.0)
+
+        prob.setup(mode=mode)
+        prob.run_model()
+
+        return prob
+
+    def test_orderings(self):
+        expected_prob = self._build('default')
+        expected = expected_prob.compute_totals(return_format='array')
+
+        for ordering in ('colamd', 'mmd_at_plus_a', 'rcm'):
+            for mode in ('fwd', 'rev'):
+                for assemble_jac in (True, False):
+                    with self.subTest(ordering=ordering, mode=mode, assemble_jac=assemble_jac):
+                        prob = self._build(ordering, mode, assemble_jac)
+                        assert_near_equal(prob.get_val('g1.y1'), expected_prob.get_val('g1.y1'),
+                                          1e-8)
+                        J = prob.compute_totals(return_format='array')
+                        assert_near_equal(J, expected, 1e-8)
+
+                        if assemble_jac:
+                            # the ordering is computed once and reused for every factorization
+                            solver = prob.model.linear_solver
+                            self.assertIsNotNone(solver._sparse_ordering)
+                            self.assertIs(solver._lu_ordering, solver._sparse_ordering)
+
+    def test_ordering_reused(self):
+        prob = self._build('rcm')
+        solver = prob.model.linear_solver
+        ordering = solver._sparse_ordering
+
+        prob.set_val('g1.z', [4.0, 1.5])
+        prob.run_model()
+        prob.compute_totals()
+
+        self.assertIs(solver._sparse_ordering, ordering)
+
+    def test_ordering_factorization_reused(self):
+        # the factorization computed along with a SuperLU ordering is used for the first solve,
+        # so there are no more factorizations than with the default ordering
+        counts = {}
+        for ordering in ('default', 'colamd', 'mmd_at_plus_a'):
+            with mock.patch('scipy.sparse.linalg.splu', wraps=scipy.sparse.linalg.splu) as splu:
+                prob = self._build(ordering)
+                prob.compute_totals()
+            counts[ordering] = splu.call_count
+
+        self.assertGreater(counts['default'], 0)
+        self.assertEqual(counts['colamd'], counts['default'])
+        self.assertEqual(counts['mmd_at_plus_a'], counts['default'])
+
+
 @unittest.skipUnless(MPI and PETScVector, "only run with MPI and PETSc.")
 class TestDirectSolverRemoteErrors(unittest.TestCase):
 
@@ -23,6 +23,18 @@ class NewtonSolver(NonlinearSolver):
         is the parent system's linear solver.
     _linesearch : NonlinearSolver
         Line search algorithm. Default is None for no line search.
+    _jac_valid : bool
+        True if the most recent linearization can be reused by a later iteration.
+    _jac_reuse_streak : int
+        Number of consecutive iterations that have reused the current linearization.
+    _norm : float or None
+        Residual norm computed at the most recent call to _iter_get_norm.
+    _prev_norm : float or None
+        Residual norm computed at the call to _iter_get_norm before the most recent one.
+    _num_linearize : int
+        Number of iterations that linearized the system since the last setup.
+    _num_jac_reuse : int
+        Number of iterations that reused a previous linearization since the last setup.
     """
 
     SOLVER = 'NL: Newton'
@@ -36,6 +48,13 @@ class NewtonSolver(NonlinearSolver):
         self.linear_solver = None
         self._linesearch = BoundsEnforceLS()
 
+        self._jac_valid = False
+        self._jac_reuse_streak = 0
+        self._norm = None
+        self._prev_norm = None
+        self._num_linearize = 0
+        self._num_jac_reuse = 0
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -53,6 +72,20 @@ class NewtonSolver(NonlinearSolver):
                              desc='When the option is true, a solver will reraise any '
                              'AnalysisError that arises during subsolve; when false, it will '
                              'continue solving.')
+        self.options.declare('max_jacobian_reuse', types=int, default=0, lower=0,
+                             desc='Maximum number of consecutive iterations that reuse the '
+                             'linearization (and any factorization) from a previous iteration '
+                             'instead of re-linearizing the system (modified Newton). The default '
+                             'of 0 re-linearizes at every iteration.')
+        self.options.declare('reuse_converge_limit', default=0.5, lower=0.0,
+                             desc='Ratio of the current residual norm to the previous one above '
+                             'which the convergence is considered too slow for the reused '
+                             'linearization, causing the system to be re-linearized at the '
+                             'next iteration. Only used when max_jacobian_reuse > 0.')
+        self.options.declare('reuse_across_solves', types=bool, default=False,
+                             desc='When True and max_jacobian_reuse > 0, the first iteration of a '
+                             'solve may reuse the linearization from the previous solve, e.g. '
+                             'from a previous driver iteration.')
 
         self.supports['linesearch'] = True
         self.supports['gradients'] = True
@@ -85,6 +118,22 @@ class NewtonSolver(NonlinearSolver):
         if self.linesearch is not None:
             self.linesearch._setup_solvers(system, self._depth + 1)
 
+        self._jac_valid = False
+        self._jac_reuse_streak = 0
+        self._num_linearize = 0
+        self._num_jac_reuse = 0
+
+    def get_jacobian_reuse_stats(self):
+        """
+        Return counts of the iterations that linearized or reused a previous linearization.
+
+        Returns
+        -------
+        dict
+            Dict with the number of 'linearize' and 'reuse' iterations since the last setup.
+        """
+        return {'linearize': self._num_linearize, 'reuse': self._num_jac_reuse}
+
     def _assembled_jac_solver_iter(self):
         """
         Return a generator of linear solvers using assembled jacs.
@@ -159,6 +208,46 @@ class NewtonSolver(NonlinearSolver):
         if self.linesearch is not None:
             self.linesearch._linearize()
 
+    def _needs_linearize(self):
+        """
+        Return True if the system must be linearized at the current iteration.
+
+        Returns
+        -------
+        bool
+            True if the previous linearization can't be reused.
+        """
+        system = self._system()
+        max_reuse = self.options['max_jacobian_reuse']
+
+        if max_reuse == 0 or system.under_complex_step or not self._jac_valid:
+            return True
+
+        if self._jac_reuse_streak >= max_reuse:
+            return True
+
+        if self._iter_count == 0:
+            return not self.options['reuse_across_solves']
+
+        if self._prev_norm:
+            return self._norm / self._prev_norm > self.options['reuse_converge_limit']
+
+        return False
+
+    def _iter_get_norm(self):
+        """
+        Return the norm of the residual.
+
+        Returns
+        -------
+        float
+            norm.
+        """
+        norm = super()._iter_get_norm()
+        self._prev_norm = self._norm
+        self._norm = norm
+        return norm
+
     def _iter_initialize(self):
         """
         Perform any necessary pre-processing operations.
@@ -182,6 +271,8 @@ class NewtonSolver(NonlinearSolver):
         if not self._restarted and system._has_guess:
             system._guess_nonlinear()
 
+        self._norm = self._prev_norm = None
+
         with Recording('Newton_subsolve', 0, self) as rec:
 
             if solve_subsystems and self._iter_count <= self.options['max_sub_solves']:
@@ -219,9 +310,17 @@ class NewtonSolver(NonlinearSolver):
         try:
             system._dresiduals.set_vec(system._residuals)
             system._dresiduals *= -1.0
-            system._linearize(sub_do_ln=do_sub_ln)
 
-            self._linearize()
+            if self._needs_linearize():
+                system._linearize(sub_do_ln=do_sub_ln)
+                self._linearize()
+                self._num_linearize += 1
+                self._jac_reuse_streak = 0
+                # a complex linearization can't be reused once we leave complex step mode
+                self._jac_valid = not system.under_complex_step
+            else:
+                self._num_jac_reuse += 1
+                self._jac_reuse_streak += 1
 
             self.linear_solver.solve('fwd')
 
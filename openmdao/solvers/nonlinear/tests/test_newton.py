@@ -860,6 +860,71 @@ class TestNewton(unittest.TestCase):
         msg = "NewtonSolver in <model> <class Group>: solve_subsystems must be set by the user."
         self.assertEqual(str(context.exception), msg)
 
+    def _jac_reuse_prob(self, **newton_opts):
+        prob = om.Problem(model=SellarStateConnection(nonlinear_solver=om.NewtonSolver,
+                                                      linear_solver=om.DirectSolver))
+        prob.setup()
+        prob.set_solver_print(level=0)
+        newton = prob.model.nonlinear_solver
+        newton.options['solve_subsystems'] = False
+        newton.options['maxiter'] = 30
+        newton.options['atol'] = 1e-10
+        newton.options['rtol'] = 1e-10
+        for name, val in newton_opts.items():
+            newton.options[name] = val
+
+        return prob
+
+    def test_jacobian_reuse(self):
+        prob = self._jac_reuse_prob()
+        prob.run_model()
+        full_stats = prob.model.nonlinear_solver.get_jacobian_reuse_stats()
+        self.assertEqual(full_stats['reuse'], 0)
+
+        prob = self._jac_reuse_prob(max_jacobian_reuse=5, reuse_converge_limit=0.9)
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('state_eq.y2_command'), 12.05848819, .00001)
+
+        stats = prob.model.nonlinear_solver.get_jacobian_reuse_stats()
+        self.assertGreater(stats['reuse'], 0)
+        self.assertLess(stats['linearize'], full_stats['linearize'])
+
+        # first iteration of a new solve re-linearizes by default
+        prob.set_val('x', 1.5)
+        prob.run_model()
+        stats2 = prob.model.nonlinear_solver.get_jacobian_reuse_stats()
+        self.assertGreater(stats2['linearize'], stats['linearize'])
+
+    def test_jacobian_reuse_across_solves(self):
+        prob = self._jac_reuse_prob(max_jacobian_reuse=100, reuse_converge_limit=1.0,
+                                    reuse_across_solves=True)
+        prob.run_model()
+        stats = prob.model.nonlinear_solver.get_jacobian_reuse_stats()
+        self.assertEqual(stats['linearize'], 1)
+
+        prob.set_val('x', 1.01)
+        prob.run_model()
+        stats = prob.model.nonlinear_solver.get_jacobian_reuse_stats()
+        self.assertEqual(stats['linearize'], 1)
+
+        prob.set_val('x', 1.0)
+        prob.run_model()
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+
+    def test_jacobian_reuse_totals(self):
+        prob = self._jac_reuse_prob(max_jacobian_reuse=5, reuse_converge_limit=0.9)
+        prob.run_model()
+        J = prob.compute_totals(of=['obj', 'con1'], wrt=['x', 'z'])
+
+        expected_prob = self._jac_reuse_prob()
+        expected_prob.run_model()
+        expected = expected_prob.compute_totals(of=['obj', 'con1'], wrt=['x', 'z'])
+
+        for key, val in expected.items():
+            assert_near_equal(J[key], val, 1e-8)
+
 
 class TestNewtonFeatures(unittest.TestCase):
 
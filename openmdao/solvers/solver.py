@@ -1081,6 +1081,37 @@ class LinearSolver(Solver):
         """
         raise NotImplementedError("class %s does not implement solve()." % (type(self).__name__))
 
+    def _rhs_batch_size(self):
+        """
+        Return the maximum number of right-hand sides to pass to a single call of _solve_multi.
+
+        Returns
+        -------
+        int
+            A value of 1 means that this solver only solves one right-hand side at a time and
+            a value of 0 means that there is no limit on the number of right-hand sides.
+        """
+        return 1
+
+    def _solve_multi(self, mode, rhs):
+        """
+        Solve the linear system for multiple right-hand sides.
+
+        Parameters
+        ----------
+        mode : str
+            'fwd' or 'rev'.
+        rhs : ndarray
+            Array of shape (n, nrhs) containing one right-hand side per column.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (n, nrhs) containing one solution per column.
+        """
+        raise NotImplementedError("class %s does not implement _solve_multi()." %
+                                  (type(self).__name__))
+
     def _solve(self):
         """
         Run the iterative solver.
@@ -1,4 +1,6 @@
 """Surrogate model based on Kriging."""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import scipy.linalg as linalg
 import os.path
@@ -6,10 +8,243 @@ from hashlib import md5
 from scipy.optimize import minimize
 
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
-from openmdao.utils.om_warnings import issue_warning, CacheWarning
+from openmdao.utils.concurrent_utils import _other_threads_alive
+from openmdao.utils.om_warnings import issue_warning, CacheWarning, SolverWarning
 
 MACHINE_EPSILON = np.finfo(np.double).eps
 
+# Upper limit on the number of point-to-training-point distances held in memory at once when
+# predicting at many points.
+_MAX_DISTANCE_ENTRIES = 2 ** 20
+
+# Diagonal jitter added to the correlation matrix, in turn, when its Cholesky factorization fails.
+_CHOLESKY_JITTER = (0., 1e-10, 1e-8, 1e-6)
+
+# the likelihood arguments of a worker process in a local training pool
+_training_args = None
+
+
+def _squared_distances(X):
+    """
+    Compute the squared distance between each pair of training points in each dimension.
+
+    Parameters
+    ----------
+    X : ndarray
+        Normalized training input values, with shape (n_samples, n_dims).
+
+    Returns
+    -------
+    ndarray
+        Squared distances, with shape (n_dims, n_samples, n_samples).
+    """
+    diff = X.T[:, :, np.newaxis] - X.T[:, np.newaxis, :]
+    return np.square(diff, out=diff)
+
+
+def _cholesky_factor(R):
+    """
+    Compute the lower Cholesky factor of the correlation matrix, adding jitter if needed.
+
+    Parameters
+    ----------
+    R : ndarray
+        Correlation matrix.
+
+    Returns
+    -------
+    ndarray
+        Lower triangular Cholesky factor.
+    """
+    for jitter in _CHOLESKY_JITTER:
+        if jitter:
+            R = R.copy()
+            R[np.diag_indices_from(R)] += jitter
+        try:
+            return linalg.cholesky(R, lower=True, check_finite=False)
+        except linalg.LinAlgError:
+            pass
+
+    raise linalg.LinAlgError('Kriging correlation matrix is not positive definite.')
+
+
+def _reduced_likelihood(thetas, sq_dists, Y, nugget, decomposition='svd', lapack_driver='gesvd',
+                        gradient=False):
+    """
+    Calculate quantity with same maximum location as the log-likelihood for a given theta.
+
+    Parameters
+    ----------
+    thetas : ndarray
+        Correlation coefficients.
+    sq_dists : ndarray
+        Squared distances between the normalized training points, from _squared_distances.
+    Y : ndarray
+        Normalized training model response values.
+    nugget : float or ndarray
+        Nugget smoothing parameter.
+    decomposition : str
+        Factorization of the correlation matrix, either 'svd' or 'cholesky'.
+    lapack_driver : str
+        Lapack driver used by the svd decomposition.
+    gradient : bool
+        If True, also compute the gradient of the reduced likelihood with respect to
+        log(thetas). Only supported by the cholesky decomposition.
+
+    Returns
+    -------
+    float
+        Calculated reduced_likelihood.
+    dict
+        Dictionary containing the parameters, with sigma2 not yet scaled by the output std.
+    ndarray or None
+        Gradient of the reduced likelihood with respect to log(thetas), if requested.
+    """
+    n_samples = Y.shape[0]
+    params = {}
+
+    # Correlation Matrix
+    R = np.exp(-np.tensordot(thetas, sq_dists, axes=1))
+    R[np.diag_indices_from(R)] = 1. + nugget
+
+    if decomposition == 'cholesky':
+        L = _cholesky_factor(R)
+        L_inv = linalg.solve_triangular(L, np.eye(n_samples), lower=True, check_finite=False)
+
+        # R^-1 = L^-T L^-1, stored in the same form as the svd factors so that prediction
+        # doesn't depend on the decomposition.
+        alpha = L_inv.T.dot(L_inv.dot(Y))
+        logdet = 2. * np.sum(np.log(np.diag(L)))
+        inv_factors = np.ones(n_samples)
+        U = L_inv.T
+        Vh = L_inv
+    else:
+        [U, S, Vh] = linalg.svd(R, lapack_driver=lapack_driver)
+
+        # Penrose-Moore Pseudo-Inverse:
+        # Given A = USV^* and Ax=b, the least-squares solution is
+        # x = V S^-1 U^* b.
+        # Tikhonov regularization is used to make the solution significantly
+        # more robust.
+        h = 1e-8 * S[0]
+        inv_factors = S / (S ** 2. + h ** 2.)
+
+        alpha = Vh.T.dot(np.einsum('j,kj,kl->jl', inv_factors, U, Y))
+        logdet = -np.sum(np.log(inv_factors))
+
+    sigma2 = np.dot(Y.T, alpha).sum(axis=0) / n_samples
+    sum_sigma2 = np.sum(sigma2)
+    reduced_likelihood = -(np.log(sum_sigma2) + logdet / n_samples)
+
+    params['alpha'] = alpha
+    params['sigma2'] = sigma2
+    params['S_inv'] = inv_factors
+    params['U'] = U
+    params['Vh'] = Vh
+
+    grad = None
+    if gradient:
+        # d(-reduced_likelihood) = trace(W dR) with W = R^-1 / n - a a^T / (n sigma2), where a
+        # is the sum of the alpha columns, and dR/dtheta_d = -sq_dists[d] * R off the diagonal.
+        a = alpha.sum(axis=1)
+        W = Vh.T.dot(Vh)
+        W -= np.outer(a, a) / sum_sigma2
+        W *= R
+        grad = thetas * np.tensordot(sq_dists, W, axes=2) / n_samples
+
+    return reduced_likelihood, params, grad
+
+
+def _training_objective(log_thetas, sq_dists, Y, nugget, decomposition, lapack_driver):
+    """
+    Return the negative reduced likelihood, and its gradient for the cholesky decomposition.
+
+    Parameters
+    ----------
+    log_thetas : ndarray
+        Log of the correlation coefficients.
+    sq_dists : ndarray
+        Squared distances between the normalized training points.
+    Y : ndarray
+        Normalized training model response values.
+    nugget : float or ndarray
+        Nugget smoothing parameter.
+    decomposition : str
+        Factorization of the correlation matrix, either 'svd' or 'cholesky'.
+    lapack_driver : str
+        Lapack driver used by the svd decomposition.
+
+    Returns
+    -------
+    float or tuple
+        Negative reduced likelihood, paired with its gradient for the cholesky decomposition.
+    """
+    gradient = decomposition == 'cholesky'
+    reduced_likelihood, _, grad = _reduced_likelihood(np.exp(log_thetas), sq_dists, Y, nugget,
+                                                      decomposition, lapack_driver, gradient)
+    if gradient:
+        return -reduced_likelihood, -grad
+
+    return -reduced_likelihood
+
+
+def _minimize_likelihood(x0, args, bounds, options):
+    """
+    Optimize the Kriging hyperparameters from one starting point.
+
+    Parameters
+    ----------
+    x0 : ndarray
+        Starting value of log(thetas).
+    args : tuple
+        Arguments of _training_objective that follow log(thetas).
+    bounds : list of tuple
+        Bounds on log(thetas).
+    options : dict
+        Options for the SLSQP optimizer.
+
+    Returns
+    -------
+    OptimizeResult
+        The result of the optimization.
+    """
+    return minimize(_training_objective, x0, args=args, jac=args[3] == 'cholesky',
+                    method='slsqp', options=options, bounds=bounds)
+
+
+def _init_training_worker(args):
+    """
+    Store the forked copy of the likelihood arguments in a training pool worker.
+
+    Parameters
+    ----------
+    args : tuple
+        Arguments of _training_objective that follow log(thetas).
+    """
+    global _training_args
+    _training_args = args
+
+
+def _run_training_start(x0, bounds, options):
+    """
+    Optimize the Kriging hyperparameters from one starting point in a pool worker.
+
+    Parameters
+    ----------
+    x0 : ndarray
+        Starting value of log(thetas).
+    bounds : list of tuple
+        Bounds on log(thetas).
+    options : dict
+        Options for the SLSQP optimizer.
+
+    Returns
+    -------
+    OptimizeResult
+        The result of the optimization.
+    """
+    return _minimize_likelihood(x0, _training_args, bounds, options)
+
 
 class KrigingSurrogate(SurrogateModel):
     """
@@ -25,6 +260,9 @@ class KrigingSurrogate(SurrogateModel):
 
     Attributes
     ----------
+    _decomposition : str or None
+        Factorization of the correlation matrix held by the trained model, or None if it was
+        loaded from the training cache.
     alpha : ndarray
         Reduced likelihood parameter: alpha
     L : ndarray
@@ -78,6 +316,8 @@ class KrigingSurrogate(SurrogateModel):
         self.Y_mean = np.zeros(0)
         self.Y_std = np.zeros(0)
 
+        self._decomposition = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -99,6 +339,21 @@ class KrigingSurrogate(SurrogateModel):
                                   "or 'gesvd' which is slower but more reliable."
                                   "'gesvd' is the default.")
 
+        self.options.declare('decomposition', default='svd', values=('svd', 'cholesky'),
+                             desc="Factorization of the correlation matrix used during training. "
+                                  "'cholesky' is much faster for large numbers of training points "
+                                  "and provides analytic likelihood gradients to the optimizer, "
+                                  "while 'svd' is more robust for ill-conditioned data.")
+
+        self.options.declare('n_start', types=int, default=1, lower=1,
+                             desc="Number of starting points for the hyperparameter "
+                                  "optimization. The first start is always the same, and the "
+                                  "others are randomly sampled within the bounds.")
+
+        self.options.declare('num_workers', types=int, default=1, lower=1,
+                             desc="Number of local worker processes used to run the "
+                                  "hyperparameter optimization starts in parallel.")
+
         self.options.declare('training_cache', types=str, default=None,
                              desc="Cache the trained model to avoid repeating training and write "
                                   "it to the given file. If the specified file exists, it will be "
@@ -127,6 +382,8 @@ class KrigingSurrogate(SurrogateModel):
                 data_hash = md5()  # nosec: hashed content not sensitive
             data_hash.update(x.flatten())
             data_hash.update(y.flatten())
+            # A model trained with other settings can have different hyperparameters.
+            data_hash.update(f"{self.options['decomposition']},{self.options['n_start']}".encode())
             training_data_hash = data_hash.hexdigest()
             cache_hash = ''
 
@@ -148,6 +405,7 @@ class KrigingSurrogate(SurrogateModel):
                     self.S_inv = np.array(data['S_inv'])
                     self.Vh = np.array(data['Vh'])
                     self.sigma2 = np.array(data['sigma2'])
+                    self._decomposition = None
                     cache_hash = str(data['hash'])
                 except KeyError as e:
                     msg = ("An error occurred while loading KrigingSurrogate Cache: %s. "
@@ -181,29 +439,47 @@ class KrigingSurrogate(SurrogateModel):
         self.X_mean, self.X_std = X_mean, X_std
         self.Y_mean, self.Y_std = Y_mean, Y_std
 
-        def _calcll(thetas):
-            """Calculate loglike (callback function)."""
-            loglike = self._calculate_reduced_likelihood_params(np.exp(thetas))[0]
-            return -loglike
+        decomposition = self.options['decomposition']
+        args = (_squared_distances(X), Y, self.options['nugget'], decomposition,
+                self.options['lapack_driver'])
 
         bounds = [(np.log(1e-5), np.log(1e5)) for _ in range(self.n_dims)]
 
-        options = {'eps': 1e-3}
+        options = {}
+        if decomposition == 'svd':
+            options['eps'] = 1e-3
 
         if cache:
             # Enable logging since we expect the model to take long to train
             options['disp'] = True
             options['iprint'] = 2
 
-        optResult = minimize(_calcll, 1e-1 * np.ones(self.n_dims), method='slsqp',
-                             options=options,
-                             bounds=bounds)
-
-        if not optResult.success:
-            raise ValueError(f'Kriging Hyper-parameter optimization failed: {optResult.message}')
+        starts = [1e-1 * np.ones(self.n_dims)]
+        if self.options['n_start'] > 1:
+            rng = np.random.default_rng(0)
+            lower, upper = np.array(bounds).T
+            starts.extend(rng.uniform(lower, upper, (self.options['n_start'] - 1, self.n_dims)))
+
+        try:
+            results = self._run_starts(starts, args, bounds, options)
+        except linalg.LinAlgError:
+            issue_warning("The Cholesky factorization of the Kriging correlation matrix failed. "
+                          "Falling back to the 'svd' decomposition.", category=SolverWarning)
+            decomposition = 'svd'
+            args = args[:3] + (decomposition,) + args[4:]
+            options['eps'] = 1e-3
+            results = self._run_starts(starts, args, bounds, options)
+
+        successes = [result for result in results if result.success]
+        if not successes:
+            raise ValueError('Kriging Hyper-parameter optimization failed: '
+                             f'{results[0].message}')
+
+        optResult = min(successes, key=lambda result: result.fun)
 
         self.thetas = np.exp(optResult.x)
-        _, params = self._calculate_reduced_likelihood_params()
+        self._decomposition = decomposition
+        _, params = self._calculate_reduced_likelihood_params(decomposition=decomposition)
         self.alpha = params['alpha']
         self.U = params['U']
         self.S_inv = params['S_inv']
@@ -234,7 +510,140 @@ class KrigingSurrogate(SurrogateModel):
                 with open(cache, 'wb') as f:
                     np.savez_compressed(f, **data)
 
-    def _calculate_reduced_likelihood_params(self, thetas=None):
+    def update(self, x_new, y_new):
+        """
+        Add training points to the trained model without optimizing the hyperparameters again.
+
+        The hyperparameters and the normalization of the data are kept from the last training.
+        If the model was trained with the cholesky decomposition, its factors are extended by
+        the new points with a rank-k update. Otherwise, the correlation matrix is factored again.
+
+        Parameters
+        ----------
+        x_new : array-like
+            Additional training input locations.
+        y_new : array-like
+            Model responses at the additional inputs.
+        """
+        if not self.trained:
+            self.train(x_new, y_new)
+            return
+
+        nugget = self.options['nugget']
+        if np.ndim(nugget) > 0:
+            raise ValueError("KrigingSurrogate can't be updated when the nugget is an array. "
+                             "Call train with all of the training data instead.")
+
+        x_new, y_new = np.atleast_2d(x_new, y_new)
+        X_new = (x_new - self.X_mean) / self.X_std
+        Y_new = (y_new - self.Y_mean) / self.Y_std
+
+        n_old = self.n_samples
+        n_new = X_new.shape[0]
+        n_samples = n_old + n_new
+        L_inv = None
+
+        if self._decomposition == 'cholesky':
+            # Correlation of the new points with the existing and with the other new points.
+            R12 = np.exp(-np.square(self.X[:, np.newaxis, :] - X_new).dot(self.thetas))
+            R22 = np.exp(-np.tensordot(self.thetas, _squared_distances(X_new), axes=1))
+            R22[np.diag_indices_from(R22)] = 1. + nugget
+
+            # With R = L L^T, the new rows of L are [L21, L22] where L21 = (L11^-1 R12)^T and
+            # L22 L22^T = R22 - L21 L21^T.
+            L11_inv = self.Vh
+            L21 = R12.T.dot(L11_inv.T)
+            try:
+                L22 = _cholesky_factor(R22 - L21.dot(L21.T))
+            except linalg.LinAlgError:
+                pass
+            else:
+                L22_inv = linalg.solve_triangular(L22, np.eye(n_new), lower=True,
+                                                  check_finite=False)
+                L_inv = np.zeros((n_samples, n_samples))
+                L_inv[:n_old, :n_old] = L11_inv
+                L_inv[n_old:, :n_old] = -L22_inv.dot(L21).dot(L11_inv)
+                L_inv[n_old:, n_old:] = L22_inv
+
+        self.X = np.vstack((self.X, X_new))
+        self.Y = np.vstack((self.Y, Y_new))
+        self.n_samples = n_samples
+
+        if L_inv is not None:
+            self.alpha = L_inv.T.dot(L_inv.dot(self.Y))
+            self.U = L_inv.T
+            self.S_inv = np.ones(n_samples)
+            self.Vh = L_inv
+            self.sigma2 = (np.dot(self.Y.T, self.alpha).sum(axis=0) / n_samples *
+                           np.square(self.Y_std))
+            return
+
+        # The new points are too close to the existing ones for a cholesky update, or the model
+        # wasn't factored with cholesky.
+        decomposition = self._decomposition or self.options['decomposition']
+        try:
+            _, params = self._calculate_reduced_likelihood_params(decomposition=decomposition)
+        except linalg.LinAlgError:
+            decomposition = 'svd'
+            _, params = self._calculate_reduced_likelihood_params(decomposition=decomposition)
+
+        self._decomposition = decomposition
+        self.alpha = params['alpha']
+        self.U = params['U']
+        self.S_inv = params['S_inv']
+        self.Vh = params['Vh']
+        self.sigma2 = params['sigma2']
+
+    def _run_starts(self, starts, args, bounds, options):
+        """
+        Optimize the hyperparameters from each starting point.
+
+        If num_workers is greater than one, the starts are run in a pool of worker processes
+        forked from this process, so the training data only needs to be sent to them once.
+        Forking while other threads are running can deadlock the workers, so the starts are
+        run serially in that case.
+
+        Parameters
+        ----------
+        starts : list of ndarray
+            Starting values of log(thetas).
+        args : tuple
+            Arguments of _training_objective that follow log(thetas).
+        bounds : list of tuple
+            Bounds on log(thetas).
+        options : dict
+            Options for the SLSQP optimizer.
+
+        Returns
+        -------
+        list of OptimizeResult
+            The result of the optimization from each start.
+        """
+        num_workers = min(self.options['num_workers'], len(starts))
+
+        if num_workers > 1:
+            if 'fork' not in multiprocessing.get_all_start_methods():
+                issue_warning(f"KrigingSurrogate: num_workers = {num_workers} requires the "
+                              "'fork' process start method, which is not available on this "
+                              "platform. Training starts will be run serially.")
+            elif _other_threads_alive():
+                issue_warning(f"KrigingSurrogate: num_workers = {num_workers} but other threads "
+                              "are running in this process, so no worker processes can be "
+                              "forked safely. Training starts will be run serially.")
+            else:
+                pool = ProcessPoolExecutor(max_workers=num_workers,
+                                           mp_context=multiprocessing.get_context('fork'),
+                                           initializer=_init_training_worker, initargs=(args,))
+                try:
+                    futures = [pool.submit(_run_training_start, x0, bounds, options)
+                               for x0 in starts]
+                    return [future.result() for future in futures]
+                finally:
+                    pool.shutdown(wait=True, cancel_futures=True)
+
+        return [_minimize_likelihood(x0, args, bounds, options) for x0 in starts]
+
+    def _calculate_reduced_likelihood_params(self, thetas=None, decomposition=None):
         """
         Calculate quantity with same maximum location as the log-likelihood for a given theta.
 
@@ -243,7 +652,9 @@ class KrigingSurrogate(SurrogateModel):
         thetas : ndarray, optional
             Given input correlation coefficients. If none given, uses self.thetas
             from training.
-
+        decomposition : str, optional
+            Factorization of the correlation matrix. If none given, uses the decomposition
+            option.
 
         Returns
         -------
@@ -254,40 +665,14 @@ class KrigingSurrogate(SurrogateModel):
         """
         if thetas is None:
             thetas = self.thetas
+        if decomposition is None:
+            decomposition = self.options['decomposition']
 
-        X, Y = self.X, self.Y
-        params = {}
-
-        # Correlation Matrix
-        distances = np.zeros((self.n_samples, self.n_dims, self.n_samples))
-        for i in range(self.n_samples):
-            distances[i, :, i + 1:] = np.abs(X[i, ...] - X[i + 1:, ...]).T
-            distances[i + 1:, :, i] = distances[i, :, i + 1:].T
-
-        R = np.exp(-thetas.dot(np.square(distances)))
-        R[np.diag_indices_from(R)] = 1. + self.options['nugget']
-
-        [U, S, Vh] = linalg.svd(R, lapack_driver=self.options['lapack_driver'])
-
-        # Penrose-Moore Pseudo-Inverse:
-        # Given A = USV^* and Ax=b, the least-squares solution is
-        # x = V S^-1 U^* b.
-        # Tikhonov regularization is used to make the solution significantly
-        # more robust.
-        h = 1e-8 * S[0]
-        inv_factors = S / (S ** 2. + h ** 2.)
-
-        alpha = Vh.T.dot(np.einsum('j,kj,kl->jl', inv_factors, U, Y))
-        logdet = -np.sum(np.log(inv_factors))
-        sigma2 = np.dot(Y.T, alpha).sum(axis=0) / self.n_samples
-        reduced_likelihood = -(np.log(np.sum(sigma2)) +
-                               logdet / self.n_samples)
-
-        params['alpha'] = alpha
-        params['sigma2'] = sigma2 * np.square(self.Y_std)
-        params['S_inv'] = inv_factors
-        params['U'] = U
-        params['Vh'] = Vh
+        reduced_likelihood, params, _ = _reduced_likelihood(thetas, _squared_distances(self.X),
+                                                            self.Y, self.options['nugget'],
+                                                            decomposition,
+                                                            self.options['lapack_driver'])
+        params['sigma2'] = params['sigma2'] * np.square(self.Y_std)
 
         return reduced_likelihood, params
 
@@ -307,20 +692,37 @@ class KrigingSurrogate(SurrogateModel):
         ndarray, optional (if eval_rmse is True)
             Root mean square of the prediction error.
         """
-        super().predict(x)
-
-        thetas = self.thetas
         if isinstance(x, list):
             x = np.array(x)
-        x = np.atleast_2d(x)
+
+        return self.vectorized_predict(np.atleast_2d(x))
+
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response at many points based on the trained model.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate is evaluated, with shape (n_points, n_dims).
+
+        Returns
+        -------
+        ndarray
+            Kriging prediction at each point, with shape (n_points, n_outputs).
+        ndarray, optional (if eval_rmse is True)
+            Root mean square of the prediction error at each point.
+        """
+        super().predict(x)
+
         n_eval = x.shape[0]
 
         # Normalize input
         x_n = (x - self.X_mean) / self.X_std
 
-        r = np.zeros((n_eval, self.n_samples), dtype=x.dtype)
-        for r_i, x_i in zip(r, x_n):
-            r_i[:] = np.exp(-thetas.dot(np.square((x_i - self.X).T)))
+        r = np.empty((n_eval, self.n_samples), dtype=x.dtype)
+        for chunk in self._point_chunks(n_eval):
+            r[chunk] = np.exp(-np.square(x_n[chunk, np.newaxis, :] - self.X).dot(self.thetas))
 
         # Scaled Predictor
         y_t = np.dot(r, self.alpha)
@@ -329,8 +731,10 @@ class KrigingSurrogate(SurrogateModel):
         y = self.Y_mean + self.Y_std * y_t
 
         if self.options['eval_rmse']:
-            mse = (1. - np.dot(np.dot(r, self.Vh.T),
-                               np.einsum('j,kj,lk->jl', self.S_inv, self.U, r))) * self.sigma2
+            # Only the variance of each point is needed, not the covariance between them.
+            mse = 1. - np.einsum('ij,j,ij->i', np.dot(r, self.Vh.T), self.S_inv,
+                                 np.dot(r, self.U))
+            mse = mse[:, np.newaxis] * self.sigma2
 
             # Forcing negative RMSE to zero if negative due to machine precision
             mse[mse < 0.] = 0.
@@ -352,17 +756,52 @@ class KrigingSurrogate(SurrogateModel):
         ndarray
             Jacobian of surrogate output wrt inputs.
         """
+        return self.vectorized_linearize(np.atleast_2d(x))[0]
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the Kriging surface at many points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate Jacobian is evaluated, with shape (n_points, n_dims).
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs at each point, with shape
+            (n_points, n_outputs, n_dims).
+        """
         thetas = self.thetas
+        n_eval = x.shape[0]
 
         # Normalize Input
         x_n = (x - self.X_mean) / self.X_std
 
-        r = np.exp(-thetas.dot(np.square((x_n - self.X).T)))
+        jac = np.empty((n_eval, self.alpha.shape[1], self.n_dims), dtype=x.dtype)
+        for chunk in self._point_chunks(n_eval):
+            diff = x_n[chunk, np.newaxis, :] - self.X
+            r = np.exp(-np.square(diff).dot(thetas))
+            gradr = -2. * thetas * diff * r[..., np.newaxis]
+            jac[chunk] = np.einsum('ijk,jl->ilk', gradr, self.alpha)
+
+        return jac * (self.Y_std[:, np.newaxis] / self.X_std)
+
+    def _point_chunks(self, n_eval):
+        """
+        Split the evaluation points into chunks that limit the memory used for the distances.
 
-        # Z = einsum('i,ij->ij', X, Y) is equivalent to, but much faster and
-        # memory efficient than, diag(X).dot(Y) for vector X and 2D array Y.
-        # i.e., Z[i,j] = X[i]*Y[i,j]
-        gradr = r * -2 * np.einsum('i,ij->ij', thetas, (x_n - self.X).T)
-        jac = np.einsum('i,j,ij->ij', self.Y_std, 1. /
-                        self.X_std, gradr.dot(self.alpha).T)
-        return jac
+        Parameters
+        ----------
+        n_eval : int
+            Number of evaluation points.
+
+        Yields
+        ------
+        slice
+            Slice of the evaluation points in the next chunk.
+        """
+        chunk = max(_MAX_DISTANCE_ENTRIES // (self.n_samples * self.n_dims), 1)
+        for start in range(0, n_eval, chunk):
+            yield slice(start, start + chunk)
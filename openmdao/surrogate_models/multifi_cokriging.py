@@ -130,6 +130,44 @@ def squared_exponential_correlation(theta, d):
         return np.exp(-np.sum(theta.reshape(1, n_features) * d ** 2, axis=1))
 
 
+def _regression_jacobian(regr, x):
+    """
+    Compute the derivatives of a regression functional basis with respect to its inputs.
+
+    The built-in regression models are differentiated analytically. Any other regression function
+    is differentiated by central finite differences.
+
+    Parameters
+    ----------
+    regr : callable
+        Regression function.
+    x : array_like
+        Input data, with shape (n_eval, n_features).
+
+    Returns
+    -------
+    array_like
+        Derivatives with shape (n_eval, p, n_features).
+    """
+    n_eval, n_features = x.shape
+
+    if regr is constant_regression:
+        return np.zeros((n_eval, 1, n_features))
+
+    if regr is linear_regression:
+        jac = np.vstack((np.zeros((1, n_features)), np.eye(n_features)))
+        return np.broadcast_to(jac, (n_eval, ) + jac.shape)
+
+    delta = 1e-6
+    jac = []
+    for k in range(n_features):
+        step = np.zeros(n_features)
+        step[k] = delta
+        jac.append((regr(x + step) - regr(x - step)) / (2. * delta))
+
+    return np.stack(jac, axis=-1)
+
+
 def l1_cross_distances(X, Y=None):
     """
     Compute the nonzero componentwise L1 cross-distances between the vectors in X and Y.
@@ -748,6 +786,66 @@ class MultiFiCoKriging(object):
         else:
             return mu[:, -1].reshape((n_eval, 1))
 
+    def predict_jacobian(self, X):
+        """
+        Compute the derivatives of the predictions of the kriging model with respect to X.
+
+        Parameters
+        ----------
+        X : array_like
+            An array with shape (n_eval, n_features) giving the point(s) at
+            which the derivatives should be computed.
+
+        Returns
+        -------
+        array_like
+            An array with shape (n_eval, n_features) with the derivatives of the Best Linear
+            Unbiased Prediction at X.
+        """
+        X = array2d(X)
+        n_eval, n_features = X.shape
+
+        # Normalize
+        if self.normalize:
+            X = (X - self.X_mean) / self.X_std
+
+        f0 = self.regr(X)
+        df0 = _regression_jacobian(self.regr, X)
+
+        mu = np.zeros(n_eval)
+        dmu = np.zeros((n_eval, n_features))
+
+        # The predictor at each level is f.beta + r.gamma, where f also depends on the
+        # prediction at the previous level.
+        for i in range(self.nlevel):
+            C = self.C[i]
+            beta = self.beta[i]
+
+            Ft = solve_triangular(C, self.F[i], lower=True)
+            yt = solve_triangular(C, self.y[i], lower=True)
+            gamma = solve_triangular(C.T, yt - np.dot(Ft, beta), lower=False)
+
+            if i == 0:
+                f = f0
+                df = df0
+            else:
+                g = self.rho_regr(X)
+                dg = _regression_jacobian(self.rho_regr, X)
+                f = np.hstack((g * mu[:, np.newaxis], f0))
+                df = np.concatenate((dg * mu[:, np.newaxis, np.newaxis] +
+                                     g[:, :, np.newaxis] * dmu[:, np.newaxis, :], df0), axis=1)
+
+            theta = np.broadcast_to(np.ravel(self.theta[i]), (n_features, ))
+            diff = X[:, np.newaxis, :] - self.X[i]
+            r_ = np.exp(-np.sum(theta * diff ** 2, axis=2))
+            dr = -2. * theta * diff * r_[:, :, np.newaxis]
+
+            mu = (np.dot(f, beta) + np.dot(r_, gamma)).ravel()
+            dmu = np.einsum('ijk,j->ik', df, beta.ravel()) + \
+                np.einsum('ijk,j->ik', dr, gamma.ravel())
+
+        return dmu * self.y_std / self.X_std
+
     def _check_list_structure(self, X, y):
         """
         Transform floats and arrays in the training data lists to have a multifidelity structure.
@@ -974,6 +1072,59 @@ class MultiFiCoKrigingSurrogate(MultiFiSurrogateModel):
         Y_pred, MSE = self.model.predict([new_x])
         return Y_pred, np.sqrt(np.abs(MSE))
 
+    def vectorized_predict(self, new_x):
+        """
+        Calculate predicted values of the response at many points based on the trained model.
+
+        Parameters
+        ----------
+        new_x : array_like
+            An array with shape (n_eval, n_features) giving the points at which the predictions
+            should be made.
+
+        Returns
+        -------
+        array_like
+            An array with shape (n_eval, 1) with the Best Linear Unbiased Prediction at X.
+        array_like
+            An array with shape (n_eval, 1) with the square root of the Mean Squared Error at X.
+        """
+        Y_pred, MSE = self.model.predict(new_x)
+        return Y_pred, np.sqrt(np.abs(MSE))
+
+    def linearize(self, x):
+        """
+        Calculate the jacobian of the surrogate at the requested point.
+
+        Parameters
+        ----------
+        x : array_like
+            Point at which the surrogate Jacobian is evaluated.
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs.
+        """
+        return self.vectorized_linearize(array2d(x))[0]
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the surrogate at many points.
+
+        Parameters
+        ----------
+        x : array_like
+            Points at which the surrogate Jacobian is evaluated, with shape (n_eval, n_features).
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs at each point, with shape
+            (n_eval, 1, n_features).
+        """
+        return self.model.predict_jacobian(x)[:, np.newaxis, :]
+
     def train_multifi(self, X, Y):
         """
         Train the surrogate model with the given set of inputs and outputs.
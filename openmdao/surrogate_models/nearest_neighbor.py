@@ -76,6 +76,23 @@ class NearestNeighbor(SurrogateModel):
         self.interpolant = _interpolators[self.options['interpolant_type']](
             x, y, **self.interpolant_init_args)
 
+    def update(self, x_new, y_new):
+        """
+        Add training points to the interpolant without building it again from scratch.
+
+        Parameters
+        ----------
+        x_new : array-like
+            Additional training input locations.
+        y_new : array-like
+            Model responses at the additional inputs.
+        """
+        if not self.trained:
+            self.train(x_new, y_new)
+            return
+
+        self.interpolant.update(x_new, y_new)
+
     def predict(self, x, **kwargs):
         """
         Calculate a predicted value of the response based on the current trained model.
@@ -95,6 +112,25 @@ class NearestNeighbor(SurrogateModel):
         super().predict(x)
         return self.interpolant(x, **kwargs)
 
+    def vectorized_predict(self, x, **kwargs):
+        """
+        Calculate predicted values of the response at many points based on the trained model.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate is evaluated, with shape (n_points, n_dims).
+        **kwargs : dict
+            Additional keyword arguments passed to the interpolant.
+
+        Returns
+        -------
+        ndarray
+            Predicted value at each point.
+        """
+        super().predict(x)
+        return self.interpolant(x, **kwargs)
+
     def linearize(self, x, **kwargs):
         """
         Calculate the jacobian of the interpolant at the requested point.
@@ -115,3 +151,22 @@ class NearestNeighbor(SurrogateModel):
         if jac.shape[0] == 1 and len(jac.shape) > 2:
             return jac[0, ...]
         return jac
+
+    def vectorized_linearize(self, x, **kwargs):
+        """
+        Calculate the jacobian of the interpolant at many points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate Jacobian is evaluated, with shape (n_points, n_dims).
+        **kwargs : dict
+            Additional keyword arguments passed to the interpolant.
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs at each point, with shape
+            (n_points, n_outputs, n_dims).
+        """
+        return self.interpolant.gradient(x, **kwargs)
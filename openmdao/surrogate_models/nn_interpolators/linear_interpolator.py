@@ -71,6 +71,27 @@ class LinearInterpolator(NNBase):
 
         return normal, pc
 
+    def _hyperplane(self, data):
+        """
+        Return the hyperplane through the neighbors of each point, computing it if needed.
+
+        Parameters
+        ----------
+        data : dict
+            Neighbor data of the points, from _neighbors.
+
+        Returns
+        -------
+        ndarray
+            Normal vector for the hyperplane.
+        ndarray
+            Constant of the hyperplane.
+        """
+        if 'hyperplane' not in data:
+            data['hyperplane'] = self._find_hyperplane(data['nloc'])
+
+        return data['hyperplane']
+
     def __call__(self, prediction_points):
         """
         Do linear interpolation by defining plane with set number of nearest neighbors to predicted.
@@ -96,17 +117,19 @@ class LinearInterpolator(NNBase):
 
         # KData query takes (data, #ofneighbors) to determine closest
         # training points to predicted data
-        ndist, nloc = self._KData.query(normalized_pts.real, points_needed)
+        data = self._neighbors(normalized_pts, points_needed)
+        nloc = data['nloc']
 
-        normal, pc = self._find_hyperplane(nloc)
+        normal, pc = self._hyperplane(data)
 
         # Set all predictions from values on plane
         predictions = np.einsum('ij,ijk->ik', normalized_pts,
                                 normal[:, :self._indep_dims, :]) - pc
 
-        # Check to see if there are any collinear points and replace them
+        # Check to see if there are any collinear points and replace them with the value at the
+        # nearest neighbor.
         n0 = np.where(normal[:, -1, :] == 0)
-        predictions[n0, :] = self._tv[nloc[0, n0], :]
+        predictions[n0] = self._tv[nloc[n0[0], 0], n0[1]]
 
         # Finish computation for the good normals
         n = np.where(normal[:, -1, :] != 0)
@@ -115,8 +138,6 @@ class LinearInterpolator(NNBase):
         # Rescale to original units
         predictions = (predictions * self._tvr) + self._tvm
 
-        self._pt_cache = (normalized_pts, ndist, nloc)
-
         return predictions
 
     def gradient(self, prediciton_points):
@@ -145,16 +166,13 @@ class LinearInterpolator(NNBase):
         dims = self._indep_dims + 1
 
         # Find the neighbors
-        if self._pt_cache is not None and \
-                np.allclose(self._pt_cache[0], normPredPts):
-            ndist, nloc = self._pt_cache[1:]
-        else:
-            ndist, nloc = self._KData.query(normPredPts.real, dims)
-
-        normal, pc = self._find_hyperplane(nloc)
-        if np.any(normal[:, -1, :]) == 0:
-            return gradient
-        gradient[:] = (-normal[:, :-1, :] / normal[:, -1, :]).squeeze().T
+        normal, pc = self._hyperplane(self._neighbors(normPredPts, dims))
+
+        # Points whose neighbors are collinear keep a zero gradient.
+        last = normal[:, -1:, :]
+        good = last != 0
+        gradient[:] = np.swapaxes(np.where(good, -normal[:, :-1, :] / np.where(good, last, 1.0),
+                                           0.0), 1, 2)
 
         grad = gradient * (self._tvr[:, np.newaxis] / self._tpr)
 
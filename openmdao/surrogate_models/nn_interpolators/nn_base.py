@@ -2,9 +2,16 @@
 
 import numpy as np
 
+from collections import OrderedDict
 from math import ceil
 from scipy.spatial import KDTree
 
+# Number of sets of query points whose neighbors are kept in the cache.
+_NEIGHBOR_CACHE_SIZE = 16
+
+# Minimum number of query points for which the KDTree search is spread over all cores.
+_PARALLEL_QUERY_MIN_POINTS = 256
+
 
 class NNBase(object):
     """
@@ -47,8 +54,15 @@ class NNBase(object):
         Number of training points
     _KData : scipy.spatial.cKDTree
         KDTree used for finding the nearest neighbors.
-    _pt_cache : tuple(ndarray, ndarray, ndarray)
-        Internal cache of the last found neighbors.
+    _ntree : int
+        Number of training points held in the KDTree. Points added later by update are searched
+        directly until the tree is rebuilt.
+    _num_leaves : int
+        How many leaves the tree should have.
+    _neighbor_cache : OrderedDict
+        Least recently used cache of the neighbors of recent sets of query points, and of any
+        local data the interpolant computed from them, so that values and gradients at the same
+        points share that work.
     """
 
     def __init__(self, training_points, training_values, num_leaves=2):
@@ -77,8 +91,116 @@ class NNBase(object):
         self._ntpts = training_points.shape[0]
 
         # Make training data into a Tree
-        leavesz = ceil(self._ntpts / float(num_leaves))
-        self._KData = KDTree(self._tp, leafsize=leavesz)
+        self._num_leaves = num_leaves
+        self._build_tree()
 
         # Cache for gradients
-        self._pt_cache = None
+        self._neighbor_cache = OrderedDict()
+
+    def _build_tree(self):
+        """
+        Build the KDTree from all of the training points.
+        """
+        leavesz = ceil(self._ntpts / float(self._num_leaves))
+        self._KData = KDTree(self._tp, leafsize=leavesz)
+        self._ntree = self._ntpts
+
+    def update(self, training_points, training_values):
+        """
+        Add training points to the interpolant.
+
+        The new points are scaled the same way as the original training points. They are searched
+        directly until they make up a tenth of the training points, when the tree is rebuilt.
+
+        Parameters
+        ----------
+        training_points : ndarray
+            Ndarray of shape (num_points x independent dims) containing new training input
+            locations.
+        training_values : ndarray
+            Ndarray of shape (num_points x dependent dims) containing new training output values.
+        """
+        self._tp = np.vstack((self._tp, (training_points - self._tpm) / self._tpr))
+        self._tv = np.vstack((self._tv, (training_values - self._tvm) / self._tvr))
+        self._ntpts = self._tp.shape[0]
+
+        if 10 * (self._ntpts - self._ntree) > self._ntpts:
+            self._build_tree()
+
+        self._neighbor_cache.clear()
+
+    def _neighbors(self, points, k):
+        """
+        Return the neighbor data of a set of query points, from the cache if possible.
+
+        Parameters
+        ----------
+        points : ndarray
+            Ndarray of shape (num_points x independent dims) containing normalized points.
+        k : int
+            Number of nearest neighbors to find.
+
+        Returns
+        -------
+        dict
+            Neighbor data containing the distances ('ndist') and indices ('nloc') of the nearest
+            neighbors. Interpolants may add their own data computed from the neighbors.
+        """
+        points = points.real
+        key = (k, points.shape, points.tobytes())
+        cache = self._neighbor_cache
+
+        try:
+            cache.move_to_end(key)
+            return cache[key]
+        except KeyError:
+            pass
+
+        ndist, nloc = self._query(points, k)
+        data = cache[key] = {'ndist': ndist, 'nloc': nloc}
+
+        if len(cache) > _NEIGHBOR_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return data
+
+    def _query(self, points, k):
+        """
+        Find the nearest training points, like KDTree.query.
+
+        Parameters
+        ----------
+        points : ndarray
+            Ndarray of shape (num_points x independent dims) containing normalized points.
+        k : int
+            Number of nearest neighbors to find.
+
+        Returns
+        -------
+        ndarray
+            Distances to the nearest neighbors, sorted from nearest to farthest.
+        ndarray
+            Indices of the nearest neighbors in the training points.
+        """
+        points = points.real
+        workers = -1 if points.shape[0] >= _PARALLEL_QUERY_MIN_POINTS else 1
+        ndist, nloc = self._KData.query(points, k, workers=workers)
+
+        if self._ntree == self._ntpts:
+            return ndist, nloc
+
+        # Merge the nearest neighbors in the tree with the points that were added after it was
+        # built.
+        shape = ndist.shape
+        ndist = np.hstack((ndist.reshape((points.shape[0], -1)),
+                           np.linalg.norm(points[:, np.newaxis, :] - self._tp[self._ntree:],
+                                          axis=-1)))
+        nloc = np.hstack((nloc.reshape((points.shape[0], -1)),
+                          np.broadcast_to(np.arange(self._ntree, self._ntpts),
+                                          (points.shape[0], self._ntpts - self._ntree))))
+
+        order = np.argsort(ndist, axis=1, kind='stable')[:, :k]
+        ndist = np.take_along_axis(ndist, order, axis=1).reshape(shape)
+        nloc = np.take_along_axis(nloc, order, axis=1).reshape(shape)
+
+        return ndist, nloc
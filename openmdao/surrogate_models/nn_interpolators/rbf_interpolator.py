@@ -53,36 +53,59 @@ class RBFInterpolator(NNBase):
         # rbf_family is an arbitrary value that picks a function to use
         self.rbf_family = rbf_family
 
+        self.N = num_neighbors
+        self.weights = self._find_weights()
+
+    def _find_weights(self):
+        """
+        Compute the weight of each training point.
+
+        Returns
+        -------
+        ndarray
+            Weights for each interpolation point.
+        """
         # For weights, first find the training points radial neighbors
-        tdist, tloc = self._KData.query(self._tp, num_neighbors)
+        tdist, tloc = self._query(self._tp, self.N)
         Tt = tdist[:, :-1] / tdist[:, -1:]
-        # Next determine weight matrix
-        Rt = self._find_R(self._ntpts, Tt, tloc)
-        weights = (spsolve(csc_matrix(Rt), self._tv))[..., np.newaxis]
+        # Next determine weight matrix, which only has entries for each point's neighbors
+        rows = np.repeat(np.arange(self._ntpts), self.N - 1)
+        Rt = csc_matrix((self._find_R(Tt).ravel(), (rows, tloc[:, :-1].ravel())),
+                        shape=(self._ntpts, self._ntpts))
+        return (spsolve(Rt, self._tv))[..., np.newaxis]
 
-        self.N = num_neighbors
-        self.weights = weights
+    def update(self, training_points, training_values):
+        """
+        Add training points to the interpolant.
+
+        The neighbors of the existing training points can change, so all of the weights are
+        computed again.
+
+        Parameters
+        ----------
+        training_points : ndarray
+            Ndarray of shape (num_points x independent dims) containing new training input
+            locations.
+        training_values : ndarray
+            Ndarray of shape (num_points x dependent dims) containing new training output values.
+        """
+        super().update(training_points, training_values)
+        self.weights = self._find_weights()
 
-    def _find_R(self, npp, T, neighbor_idx):
+    def _find_R(self, T):
         """
         Evaluate RBF polynomial.
 
         Parameters
         ----------
-        npp : int
-            Number of prediction points
-        T : int
-            Radial distance
-        neighbor_idx : ndarray
-            Int array of neighbor indices.
+        T : ndarray
+            Radial distance from each point to each of its neighbors.
 
         Returns
         -------
         ndarray
-            Evaluation of RBF polynomial.
+            Evaluation of RBF polynomial for each neighbor.
         """
-        R = np.zeros((npp, self._ntpts), dtype="float")
-
         # Choose type of CRBF R matrix
         if self.rbf_family == -1:
             # Comp #1 - a
@@ -204,12 +227,9 @@ class RBFInterpolator(NNBase):
 
         Cb = np.polyval(cb_poly, T)
 
-        for i in range(npp):
-            R[i, neighbor_idx[i, :-1]] = Cf[i, :] * Cb[i, :]
+        return Cf * Cb
 
-        return R
-
-    def _find_dR(self, prediction_points, neighbor_idx, neighbor_dists):
+    def _find_dR(self, prediction_points, neighbor_idx, neighbor_dists, neighbor_weights):
         """
         Find dR.
 
@@ -221,6 +241,8 @@ class RBFInterpolator(NNBase):
             Nearest neighbor indices for prediction points.
         neighbor_dists : ndarray
             Distances from prediction points to neighbors.
+        neighbor_weights : ndarray
+            Weights of all but the farthest neighbor of each prediction point.
 
         Returns
         -------
@@ -354,8 +376,7 @@ class RBFInterpolator(NNBase):
         dtx = (xpi - (np.square(T) * xpm)) / (np.square(neighbor_dists[:, -1:, :]) * T)
 
         # The gradient then is the summation across neighs of w*df/dt*dt/dx
-        grad = np.einsum('ijk,ijk,ijl...->ilk...', dRp,
-                         dtx, self.weights[neighbor_idx[:, :-1]])
+        grad = np.einsum('ijk,ijk,ijl...->ilk...', dRp, dtx, neighbor_weights)
 
         return grad.reshape((prediction_points.shape[0], self._dep_dims, self._indep_dims))
 
@@ -380,24 +401,45 @@ class RBFInterpolator(NNBase):
         normalized_pts = (prediction_points - self._tpm) / self._tpr
         nppts = normalized_pts.shape[0]
         # Setup prediction points and find their radial neighbors
-        ndist, nloc = self._KData.query(normalized_pts, self.N)
+        data = self._neighbors(normalized_pts, self.N)
+        ndist, nloc = data['ndist'], data['nloc']
+        local_weights = self._local_weights(data)
+
         # Check if complex step is being run
         if np.any(np.abs(normalized_pts[0, :].imag)) > 0:
             dimdiff = np.subtract(normalized_pts.reshape((nppts, 1, self._indep_dims)),
                                   self._tp[nloc, :])
             # KD Tree ignores imaginary part, muse redo ndist if complex
             ndist = np.sqrt(np.sum((dimdiff * dimdiff), axis=2))
+            Rp = self._find_R(ndist[:, :-1] / ndist[:, -1:])
+        else:
+            if 'Rp' not in data:
+                # Take farthest distance of each point
+                data['Rp'] = self._find_R(ndist[:, :-1] / ndist[:, -1:])
+            Rp = data['Rp']
 
-        # Take farthest distance of each point
-        Tp = ndist[:, :-1] / ndist[:, -1:]
+        predz = np.einsum('ij,ij...->i...', Rp, local_weights).reshape(nppts, self._dep_dims)
 
-        Rp = self._find_R(nppts, Tp, nloc)
-        predz = ((np.dot(Rp, self.weights[..., 0]) * self._tvr) +
-                 self._tvm).reshape(nppts, self._dep_dims)
+        return (predz * self._tvr) + self._tvm
 
-        self._pt_cache = (normalized_pts, ndist, nloc)
+    def _local_weights(self, data):
+        """
+        Return the weights of the neighbors of each point, which are shared by values and gradients.
 
-        return predz
+        Parameters
+        ----------
+        data : dict
+            Neighbor data of the points, from _neighbors.
+
+        Returns
+        -------
+        ndarray
+            Weights of all but the farthest neighbor of each point.
+        """
+        if 'weights' not in data:
+            data['weights'] = self.weights[data['nloc'][:, :-1]]
+
+        return data['weights']
 
     def gradient(self, prediction_points):
         """
@@ -419,14 +461,11 @@ class RBFInterpolator(NNBase):
 
         normalized_pts = (prediction_points - self._tpm) / self._tpr
         # Setup prediction points and find their radial neighbors
-        if self._pt_cache is not None and \
-                np.allclose(self._pt_cache[0], normalized_pts):
-            pdist, ploc = self._pt_cache[1:]
-        else:
-            pdist, ploc = self._KData.query(normalized_pts, self.N)
+        data = self._neighbors(normalized_pts, self.N)
 
         # Find Gradient
-        grad = self._find_dR(normalized_pts[:, np.newaxis, :], ploc,
-                             pdist[:, :, np.newaxis]) * (self._tvr[..., np.newaxis] / self._tpr)
+        grad = self._find_dR(normalized_pts[:, np.newaxis, :], data['nloc'],
+                             data['ndist'][:, :, np.newaxis],
+                             self._local_weights(data)) * (self._tvr[..., np.newaxis] / self._tpr)
 
         return grad
@@ -3,7 +3,7 @@
 Surrogate Model based on second order response surface equations.
 """
 
-from numpy import zeros, einsum
+from numpy import zeros
 import numpy as np
 from packaging.version import Version
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
@@ -20,6 +20,12 @@ class ResponseSurface(SurrogateModel):
 
     Attributes
     ----------
+    _normal_eqs : tuple of ndarray or None
+        The normal equations (X^T X, X^T y) of the training terms, kept while the terms are rank
+        deficient, or None.
+    _P : ndarray or None
+        Inverse of X^T X of the training terms, used for recursive least squares updates, or
+        None if the terms are rank deficient.
     betas : ndarray
         Vector of response surface equation coefficients.
     m : int
@@ -39,6 +45,9 @@ class ResponseSurface(SurrogateModel):
         # vector of response surface equation coefficients
         self.betas = zeros(0)
 
+        self._P = None
+        self._normal_eqs = None
+
     def train(self, x, y):
         """
         Calculate response surface equation coefficients using least squares regression.
@@ -52,31 +61,84 @@ class ResponseSurface(SurrogateModel):
         """
         super().train(x, y)
 
-        m = self.m = x.shape[0]
-        n = self.n = x.shape[1]
+        self.m = x.shape[0]
+        self.n = x.shape[1]
 
-        X = zeros((m, ((n + 1) * (n + 2)) // 2))
+        X = self._get_terms(x)
 
-        # Modify X to include constant, squared terms and cross terms
+        # Determine response surface equation coefficients (betas) using least
+        # squares
+        self.betas, rs, r, s = lstsq(X, y)
 
-        # Constant Terms
-        X[:, 0] = 1.0
+        if r == X.shape[1]:
+            # (X^T X)^-1 = R^-1 R^-T, from the QR factorization of X.
+            R_inv = np.linalg.inv(np.linalg.qr(X, mode='r'))
+            self._P = R_inv.dot(R_inv.T)
+            self._normal_eqs = None
+        else:
+            self._P = None
+            self._normal_eqs = (X.T.dot(X), X.T.dot(y))
 
-        # Linear Terms
-        X[:, 1:n + 1] = x
+    def update(self, x_new, y_new):
+        """
+        Add training points to the response surface using recursive least squares.
 
-        # Quadratic Terms
-        X_offset = X[:, n + 1:]
-        for i in range(n):
-            # Z = einsum('i,ij->ij', X, Y) is equivalent to, but much faster and
-            # memory efficient than, diag(X).dot(Y) for vector X and 2D array Y.
-            # I.e. Z[i,j] = X[i]*Y[i,j]
-            X_offset[:, :n - i] = einsum('i,ij->ij', x[:, i], x[:, i:])
-            X_offset = X_offset[:, n - i:]
+        Parameters
+        ----------
+        x_new : array-like
+            Additional training input locations.
+        y_new : array-like
+            Model responses at the additional inputs.
+        """
+        if not self.trained:
+            self.train(x_new, y_new)
+            return
+
+        A = self._get_terms(x_new)
+        self.m += A.shape[0]
+
+        if self._P is not None:
+            # Woodbury update of (X^T X)^-1 with the new rows, K being the gain.
+            PA = self._P.dot(A.T)
+            K = np.linalg.solve(np.eye(A.shape[0]) + A.dot(PA), PA.T).T
+            self.betas = self.betas + K.dot(y_new - A.dot(self.betas))
+            self._P = self._P - K.dot(PA.T)
+        else:
+            # Not enough independent training points yet for recursive updates.
+            XtX, Xty = self._normal_eqs
+            XtX = XtX + A.T.dot(A)
+            Xty = Xty + A.T.dot(y_new)
+            self.betas, rs, r, s = lstsq(XtX, Xty)
+
+            if r == XtX.shape[0]:
+                self._P = np.linalg.inv(XtX)
+                self._normal_eqs = None
+            else:
+                self._normal_eqs = (XtX, Xty)
+
+    def _get_terms(self, x):
+        """
+        Compute the constant, linear, squared and cross terms of the response surface.
 
-        # Determine response surface equation coefficients (betas) using least
-        # squares
-        self.betas, rs, r, s = lstsq(X, y)
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the terms are evaluated, with shape (n_points, n).
+
+        Returns
+        -------
+        ndarray
+            Terms at each point, with shape (n_points, (n + 1) * (n + 2) / 2).
+        """
+        n = self.n
+        rows, cols = np.triu_indices(n)
+
+        X = np.empty((x.shape[0], ((n + 1) * (n + 2)) // 2), dtype=np.result_type(x, 1.0))
+        X[:, 0] = 1.0
+        X[:, 1:n + 1] = x
+        X[:, n + 1:] = x[:, rows] * x[:, cols]
+
+        return X
 
     def predict(self, x):
         """
@@ -92,28 +154,26 @@ class ResponseSurface(SurrogateModel):
         float
             Predicted response.
         """
-        super().predict(x)
-
-        n = x.size
+        return self.vectorized_predict(np.reshape(x, (1, -1)))[0]
 
-        X = zeros(((self.n + 1) * (self.n + 2)) // 2)
-
-        # Modify X to include constant, squared terms and cross terms
-
-        # Constant Terms
-        X[0] = 1.0
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of response at many points based on the response surface model.
 
-        # Linear Terms
-        X[1:n + 1] = x
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate is evaluated, with shape (n_points, n).
 
-        # Quadratic Terms
-        X_offset = X[n + 1:]
-        for i in range(n):
-            X_offset[:n - i] = x[i] * x[i:]
-            X_offset = X_offset[n - i:]
+        Returns
+        -------
+        ndarray
+            Predicted response at each point.
+        """
+        super().predict(x)
 
         # Predict new_y using X and betas
-        return X.dot(self.betas)
+        return self._get_terms(x).dot(self.betas)
 
     def linearize(self, x):
         """
@@ -129,16 +189,31 @@ class ResponseSurface(SurrogateModel):
         ndarray
             Jacobian of surrogate output wrt inputs.
         """
+        return self.vectorized_linearize(np.reshape(x, (1, -1)))[0]
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the response surface at many points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate Jacobian is evaluated, with shape (n_points, n).
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs at each point, with shape
+            (n_points, n_outputs, n).
+        """
         n = self.n
         betas = self.betas
+        rows, cols = np.triu_indices(n)
 
-        x = x.flat
-
-        jac = betas[1:n + 1, :].copy()
-        beta_offset = betas[n + 1:, :]
-        for i in range(n):
-            jac[i, :] += x[i:].dot(beta_offset[:n - i, :])
-            jac[i:, :] += x[i] * beta_offset[:n - i, :]
-            beta_offset = beta_offset[n - i:, :]
+        # The quadratic terms are x.T A x / 2, with A holding each cross term coefficient twice.
+        hess = zeros((n, n) + betas.shape[1:], dtype=betas.dtype)
+        hess[rows, cols] = betas[n + 1:]
+        hess = hess + np.swapaxes(hess, 0, 1)
 
-        return jac.T
+        jac = betas[1:n + 1] + np.tensordot(x, hess, axes=(1, 1))
+        return np.moveaxis(jac, 1, -1)
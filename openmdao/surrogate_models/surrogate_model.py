@@ -44,6 +44,27 @@ class SurrogateModel(object):
         """
         self.trained = True
 
+    def update(self, x_new, y_new):
+        """
+        Add training points to the trained model without training it again from scratch.
+
+        Surrogates that support incremental training override this method. An untrained
+        surrogate is trained with the given points.
+
+        Parameters
+        ----------
+        x_new : array-like
+            Additional training input locations.
+        y_new : array-like
+            Model responses at the additional inputs.
+        """
+        if not self.trained:
+            self.train(x_new, y_new)
+            return
+
+        raise NotImplementedError(f"{type(self).__name__} does not support incremental "
+                                  "training. Call train with all of the training data instead.")
+
     def predict(self, x):
         """
         Calculate a predicted value of the response based on the current trained model.
@@ -65,7 +86,7 @@ class SurrogateModel(object):
         Parameters
         ----------
         x : array-like
-            Vectorized point(s) at which the surrogate is evaluated.
+            Vectorized point(s) at which the surrogate is evaluated, with one row per point.
         """
         pass
 
@@ -80,6 +101,18 @@ class SurrogateModel(object):
         """
         pass
 
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the interpolant at many points.
+
+        Parameters
+        ----------
+        x : array-like
+            Vectorized points at which the surrogate Jacobian is evaluated, with one row per
+            point.
+        """
+        pass
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
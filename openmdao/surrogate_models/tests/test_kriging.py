@@ -2,12 +2,17 @@
 # pylint: disable-msg=C0111,C0103
 
 import unittest
+from unittest import mock
 import itertools
+import threading
 import numpy as np
 import os
+import scipy.linalg as linalg
 
 from openmdao.api import KrigingSurrogate
-from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.surrogate_models.kriging import _squared_distances, _training_objective
+from openmdao.utils.assert_utils import assert_near_equal, assert_warning
+from openmdao.utils.om_warnings import OpenMDAOWarning, SolverWarning
 
 
 def branin(x):
@@ -149,6 +154,29 @@ class TestKrigingSurrogate(unittest.TestCase):
         jac = surrogate.linearize(np.array([[0.5, 0.5]]))
         assert_near_equal(jac, np.array([[1, 1], [1, -1], [1, 2]]), 1e-3)
 
+    def test_vectorized(self):
+        x = np.array([[a, b] for a, b in itertools.product(np.linspace(-5, 10, 6),
+                                                           np.linspace(0, 15, 6))])
+        y = np.array([[branin(case), np.sum(case)] for case in x])
+
+        surrogate = KrigingSurrogate(eval_rmse=True)
+        surrogate.train(x, y)
+
+        points = np.array([[a, b] for a, b in itertools.product(np.linspace(-4, 9, 7),
+                                                                np.linspace(1, 14, 5))])
+        mu, sigma = surrogate.vectorized_predict(points)
+        jac = surrogate.vectorized_linearize(points)
+
+        self.assertEqual(mu.shape, (35, 2))
+        self.assertEqual(sigma.shape, (35, 2))
+        self.assertEqual(jac.shape, (35, 2, 2))
+
+        for i, point in enumerate(points):
+            mu_i, sigma_i = surrogate.predict(point)
+            assert_near_equal(mu[i], mu_i[0], 1e-10)
+            assert_near_equal(sigma[i], sigma_i[0], 1e-10)
+            assert_near_equal(jac[i], surrogate.linearize(point), 1e-10)
+
     def test_cache(self):
         x = np.array([[-2., 0.], [-0.5, 1.5], [1., 3.], [8.5, 4.5],
                       [-3.5, 6.], [4., 7.5], [-5., 9.], [5.5, 10.5],
@@ -161,6 +189,9 @@ class TestKrigingSurrogate(unittest.TestCase):
         surrogate = KrigingSurrogate(nugget=0., eval_rmse=True, training_cache='test_cache.npz')
         surrogate.train(x, y)
 
+        # loaded from the cache, not trained
+        self.assertIsNone(surrogate._decomposition)
+
         for x0, y0 in zip(x, y):
             mu, sigma = surrogate.predict(x0)
             assert_near_equal(mu, [y0], 1e-9)
@@ -171,8 +202,154 @@ class TestKrigingSurrogate(unittest.TestCase):
         assert_near_equal(mu, [[16.72]], 1e-1)
         assert_near_equal(sigma, [[15.27]], 1e-2)
 
+        # a model trained with other settings is trained again
+        for options in ({'decomposition': 'cholesky'}, {'n_start': 2}):
+            surrogate = KrigingSurrogate(nugget=0., eval_rmse=True,
+                                         training_cache='test_cache.npz', **options)
+            surrogate.train(x, y)
+            self.assertIsNotNone(surrogate._decomposition)
+
         os.unlink('test_cache.npz')
 
+    def test_cholesky(self):
+        x = np.array([[-2., 0.], [-0.5, 1.5], [1., 3.], [8.5, 4.5],
+                      [-3.5, 6.], [4., 7.5], [-5., 9.], [5.5, 10.5],
+                      [10., 12.], [7., 13.5], [2.5, 15.]])
+        y = np.array([[branin(case)] for case in x])
+
+        surrogate = KrigingSurrogate(nugget=0., eval_rmse=True, decomposition='cholesky')
+        surrogate.train(x, y)
+
+        for x0, y0 in zip(x, y):
+            mu, sigma = surrogate.predict(x0)
+            assert_near_equal(mu, [y0], 1e-9)
+            assert_near_equal(sigma, [[0]], 1e-4)
+
+        # at the same hyperparameters, the svd and cholesky models are the same
+        svd_surrogate = KrigingSurrogate(nugget=0., eval_rmse=True)
+        svd_surrogate.train(x, y)
+        surrogate.thetas = svd_surrogate.thetas
+        _, params = surrogate._calculate_reduced_likelihood_params()
+        surrogate.alpha = params['alpha']
+        surrogate.U = params['U']
+        surrogate.S_inv = params['S_inv']
+        surrogate.Vh = params['Vh']
+        surrogate.sigma2 = params['sigma2']
+
+        points = np.array([[5., 5.], [0., 10.], [7.5, 2.5]])
+        mu, sigma = surrogate.vectorized_predict(points)
+        svd_mu, svd_sigma = svd_surrogate.vectorized_predict(points)
+
+        assert_near_equal(mu, svd_mu, 1e-6)
+        assert_near_equal(sigma, svd_sigma, 1e-3)
+
+    def test_cholesky_fallback(self):
+        x = np.array([[-2., 0.], [-0.5, 1.5], [1., 3.], [8.5, 4.5],
+                      [-3.5, 6.], [4., 7.5], [-5., 9.], [5.5, 10.5],
+                      [10., 12.], [7., 13.5], [2.5, 15.]])
+        y = np.array([[branin(case)] for case in x])
+
+        surrogate = KrigingSurrogate(nugget=0., decomposition='cholesky')
+
+        msg = ("The Cholesky factorization of the Kriging correlation matrix failed. "
+               "Falling back to the 'svd' decomposition.")
+        with mock.patch('openmdao.surrogate_models.kriging._cholesky_factor',
+                        side_effect=linalg.LinAlgError):
+            with assert_warning(SolverWarning, msg):
+                surrogate.train(x, y)
+
+        self.assertEqual(surrogate._decomposition, 'svd')
+
+    def test_cholesky_gradient(self):
+        x = np.array([[a, b] for a, b in itertools.product(np.linspace(-5, 10, 5),
+                                                           np.linspace(0, 15, 5))])
+        x = (x - np.mean(x, axis=0)) / np.std(x, axis=0)
+        y = np.array([[branin(case), np.sum(case)] for case in x])
+
+        args = (_squared_distances(x), y, 1e-10, 'cholesky', 'gesvd')
+        log_thetas = np.log([0.5, 2.])
+        _, grad = _training_objective(log_thetas, *args)
+
+        fd = np.empty(2)
+        for i, step in enumerate(np.eye(2) * 1e-6):
+            fd[i] = (_training_objective(log_thetas + step, *args)[0] -
+                     _training_objective(log_thetas - step, *args)[0]) / 2e-6
+
+        assert_near_equal(grad, fd, 1e-5)
+
+    def test_multistart(self):
+        x = np.array([[a, b] for a, b in itertools.product(np.linspace(-5, 10, 6),
+                                                           np.linspace(0, 15, 6))])
+        y = np.array([[branin(case)] for case in x])
+
+        surrogate = KrigingSurrogate(decomposition='cholesky', n_start=4)
+        surrogate.train(x, y)
+
+        pool_surrogate = KrigingSurrogate(decomposition='cholesky', n_start=4, num_workers=2)
+        pool_surrogate.train(x, y)
+
+        assert_near_equal(pool_surrogate.thetas, surrogate.thetas, 1e-12)
+
+        # no workers are forked while another thread is running
+        stop = threading.Event()
+        thread = threading.Thread(target=stop.wait)
+        thread.start()
+        try:
+            serial_surrogate = KrigingSurrogate(decomposition='cholesky', n_start=4,
+                                                num_workers=2)
+            msg = ("KrigingSurrogate: num_workers = 2 but other threads are running in this "
+                   "process, so no worker processes can be forked safely. Training starts will "
+                   "be run serially.")
+            with assert_warning(OpenMDAOWarning, msg):
+                serial_surrogate.train(x, y)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert_near_equal(serial_surrogate.thetas, surrogate.thetas, 1e-12)
+
+        # the best start is at least as likely as the default single start
+        single = KrigingSurrogate(decomposition='cholesky')
+        single.train(x, y)
+        self.assertGreaterEqual(surrogate._calculate_reduced_likelihood_params()[0],
+                                single._calculate_reduced_likelihood_params()[0] - 1e-10)
+
+    def test_update(self):
+        x = np.array([[a, b] for a, b in itertools.product(np.linspace(-5, 10, 6),
+                                                           np.linspace(0, 15, 6))])
+        y = np.array([[branin(case), np.sum(case)] for case in x])
+        points = np.array([[5., 5.], [0., 10.], [7.5, 2.5]])
+
+        for decomposition in ('cholesky', 'svd'):
+            with self.subTest(decomposition=decomposition):
+                surrogate = KrigingSurrogate(nugget=1e-6, eval_rmse=True,
+                                             decomposition=decomposition)
+                surrogate.train(x[:24], y[:24])
+                thetas = surrogate.thetas
+                surrogate.update(x[24:], y[24:])
+
+                assert_near_equal(surrogate.thetas, thetas, 0.)
+                self.assertEqual(surrogate.n_samples, 36)
+
+                # same as factoring the correlation matrix of all the points
+                expected = KrigingSurrogate(nugget=1e-6, eval_rmse=True,
+                                            decomposition=decomposition)
+                expected.train(x[:24], y[:24])
+                expected.X = np.vstack((expected.X, (x[24:] - expected.X_mean) / expected.X_std))
+                expected.Y = np.vstack((expected.Y, (y[24:] - expected.Y_mean) / expected.Y_std))
+                expected.n_samples = 36
+                _, params = expected._calculate_reduced_likelihood_params()
+                expected.alpha = params['alpha']
+                expected.U = params['U']
+                expected.S_inv = params['S_inv']
+                expected.Vh = params['Vh']
+                expected.sigma2 = params['sigma2']
+
+                mu, sigma = surrogate.vectorized_predict(points)
+                expected_mu, expected_sigma = expected.vectorized_predict(points)
+                assert_near_equal(mu, expected_mu, 1e-8)
+                assert_near_equal(sigma, expected_sigma, 1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()
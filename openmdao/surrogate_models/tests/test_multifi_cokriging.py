@@ -45,6 +45,44 @@ class CoKrigingSurrogateTest(unittest.TestCase):
         # Prediction on x=0.05
         self.assertTrue(model.predict([0.05])[0].item() - fe(0.05) < 0.05)
 
+    def test_vectorized(self):
+        # high fidelity model
+        def fe(x):
+            return (x[:, 0] * 6 - 2) ** 2 * np.sin((x[:, 0] * 6 - 2) * 2) + x[:, 1] ** 2
+
+        # low fidelity model
+        def fc(x):
+            return 0.5 * fe(x) + (x[:, 0] - 0.5) * 10.0 - 5
+
+        Xe = np.array([[a, b] for a in np.linspace(0, 1, 4) for b in np.linspace(0, 1, 3)])
+        Xc = np.vstack((np.array([[a, b] for a in np.linspace(0.1, 0.9, 5)
+                                  for b in np.linspace(0.1, 0.9, 4)]), Xe))
+
+        for regr in ['constant', 'linear']:
+            with self.subTest(regr=regr):
+                surrogate = MultiFiCoKrigingSurrogate(regr=regr, rho_regr=regr, theta=[5., 2.])
+                surrogate.train_multifi([Xe, Xc], [fe(Xe), fc(Xc)])
+
+                points = np.array([[0.15, 0.2], [0.45, 0.85], [0.7, 0.5], [0.95, 0.05]])
+                mu, sigma = surrogate.vectorized_predict(points)
+                jac = surrogate.vectorized_linearize(points)
+
+                self.assertEqual(jac.shape, (4, 1, 2))
+
+                delta = 1e-6
+                for i, point in enumerate(points):
+                    mu_i, sigma_i = surrogate.predict(point)
+                    assert_near_equal(mu[i], mu_i[0], 1e-10)
+                    assert_near_equal(sigma[i], sigma_i[0], 1e-6)
+                    assert_near_equal(jac[i], surrogate.linearize(point), 1e-12)
+
+                    for j in range(2):
+                        step = np.zeros(2)
+                        step[j] = delta
+                        fd = (surrogate.predict(point + step)[0] -
+                              surrogate.predict(point - step)[0]) / (2. * delta)
+                        assert_near_equal(jac[i, 0, j], fd.item(), 1e-6)
+
     def test_1d_1fi_cokriging(self):
         # CoKrigingSurrogate with one fidelity could be used as a KrigingSurrogate
         # Same test as for KrigingSurrogate...  well with predicted test value adjustment
@@ -15,6 +15,75 @@ class TestNearestNeighbor(unittest.TestCase):
                        "['linear', 'weighted', 'rbf']."
         self.assertEqual(expected_msg, str(cm.exception))
 
+    def test_vectorized(self):
+        x = np.array([[a, b] for a in np.linspace(0, 1, 6) for b in np.linspace(0, 2, 7)])
+        y = np.column_stack((np.sin(3. * x[:, 0]) + x[:, 1], x[:, 0] * x[:, 1] ** 2))
+
+        points = np.array([[0.13, 0.31], [0.52, 1.77], [0.77, 0.05], [0.41, 1.02]])
+
+        for interpolant_type in ['linear', 'weighted', 'rbf']:
+            with self.subTest(interpolant_type=interpolant_type):
+                surrogate = NearestNeighbor(interpolant_type=interpolant_type)
+                surrogate.train(x, y)
+
+                mu = surrogate.vectorized_predict(points.copy())
+                jac = surrogate.vectorized_linearize(points.copy())
+
+                self.assertEqual(jac.shape, (4, 2, 2))
+                for i, point in enumerate(points):
+                    assert_near_equal(mu[i], surrogate.predict(point.copy())[0], 1e-12)
+                    assert_near_equal(jac[i], surrogate.linearize(point.copy()), 1e-12)
+
+    def test_update(self):
+        rng = np.random.default_rng(0)
+        x = np.vstack(([[0., 0.], [0., 1.], [1., 0.], [1., 1.]], rng.random((60, 2))))
+        y = np.column_stack((np.sin(3. * x.sum(axis=1)), x[:, 0] * x[:, 1]))
+        y[:2, 0] = [-2., 2.]
+        points = rng.random((20, 2))
+
+        for interpolant_type in ('linear', 'weighted', 'rbf'):
+            with self.subTest(interpolant_type=interpolant_type):
+                surrogate = NearestNeighbor(interpolant_type=interpolant_type)
+                surrogate.train(x[:40], y[:40])
+
+                # a few new points are searched outside of the tree, and more rebuild it
+                for start, stop, ntree in ((40, 43, 40), (43, 64, 64)):
+                    surrogate.update(x[start:stop], y[start:stop])
+                    self.assertEqual(surrogate.interpolant._ntree, ntree)
+
+                    expected = NearestNeighbor(interpolant_type=interpolant_type)
+                    expected.train(x[:stop], y[:stop])
+
+                    assert_near_equal(surrogate.vectorized_predict(points),
+                                      expected.vectorized_predict(points), 1e-10)
+                    assert_near_equal(surrogate.vectorized_linearize(points),
+                                      expected.vectorized_linearize(points), 1e-10)
+
+    def test_neighbor_cache(self):
+        rng = np.random.default_rng(0)
+        x = rng.random((50, 2))
+        y = np.column_stack((np.sin(3. * x.sum(axis=1)), x[:, 0] * x[:, 1]))
+        points = [rng.random((10, 2)) for _ in range(3)]
+
+        for interpolant_type in ('linear', 'weighted', 'rbf'):
+            with self.subTest(interpolant_type=interpolant_type):
+                surrogate = NearestNeighbor(interpolant_type=interpolant_type)
+                surrogate.train(x, y)
+
+                expected = [(surrogate.vectorized_predict(p), surrogate.vectorized_linearize(p))
+                            for p in points]
+
+                # The neighbors of all the recent points are cached, not just the last ones.
+                surrogate.interpolant._KData = None
+                for p, (val, jac) in zip(points, expected):
+                    assert_near_equal(surrogate.vectorized_predict(p), val, 1e-15)
+                    assert_near_equal(surrogate.vectorized_linearize(p), jac, 1e-15)
+
+                # Adding training points clears the cache.
+                surrogate.train(x, y)
+                surrogate.update(x[:1] + 0.01, y[:1])
+                self.assertEqual(len(surrogate.interpolant._neighbor_cache), 0)
+
 
 class TestLinearInterpolator1D(unittest.TestCase):
     def setUp(self):
@@ -137,6 +137,42 @@ class TestResponseSurfaceSurrogate(unittest.TestCase):
         jac = surrogate.linearize(array([[0.5, 0.5]]))
         assert_near_equal(jac, array([[1, 1], [1, -1]]), 1e-5)
 
+    def test_vectorized(self):
+        surrogate = ResponseSurface()
+
+        x = array([[a, b, c] for a, b, c in
+                   itertools.product(linspace(0, 1, 4), repeat=3)])
+        y = array([[a * b + c * c, a - 2. * b * c + a * a] for a, b, c in x])
+
+        surrogate.train(x, y)
+
+        points = array([[a, b, c] for a, b, c in
+                        itertools.product(linspace(0.1, 0.9, 3), repeat=3)])
+        mu = surrogate.vectorized_predict(points)
+        jac = surrogate.vectorized_linearize(points)
+
+        for i, (a, b, c) in enumerate(points):
+            assert_near_equal(mu[i], surrogate.predict(points[i]), 1e-12)
+            assert_near_equal(mu[i], [a * b + c * c, a - 2. * b * c + a * a], 1e-10)
+            assert_near_equal(jac[i], surrogate.linearize(points[i]), 1e-12)
+            assert_near_equal(jac[i], [[b, a, 2. * c], [1. + 2. * a, -2. * c, -2. * b]], 1e-10)
+
+    def test_update(self):
+        x = array([[a, b] for a, b in itertools.product(linspace(0, 1, 6), repeat=2)])
+        y = array([[a * b + sin(a), cos(b) - a * a] for a, b in x])
+
+        # the first update arrives while there are fewer points than terms
+        surrogate = ResponseSurface()
+        surrogate.train(x[:4], y[:4])
+        surrogate.update(x[4:10], y[4:10])
+        surrogate.update(x[10:], y[10:])
+
+        expected = ResponseSurface()
+        expected.train(x, y)
+
+        self.assertEqual(surrogate.m, 36)
+        assert_near_equal(surrogate.betas, expected.betas, 1e-10)
+
 
 if __name__ == "__main__":
     unittest.main()
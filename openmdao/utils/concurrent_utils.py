@@ -1,16 +1,51 @@
 """
-Utilities for submitting function evaluations under MPI.
+Utilities for submitting function evaluations under MPI or in a local process pool.
 """
 import os
+import copy
+import time
+import threading
 import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import _ExecutorManagerThread
+from functools import partial
 from itertools import chain, islice
 
 from openmdao.utils.mpi import debug
+from openmdao.utils.om_warnings import issue_warning, DriverWarning
 
 trace = os.environ.get('OPENMDAO_TRACE')
 
+# the function, driver and captured recording data of a worker process in a local pool
+_pool_worker = None
 
-def concurrent_eval_lb(func, cases, comm, broadcast=False):
+
+def _other_threads_alive():
+    """
+    Return True if threads other than this one and the helper threads of process pools are alive.
+
+    Forking a process while another thread may hold a lock, like the writer thread of a
+    SqliteRecorder with async_write, can deadlock the child. The helper threads of process
+    pools only wait on the queues and pipes of their own pool, so they are ignored.
+
+    Returns
+    -------
+    bool
+        True if forking this process now could deadlock the child.
+    """
+    current = threading.current_thread()
+    for thread in threading.enumerate():
+        if thread is current or isinstance(thread, _ExecutorManagerThread):
+            continue
+        if thread.daemon and thread.name == 'QueueFeederThread':
+            continue
+        return True
+
+    return False
+
+
+def concurrent_eval_lb(func, cases, comm, broadcast=False, callback=None):
     """
     Evaluate function on multiple processors with load balancing.
 
@@ -32,6 +67,11 @@ def concurrent_eval_lb(func, cases, comm, broadcast=False):
         If True, the results will be broadcast out to the worker procs so
         that the return value of concurrent_eval_lb will be the full result
         list in every process.
+    callback : function or None
+        If not None, this is called in the master rank with the return value and error
+        of each case as soon as it is received, before the next case is taken from cases.
+        This allows cases to be a generator that creates new cases based on the results
+        of earlier ones.
 
     Returns
     -------
@@ -42,7 +82,7 @@ def concurrent_eval_lb(func, cases, comm, broadcast=False):
         if comm.rank == 0:  # master rank
             if trace:
                 debug('Running Master Rank')
-            results = _concurrent_eval_lb_master(cases, comm)
+            results = _concurrent_eval_lb_master(cases, comm, callback)
             if trace:
                 debug('Master Rank Complete')
         else:
@@ -70,10 +110,13 @@ def concurrent_eval_lb(func, cases, comm, broadcast=False):
                 err = None
             results.append((retval, err))
 
+            if callback is not None:
+                callback(retval, err)
+
     return results
 
 
-def _concurrent_eval_lb_master(cases, comm):
+def _concurrent_eval_lb_master(cases, comm, callback=None):
     """
     Coordinate worker processes.
 
@@ -88,6 +131,9 @@ def _concurrent_eval_lb_master(cases, comm):
     comm : MPI communicator or None
         The MPI communicator that is shared between the master and workers.
         If None, the function will be executed serially.
+    callback : function or None
+        If not None, this is called with the return value and error of each case as soon
+        as it is received.
 
     Returns
     -------
@@ -126,6 +172,9 @@ def _concurrent_eval_lb_master(cases, comm):
             # store results
             results.append((retval, err))
 
+            if callback is not None:
+                callback(retval, err)
+
             # don't stop until we hear back from every worker process
             # we sent a case to
             if received == sent:
@@ -252,3 +301,329 @@ def concurrent_eval(func, cases, comm, allgather=False, model_mpi=None):
                 results = None
 
     return results
+
+
+def check_num_workers(num_workers, comm, prefix=''):
+    """
+    Return the number of local pool workers that can actually be used.
+
+    Parameters
+    ----------
+    num_workers : int
+        Requested number of worker processes.
+    comm : MPI communicator or None
+        The communicator of the Problem.
+    prefix : str
+        Prefix for any warning message.
+
+    Returns
+    -------
+    int
+        Number of worker processes to use. A value of 1 means that cases are evaluated
+        in this process.
+    """
+    if num_workers > 1:
+        if comm is not None and comm.size > 1:
+            issue_warning(f"num_workers = {num_workers} is not supported under MPI and will be "
+                          "ignored.", prefix=prefix, category=DriverWarning)
+            return 1
+        elif 'fork' not in multiprocessing.get_all_start_methods():
+            issue_warning(f"num_workers = {num_workers} requires the 'fork' process start "
+                          "method, which is not available on this platform. Cases will be "
+                          "evaluated serially.", prefix=prefix, category=DriverWarning)
+            return 1
+
+    return num_workers
+
+
+def can_fork_workers(num_workers, prefix=''):
+    """
+    Return True if a local pool of worker processes can be forked from this process now.
+
+    Forking while other threads are running, like the writer thread of a SqliteRecorder with
+    async_write, can deadlock the workers, so a warning is issued and False is returned in
+    that case. This is checked when the pool is about to be created, once the recorders have
+    been started.
+
+    Parameters
+    ----------
+    num_workers : int
+        Requested number of worker processes.
+    prefix : str
+        Prefix for any warning message.
+
+    Returns
+    -------
+    bool
+        True if the pool can be forked, False if cases must be evaluated in this process.
+    """
+    if _other_threads_alive():
+        issue_warning(f"num_workers = {num_workers} but other threads are running in this "
+                      "process, so no worker processes can be forked safely. Cases will be "
+                      "evaluated serially.", prefix=prefix, category=DriverWarning)
+        return False
+
+    return True
+
+
+def _get_recording_requesters(driver):
+    """
+    Return the driver, systems and solvers of the driver's problem that have recorders.
+
+    Parameters
+    ----------
+    driver : Driver
+        The driver.
+
+    Returns
+    -------
+    list
+        Objects with recorders, always in the same order for a given model.
+    """
+    requesters = [driver]
+
+    for system in driver._problem().model.system_iter(include_self=True, recurse=True):
+        requesters.append(system)
+        for solver in (system.nonlinear_solver, system.linear_solver):
+            if solver is not None:
+                requesters.append(solver)
+                linesearch = getattr(solver, 'linesearch', None)
+                if linesearch is not None:
+                    requesters.append(linesearch)
+
+    return [req for req in requesters if req._rec_mgr._recorders]
+
+
+def _init_pool_worker(func, driver, requesters):
+    """
+    Set up a forked pool worker to capture its recording data instead of writing it.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute in the worker.
+    driver : Driver
+        The driver running the cases.
+    requesters : list
+        Objects with recorders.
+    """
+    global _pool_worker
+    records = []
+    _pool_worker = (func, driver, records)
+
+    def capture(idx, method, requester, data, metadata):
+        if metadata is not None:
+            metadata['timestamp'] = time.perf_counter()
+        records.append((idx, method, list(requester._recording_iter.stack),
+                        copy.deepcopy(data), metadata))
+
+    for idx, requester in enumerate(requesters):
+        rec_mgr = requester._rec_mgr
+        for method in ('record_iteration', 'record_derivatives'):
+            setattr(rec_mgr, method, partial(capture, idx, method))
+
+
+def _run_pool_task(iter_count, args, kwargs):
+    """
+    Evaluate one case in a pool worker.
+
+    Parameters
+    ----------
+    iter_count : int
+        Iteration count of the driver for this case.
+    args : list or tuple
+        Positional arguments of the function.
+    kwargs : dict or None
+        Keyword arguments of the function.
+
+    Returns
+    -------
+    object
+        Return value of the function, or None if it raised an exception.
+    str or None
+        Traceback if the function raised an exception.
+    list
+        Recording data captured during the evaluation.
+    tuple
+        Model and derivative evaluation counts and times.
+    """
+    func, driver, records = _pool_worker
+    result = driver.result
+    stats = (result.model_evals, result.model_time, result.deriv_evals, result.deriv_time)
+
+    records.clear()
+    driver.iter_count = iter_count
+
+    try:
+        if kwargs:
+            retval = func(*args, **kwargs)
+        else:
+            retval = func(*args)
+    except Exception:
+        err = traceback.format_exc()
+        retval = None
+    else:
+        err = None
+
+    stats = (result.model_evals - stats[0], result.model_time - stats[1],
+             result.deriv_evals - stats[2], result.deriv_time - stats[3])
+
+    return retval, err, records, stats
+
+
+class LocalPool(object):
+    """
+    A pool of worker processes used to evaluate cases of a driver without MPI.
+
+    The workers are forked from this process when the first cases are submitted, so each one
+    has its own copy of the driver and model and nothing needs to be pickled except the case
+    arguments and results. Use can_fork_workers to check that no other threads are running
+    before creating a pool. Anything the workers record is sent back and written by the
+    recorders in this process, and the evaluation counts and times are added to the
+    driver result.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute in workers, usually a method of the driver.
+    driver : Driver
+        The driver running the cases. Each case is given the next iteration count of the driver.
+    num_workers : int
+        Number of worker processes.
+
+    Attributes
+    ----------
+    _driver : Driver
+        The driver running the cases.
+    _num_workers : int
+        Number of worker processes.
+    _requesters : list
+        Objects with recorders, in the same order as in the workers.
+    _executor : ProcessPoolExecutor
+        The executor that manages the worker processes.
+    """
+
+    def __init__(self, func, driver, num_workers):
+        """
+        Initialize attributes.
+        """
+        self._driver = driver
+        self._num_workers = num_workers
+        self._requesters = _get_recording_requesters(driver)
+        self._executor = ProcessPoolExecutor(max_workers=num_workers,
+                                             mp_context=multiprocessing.get_context('fork'),
+                                             initializer=_init_pool_worker,
+                                             initargs=(func, driver, self._requesters))
+
+    def __enter__(self):
+        """
+        Enter the context.
+
+        Returns
+        -------
+        LocalPool
+            This pool.
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        Shut down the pool when leaving the context.
+
+        Parameters
+        ----------
+        *args : list
+            Exception info, if any.
+        """
+        self.shutdown()
+
+    def shutdown(self):
+        """
+        Stop the worker processes.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def evaluate(self, cases, callback=None):
+        """
+        Evaluate the given cases in the worker processes.
+
+        This keeps a few more cases than there are workers in flight, so cases may be a
+        generator and is never consumed far ahead of the results.
+
+        Parameters
+        ----------
+        cases : collection of function args
+            Entries are assumed to be of the form (args, kwargs) where
+            kwargs are allowed to be None and args should be a list or tuple.
+        callback : function or None
+            If not None, this is called with the return value and error of each case as soon
+            as it is received, before more cases are taken from cases. The results are then not
+            collected, so any number of cases can be evaluated in bounded memory.
+
+        Returns
+        -------
+        list
+            Tuples of (return value, error) for each case, in the order they finished. Empty if
+            a callback is given.
+        """
+        driver = self._driver
+        result = driver.result
+        case_iter = iter(cases)
+        max_pending = 2 * self._num_workers
+        pending = set()
+        results = []
+
+        while True:
+            while len(pending) < max_pending:
+                try:
+                    args, kwargs = next(case_iter)
+                except StopIteration:
+                    break
+
+                pending.add(self._executor.submit(_run_pool_task, driver.iter_count,
+                                                  args, kwargs))
+                driver.iter_count += 1
+
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                retval, err, records, stats = future.result()
+
+                self._record(records)
+
+                result.model_evals += stats[0]
+                result.model_time += stats[1]
+                result.deriv_evals += stats[2]
+                result.deriv_time += stats[3]
+
+                if callback is None:
+                    results.append((retval, err))
+                else:
+                    callback(retval, err)
+
+        return results
+
+    def _record(self, records):
+        """
+        Write the recording data captured in a worker.
+
+        Parameters
+        ----------
+        records : list
+            Recording data captured during the evaluation of a case.
+        """
+        for idx, method, stack, data, metadata in records:
+            requester = self._requesters[idx]
+            rec_iter = requester._recording_iter
+
+            # use the iteration coordinate of the worker
+            saved_stack = rec_iter.stack
+            rec_iter.stack = stack
+            try:
+                for recorder in requester._rec_mgr._recorders:
+                    getattr(recorder, method)(requester, data, metadata)
+            finally:
+                rec_iter.stack = saved_stack
@@ -5,6 +5,8 @@ Note: This is a work in progress.
 """
 
 
+import mmap
+import os
 import re
 
 try:
@@ -595,6 +597,167 @@ class InputFileGenerator(object):
             return None
 
 
+class _MappedLines(object):
+    """
+    Read-only sequence of the lines of a memory mapped file.
+
+    The byte offsets of the lines are found once, and lines are only decoded when accessed.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file.
+    end_of_line_comment_char : str or None
+        End-of-line comment character. Text after it is removed from the lines.
+    full_line_comment_char : str or None
+        Comment character that signifies a line should be skipped.
+
+    Attributes
+    ----------
+    _mmap : mmap.mmap or bytes
+        Contents of the file.
+    _starts : ndarray
+        Byte offset of the start of each line that isn't a full line comment.
+    _ends : ndarray
+        Byte offset of the end of each line that isn't a full line comment, including the
+        newline.
+    _end_of_line_comment_char : str or None
+        End-of-line comment character.
+    _split_comments : bool
+        If True, lines are split at the end-of-line comment character like the comment-aware
+        reading in FileParser.set_file.
+    """
+
+    def __init__(self, filename, end_of_line_comment_char=None, full_line_comment_char=None):
+        """
+        Map the file and index its lines.
+        """
+        with open(filename, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # an empty file can't be mapped
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+        buf = np.frombuffer(self._mmap, dtype=np.uint8)
+        ends = np.flatnonzero(buf == ord('\n')) + 1
+        if size and (ends.size == 0 or ends[-1] != size):
+            ends = np.append(ends, size)
+        starts = np.concatenate(([0], ends[:-1])).astype(ends.dtype)
+
+        if full_line_comment_char and len(full_line_comment_char) == 1:
+            comment = np.ones(starts.size, dtype=bool)
+            for i, byte in enumerate(full_line_comment_char.encode()):
+                idx = starts + i
+                comment &= idx < ends
+                comment[comment] &= buf[idx[comment]] == byte
+            starts = starts[~comment]
+            ends = ends[~comment]
+
+        del buf
+
+        self._starts = starts
+        self._ends = ends
+        self._end_of_line_comment_char = end_of_line_comment_char
+        self._split_comments = bool(end_of_line_comment_char or full_line_comment_char)
+
+    def __len__(self):
+        """
+        Return the number of lines.
+
+        Returns
+        -------
+        int
+            Number of lines.
+        """
+        return self._starts.size
+
+    def __getitem__(self, index):
+        """
+        Return a line, or a list of lines for a slice.
+
+        Parameters
+        ----------
+        index : int or slice
+            Index of the line(s).
+
+        Returns
+        -------
+        str or list of str
+            The requested line(s).
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        line = self._mmap[self._starts[index]:self._ends[index]].decode(errors='replace')
+        if line.endswith('\r\n'):
+            line = line[:-2] + '\n'
+
+        if self._split_comments:
+            line = line.split(self._end_of_line_comment_char)[0]
+
+        return line
+
+    def __iter__(self):
+        """
+        Iterate over the lines.
+
+        Yields
+        ------
+        str
+            The next line.
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def find(self, text, start, stop, reverse=False):
+        """
+        Return the index of the first (or last) line in a range of lines that contains text.
+
+        The file is searched directly rather than line by line.
+
+        Parameters
+        ----------
+        text : str
+            The text to search for.
+        start : int
+            Index of the first line to search.
+        stop : int
+            Index after the last line to search.
+        reverse : bool
+            If True, return the last line that contains the text.
+
+        Returns
+        -------
+        int
+            Index of the line, or -1 if the text isn't found.
+        """
+        if start >= stop:
+            return -1
+
+        key = text.encode()
+        lo = self._starts[start]
+        hi = self._ends[stop - 1]
+
+        while lo < hi:
+            if reverse:
+                pos = self._mmap.rfind(key, lo, hi)
+            else:
+                pos = self._mmap.find(key, lo, hi)
+            if pos < 0:
+                break
+
+            row = np.searchsorted(self._ends, pos, side='right')
+            # matches in skipped comment lines or end-of-line comments don't count
+            if self._starts[row] <= pos and text in self[row]:
+                return int(row)
+
+            if reverse:
+                hi = pos + len(key) - 1
+            else:
+                lo = pos + 1
+
+        return -1
+
+
 class FileParser(object):
     """
     Utility to locate and read data from a file.
@@ -608,11 +771,17 @@ class FileParser(object):
     full_line_comment_char : str, optional
         Comment character that signifies a line should be skipped.
 
+    memory_map : bool, optional
+        If True, files are memory mapped and indexed by line instead of being read into
+        memory, anchors are searched for in the file directly, and numeric arrays are converted
+        by numpy rather than by pyparsing. This is much faster for large files. A file must not
+        be modified while it is set in the parser.
+
     Attributes
     ----------
     _filename : str
         the name of the file.
-    _data : list of string
+    _data : list of string or _MappedLines
         the contents of the file, by line
     _delimiter : str
         the name of the file.
@@ -620,13 +789,16 @@ class FileParser(object):
         end-of-line comment character to be ignored.
     _full_line_comment_char : str
         comment character that signifies a line should be skipped.
+    _memory_map : bool
+        if True, files are memory mapped and numeric arrays are converted by numpy.
     _current_row : int
         the current row of the file.
     _anchored : bool
         indicator that position is relative to a landmark location.
     """
 
-    def __init__(self, end_of_line_comment_char=None, full_line_comment_char=None):
+    def __init__(self, end_of_line_comment_char=None, full_line_comment_char=None,
+                 memory_map=False):
         """
         Initialize attributes.
         """
@@ -640,6 +812,7 @@ class FileParser(object):
         self._delimiter = " \t"
         self._end_of_line_comment_char = end_of_line_comment_char
         self._full_line_comment_char = full_line_comment_char
+        self._memory_map = memory_map
 
         self._current_row = 0
         self._anchored = False
@@ -657,6 +830,11 @@ class FileParser(object):
         """
         self._filename = filename
 
+        if self._memory_map:
+            self._data = _MappedLines(filename, self._end_of_line_comment_char,
+                                      self._full_line_comment_char)
+            return
+
         inputfile = open(filename, 'r')
 
         if not self._end_of_line_comment_char and not self._full_line_comment_char:
@@ -710,50 +888,29 @@ class FileParser(object):
         if not isinstance(occurrence, int):
             raise ValueError("The value for occurrence must be an integer")
 
-        instance = 0
-
+        # If we are marking a new anchor from an existing anchor, the search skips the line of
+        # the existing anchor, which is the last line of the file for a reverse search.
         if occurrence > 0:
-            count = 0
-            max_lines = len(self._data)
-            for index in range(self._current_row, max_lines):
-                line = self._data[index]
-
-                # If we are marking a new anchor from an existing anchor, and
-                # the anchor is mid-line, then we still search the line, but
-                # only after the anchor.
-                if count == 0 and self._anchored:
-                    line = line.split(anchor)[-1]
-
-                if anchor in line:
-
-                    instance += 1
-                    if instance == occurrence:
-                        self._current_row += count
-                        self._anchored = True
-                        return
-
-                count += 1
+            row = self._current_row - 1 + self._anchored
+            for _ in range(occurrence):
+                row = self._find_row(anchor, row + 1, len(self._data))
+                if row < 0:
+                    break
+            else:
+                self._current_row = row
+                self._anchored = True
+                return
 
         elif occurrence < 0:
-            max_lines = len(self._data) - 1
-            count = max_lines
-            for index in range(max_lines, -1, -1):
-                line = self._data[index]
-
-                # If we are marking a new anchor from an existing anchor, and
-                # the anchor is mid-line, then we still search the line, but
-                # only before the anchor.
-                if count == max_lines and self._anchored:
-                    line = line.split(anchor)[0]
-
-                if anchor in line:
-                    instance += -1
-                    if instance == occurrence:
-                        self._current_row = count
-                        self._anchored = True
-                        return
-
-                count -= 1
+            row = max(len(self._data) - self._anchored, 0)
+            for _ in range(-occurrence):
+                row = self._find_row(anchor, 0, row, reverse=True)
+                if row < 0:
+                    break
+            else:
+                self._current_row = row
+                self._anchored = True
+                return
         else:
             raise ValueError("0 is not valid for an anchor occurrence.")
 
@@ -860,24 +1017,24 @@ class FileParser(object):
             msg = "The value for occurrence must be a nonzero integer"
             raise ValueError(msg)
 
-        instance = 0
+        nlines = len(self._data)
         if occurrence > 0:
-            row = 0
-            for line in self._data[self._current_row:]:
-                if line.find(key) > -1:
-                    instance += 1
-                    if instance == occurrence:
-                        break
-                row += 1
+            index = self._current_row - 1
+            for _ in range(occurrence):
+                index = self._find_row(key, index + 1, nlines)
+                if index < 0:
+                    index = nlines
+                    break
+            row = index - self._current_row
 
         elif occurrence < 0:
-            row = -1
-            for line in reversed(self._data[self._current_row:]):
-                if line.find(key) > -1:
-                    instance += -1
-                    if instance == occurrence:
-                        break
-                row -= 1
+            index = nlines
+            for _ in range(-occurrence):
+                index = self._find_row(key, self._current_row, index, reverse=True)
+                if index < 0:
+                    index = self._current_row - 1
+                    break
+            row = index - nlines
 
         j = self._current_row + row + rowoffset
         line = self._data[j]
@@ -926,6 +1083,20 @@ class FileParser(object):
 
         lines = self._data[j1:j2]
 
+        if self._memory_map:
+            if self._delimiter == "columns":
+                rows = [line[(fieldstart - 1):fieldend].split() for line in lines]
+            else:
+                rows = self._split_fields(lines)
+                if rows:
+                    rows[-1] = rows[-1][:fieldend]
+                    rows[0] = rows[0][(fieldstart - 1):]
+            try:
+                return np.array([field for row in rows for field in row], dtype=float)
+            except ValueError:
+                # not all numbers, so let pyparsing sort them out
+                pass
+
         data = np.zeros(shape=(0, 0))
 
         for i, line in enumerate(lines):
@@ -997,6 +1168,17 @@ class FileParser(object):
         j2 = self._current_row + rowend + 1
         lines = list(self._data[j1:j2])
 
+        if self._memory_map:
+            if self._delimiter == "columns":
+                rows = [line[(fieldstart - 1):fieldend].split() for line in lines]
+            else:
+                rows = [row[(fieldstart - 1):fieldend] for row in self._split_fields(lines)]
+            try:
+                return np.array(rows, dtype=float).reshape((abs(j2 - j1), -1))
+            except ValueError:
+                # not all numbers, or not the same number on each row
+                pass
+
         if self._delimiter == "columns":
             if fieldend:
                 line = lines[0][(fieldstart - 1):fieldend]
@@ -1039,6 +1221,53 @@ class FileParser(object):
 
         return data
 
+    def _find_row(self, text, start, stop, reverse=False):
+        """
+        Return the index of the first (or last) line in a range of lines that contains text.
+
+        Parameters
+        ----------
+        text : str
+            The text to search for.
+        start : int
+            Index of the first line to search.
+        stop : int
+            Index after the last line to search.
+        reverse : bool
+            If True, return the last line that contains the text.
+
+        Returns
+        -------
+        int
+            Index of the line, or -1 if the text isn't found.
+        """
+        if isinstance(self._data, _MappedLines):
+            return self._data.find(text, start, stop, reverse)
+
+        rows = range(stop - 1, start - 1, -1) if reverse else range(start, stop)
+        for row in rows:
+            if text in self._data[row]:
+                return row
+
+        return -1
+
+    def _split_fields(self, lines):
+        """
+        Split lines into fields at the delimiters, without converting them.
+
+        Parameters
+        ----------
+        lines : list of str
+            The lines to split.
+
+        Returns
+        -------
+        list of list of str
+            Fields of each line.
+        """
+        table = str.maketrans(self._delimiter, ' ' * len(self._delimiter))
+        return [line.translate(table).split() for line in lines]
+
     def _parse_line(self):
         """
         Parse a single data line that may contain string or numerical data.
@@ -264,3 +264,46 @@ def dict_to_structured_array(values):
         return array
     else:
         return None
+
+
+def get_recorded_name(name, recorded, io, prom2abs, abs2prom, conns):
+    """
+    Return the name under which a variable was recorded.
+
+    Parameters
+    ----------
+    name : str
+        Promoted or absolute name of the variable.
+    recorded : set or dict
+        Names of the recorded variables.
+    io : str
+        'input' or 'output'.
+    prom2abs : {'input': dict, 'output': dict}
+        Dictionary mapping promoted names to absolute names.
+    abs2prom : {'input': dict, 'output': dict}
+        Dictionary mapping absolute names to promoted names.
+    conns : dict
+        Dictionary of all model connections.
+
+    Returns
+    -------
+    str or None
+        The recorded name, or None if the variable was not recorded.
+    """
+    if name in recorded:
+        return name
+
+    candidates = list(prom2abs[io].get(name, ()))
+
+    if io == 'output':
+        if name in prom2abs['input']:
+            # auto_ivc outputs may have been recorded under a connected input name
+            src = conns[prom2abs['input'][name][0]]
+            candidates.append(src)
+            candidates.append(abs2prom['output'].get(src))
+        elif name in abs2prom['output']:
+            candidates.append(abs2prom['output'][name])
+
+    for candidate in candidates:
+        if candidate in recorded:
+            return candidate
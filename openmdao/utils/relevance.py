@@ -774,14 +774,18 @@ class Relevance(object):
         else:
             save_active = self._active
             save_relsarray = self._current_rel_sarray
+            save_relvarray = self._current_rel_varray
             self._active = True
             self._current_rel_sarray = self._nonlinear_sets[name]
+            # variable relevance of the current seeds doesn't apply to the nonlinear sets
+            self._current_rel_varray = None
 
             try:
                 yield
             finally:
                 self._active = save_active
                 self._current_rel_sarray = save_relsarray
+                self._current_rel_varray = save_relvarray
 
     def _set_seeds(self, fwd_seeds, rev_seeds):
         """
@@ -201,7 +201,7 @@ class ShellProc(subprocess.Popen):
         ----------
         poll_delay : float (seconds)
             Time to delay between polling for command completion.
-            A value of zero uses an internal default.
+            A value of zero waits for the command to complete without polling.
         timeout : float (seconds)
             Maximum time to wait for command completion.
             A value of zero implies an infinite maximum wait.
@@ -216,19 +216,23 @@ class ShellProc(subprocess.Popen):
         return_code = None
         try:
             if poll_delay <= 0:
-                poll_delay = max(0.1, timeout / 100.)
-                poll_delay = min(10., poll_delay)
-            npolls = int(timeout / poll_delay) + 1
-
-            time.sleep(poll_delay)
-            return_code = self.poll()
-            while return_code is None:
-                npolls -= 1
-                if (timeout > 0) and (npolls < 0):
+                # Block until the process exits rather than sleeping between polls.
+                try:
+                    return_code = subprocess.Popen.wait(self, timeout if timeout > 0 else None)
+                except subprocess.TimeoutExpired:
                     self.terminate()
-                    break
+            else:
+                npolls = int(timeout / poll_delay) + 1
+
                 time.sleep(poll_delay)
                 return_code = self.poll()
+                while return_code is None:
+                    npolls -= 1
+                    if (timeout > 0) and (npolls < 0):
+                        self.terminate()
+                        break
+                    time.sleep(poll_delay)
+                    return_code = self.poll()
         finally:
             self.close_files()
 
@@ -304,7 +308,7 @@ def call(args, stdin=None, stdout=None, stderr=None, env=None,
         Environment variables for the command.
     poll_delay : float (seconds)
         Time to delay between polling for command completion.
-        A value of zero uses an internal default.
+        A value of zero waits for the command to complete without polling.
     timeout : float (seconds)
         Maximum time to wait for command completion.
         A value of zero implies an infinite maximum wait.
@@ -350,7 +354,7 @@ def check_call(args, stdin=None, stdout=None, stderr=None, env=None,
         Environment variables for the command.
     poll_delay : float (seconds)
         Time to delay between polling for command completion.
-        A value of zero uses an internal default.
+        A value of zero waits for the command to complete without polling.
     timeout : float (seconds)
         Maximum time to wait for command completion.
         A value of zero implies an infinite maximum wait.
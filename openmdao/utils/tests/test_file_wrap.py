@@ -605,6 +605,54 @@ class TestCase(unittest.TestCase):
         val = op.transfer_var(4, 4)
         self.assertEqual(val, '#$%')
 
+    def test_memory_map(self):
+        data = '\r\n'.join([
+            "C comment Anchor",
+            "Anchor",
+            " Key1 1 2 3.7 Test 1e65 $ Anchor",
+            " 1.5 2.5 3.5 4.5",
+            " 5.5 6.5 7.5 8.5",
+            "C Anchor",
+            "Anchor",
+            " Key1 3 4 3.2 ibg 0.0003",
+            " 10, 20, 30, 40",
+            " 50, 60, 70, 80",
+            " Key a b c d e",
+        ])
+
+        with open(self.filename, 'w', newline='') as outfile:
+            outfile.write(data)
+
+        parsers = [FileParser(end_of_line_comment_char='$', full_line_comment_char='C',
+                              memory_map=memory_map) for memory_map in (False, True)]
+
+        results = []
+        for op in parsers:
+            op.set_file(self.filename)
+            op.set_delimiters(' \t,')
+
+            op.mark_anchor('Anchor')
+            vals = [op.transfer_line(0), op.transfer_var(1, 4), op.transfer_array(2, 2, 3, 3),
+                    op.transfer_2Darray(2, 1, 3), op.transfer_keyvar('Key1', 2, -1)]
+
+            op.mark_anchor('Anchor')
+            vals += [op.transfer_2Darray(2, 2, 3, 3), op.transfer_array(4, 2, 4, 6)]
+
+            op.reset_anchor()
+            op.mark_anchor('Anchor', -1)
+            vals.append(op.transfer_var(1, 6))
+            results.append(vals)
+
+        for val, expected in zip(results[1], results[0]):
+            if isinstance(expected, numpy.ndarray):
+                assert_equal_arrays(val, expected)
+            else:
+                self.assertEqual(val, expected)
+
+        assert_equal_arrays(results[1][3], array([[1.5, 2.5, 3.5, 4.5], [5.5, 6.5, 7.5, 8.5]]))
+        assert_equal_arrays(results[1][5], array([[20., 30.], [60., 70.]]))
+        self.assertEqual(results[1][-1], 0.0003)
+
 
 @unittest.skipUnless(pyparsing is not None, "Test requires pyparsing to be installed. (pip install pyparsing).")
 class FileGenFeature(unittest.TestCase):
@@ -4,6 +4,7 @@ import numpy as np
 
 import openmdao.api as om
 from openmdao.utils.relevance import _vars2systems
+from openmdao.core.group import _RELEVANT_TRANSFER_CACHE_SIZE
 from openmdao.utils.assert_utils import assert_check_totals
 
 
@@ -135,3 +136,108 @@ class TestRelevanceNoObjLinearConstraint(unittest.TestCase):
         prob.setup()
         prob.run_model()
         assert_check_totals(prob.check_totals(show_only_incorrect=True))
+
+
+class MatFreeMix(om.ExplicitComponent):
+    def initialize(self):
+        self.options.declare('n', types=int)
+
+    def setup(self):
+        n = self.options['n']
+        self.add_input('a', np.ones(n))
+        self.add_input('b', np.ones(n))
+        self.add_output('z', np.ones(n))
+
+    def compute(self, inputs, outputs):
+        outputs['z'] = 2. * inputs['a'] + 3. * inputs['b']
+
+    def compute_jacvec_product(self, inputs, d_inputs, d_outputs, mode):
+        if mode == 'fwd':
+            d_outputs['z'] += 2. * d_inputs['a'] + 3. * d_inputs['b']
+        else:
+            d_inputs['a'] += 2. * d_outputs['z']
+            d_inputs['b'] += 3. * d_outputs['z']
+
+
+class TestRelevantTransfers(unittest.TestCase):
+    def build_model(self, mode, npts=4, n=5):
+        prob = om.Problem()
+        model = prob.model
+
+        for i in range(npts):
+            model.add_subsystem(f'dv{i}', om.IndepVarComp('x', np.arange(n) + i + 1.0))
+            model.add_subsystem(f'sq{i}', om.ExecComp('y=x*x', x=np.ones(n), y=np.ones(n)))
+            model.connect(f'dv{i}.x', f'sq{i}.x')
+            model.add_design_var(f'dv{i}.x')
+            model.add_constraint(f'sq{i}.y', lower=0.)
+
+        # a component that is relevant to every seed but whose inputs aren't
+        model.add_subsystem('mix', MatFreeMix(n=n))
+        model.connect('sq0.y', 'mix.a')
+        model.connect('sq1.y', 'mix.b')
+        model.add_constraint('mix.z', lower=0.)
+
+        model.linear_solver = om.LinearBlockGS()
+
+        prob.setup(mode=mode, force_alloc_complex=True)
+        prob.run_model()
+
+        return prob
+
+    def test_totals(self):
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                prob = self.build_model(mode)
+                assert_check_totals(prob.check_totals(method='cs', out_stream=None))
+
+                # repeated computation reuses the filtered transfers
+                J1 = prob.compute_totals()
+                nxfers = len(prob.model._relevant_transfers)
+                J2 = prob.compute_totals()
+                self.assertEqual(len(prob.model._relevant_transfers), nxfers)
+                for key in J1:
+                    np.testing.assert_allclose(J1[key], J2[key])
+
+    def test_filtered_transfer(self):
+        prob = self.build_model('fwd')
+        model = prob.model
+        relevance = model._relevance
+        full = model._transfers['fwd'][None]
+
+        with relevance.seeds_active(fwd_seeds=('dv2.x',)):
+            with relevance.active(True):
+                xfer = model._get_relevant_transfer(full, 'fwd', None)
+
+        # only the dv2.x -> sq2.x connection is relevant, and all other inputs are zeroed
+        self.assertEqual(xfer._in_inds.size, 5)
+        self.assertEqual(xfer._zero_rest.size + sum(s.stop - s.start for s in xfer._zero_slices),
+                         full._in_inds.size - 5)
+
+        # outside of a derivative computation the full transfer is used
+        self.assertIs(model._get_relevant_transfer(full, 'fwd', None), full)
+
+    def test_cache_bounded(self):
+        prob = self.build_model('fwd', npts=12)
+        model = prob.model
+        relevance = model._relevance
+        full = model._transfers['fwd'][None]
+
+        def get_xfer(seed):
+            with relevance.seeds_active(fwd_seeds=(seed,)):
+                with relevance.active(True):
+                    return model._get_relevant_transfer(full, 'fwd', None)
+
+        first = get_xfer('dv0.x')
+        self.assertIs(get_xfer('dv0.x'), first)
+
+        for i in range(1, 12):
+            get_xfer(f'dv{i}.x')
+
+        # only the most recently used seed sets are kept
+        self.assertEqual(len(model._relevant_transfers), _RELEVANT_TRANSFER_CACHE_SIZE)
+        fwd_seeds = [fwd for fwd, _ in model._relevant_transfers]
+        self.assertEqual(fwd_seeds, [(f'dv{i}.x',) for i in range(4, 12)])
+
+        xfer = get_xfer('dv0.x')
+        self.assertIsNot(xfer, first)
+        np.testing.assert_array_equal(xfer._in_inds, first._in_inds)
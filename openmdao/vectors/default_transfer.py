@@ -8,6 +8,58 @@ from openmdao.core.constants import INT_DTYPE
 from openmdao.vectors.transfer import Transfer
 from openmdao.utils.array_utils import _global2local_offsets
 
+# contiguous runs shorter than this are transferred using fancy indexing
+_MIN_SLICE_SIZE = 64
+
+
+def _get_transfer_plan(in_inds, out_inds, min_size=_MIN_SLICE_SIZE):
+    """
+    Split a transfer into contiguous slice copies and the remaining fancy indexed entries.
+
+    A run is a sequence of entries where both the input and the output indices increase by
+    one, so adjacent connections with adjacent variables are combined into a single run.
+
+    Parameters
+    ----------
+    in_inds : int ndarray
+        Input indices for the transfer.
+    out_inds : int ndarray
+        Output indices for the transfer.
+    min_size : int
+        Minimum length of a run that is transferred as a slice.
+
+    Returns
+    -------
+    list of (slice, slice)
+        Input and output slices of each run.
+    int ndarray
+        Input indices that aren't part of any run.
+    int ndarray
+        Output indices that aren't part of any run.
+    """
+    size = len(in_inds)
+    if size == 0:
+        return [], in_inds, out_inds
+
+    # each input is only transferred once, so entries can be reordered to lengthen the runs
+    order = np.argsort(in_inds, kind='stable')
+    in_inds = in_inds[order]
+    out_inds = out_inds[order]
+
+    breaks = np.nonzero((np.diff(in_inds) != 1) | (np.diff(out_inds) != 1))[0] + 1
+    starts = np.concatenate(([0], breaks))
+    lens = np.diff(np.concatenate((starts, [size])))
+
+    is_slice = lens >= min_size
+    in_starts = in_inds[starts[is_slice]].tolist()
+    out_starts = out_inds[starts[is_slice]].tolist()
+    slices = [(slice(istart, istart + n), slice(ostart, ostart + n))
+              for istart, ostart, n in zip(in_starts, out_starts, lens[is_slice].tolist())]
+
+    rest = np.repeat(~is_slice, lens)
+
+    return slices, in_inds[rest], out_inds[rest]
+
 
 def _fill(arr, indices_iter):
     """
@@ -125,8 +177,60 @@ class DefaultTransfer(Transfer):
         Output indices for the transfer.
     has_input_scaling : bool
         Whether any of the inputs has scaling.
+
+    Attributes
+    ----------
+    _slices : list of (slice, slice)
+        Input and output slices of the contiguous runs of the transfer.
+    _in_rest : int ndarray
+        Input indices of the entries that aren't part of a contiguous run.
+    _out_rest : int ndarray
+        Output indices of the entries that aren't part of a contiguous run.
+    _zero_slices : list of slice
+        Slices of the input vector that are zeroed rather than transferred in fwd mode.
+    _zero_rest : int ndarray
+        Indices of the input vector that are zeroed rather than transferred in fwd mode.
     """
 
+    def __init__(self, in_vec, out_vec, in_inds, out_inds, has_input_scaling):
+        """
+        Initialize all attributes.
+        """
+        super().__init__(in_vec, out_vec, in_inds, out_inds, has_input_scaling)
+        self._slices, self._in_rest, self._out_rest = _get_transfer_plan(in_inds, out_inds)
+        self._zero_slices = []
+        self._zero_rest = np.zeros(0, dtype=INT_DTYPE)
+
+    def _relevant_subset(self, in_mask):
+        """
+        Return a transfer that only moves the entries of relevant inputs.
+
+        Irrelevant inputs can only be fed by outputs that don't depend on any active forward
+        seed, so they are zeroed in fwd mode and skipped in rev mode.
+
+        Parameters
+        ----------
+        in_mask : bool ndarray
+            Mask over the input vector that is True for entries of relevant inputs.
+
+        Returns
+        -------
+        <DefaultTransfer>
+            The filtered transfer, or this transfer if all of its inputs are relevant.
+        """
+        mask = in_mask[self._in_inds]
+        if mask.all():
+            return self
+
+        xfer = DefaultTransfer(None, None, self._in_inds[mask], self._out_inds[mask],
+                               self._has_input_scaling)
+
+        zero_inds = self._in_inds[~mask]
+        zero_slices, xfer._zero_rest, _ = _get_transfer_plan(zero_inds, zero_inds)
+        xfer._zero_slices = [in_slice for in_slice, _ in zero_slices]
+
+        return xfer
+
     @staticmethod
     def _setup_transfers(group):
         """
@@ -315,9 +419,28 @@ class DefaultTransfer(Transfer):
 
         """
         if mode == 'fwd':
-            # this works whether the vecs have multi columns or not due to broadcasting
-            in_vec.set_val(out_vec.asarray()[self._out_inds.flat], self._in_inds)
+            in_data = in_vec._data
+            out_data = out_vec.asarray()
+
+            for in_slice, out_slice in self._slices:
+                in_data[in_slice] = out_data[out_slice]
+
+            if self._in_rest.size > 0:
+                in_data[self._in_rest] = out_data[self._out_rest]
+
+            for zero_slice in self._zero_slices:
+                in_data[zero_slice] = 0.0
+
+            if self._zero_rest.size > 0:
+                in_data[self._zero_rest] = 0.0
 
         else:  # rev
-            out_vec.iadd(np.bincount(self._out_inds, in_vec._get_data()[self._in_inds],
-                                     minlength=out_vec._data.size))
+            in_data = in_vec._get_data()
+            out_data = out_vec.asarray()
+
+            # output indices within a run are unique, so each slice can be added directly
+            for in_slice, out_slice in self._slices:
+                out_data[out_slice] += in_data[in_slice]
+
+            if self._in_rest.size > 0:
+                np.add.at(out_data, self._out_rest, in_data[self._in_rest])
@@ -59,6 +59,22 @@ else:
             self._scatter = PETSc.Scatter().create(out_vec._petsc, out_indexset, in_vec._petsc,
                                                    in_indexset).scatter
 
+        def _relevant_subset(self, in_mask):
+            """
+            Return a transfer that only moves the entries of relevant inputs.
+
+            Parameters
+            ----------
+            in_mask : bool ndarray
+                Mask over the input vector that is True for entries of relevant inputs.
+
+            Returns
+            -------
+            <PETScTransfer>
+                This transfer, since PETSc scatters aren't filtered.
+            """
+            return self
+
         @staticmethod
         def _setup_transfers(group):
             """
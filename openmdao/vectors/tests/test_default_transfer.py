@@ -0,0 +1,83 @@
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.vectors.default_transfer import _get_transfer_plan
+from openmdao.utils.assert_utils import assert_near_equal, assert_check_totals
+
+
+class TestTransferPlan(unittest.TestCase):
+
+    def test_plan(self):
+        in_inds = np.array([100, 101, 102, 103, 0, 1, 2, 3, 4, 5, 50, 52], dtype=int)
+        out_inds = np.array([10, 11, 12, 13, 6, 7, 8, 9, 20, 21, 3, 3], dtype=int)
+
+        slices, in_rest, out_rest = _get_transfer_plan(in_inds, out_inds, min_size=4)
+
+        # entries are sorted by input index before the runs are found
+        self.assertEqual(slices, [(slice(0, 4), slice(6, 10)), (slice(100, 104), slice(10, 14))])
+        np.testing.assert_equal(in_rest, [4, 5, 50, 52])
+        np.testing.assert_equal(out_rest, [20, 21, 3, 3])
+
+        in_vec = np.zeros(110)
+        out_vec = np.arange(30.)
+        for in_slice, out_slice in slices:
+            in_vec[in_slice] = out_vec[out_slice]
+        in_vec[in_rest] = out_vec[out_rest]
+        assert_near_equal(in_vec[in_inds], out_vec[out_inds])
+
+    def test_empty(self):
+        slices, in_rest, out_rest = _get_transfer_plan(np.zeros(0, dtype=int),
+                                                       np.zeros(0, dtype=int))
+        self.assertEqual(slices, [])
+        self.assertEqual(in_rest.size, 0)
+        self.assertEqual(out_rest.size, 0)
+
+
+class TestDefaultTransfer(unittest.TestCase):
+
+    def build_model(self, mode):
+        n = 100
+        p = om.Problem()
+        model = p.model
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.arange(n, dtype=float)))
+        model.add_subsystem('c0', om.ExecComp('y=2*x', x=np.ones(n), y=np.ones(n)))
+        model.add_subsystem('c1', om.ExecComp('y=3*x', x=np.ones(n), y=np.ones(n)))
+        model.add_subsystem('c2', om.ExecComp('y=x*x', x=np.ones(n // 2), y=np.ones(n // 2)))
+        model.add_subsystem('c3', om.ExecComp('y=x+1', x=np.ones(n), y=np.ones(n)))
+
+        # contiguous connections, a reversed and strided connection, and a fan out
+        model.connect('ivc.x', 'c0.x')
+        model.connect('c0.y', 'c1.x')
+        model.connect('c1.y', 'c2.x', src_indices=np.arange(n - 1, 0, -2))
+        model.connect('c1.y', 'c3.x')
+
+        model.add_design_var('ivc.x')
+        model.add_constraint('c2.y', lower=0.)
+        model.add_constraint('c3.y', lower=0.)
+
+        p.setup(mode=mode, force_alloc_complex=True)
+        p.run_model()
+
+        return p
+
+    def test_values(self):
+        p = self.build_model('fwd')
+        x = np.arange(100, dtype=float)
+
+        assert_near_equal(p.get_val('c2.y'), (6. * x[99:0:-2]) ** 2)
+        assert_near_equal(p.get_val('c3.y'), 6. * x + 1.)
+
+        xfer = p.model._transfers['fwd'][None]
+        self.assertTrue(len(xfer._slices) > 0)
+
+    def test_totals(self):
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                p = self.build_model(mode)
+                assert_check_totals(p.check_totals(method='cs', out_stream=None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -50,6 +50,22 @@ class Transfer(object):
         except Exception as err:
             return "<error during call to Transfer.__str__: %s" % err
 
+    def _relevant_subset(self, in_mask):
+        """
+        Return a transfer that only moves the entries of relevant inputs.
+
+        Parameters
+        ----------
+        in_mask : bool ndarray
+            Mask over the input vector that is True for entries of relevant inputs.
+
+        Returns
+        -------
+        <Transfer>
+            This transfer, since the base class doesn't support filtering.
+        """
+        return self
+
     def __call__(self, in_vec, out_vec, mode='fwd'):
         """
         Perform transfer.